@@ -0,0 +1,133 @@
+"""Microbenchmark of per-request prompt assembly before and after the prompt registry.
+
+Run from the project root:
+
+    python benchmarks/prompt_assembly_benchmark.py
+"""
+
+import sys
+import timeit
+import tomllib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from prompts.prompt_loader import PromptLoader  # noqa: E402
+
+PROMPT_FILE = Path(__file__).parent.parent / "src" / "prompts" / "research_agent_prompt.toml"
+QUERY = "What is LangGraph?"
+USER_VALUES = {
+    "query": QUERY,
+    "context": "benchmark",
+    "primary_focus": "frameworks",
+    "depth_level": "standard",
+    "time_frame": "current",
+    "requirements": "none",
+    "deliverables": "report",
+}
+SYNTHESIS_VALUES = {
+    "source_count": 10,
+    "executive_summary": "summary",
+    "key_findings": "findings",
+    "source_analysis": "sources",
+    "confidence_assessment": "confidence",
+    "recommendations": "recommendations",
+    "further_research": "further",
+}
+COMPONENTS = [
+    "executive_summary_template",
+    "key_findings_template",
+    "recommendations_template",
+    "further_research_template",
+]
+
+
+class OriginalPromptLoader:
+    """The prompt loader as it was before the registry: parse per instance."""
+
+    def __init__(self, prompt_file: Path) -> None:
+        with prompt_file.open("rb") as f:
+            self._prompts = tomllib.load(f)
+
+    def get(self, section: str, key: str) -> str:
+        return self._prompts.get(section, {}).get(key, "")
+
+
+def before_sections(loader: OriginalPromptLoader) -> dict:
+    """Assemble each section from raw strings with str.format."""
+    return {
+        "template": [loader.get("template", key).format(user_query=QUERY) for key in COMPONENTS]
+        + [loader.get("template", "user_message_template").format(**USER_VALUES)],
+        "prompts": loader.get("prompts", "synthesis_prompt").format(**SYNTHESIS_VALUES),
+        "research_types": loader.get("research_types", "academic_research"),
+    }
+
+
+def after_sections(loader: PromptLoader) -> dict:
+    """Assemble each section from precompiled templates in the shared registry."""
+    prompt_set = loader.get_prompt_set()
+    return {
+        "template": [
+            prompt_set.template("template", key).format(user_query=QUERY)
+            for key in COMPONENTS
+        ]
+        + [prompt_set.template("template", "user_message_template").format(**USER_VALUES)],
+        "prompts": prompt_set.template("prompts", "synthesis_prompt").format(
+            **SYNTHESIS_VALUES
+        ),
+        "research_types": prompt_set.get("research_types", "academic_research"),
+    }
+
+
+SECTIONS = {
+    "template": (
+        lambda loader: [loader.get("template", key).format(user_query=QUERY) for key in COMPONENTS]
+        + [loader.get("template", "user_message_template").format(**USER_VALUES)],
+        lambda prompt_set: [
+            prompt_set.template("template", key).format(user_query=QUERY) for key in COMPONENTS
+        ]
+        + [prompt_set.template("template", "user_message_template").format(**USER_VALUES)],
+    ),
+    "prompts": (
+        lambda loader: loader.get("prompts", "synthesis_prompt").format(**SYNTHESIS_VALUES),
+        lambda prompt_set: prompt_set.template("prompts", "synthesis_prompt").format(
+            **SYNTHESIS_VALUES
+        ),
+    ),
+    "research_types": (
+        lambda loader: loader.get("research_types", "academic_research"),
+        lambda prompt_set: prompt_set.get("research_types", "academic_research"),
+    ),
+}
+
+
+def measure(func, number: int) -> float:
+    """Time a callable and return microseconds per call."""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    original = OriginalPromptLoader(PROMPT_FILE)
+    loader = PromptLoader(PROMPT_FILE)
+    assert before_sections(original) == after_sections(loader)
+
+    number = 5000
+    print(f"Per-request prompt assembly ({PROMPT_FILE.name}), microseconds per call\n")
+    print(f"{'section':<32}{'before':>10}{'after':>10}{'speedup':>10}")
+    prompt_set = loader.get_prompt_set()
+    for section, (old, new) in SECTIONS.items():
+        old_us = measure(lambda old=old: old(original), number)
+        new_us = measure(lambda new=new: new(prompt_set), number)
+        print(f"{section:<32}{old_us:10.2f}{new_us:10.2f}{old_us / new_us:9.1f}x")
+
+    old_us = measure(lambda: before_sections(original), number)
+    new_us = measure(lambda: after_sections(loader), number)
+    print(f"{'all sections, existing agent':<32}{old_us:10.2f}{new_us:10.2f}{old_us / new_us:9.1f}x")
+    old_us = measure(lambda: before_sections(OriginalPromptLoader(PROMPT_FILE)), 500)
+    new_us = measure(lambda: after_sections(PromptLoader(PROMPT_FILE)), 500)
+    print(f"{'all sections, new agent':<32}{old_us:10.2f}{new_us:10.2f}{old_us / new_us:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Microbenchmark of per-step graph state overhead for the research agent state.
+
+Compares the original Pydantic ``State`` (``add_messages`` reducer, validated
+on every step) with the slotted dataclass ``State`` and its append-only
+``MessageLog``. Each run starts from a history of N messages and executes a
+loop of steps that read the last message and append one.
+
+Run from the project root:
+
+    python benchmarks/state_benchmark.py
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Annotated, Any, Callable
+
+from langchain_core.messages import AIMessage, AnyMessage
+from langgraph.graph import END, START, StateGraph, add_messages
+from pydantic import BaseModel
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from agents.research_agent.state import State, validate_state  # noqa: E402
+from models.relevant_data import Evidence  # noqa: E402
+
+HISTORY_SIZES = [10, 100, 1000]
+STEPS = 20
+REPEAT = 5
+
+
+class OriginalState(BaseModel):
+    """The research agent state as it was: a Pydantic model."""
+
+    messages: Annotated[list[AnyMessage], add_messages] = []
+    relevant_data: dict = {}
+
+
+def build_graph(state_schema: type, max_messages: int) -> Any:
+    """Build a graph appending one message per step until ``max_messages``."""
+
+    def step(state: Any) -> dict:
+        last = state.messages[-1]
+        return {"messages": [AIMessage(content=f"reply to {len(last.content)} chars")]}
+
+    def route(state: Any) -> str:
+        return END if len(state.messages) >= max_messages else "step"
+
+    graph = StateGraph(state_schema)
+    graph.add_node("step", step)
+    graph.add_edge(START, "step")
+    graph.add_conditional_edges("step", route)
+    return graph.compile()
+
+
+def history(size: int) -> list[dict]:
+    """Build a message history as it arrives at the graph boundary."""
+    return [
+        {"type": "human" if i % 2 == 0 else "ai", "content": f"message {i} " * 20}
+        for i in range(size)
+    ]
+
+
+def run(state_schema: type, make_input: Callable[[list[dict]], Any], size: int) -> float:
+    """Time runs from a history of ``size`` messages and return microseconds per step."""
+    graph = build_graph(state_schema, size + STEPS)
+    messages = history(size)
+    best = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        graph.invoke(make_input(messages), {"recursion_limit": STEPS + 5})
+        best = min(best, time.perf_counter() - started)
+    return best / STEPS * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    evidence = [Evidence("retrieved passage", "title", "https://example.com", "local", 0.5)]
+
+    def original_input(messages: list[dict]) -> dict:
+        return {"messages": messages, "relevant_data": {"evidence": evidence}}
+
+    def compact_input(messages: list[dict]) -> State:
+        return validate_state({"messages": messages, "relevant_data": evidence})
+
+    print(f"Research agent graph state, microseconds per step ({STEPS} steps per run)\n")
+    print(f"{'history':>10}{'pydantic':>12}{'compact':>12}{'speedup':>10}")
+    for size in HISTORY_SIZES:
+        original_us = run(OriginalState, original_input, size)
+        compact_us = run(State, compact_input, size)
+        print(f"{size:>10}{original_us:12.1f}{compact_us:12.1f}{original_us / compact_us:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 """Monitoring and tracking implementations."""
 
+from .export_pipeline import ExportPipeline, HttpEventExporter, LocalCollectorExporter
 from .langwatch_tracker import LangWatchTracker
 
-__all__ = ["LangWatchTracker"]
\ No newline at end of file
+__all__ = ["ExportPipeline", "HttpEventExporter", "LangWatchTracker", "LocalCollectorExporter"]
@@ -0,0 +1,249 @@
+"""Background, batched export of tracking events."""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Protocol
+
+import httpx
+
+
+class EventExporter(Protocol):
+    """Destination for batches of tracking events."""
+
+    async def export(self, batch: List[Dict[str, Any]]) -> None:
+        """Ship one batch of events; raise to trigger a retry."""
+        ...
+
+
+class HttpEventExporter:
+    """Export event batches to a LangWatch collector endpoint over HTTP."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        api_key: Optional[str] = None,
+        path: str = "/api/collector",
+        timeout_seconds: float = 10.0,
+    ):
+        """Initialize the exporter.
+
+        Args:
+            endpoint: LangWatch base URL
+            api_key: Optional API key sent as ``X-Auth-Token``
+            path: Collector path appended to the endpoint
+            timeout_seconds: Request timeout
+        """
+        self.url = endpoint.rstrip("/") + path
+        headers = {"X-Auth-Token": api_key} if api_key else {}
+        self._client = httpx.AsyncClient(headers=headers, timeout=timeout_seconds)
+
+    async def export(self, batch: List[Dict[str, Any]]) -> None:
+        """POST a batch of events as JSON.
+
+        Raises:
+            httpx.HTTPError: If the request fails or returns an error status
+        """
+        response = await self._client.post(self.url, json={"events": batch})
+        response.raise_for_status()
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        await self._client.aclose()
+
+
+class LocalCollectorExporter:
+    """Collector stub keeping exported batches in memory (for development and tests)."""
+
+    def __init__(self, max_batches: int = 1000):
+        """Initialize the collector.
+
+        Args:
+            max_batches: Number of most recent batches kept
+        """
+        self.batches: Deque[List[Dict[str, Any]]] = deque(maxlen=max_batches)
+
+    async def export(self, batch: List[Dict[str, Any]]) -> None:
+        """Store a batch of events."""
+        self.batches.append(batch)
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        """All events in the stored batches."""
+        return [event for batch in self.batches for event in batch]
+
+
+class ExportPipeline:
+    """Bounded ring buffer drained by a background batching worker.
+
+    ``submit`` never blocks or performs I/O: events go into a fixed-size
+    buffer, and new events are dropped (and counted) when it is full. A
+    worker task ships batches when ``batch_size`` events are buffered or
+    every ``flush_interval_seconds``, retrying failed batches with
+    exponential backoff before dropping them.
+    """
+
+    def __init__(
+        self,
+        exporter: EventExporter,
+        buffer_size: int = 10_000,
+        batch_size: int = 100,
+        flush_interval_seconds: float = 1.0,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 0.5,
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            exporter: Destination for event batches
+            buffer_size: Maximum number of buffered events
+            batch_size: Maximum events per exported batch
+            flush_interval_seconds: Maximum time an event waits in the buffer
+            max_retries: Retries per batch before it is dropped
+            retry_backoff_seconds: Initial delay between retries (doubled each time)
+        """
+        self.exporter = exporter
+        self.buffer_size = buffer_size
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.logger = logging.getLogger(__name__)
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._wakeup = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+        self._export_lock = asyncio.Lock()
+        self.submitted = 0
+        self.exported = 0
+        self.dropped_overflow = 0
+        self.dropped_failed = 0
+        self.retries = 0
+        self.batches = 0
+
+    def submit(self, event: Dict[str, Any]) -> bool:
+        """Buffer an event for export without blocking.
+
+        Starts the worker on first use when called from a running event loop.
+
+        Args:
+            event: Serialized event
+
+        Returns:
+            False if the event was dropped because the buffer is full
+        """
+        if len(self._buffer) >= self.buffer_size:
+            self.dropped_overflow += 1
+            return False
+        self._buffer.append(event)
+        self.submitted += 1
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+        if self._worker is None or self._worker.get_loop() is not loop:
+            self.start()
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    def start(self) -> None:
+        """Start the background worker (requires a running event loop)."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._worker is not None
+            and not self._worker.done()
+            and self._worker.get_loop() is loop
+        ):
+            return
+        self._wakeup = asyncio.Event()
+        self._export_lock = asyncio.Lock()
+        self._worker = asyncio.create_task(self._run())
+
+    async def flush(self) -> None:
+        """Export every buffered event now."""
+        await self._export_buffered(full_batches_only=False)
+
+    async def stop(self) -> None:
+        """Stop the worker after exporting the buffered events."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        await self.flush()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get export counters.
+
+        Returns:
+            Dictionary of pipeline statistics
+        """
+        return {
+            "submitted": self.submitted,
+            "exported": self.exported,
+            "buffered": len(self._buffer),
+            "batches": self.batches,
+            "retries": self.retries,
+            "dropped_overflow": self.dropped_overflow,
+            "dropped_failed": self.dropped_failed,
+        }
+
+    async def _run(self) -> None:
+        """Export full batches as they fill and everything on each interval."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval_seconds)
+                full_batches_only = True
+            except asyncio.TimeoutError:
+                full_batches_only = False
+            self._wakeup.clear()
+            await self._export_buffered(full_batches_only)
+
+    async def _export_buffered(self, full_batches_only: bool) -> None:
+        """Export buffered events batch by batch.
+
+        Args:
+            full_batches_only: Leave a final partial batch in the buffer
+        """
+        async with self._export_lock:
+            while self._buffer and (
+                not full_batches_only or len(self._buffer) >= self.batch_size
+            ):
+                await self._export_batch(self._take_batch())
+
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        """Remove up to ``batch_size`` events from the buffer."""
+        count = min(self.batch_size, len(self._buffer))
+        return [self._buffer.popleft() for _ in range(count)]
+
+    async def _export_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Export a batch, retrying with backoff before dropping it."""
+        delay = self.retry_backoff_seconds
+        try:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    await self.exporter.export(batch)
+                except Exception as e:
+                    if attempt == self.max_retries:
+                        self.dropped_failed += len(batch)
+                        self.logger.warning(
+                            "Dropping %d events after %d failed exports: %s",
+                            len(batch),
+                            attempt + 1,
+                            e,
+                        )
+                        return
+                    self.retries += 1
+                    await asyncio.sleep(delay)
+                    delay *= 2
+                else:
+                    self.exported += len(batch)
+                    self.batches += 1
+                    return
+        except asyncio.CancelledError:
+            # Keep the batch for the final flush when the worker is stopped
+            self._buffer.extendleft(reversed(batch))
+            raise
@@ -2,10 +2,24 @@
 
 import logging
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
+from .export_pipeline import EventExporter, ExportPipeline, HttpEventExporter
+from .statistics import EventStore, LatencyHistogram, StoredEvent
+
+# Data field holding the latency of each event type, for the histograms
+LATENCY_FIELDS: Dict[str, str] = {
+    "agent_execution": "execution_time",
+    "workflow_complete": "execution_time",
+    "workflow_error": "execution_time",
+    "workflow_batch": "elapsed_seconds",
+    "request_dispatch": "wait_seconds",
+    "node_execution": "execution_time",
+    "startup": "startup_seconds",
+}
+
 
 class TrackingEvent(BaseModel):
     """Event tracking data structure."""
@@ -24,6 +38,12 @@ class LangWatchTracker:
         api_key: Optional[str] = None,
         endpoint: str = "http://localhost:3000",
         project_name: str = "langgraph-langwatch-cli",
+        exporter: Optional[EventExporter] = None,
+        max_retained_events: int = 10_000,
+        max_event_age_seconds: Optional[float] = None,
+        buffer_size: int = 10_000,
+        batch_size: int = 100,
+        flush_interval_seconds: float = 1.0,
     ):
         """Initialize LangWatch tracker.
         
@@ -31,15 +51,39 @@ class LangWatchTracker:
             api_key: LangWatch API key
             endpoint: LangWatch endpoint (local by default)
             project_name: Project name for tracking
+            exporter: Event batch destination (defaults to the LangWatch
+                endpoint when an API key is given; no export otherwise)
+            max_retained_events: Most recent events kept for ``get_events``
+            max_event_age_seconds: Maximum age of events kept for ``get_events``
+                (statistics cover all events regardless of retention)
+            buffer_size: Maximum events waiting for export before new ones are dropped
+            batch_size: Maximum events per exported batch
+            flush_interval_seconds: Maximum time an event waits for export
         """
         self.api_key = api_key
         self.endpoint = endpoint
         self.project_name = project_name
-        self.events: List[TrackingEvent] = []
         self.logger = logging.getLogger(__name__)
-        
-        # TODO: Initialize actual LangWatch client
-        self._initialized = False
+        self._store = EventStore(max_retained_events, max_event_age_seconds)
+        self._event_counts: Dict[str, int] = {}
+        self._workflow_counts: Dict[str, Dict[str, int]] = {}
+        self._latency: Dict[str, LatencyHistogram] = {}
+        self._workflow_latency: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._node_latency: Dict[Tuple[str, str], LatencyHistogram] = {}
+
+        if exporter is None and api_key:
+            exporter = HttpEventExporter(endpoint, api_key)
+        self._pipeline: Optional[ExportPipeline] = (
+            ExportPipeline(
+                exporter,
+                buffer_size=buffer_size,
+                batch_size=batch_size,
+                flush_interval_seconds=flush_interval_seconds,
+            )
+            if exporter is not None
+            else None
+        )
+        self._initialized = self._pipeline is not None
 
     def track_agent_registration(self, agent_name: str, agent_class: str) -> None:
         """Track agent registration.
@@ -48,15 +92,14 @@ class LangWatchTracker:
             agent_name: Name of the registered agent
             agent_class: Class name of the agent
         """
-        event = TrackingEvent(
-            event_type="agent_registration",
-            data={
+        self._record(
+            "agent_registration",
+            {
                 "agent_name": agent_name,
                 "agent_class": agent_class,
                 "project": self.project_name,
-            }
+            },
         )
-        self._track_event(event)
 
     def track_workflow_registration(self, workflow_name: str, workflow_class: str) -> None:
         """Track workflow registration.
@@ -65,15 +108,14 @@ class LangWatchTracker:
             workflow_name: Name of the registered workflow
             workflow_class: Class name of the workflow
         """
-        event = TrackingEvent(
-            event_type="workflow_registration",
-            data={
+        self._record(
+            "workflow_registration",
+            {
                 "workflow_name": workflow_name,
                 "workflow_class": workflow_class,
                 "project": self.project_name,
-            }
+            },
         )
-        self._track_event(event)
 
     def start_workflow_execution(
         self, 
@@ -88,22 +130,22 @@ class LangWatchTracker:
             input_data: Input data for the workflow
             session_id: Optional session identifier
         """
-        event = TrackingEvent(
-            event_type="workflow_start",
-            data={
+        self._record(
+            "workflow_start",
+            {
                 "workflow_name": workflow_name,
                 "input_keys": list(input_data.keys()),
                 "project": self.project_name,
             },
-            session_id=session_id
+            session_id,
         )
-        self._track_event(event)
 
     def complete_workflow_execution(
         self, 
         workflow_name: str, 
         result: Dict[str, Any],
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        execution_time: Optional[float] = None,
     ) -> None:
         """Track completion of workflow execution.
         
@@ -111,24 +153,26 @@ class LangWatchTracker:
             workflow_name: Name of the workflow
             result: Workflow execution result
             session_id: Optional session identifier
+            execution_time: Optional execution time in seconds
         """
-        event = TrackingEvent(
-            event_type="workflow_complete",
-            data={
+        self._record(
+            "workflow_complete",
+            {
                 "workflow_name": workflow_name,
                 "result_keys": list(result.keys()),
                 "success": True,
+                "execution_time": execution_time,
                 "project": self.project_name,
             },
-            session_id=session_id
+            session_id,
         )
-        self._track_event(event)
 
     def error_workflow_execution(
         self, 
         workflow_name: str, 
         error_message: str,
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        execution_time: Optional[float] = None,
     ) -> None:
         """Track workflow execution error.
         
@@ -136,18 +180,77 @@ class LangWatchTracker:
             workflow_name: Name of the workflow
             error_message: Error message
             session_id: Optional session identifier
+            execution_time: Optional time until the failure in seconds
         """
-        event = TrackingEvent(
-            event_type="workflow_error",
-            data={
+        self._record(
+            "workflow_error",
+            {
                 "workflow_name": workflow_name,
                 "error_message": error_message,
                 "success": False,
+                "execution_time": execution_time,
                 "project": self.project_name,
             },
-            session_id=session_id
+            session_id,
+        )
+
+    def track_batch_execution(
+        self,
+        workflow_name: str,
+        summary: Dict[str, Any],
+        session_id: Optional[str] = None
+    ) -> None:
+        """Track a completed batch of workflow executions as a single event.
+        
+        Args:
+            workflow_name: Name of the workflow
+            summary: Aggregated batch statistics (counts, throughput, latency)
+            session_id: Optional session identifier
+        """
+        self._record(
+            "workflow_batch",
+            {
+                **summary,
+                "workflow_name": workflow_name,
+                "success": summary.get("failed", 0) == 0,
+                "project": self.project_name,
+            },
+            session_id,
+        )
+
+    def track_request_scheduling(
+        self,
+        workflow_name: str,
+        tenant: str,
+        priority: Optional[int],
+        wait_seconds: float,
+        queue_depth: int,
+        admitted: bool = True,
+        session_id: Optional[str] = None
+    ) -> None:
+        """Track a scheduler dispatch or admission rejection.
+        
+        Args:
+            workflow_name: Name of the workflow
+            tenant: Tenant or session the request is accounted to
+            priority: Request priority (None for rejected requests)
+            wait_seconds: Time spent queued (estimated wait for rejections)
+            queue_depth: Number of requests still queued
+            admitted: Whether the request was admitted to the queue
+            session_id: Optional session identifier
+        """
+        self._record(
+            "request_dispatch" if admitted else "request_rejected",
+            {
+                "workflow_name": workflow_name,
+                "tenant": tenant,
+                "priority": priority,
+                "wait_seconds": wait_seconds,
+                "queue_depth": queue_depth,
+                "project": self.project_name,
+            },
+            session_id,
         )
-        self._track_event(event)
 
     def track_agent_execution(
         self,
@@ -155,7 +258,10 @@ class LangWatchTracker:
         input_messages: List[str],
         output_message: str,
         execution_time: float,
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        prompt_tokens: Optional[int] = None,
+        completion_tokens: Optional[int] = None,
+        time_to_first_token: Optional[float] = None,
     ) -> None:
         """Track agent execution.
         
@@ -165,77 +271,252 @@ class LangWatchTracker:
             output_message: Output from the agent
             execution_time: Execution time in seconds
             session_id: Optional session identifier
+            prompt_tokens: Optional prompt token count
+            completion_tokens: Optional completion token count
+            time_to_first_token: Optional latency until the first streamed chunk
         """
-        event = TrackingEvent(
-            event_type="agent_execution",
-            data={
+        self._record(
+            "agent_execution",
+            {
                 "agent_name": agent_name,
                 "input_count": len(input_messages),
                 "output_length": len(output_message),
                 "execution_time": execution_time,
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "time_to_first_token": time_to_first_token,
                 "project": self.project_name,
             },
-            session_id=session_id
+            session_id,
         )
-        self._track_event(event)
 
-    def _track_event(self, event: TrackingEvent) -> None:
-        """Internal method to track an event.
+    def track_node_execution(
+        self,
+        workflow_name: str,
+        node_name: str,
+        execution_time: float,
+        step: Optional[int] = None,
+        input_state_bytes: Optional[int] = None,
+        output_state_bytes: Optional[int] = None,
+        prompt_tokens: Optional[int] = None,
+        completion_tokens: Optional[int] = None,
+        error: Optional[str] = None,
+        session_id: Optional[str] = None,
+    ) -> None:
+        """Track one execution of a graph node.
         
         Args:
-            event: Event to track
+            workflow_name: Name of the workflow
+            node_name: Name of the graph node
+            execution_time: Time between node enter and exit in seconds
+            step: Optional graph iteration step
+            input_state_bytes: Optional serialized size of the node input state
+            output_state_bytes: Optional serialized size of the node state update
+            prompt_tokens: Optional prompt tokens used by model calls in the node
+            completion_tokens: Optional completion tokens used by model calls in the node
+            error: Optional error message if the node failed
+            session_id: Optional session identifier
         """
-        self.events.append(event)
-        self.logger.info(f"Tracked event: {event.event_type} - {event.data}")
+        self._record(
+            "node_execution",
+            {
+                "workflow_name": workflow_name,
+                "node_name": node_name,
+                "execution_time": execution_time,
+                "step": step,
+                "input_state_bytes": input_state_bytes,
+                "output_state_bytes": output_state_bytes,
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "error": error,
+                "success": error is None,
+                "project": self.project_name,
+            },
+            session_id,
+        )
+
+    def track_trace(
+        self,
+        workflow_name: str,
+        spans: List[Dict[str, Any]],
+        session_id: Optional[str] = None,
+    ) -> None:
+        """Track the spans of one traced workflow run.
+        
+        Args:
+            workflow_name: Name of the workflow
+            spans: Spans in OpenTelemetry (OTLP/JSON) form
+            session_id: Optional session identifier
+        """
+        self._record(
+            "trace",
+            {
+                "workflow_name": workflow_name,
+                "trace_id": spans[0]["traceId"] if spans else None,
+                "spans": spans,
+                "project": self.project_name,
+            },
+            session_id,
+        )
+
+    def track_startup(
+        self,
+        metrics: Dict[str, Any],
+        session_id: Optional[str] = None,
+    ) -> None:
+        """Track startup costs (settings load, graph compilation).
+        
+        Args:
+            metrics: Startup timings in seconds and counts
+            session_id: Optional session identifier
+        """
+        self._record(
+            "startup",
+            {**metrics, "project": self.project_name},
+            session_id,
+        )
+
+    def _record(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        session_id: Optional[str] = None,
+    ) -> None:
+        """Internal method to track an event.
+
+        Updates the incremental statistics, retains the event in compact
+        form and queues it for export.
         
-        # TODO: Send to actual LangWatch API
-        if self._initialized:
-            self._send_to_langwatch(event)
+        Args:
+            event_type: Type of event
+            data: Event data
+            session_id: Optional session identifier
+        """
+        event = StoredEvent(event_type, time.time(), data, session_id)
+        self._store.add(event)
+        self._update_statistics(event)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Tracked event: %s - %s", event_type, data)
+
+        self._send_to_langwatch(event)
 
-    def _send_to_langwatch(self, event: TrackingEvent) -> None:
-        """Send event to LangWatch API.
+    def _update_statistics(self, event: StoredEvent) -> None:
+        """Update event counters and latency histograms for one event."""
+        event_type = event.event_type
+        self._event_counts[event_type] = self._event_counts.get(event_type, 0) + 1
+
+        workflow_name = event.data.get("workflow_name")
+        if workflow_name is not None:
+            counts = self._workflow_counts.setdefault(workflow_name, {})
+            counts[event_type] = counts.get(event_type, 0) + 1
+
+        field = LATENCY_FIELDS.get(event_type)
+        latency = event.data.get(field) if field is not None else None
+        if latency is None:
+            return
+        histogram = self._latency.get(event_type)
+        if histogram is None:
+            histogram = self._latency[event_type] = LatencyHistogram()
+        histogram.record(latency)
+        if workflow_name is not None:
+            key = (workflow_name, event_type)
+            histogram = self._workflow_latency.get(key)
+            if histogram is None:
+                histogram = self._workflow_latency[key] = LatencyHistogram()
+            histogram.record(latency)
+            if event_type == "node_execution":
+                key = (workflow_name, event.data["node_name"])
+                histogram = self._node_latency.get(key)
+                if histogram is None:
+                    histogram = self._node_latency[key] = LatencyHistogram()
+                histogram.record(latency)
+
+    def _send_to_langwatch(self, event: StoredEvent) -> None:
+        """Queue an event for batched export to LangWatch.
+
+        Never blocks: the event is dropped (and counted) if the export
+        buffer is full.
         
         Args:
             event: Event to send
         """
-        # TODO: Implement actual LangWatch API integration
-        self.logger.debug(f"Would send to LangWatch: {event}")
+        if self._pipeline is not None:
+            self._pipeline.submit(event._asdict())
+
+    async def flush(self) -> None:
+        """Export all buffered events now."""
+        if self._pipeline is not None:
+            await self._pipeline.flush()
+
+    async def close(self) -> None:
+        """Stop the export worker after exporting buffered events."""
+        if self._pipeline is not None:
+            await self._pipeline.stop()
+            close = getattr(self._pipeline.exporter, "close", None)
+            if close is not None:
+                await close()
 
-    def get_events(self, event_type: Optional[str] = None) -> List[TrackingEvent]:
+    @property
+    def events(self) -> List[TrackingEvent]:
+        """Retained events, oldest first."""
+        return self.get_events()
+
+    def get_events(
+        self, event_type: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[TrackingEvent]:
         """Get tracked events.
         
         Args:
             event_type: Optional filter by event type
+            limit: Optional maximum number of most recent events
             
         Returns:
-            List of tracked events
+            List of retained events, oldest first
         """
-        if event_type is None:
-            return self.events.copy()
-        
-        return [event for event in self.events if event.event_type == event_type]
+        return [
+            TrackingEvent.model_construct(**event._asdict())
+            for event in self._store.get(event_type, limit)
+        ]
 
     def clear_events(self) -> None:
-        """Clear all tracked events."""
-        self.events.clear()
+        """Clear all tracked events and statistics."""
+        self._store.clear()
+        self._event_counts.clear()
+        self._workflow_counts.clear()
+        self._latency.clear()
+        self._workflow_latency.clear()
+        self._node_latency.clear()
         self.logger.info("Cleared all tracked events")
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get tracking statistics.
+
+        Counters and latency histograms are maintained incrementally and
+        cover every tracked event, including events no longer retained.
         
         Returns:
             Dictionary with tracking statistics
         """
-        total_events = len(self.events)
-        event_types = {}
-        
-        for event in self.events:
-            event_types[event.event_type] = event_types.get(event.event_type, 0) + 1
+        workflows: Dict[str, Dict[str, Any]] = {
+            name: {"event_types": dict(counts), "latency": {}, "nodes": {}}
+            for name, counts in self._workflow_counts.items()
+        }
+        for (name, event_type), histogram in self._workflow_latency.items():
+            workflows[name]["latency"][event_type] = histogram.summary()
+        for (name, node_name), histogram in self._node_latency.items():
+            workflows[name]["nodes"][node_name] = histogram.summary()
 
         return {
-            "total_events": total_events,
-            "event_types": event_types,
+            "total_events": sum(self._event_counts.values()),
+            "retained_events": len(self._store),
+            "event_types": dict(self._event_counts),
+            "latency": {
+                event_type: histogram.summary()
+                for event_type, histogram in self._latency.items()
+            },
+            "workflows": workflows,
             "project": self.project_name,
             "endpoint": self.endpoint,
             "initialized": self._initialized,
-        }
\ No newline at end of file
+            "export": self._pipeline.get_stats() if self._pipeline is not None else None,
+        }
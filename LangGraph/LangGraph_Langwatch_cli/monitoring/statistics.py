@@ -0,0 +1,174 @@
+"""Incremental event statistics and bounded, indexed event retention."""
+
+import math
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Any, Deque, Dict, List, NamedTuple, Optional
+
+# Histogram bucket upper bounds: 0.1ms to ~22 minutes, 20% apart. Percentiles
+# interpolate within a bucket, so they are never off by more than its width
+# (20%) and are usually much closer, which is plenty for latency percentiles
+_BUCKET_GROWTH = 1.2
+_BUCKET_BOUNDS: List[float] = [1e-4 * _BUCKET_GROWTH**i for i in range(91)]
+
+
+class StoredEvent(NamedTuple):
+    """Compact retained event (a tuple instead of a validated model)."""
+
+    event_type: str
+    timestamp: float
+    data: Dict[str, Any]
+    session_id: Optional[str]
+
+
+class LatencyHistogram:
+    """Streaming latency histogram with log-spaced buckets.
+
+    Uses constant memory regardless of how many values are recorded;
+    percentiles are interpolated within bucket bounds.
+    """
+
+    __slots__ = ("buckets", "count", "total", "minimum", "maximum")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = 0.0
+
+    def record(self, value: float) -> None:
+        """Record a latency in seconds.
+
+        Args:
+            value: Latency in seconds
+        """
+        index = bisect_left(_BUCKET_BOUNDS, value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def percentile(self, fraction: float) -> float:
+        """Estimate a percentile.
+
+        Args:
+            fraction: Percentile as a fraction (e.g. 0.95)
+
+        Returns:
+            Estimated latency (0.0 if nothing was recorded)
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for index in sorted(self.buckets):
+            in_bucket = self.buckets[index]
+            if seen + in_bucket >= rank:
+                # Assume the bucket's values are spread evenly between its bounds
+                # (narrowed to the recorded minimum and maximum)
+                lower = max(_BUCKET_BOUNDS[index - 1] if index > 0 else 0.0, self.minimum)
+                upper = min(
+                    _BUCKET_BOUNDS[index] if index < len(_BUCKET_BOUNDS) else math.inf,
+                    self.maximum,
+                )
+                return lower + (upper - lower) * (rank - seen) / in_bucket
+            seen += in_bucket
+        return self.maximum
+
+    def summary(self) -> Dict[str, float]:
+        """Summarize the recorded latencies.
+
+        Returns:
+            Count, mean, min, max and p50/p95/p99 estimates
+        """
+        if self.count == 0:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": self.total / self.count,
+            "min": self.minimum,
+            "max": self.maximum,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+        }
+
+
+class EventStore:
+    """Retained events bounded by count and age, indexed by event type.
+
+    Events are kept in arrival order in one deque and in a per-type deque,
+    so eviction and type lookups never scan unrelated events.
+    """
+
+    def __init__(self, max_events: int = 10_000, max_age_seconds: Optional[float] = None):
+        """Initialize the store.
+
+        Args:
+            max_events: Maximum number of retained events
+            max_age_seconds: Maximum event age (None to keep events until evicted by count)
+        """
+        self.max_events = max_events
+        self.max_age_seconds = max_age_seconds
+        self._events: Deque[StoredEvent] = deque()
+        self._by_type: Dict[str, Deque[StoredEvent]] = {}
+
+    def add(self, event: StoredEvent) -> None:
+        """Retain an event, evicting the oldest events beyond the bounds.
+
+        Args:
+            event: Event to retain
+        """
+        self._events.append(event)
+        by_type = self._by_type.get(event.event_type)
+        if by_type is None:
+            by_type = self._by_type[event.event_type] = deque()
+        by_type.append(event)
+        while len(self._events) > self.max_events:
+            self._evict_oldest()
+        self._expire(event.timestamp)
+
+    def get(self, event_type: Optional[str] = None, limit: Optional[int] = None) -> List[StoredEvent]:
+        """Get retained events, oldest first.
+
+        Args:
+            event_type: Optional filter by event type
+            limit: Optional maximum number of most recent events
+
+        Returns:
+            Retained events
+        """
+        self._expire(time.time())
+        events = self._events if event_type is None else self._by_type.get(event_type, ())
+        if limit is not None and limit < len(events):
+            return [events[i] for i in range(len(events) - limit, len(events))]
+        return list(events)
+
+    def clear(self) -> None:
+        """Drop all retained events."""
+        self._events.clear()
+        self._by_type.clear()
+
+    def __len__(self) -> int:
+        """Number of retained events."""
+        return len(self._events)
+
+    def _expire(self, now: float) -> None:
+        """Evict events older than the maximum age."""
+        if self.max_age_seconds is None:
+            return
+        cutoff = now - self.max_age_seconds
+        while self._events and self._events[0].timestamp < cutoff:
+            self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        """Evict the oldest event from the store and its type index."""
+        event = self._events.popleft()
+        by_type = self._by_type[event.event_type]
+        by_type.popleft()
+        if not by_type:
+            del self._by_type[event.event_type]
@@ -1,11 +1,30 @@
 """Base agent class for all LangGraph agents."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Optional,
+)
 
+from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import BaseMessage
 from pydantic import BaseModel, Field
 
+from agents.response_cache import ResponseCache, cache_key
+
+if TYPE_CHECKING:
+    from llm.router import ModelRouter
+
+ExecuteFunction = Callable[[List[BaseMessage], Optional[Dict[str, Any]]], Awaitable[BaseMessage]]
+
 
 class AgentConfig(BaseModel):
     """Configuration for agents."""
@@ -14,21 +33,44 @@ class AgentConfig(BaseModel):
     description: str = Field(..., description="Agent description")
     temperature: float = Field(default=0.7, description="Model temperature")
     max_tokens: int = Field(default=1000, description="Maximum tokens")
-    model_name: str = Field(default="gpt-4", description="Model name")
+    model_name: str = Field(
+        default="auto",
+        description="Backend or deployment to prefer (``auto`` picks the fastest healthy one)",
+    )
+    model_tier: Literal["chat", "reasoning"] = Field(
+        default="chat", description="Model tier the agent's calls are routed to"
+    )
 
 
 class BaseAgent(ABC):
     """Abstract base class for all agents."""
 
-    def __init__(self, config: AgentConfig):
+    # Context keys that affect the response; they are part of the cache key
+    cache_context_keys: ClassVar[FrozenSet[str]] = frozenset()
+
+    def __init__(
+        self,
+        config: AgentConfig,
+        tracker: Optional[Any] = None,
+        response_cache: Optional[ResponseCache] = None,
+        model_router: Optional["ModelRouter"] = None,
+    ):
         """Initialize the agent.
         
         Args:
             config: Agent configuration
+            tracker: Optional monitoring tracker for agent executions
+            response_cache: Optional response cache (used by agents that
+                route ``execute`` through ``run_cached``)
+            model_router: Optional model router (defaults to the shared
+                ``llm.router.model_router``)
         """
         self.config = config
         self.name = config.name
         self.description = config.description
+        self.tracker = tracker
+        self.response_cache = response_cache
+        self.model_router = model_router
 
     @abstractmethod
     async def execute(
@@ -56,6 +98,71 @@ class BaseAgent(ABC):
         """
         pass
 
+    def get_chat_model(self) -> Optional[BaseChatModel]:
+        """Get a chat model routed across the backends of the agent's tier.
+
+        Returns:
+            Routed chat model using the agent's temperature and token limit,
+            or None when no model backends are configured
+        """
+        router = self.model_router
+        if router is None:
+            # Imported here: the llm package depends on this module
+            from llm.router import model_router
+
+            router = model_router
+        return router.chat_model(
+            self.config.model_tier,
+            temperature=self.config.temperature,
+            max_tokens=self.config.max_tokens,
+            preferred=None if self.config.model_name == "auto" else self.config.model_name,
+        )
+
+    def get_cache_version(self) -> str:
+        """Get the version of the prompts behind the agent's responses.
+
+        Changing prompt templates changes the version, so cached responses
+        produced by older templates are no longer used.
+
+        Returns:
+            Version string (empty if the agent has no versioned prompts)
+        """
+        return ""
+
+    async def run_cached(
+        self,
+        messages: List[BaseMessage],
+        context: Optional[Dict[str, Any]],
+        execute: ExecuteFunction,
+    ) -> BaseMessage:
+        """Run an execution through the response cache, if one is configured.
+
+        The cache key covers the message contents, the ``cache_context_keys``
+        entries of the context, the agent config and the prompt version.
+
+        Args:
+            messages: Input messages
+            context: Optional context data
+            execute: Uncached execution
+
+        Returns:
+            Cached or freshly computed response
+        """
+        if self.response_cache is None:
+            return await execute(messages, context)
+
+        key = cache_key(
+            messages,
+            context,
+            self.cache_context_keys,
+            self.config,
+            version=self.get_cache_version(),
+            namespace=type(self).__name__,
+        )
+        return await self.response_cache.get_or_execute(
+            key, lambda: execute(messages, context)
+        )
+
     def get_capabilities(self) -> List[str]:
         """Get list of agent capabilities.
         
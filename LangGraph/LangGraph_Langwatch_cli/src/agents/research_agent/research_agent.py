@@ -1,87 +1,444 @@
 """Research agent implementation."""
 
+import time
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from pathlib import Path
 from typing import Any
 
-from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+)
 
 from agents.base_agent import AgentConfig, BaseAgent
+from agents.response_cache import ResponseCache
+from agents.research_agent.research_engine import ResearchEngine, ResearchResult
+from agents.research_agent.retrievers import Retriever
 
-from ...config.llm_config import llm_config
-from ...config.research_config import research_config
-from ...prompts.prompt_loader import PromptLoader
+from config.settings import settings
+from llm import TokenBudget, estimate_tokens
+from llm.router import ModelRouter
+from llm.token_budget import truncate_to_tokens
+from prompts.prompt_loader import SYNTHESIS_COMPONENTS, PromptLoader
+from prompts.prompt_registry import CompiledTemplate, PromptSet
+
+# Placeholders each synthesis template may use; checked when prompts are loaded
+SYNTHESIS_PLACEHOLDERS = frozenset({"source_count", *SYNTHESIS_COMPONENTS})
+COMPONENT_PLACEHOLDERS = frozenset({"user_query"})
+
+# Defaults for the research scope placeholders of the user message template
+USER_PROMPT_DEFAULTS: dict[str, str] = {
+    "context": "No additional context provided.",
+    "primary_focus": "General research",
+    "time_frame": "Current",
+    "requirements": "None",
+    "deliverables": "Structured research findings with confidence levels.",
+}
 
 
 class ResearchAgent(BaseAgent):
     """Agent specialized in research and information gathering."""
 
-    def __init__(self, config: AgentConfig | None = None):
-        """Initialize the research agent."""
+    cache_context_keys = frozenset(
+        {*USER_PROMPT_DEFAULTS, "depth_level", "research_type"}
+    )
+
+    def __init__(
+        self,
+        config: AgentConfig | None = None,
+        tracker: Any | None = None,
+        chat_model: BaseChatModel | None = None,
+        retrievers: list[Retriever] | None = None,
+        response_cache: ResponseCache | None = None,
+        model_router: ModelRouter | None = None,
+    ):
+        """Initialize the research agent.
+
+        Args:
+            config: Agent configuration (defaults derived from ``settings.llm``)
+            tracker: Optional tracker receiving latency and token counts
+            chat_model: Chat model to use (routed across the configured model
+                backends if None; the agent falls back to mockup responses when
+                neither is available)
+            retrievers: Optional source retrievers; their evidence is added to
+                the prompt context
+            response_cache: Optional cache for identical research requests
+            model_router: Optional model router (defaults to the shared router)
+        """
         if config is None:
             config = AgentConfig(
                 name="research_agent",
                 description="Specializes in research and information gathering",
-                temperature=llm_config.anthropic_chat_temperature,
-                max_tokens=llm_config.max_tokens,
-                model_name="gpt-4",
+                temperature=settings.llm.anthropic_chat_temperature or 0.7,
+                max_tokens=settings.llm.anthropic_max_tokens or 1000,
             )
-        super().__init__(config)
+        super().__init__(config, tracker, response_cache, model_router)
+        self.chat_model = chat_model or self.get_chat_model()
+        self.research_engine = ResearchEngine(retrievers) if retrievers else None
 
         # Load prompt templates
         prompt_file = (
             Path(__file__).parent.parent.parent / "prompts" / "research_agent_prompt.toml"
         )
         self.prompt_loader = PromptLoader(prompt_file)
+        self._compiled_prompt_set: PromptSet | None = None
+        self._synthesis_templates: tuple[
+            CompiledTemplate, dict[str, CompiledTemplate]
+        ] | None = None
+        self._get_synthesis_templates()
+
+    def _get_synthesis_templates(
+        self,
+    ) -> tuple[CompiledTemplate, dict[str, CompiledTemplate]]:
+        """Get the compiled synthesis templates, revalidating after a reload.
+
+        Returns:
+            Compiled synthesis prompt and compiled component templates
+
+        Raises:
+            ValueError: If a template uses placeholders the agent does not supply
+        """
+        prompt_set = self.prompt_loader.get_prompt_set()
+        if (
+            prompt_set is not self._compiled_prompt_set
+            or self._synthesis_templates is None
+        ):
+            synthesis = prompt_set.template("prompts", "synthesis_prompt")
+            synthesis.validate(SYNTHESIS_PLACEHOLDERS)
+            components = self.prompt_loader.get_compiled_synthesis_components()
+            for component in components.values():
+                component.validate(COMPONENT_PLACEHOLDERS)
+            self._synthesis_templates = (synthesis, components)
+            self._compiled_prompt_set = prompt_set
+        return self._synthesis_templates
+
+    def get_token_budget(self, context: dict[str, Any] | None = None) -> TokenBudget:
+        """Get the token budget for a research call.
+
+        Args:
+            context: Optional context; ``depth_level`` overrides the default depth
+
+        Returns:
+            Prompt and completion token budget
+        """
+        depth = (context or {}).get("depth_level", settings.research.default_depth)
+        return TokenBudget.for_agent(self.config, depth)
+
+    def build_messages(
+        self,
+        messages: list[BaseMessage],
+        context: dict[str, Any] | None = None,
+        budget: TokenBudget | None = None,
+    ) -> list[BaseMessage]:
+        """Build the system and user messages for a research call.
+
+        The free-text ``context`` entry is truncated when the prompt would
+        exceed the budget.
+
+        Args:
+            messages: Input messages (the first human message is the query)
+            context: Optional context with research scope parameters
+            budget: Token budget (derived from the context if None)
+
+        Returns:
+            System and user messages within the prompt budget
+
+        Raises:
+            ValueError: If the prompt exceeds the budget even without context
+        """
+        context = context or {}
+        budget = budget or self.get_token_budget(context)
+        values = {
+            **USER_PROMPT_DEFAULTS,
+            **{
+                key: str(value)
+                for key, value in context.items()
+                if key in USER_PROMPT_DEFAULTS and value
+            },
+            "query": self._get_query(messages),
+            "depth_level": context.get("depth_level", settings.research.default_depth),
+        }
+
+        system_prompt = self.prompt_loader.get_system_prompt().strip()
+        research_type = context.get("research_type")
+        if research_type:
+            instructions = self.prompt_loader.get_research_type_prompt(research_type)
+            if instructions:
+                system_prompt += f"\n\n## Research Type:\n{instructions}"
+
+        template = self.prompt_loader.get_compiled("template", "user_message_template")
+        user_prompt = template.format(**values).strip()
+        overflow = (
+            estimate_tokens(system_prompt)
+            + estimate_tokens(user_prompt)
+            - budget.prompt_tokens
+        )
+        if overflow > 0:
+            remaining = estimate_tokens(values["context"]) - overflow
+            if remaining <= 0:
+                msg = (
+                    f"Research prompt exceeds the {budget.prompt_tokens} token "
+                    f"budget by {overflow} tokens"
+                )
+                raise ValueError(msg)
+            values["context"] = truncate_to_tokens(values["context"], remaining)
+            user_prompt = template.format(**values).strip()
+
+        return [SystemMessage(content=system_prompt), HumanMessage(content=user_prompt)]
+
+    async def gather_sources(
+        self,
+        messages: list[BaseMessage],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, Any], ResearchResult | None]:
+        """Gather sources for the query and add them to the prompt context.
+
+        The evidence is fitted into whatever the prompt budget leaves after
+        the templates and any caller-provided context.
+
+        Args:
+            messages: Input messages
+            context: Optional context with research scope parameters
+
+        Returns:
+            Context including the evidence, and the research result (None
+            when no retrievers are configured)
+        """
+        context = dict(context or {})
+        if self.research_engine is None:
+            return context, None
+
+        result = await self.research_engine.research(self._get_query(messages))
+        if result.sources:
+            budget = self.get_token_budget(context)
+            base_context = str(context.get("context") or "")
+            overhead = sum(
+                estimate_tokens(message.content)
+                for message in self.build_messages(
+                    messages, {**context, "context": base_context or " "}, budget
+                )
+            )
+            evidence = result.format_evidence(budget.prompt_tokens - overhead - 8)
+            if evidence:
+                context["context"] = f"{base_context}\n\n## Sources:\n{evidence}".strip()
+        return context, result
+
+    async def _generate(
+        self,
+        messages: list[BaseMessage],
+        context: dict[str, Any] | None = None,
+    ) -> AsyncIterator[AIMessageChunk]:
+        """Stream response chunks from the chat model within the token budget.
+
+        Args:
+            messages: Input messages
+            context: Optional context with research scope parameters
+
+        Yields:
+            Response chunks; streaming stops if the model overruns the
+            completion budget (each streamed content chunk is one token)
+        """
+        budget = self.get_token_budget(context)
+        prompt = self.build_messages(messages, context, budget)
+        model = self.chat_model.bind(max_tokens=budget.completion_tokens)
+
+        completion_tokens = 0
+        async with aclosing(model.astream(prompt)) as chunks:
+            async for chunk in chunks:
+                if chunk.text:
+                    completion_tokens += 1
+                    if completion_tokens > budget.completion_tokens:
+                        break
+                yield chunk
+
+    async def stream(
+        self,
+        messages: list[BaseMessage],
+        context: dict[str, Any] | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream the research response incrementally.
+
+        Args:
+            messages: Input messages
+            context: Optional context with search parameters
+
+        Yields:
+            Response text chunks; the execution is reported to the tracker
+            once the stream is exhausted or closed
+        """
+        context, sources = await self.gather_sources(messages, context)
+        if self.chat_model is None:
+            yield self._mock_research(self._get_query(messages), sources)
+            return
+
+        start = time.perf_counter()
+        time_to_first_token: float | None = None
+        parts: list[str] = []
+        usage = None
+        try:
+            async for chunk in self._generate(messages, context):
+                usage = chunk.usage_metadata or usage
+                if chunk.text:
+                    if time_to_first_token is None:
+                        time_to_first_token = time.perf_counter() - start
+                    parts.append(chunk.text)
+                    yield chunk.text
+        finally:
+            self._track_execution(
+                messages,
+                context,
+                "".join(parts),
+                time.perf_counter() - start,
+                usage,
+                time_to_first_token,
+                # Each streamed content chunk is one token
+                streamed_tokens=len(parts),
+            )
 
     async def execute(
         self,
         messages: list[BaseMessage],
         context: dict[str, Any] | None = None,
     ) -> BaseMessage:
-        """Execute research task.
+        """Execute research task, reusing cached results for identical requests.
         
         Args:
             messages: Input messages
             context: Optional context with search parameters
             
         Returns:
-            Research results as AIMessage
+            Research results as AIMessage (with ``usage_metadata`` when available
+            and the gathered sources in ``response_metadata``)
         """
-        # TODO: Implement actual research logic with Azure OpenAI
-        # This is a mockup implementation
+        return await self.run_cached(messages, context, self._execute)
 
-        user_query = ""
+    def get_cache_version(self) -> str:
+        """Get the prompt version and execution mode behind responses."""
+        mode = "mockup" if self.chat_model is None else "llm"
+        return f"{self.prompt_loader.get_prompt_set().version}:{mode}"
+
+    async def _execute(
+        self,
+        messages: list[BaseMessage],
+        context: dict[str, Any] | None = None,
+    ) -> BaseMessage:
+        """Execute research task without the response cache."""
+        context, sources = await self.gather_sources(messages, context)
+        response_metadata = (
+            {"sources": [source.model_dump() for source in sources.sources]}
+            if sources is not None
+            else {}
+        )
+        if self.chat_model is None:
+            return AIMessage(
+                content=self._mock_research(self._get_query(messages), sources),
+                response_metadata=response_metadata,
+            )
+
+        start = time.perf_counter()
+        time_to_first_token: float | None = None
+        response: AIMessageChunk | None = None
+        async for chunk in self._generate(messages, context):
+            if time_to_first_token is None and chunk.text:
+                time_to_first_token = time.perf_counter() - start
+            response = chunk if response is None else response + chunk
+        execution_time = time.perf_counter() - start
+
+        content = response.text if response is not None else ""
+        usage = response.usage_metadata if response is not None else None
+        result = AIMessage(
+            content=content, usage_metadata=usage, response_metadata=response_metadata
+        )
+
+        self._track_execution(
+            messages, context, content, execution_time, usage, time_to_first_token
+        )
+        return result
+
+    def _track_execution(
+        self,
+        messages: list[BaseMessage],
+        context: dict[str, Any] | None,
+        content: str,
+        execution_time: float,
+        usage: dict[str, Any] | None,
+        time_to_first_token: float | None,
+        streamed_tokens: int | None = None,
+    ) -> None:
+        """Report a model execution to the tracker.
+
+        Completion tokens come from the usage metadata when the provider sent
+        it, else from the streamed chunk count, else from an estimate.
+        """
+        if self.tracker is None:
+            return
+        if usage:
+            completion_tokens = usage["output_tokens"]
+        elif streamed_tokens is not None:
+            completion_tokens = streamed_tokens
+        else:
+            completion_tokens = estimate_tokens(content)
+        self.tracker.track_agent_execution(
+            agent_name=self.name,
+            input_messages=messages,
+            output_message=content,
+            execution_time=execution_time,
+            session_id=(context or {}).get("session_id"),
+            prompt_tokens=usage["input_tokens"] if usage else None,
+            completion_tokens=completion_tokens,
+            time_to_first_token=time_to_first_token,
+        )
+
+    @staticmethod
+    def _get_query(messages: list[BaseMessage]) -> str:
+        """Get the research query from the first human message."""
         for msg in messages:
             if isinstance(msg, HumanMessage):
-                user_query = msg.content
-                break
+                return msg.content
+        return ""
+
+    def _mock_research(
+        self, user_query: str, sources: ResearchResult | None = None
+    ) -> str:
+        """Build a mockup research response from the synthesis templates.
 
-        # Generate research response using synthesis prompt template
-        synthesis_template = self.prompt_loader.get_prompt("prompts", "synthesis_prompt")
+        Used when no chat model is configured.
 
-        # Load synthesis component templates
-        components = self.prompt_loader.get_synthesis_components()
+        Args:
+            user_query: Research query
+            sources: Gathered sources, if retrievers are configured
 
-        # Format each component with user query (for templates that need it)
+        Returns:
+            Mockup research response
+        """
+        synthesis_template, components = self._get_synthesis_templates()
         research_result = synthesis_template.format(
-            source_count=research_config.max_sources,
+            source_count=(
+                len(sources.sources) if sources is not None else settings.research.max_sources
+            ),
             executive_summary=components["executive_summary"].format(user_query=user_query),
             key_findings=components["key_findings"].format(user_query=user_query).strip(),
-            source_analysis=components["source_analysis"].strip(),
-            confidence_assessment=components["confidence_assessment"].strip(),
+            source_analysis=components["source_analysis"].format().strip(),
+            confidence_assessment=components["confidence_assessment"].format().strip(),
             recommendations=components["recommendations"].format(user_query=user_query).strip(),
             further_research=components["further_research"].format(user_query=user_query).strip()
         )
 
         # Add implementation note
-        research_result += "\n\n*Note: This is a mockup response using prompt templates. Actual implementation will integrate with Azure OpenAI for real research capabilities.*"
+        research_result += "\n\n*Note: This is a mockup response using prompt templates. Configure Azure OpenAI for real research capabilities.*"
 
-        return AIMessage(content=research_result)
+        return research_result
 
     async def health_check(self) -> str:
         """Perform health check."""
-        # TODO: Add actual Azure OpenAI connection check
-        return "healthy (mockup mode)"
+        if self.chat_model is None:
+            return "healthy (mockup mode)"
+        return f"healthy (model: {self.config.model_name})"
 
     def get_capabilities(self) -> list[str]:
         """Get research agent capabilities."""
@@ -101,10 +458,12 @@ class ResearchAgent(BaseAgent):
             Dictionary containing research configuration settings
         """
         return {
-            "max_sources": research_config.max_sources,
-            "confidence_threshold": research_config.confidence_threshold,
-            "default_depth": research_config.default_depth,
-            "citation_format": research_config.citation_format,
-            "fact_check_enabled": research_config.fact_check_enabled,
-            "bias_detection_enabled": research_config.bias_detection_enabled,
+            "max_sources": settings.research.max_sources,
+            "confidence_threshold": settings.research.confidence_threshold,
+            "default_depth": settings.research.default_depth,
+            "citation_format": settings.research.citation_format,
+            "fact_check_enabled": settings.research.fact_check_enabled,
+            "bias_detection_enabled": settings.research.bias_detection_enabled,
+            "min_confident_sources": settings.research.min_confident_sources,
+            "max_concurrent_retrievals": settings.research.max_concurrent_retrievals,
         }
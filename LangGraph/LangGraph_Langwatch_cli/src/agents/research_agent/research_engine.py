@@ -0,0 +1,214 @@
+"""Concurrent multi-source research: decompose, fetch, dedupe, rank."""
+
+import asyncio
+import logging
+import re
+from collections.abc import Callable
+
+from pydantic import BaseModel, Field
+
+from agents.research_agent.retrievers import (
+    Retriever,
+    Source,
+    query_terms,
+    relevance_score,
+    tokenize,
+)
+from config.research_config import ResearchConfig
+from config.settings import settings
+from llm.token_budget import estimate_tokens, truncate_to_tokens
+
+logger = logging.getLogger(__name__)
+
+# Separators used to split compound queries into sub-questions
+_SUB_QUESTION_PATTERN = re.compile(r"\?|;|\n|\band\b|\bvs\.?\b|\bversus\b", re.IGNORECASE)
+
+# Word shingle size and Jaccard similarity above which two sources are duplicates
+SHINGLE_SIZE = 3
+DUPLICATE_SIMILARITY = 0.8
+
+
+def decompose_query(query: str, max_sub_questions: int = 4) -> list[str]:
+    """Split a research query into sub-questions.
+
+    The full query always comes first; compound parts ("X and Y", several
+    questions) follow as separate sub-questions.
+
+    Args:
+        query: Research query
+        max_sub_questions: Maximum number of sub-questions returned
+
+    Returns:
+        Distinct sub-questions, the full query first
+    """
+    sub_questions = [query.strip()]
+    for part in _SUB_QUESTION_PATTERN.split(query):
+        part = part.strip(" ,.")
+        if len(query_terms(part)) >= 2 and part not in sub_questions:
+            sub_questions.append(part)
+    return sub_questions[:max_sub_questions]
+
+
+def _shingles(text: str) -> frozenset[tuple[str, ...]]:
+    """Get the word shingles of a text for near-duplicate detection."""
+    words = tokenize(text)
+    if len(words) <= SHINGLE_SIZE:
+        return frozenset({tuple(words)})
+    return frozenset(
+        tuple(words[i : i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)
+    )
+
+
+def is_near_duplicate(
+    shingles: frozenset[tuple[str, ...]],
+    other: frozenset[tuple[str, ...]],
+    threshold: float = DUPLICATE_SIMILARITY,
+) -> bool:
+    """Check whether two shingle sets are near duplicates.
+
+    Args:
+        shingles: Shingles of the first text
+        other: Shingles of the second text
+        threshold: Minimum Jaccard similarity for a duplicate
+
+    Returns:
+        True if the texts are near duplicates
+    """
+    union = len(shingles | other)
+    return union > 0 and len(shingles & other) / union >= threshold
+
+
+class ResearchResult(BaseModel):
+    """Sources gathered for a research query."""
+
+    query: str = Field(..., description="Research query")
+    sub_questions: list[str] = Field(default_factory=list, description="Sub-questions searched")
+    sources: list[Source] = Field(default_factory=list, description="Ranked, deduplicated sources")
+    confident_sources: int = Field(default=0, description="Sources at or above the confidence threshold")
+    duplicates_removed: int = Field(default=0, description="Near-duplicate sources dropped")
+    stopped_early: bool = Field(default=False, description="Whether retrieval stopped on enough evidence")
+    errors: list[str] = Field(default_factory=list, description="Retriever failures")
+
+    def format_evidence(self, max_tokens: int) -> str:
+        """Render the sources as numbered evidence within a token budget.
+
+        Lower-ranked sources are cut first when the budget runs out.
+
+        Args:
+            max_tokens: Token budget for the evidence text
+
+        Returns:
+            Numbered evidence text
+        """
+        parts: list[str] = []
+        remaining = max_tokens
+        for number, source in enumerate(self.sources, start=1):
+            header = f"[{number}] {source.title or source.url or source.retriever}"
+            if source.url and source.title:
+                header += f" ({source.url})"
+            entry = f"{header}\n{source.content.strip()}"
+            tokens = estimate_tokens(entry) + 1
+            if tokens > remaining:
+                if remaining > estimate_tokens(header) + 8:
+                    parts.append(truncate_to_tokens(entry, remaining - 1))
+                break
+            parts.append(entry)
+            remaining -= tokens
+        return "\n\n".join(parts)
+
+
+class ResearchEngine:
+    """Fetch sources for a query concurrently from several retrievers.
+
+    Every (sub-question, retriever) pair is fetched as its own task under a
+    concurrency limit. Results are scored, deduplicated and merged as they
+    arrive, and outstanding fetches are cancelled once enough sources reach
+    ``confidence_threshold``.
+    """
+
+    def __init__(
+        self,
+        retrievers: list[Retriever],
+        config: ResearchConfig | None = None,
+        decompose: Callable[[str], list[str]] = decompose_query,
+    ):
+        """Initialize the engine.
+
+        Args:
+            retrievers: Retriever backends to query
+            config: Research configuration (defaults to the global config)
+            decompose: Function splitting a query into sub-questions
+        """
+        self.retrievers = retrievers
+        self.config = config or settings.research
+        self.decompose = decompose
+
+    async def research(self, query: str, max_sources: int | None = None) -> ResearchResult:
+        """Gather ranked, deduplicated sources for a query.
+
+        Args:
+            query: Research query
+            max_sources: Maximum sources to keep (defaults to ``config.max_sources``)
+
+        Returns:
+            Research result with sources ranked by relevance
+        """
+        max_sources = max_sources or self.config.max_sources
+        sub_questions = self.decompose(query)
+        result = ResearchResult(query=query, sub_questions=sub_questions)
+        if not self.retrievers or max_sources <= 0:
+            return result
+
+        terms = query_terms(query)
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_retrievals)
+        accepted: list[tuple[float, Source, frozenset[tuple[str, ...]]]] = []
+        seen_urls: set[str] = set()
+
+        async def fetch(retriever: Retriever, question: str) -> list[Source]:
+            async with semaphore:
+                try:
+                    return await retriever.retrieve(question, max_sources)
+                except Exception as e:
+                    logger.warning("Retriever %s failed for %r: %s", retriever.name, question, e)
+                    result.errors.append(f"{retriever.name}: {e}")
+                    return []
+
+        tasks = [
+            asyncio.ensure_future(fetch(retriever, question))
+            for question in sub_questions
+            for retriever in self.retrievers
+        ]
+        try:
+            for future in asyncio.as_completed(tasks):
+                sources = await future
+
+                for source in sources:
+                    if source.url and source.url in seen_urls:
+                        result.duplicates_removed += 1
+                        continue
+                    shingles = _shingles(source.content)
+                    if any(is_near_duplicate(shingles, other) for _, _, other in accepted):
+                        result.duplicates_removed += 1
+                        continue
+                    score = relevance_score(terms, tokenize(source.content))
+                    if source.score is not None:
+                        score = max(score, source.score)
+                    if source.url:
+                        seen_urls.add(source.url)
+                    accepted.append((score, source.model_copy(update={"score": score}), shingles))
+
+                result.confident_sources = sum(
+                    1 for score, _, _ in accepted if score >= self.config.confidence_threshold
+                )
+                if result.confident_sources >= min(self.config.min_confident_sources, max_sources):
+                    result.stopped_early = any(not task.done() for task in tasks)
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        accepted.sort(key=lambda item: item[0], reverse=True)
+        result.sources = [source for _, source, _ in accepted[:max_sources]]
+        result.confident_sources = min(result.confident_sources, len(result.sources))
+        return result
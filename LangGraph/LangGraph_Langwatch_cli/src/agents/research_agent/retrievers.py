@@ -0,0 +1,217 @@
+"""Pluggable source retrievers for the research engine."""
+
+import re
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, Protocol, runtime_checkable
+
+from langchain_core.tools import BaseTool
+from pydantic import BaseModel, Field
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+# Words ignored when matching queries against content
+STOP_WORDS = frozenset(
+    {
+        "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how",
+        "in", "is", "it", "of", "on", "or", "that", "the", "to", "was", "what",
+        "when", "where", "which", "who", "why", "with",
+    }
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase words.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Lowercase words in order of appearance
+    """
+    return _WORD_PATTERN.findall(text.lower())
+
+
+def query_terms(text: str) -> frozenset[str]:
+    """Get the significant terms of a query.
+
+    Args:
+        text: Query text
+
+    Returns:
+        Lowercase words without stop words
+    """
+    return frozenset(word for word in tokenize(text) if word not in STOP_WORDS)
+
+
+def relevance_score(terms: frozenset[str], content_words: Iterable[str]) -> float:
+    """Score content by the fraction of query terms it contains.
+
+    Args:
+        terms: Significant query terms
+        content_words: Words of the content
+
+    Returns:
+        Relevance between 0.0 and 1.0
+    """
+    if not terms:
+        return 0.0
+    return len(terms.intersection(content_words)) / len(terms)
+
+
+class Source(BaseModel):
+    """A piece of evidence returned by a retriever."""
+
+    content: str = Field(..., description="Source text")
+    title: str = Field(default="", description="Source title")
+    url: str | None = Field(default=None, description="Source location")
+    retriever: str = Field(default="", description="Name of the retriever")
+    score: float | None = Field(
+        default=None, description="Relevance to the query between 0.0 and 1.0"
+    )
+
+
+@runtime_checkable
+class Retriever(Protocol):
+    """Backend returning sources for a research question."""
+
+    name: str
+
+    async def retrieve(self, query: str, limit: int) -> list[Source]:
+        """Retrieve up to ``limit`` sources for a query."""
+        ...
+
+
+class LocalCorpusRetriever:
+    """Retriever over an in-memory document corpus.
+
+    Documents are tokenized once up front; queries are scored by term overlap.
+    """
+
+    def __init__(self, documents: Iterable[Source | str], name: str = "local_corpus"):
+        """Initialize the retriever.
+
+        Args:
+            documents: Corpus documents (plain strings become untitled sources)
+            name: Retriever name recorded on returned sources
+        """
+        self.name = name
+        self._documents: list[tuple[Source, frozenset[str]]] = []
+        for document in documents:
+            source = document if isinstance(document, Source) else Source(content=document)
+            self._documents.append((source, frozenset(tokenize(source.content))))
+
+    async def retrieve(self, query: str, limit: int) -> list[Source]:
+        """Retrieve the corpus documents most relevant to a query.
+
+        Args:
+            query: Research question
+            limit: Maximum number of sources
+
+        Returns:
+            Matching documents, most relevant first
+        """
+        terms = query_terms(query)
+        scored = [
+            (relevance_score(terms, words), source)
+            for source, words in self._documents
+        ]
+        scored = [item for item in scored if item[0] > 0]
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [
+            source.model_copy(update={"score": score, "retriever": self.name})
+            for score, source in scored[:limit]
+        ]
+
+
+class MCPToolRetriever:
+    """Retriever calling a search tool, e.g. one loaded from an MCP server.
+
+    The tool is invoked with the query and may return a string, a dict or a
+    list of strings/dicts; dicts are read through their ``content``/``text``,
+    ``title`` and ``url`` keys.
+    """
+
+    def __init__(self, tool: BaseTool, query_arg: str = "query", name: str | None = None):
+        """Initialize the retriever.
+
+        Args:
+            tool: LangChain tool to call (MCP adapters expose tools this way)
+            query_arg: Name of the tool argument receiving the query
+            name: Retriever name (defaults to the tool name)
+        """
+        self.tool = tool
+        self.query_arg = query_arg
+        self.name = name or tool.name
+
+    async def retrieve(self, query: str, limit: int) -> list[Source]:
+        """Call the tool and convert its output to sources.
+
+        Args:
+            query: Research question
+            limit: Maximum number of sources
+
+        Returns:
+            Sources parsed from the tool output
+        """
+        output = await self.tool.ainvoke({self.query_arg: query})
+        items = output if isinstance(output, list) else [output]
+        sources = [self._to_source(item) for item in items[:limit]]
+        return [source for source in sources if source.content]
+
+    def _to_source(self, item: Any) -> Source:
+        """Convert one tool output item to a source."""
+        if isinstance(item, dict):
+            return Source(
+                content=str(item.get("content") or item.get("text") or ""),
+                title=str(item.get("title", "")),
+                url=item.get("url"),
+                retriever=self.name,
+                score=item.get("score"),
+            )
+        return Source(content=str(item), retriever=self.name)
+
+
+SearchFunction = Callable[[str, int], Awaitable[list[dict[str, Any]]]]
+
+
+class WebSearchRetriever:
+    """Web search retriever stub.
+
+    Without a search function it returns no sources; pass an async
+    ``search(query, limit)`` returning dicts with ``content``, ``title`` and
+    ``url`` to connect a search API.
+    """
+
+    def __init__(self, search: SearchFunction | None = None, name: str = "web_search"):
+        """Initialize the retriever.
+
+        Args:
+            search: Optional async search function
+            name: Retriever name recorded on returned sources
+        """
+        self.search = search
+        self.name = name
+
+    async def retrieve(self, query: str, limit: int) -> list[Source]:
+        """Search the web for a query.
+
+        Args:
+            query: Research question
+            limit: Maximum number of sources
+
+        Returns:
+            Search results (empty when no search function is configured)
+        """
+        if self.search is None:
+            return []
+        results = await self.search(query, limit)
+        return [
+            Source(
+                content=str(result.get("content", "")),
+                title=str(result.get("title", "")),
+                url=result.get("url"),
+                retriever=self.name,
+                score=result.get("score"),
+            )
+            for result in results[:limit]
+        ]
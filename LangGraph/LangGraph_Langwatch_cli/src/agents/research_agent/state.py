@@ -1,12 +1,172 @@
-from typing import Annotated
+"""Graph state of the research agent.
 
-from pydantic import BaseModel
-from langchain_core.messages import AnyMessage
-from langgraph.graph import add_messages
+Hot graphs rebuild the state on every step, so it is a slotted dataclass
+(no per-step validation) with an append-only message log whose appends
+share the existing history instead of copying it. Input is validated once,
+at the graph boundary, by ``validate_state``.
+"""
 
-from models.relevant_data import RelevantData
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Annotated, Any, overload
 
+from langchain_core.messages import AnyMessage, BaseMessage
+from pydantic import TypeAdapter
 
-class State(BaseModel):
-    messages: Annotated[list[AnyMessage], add_messages] = []
-    relevant_data: RelevantData
\ No newline at end of file
+from models.relevant_data import Evidence, RelevantData, merge_relevant_data
+
+
+class MessageLog(Sequence[BaseMessage]):
+    """Immutable, append-only message history with structural sharing.
+
+    ``append`` returns a new log that points at this one and holds only the
+    new messages, so a step adding one message costs O(1) regardless of the
+    history length. The newest messages are read without touching older
+    ones; a full view is materialized on demand and then reused.
+    """
+
+    __slots__ = ("_parent", "_items", "_length")
+
+    def __init__(self, messages: Iterable[BaseMessage] = ()):
+        """Initialize a log.
+
+        Args:
+            messages: Initial messages
+        """
+        self._parent: MessageLog | None = None
+        self._items: tuple[BaseMessage, ...] = tuple(messages)
+        self._length = len(self._items)
+
+    def append(self, messages: Iterable[BaseMessage]) -> "MessageLog":
+        """Get a log with messages appended (this log is unchanged).
+
+        Args:
+            messages: Messages to append
+
+        Returns:
+            New log sharing this log's history
+        """
+        items = tuple(messages)
+        if not items:
+            return self
+        if not self._length:
+            return MessageLog(items)
+        log = MessageLog.__new__(MessageLog)
+        log._parent = self
+        log._items = items
+        log._length = self._length + len(items)
+        return log
+
+    @overload
+    def __getitem__(self, index: int) -> BaseMessage: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[BaseMessage, ...]: ...
+
+    def __getitem__(self, index: int | slice) -> BaseMessage | tuple[BaseMessage, ...]:
+        """Get a message (recent messages without materializing the history)."""
+        if isinstance(index, int) and -self._length <= index < 0:
+            log: MessageLog | None = self
+            while log is not None:
+                if -index <= len(log._items):
+                    return log._items[index]
+                index += len(log._items)
+                log = log._parent
+        return self._materialize()[index]
+
+    def __iter__(self) -> Iterator[BaseMessage]:
+        """Iterate over the messages, oldest first."""
+        return iter(self._materialize())
+
+    def __len__(self) -> int:
+        """Number of messages."""
+        return self._length
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the messages with another sequence of messages."""
+        if isinstance(other, MessageLog):
+            return self._length == other._length and self._materialize() == other._materialize()
+        if isinstance(other, (list, tuple)):
+            return self._materialize() == tuple(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Short representation of the log."""
+        return f"MessageLog({self._length} messages)"
+
+    def _materialize(self) -> tuple[BaseMessage, ...]:
+        """Flatten the history into this log's own tuple.
+
+        The log then no longer references its parents, so older logs can be
+        freed and later appends share the flat tuple.
+        """
+        if self._parent is None:
+            return self._items
+        chunks = []
+        log: MessageLog | None = self
+        while log is not None:
+            chunks.append(log._items)
+            log = log._parent
+        self._items = tuple(message for chunk in reversed(chunks) for message in chunk)
+        self._parent = None
+        return self._items
+
+
+def append_messages(
+    current: MessageLog, update: MessageLog | BaseMessage | Iterable[BaseMessage]
+) -> MessageLog:
+    """Graph state reducer appending messages to the log.
+
+    Unlike ``add_messages`` it never replaces or removes messages by ID, which
+    is what lets appends share the existing history.
+
+    Args:
+        current: Messages so far
+        update: Message or messages returned by a node
+
+    Returns:
+        Log with the new messages appended
+    """
+    if isinstance(update, BaseMessage):
+        update = (update,)
+    if not len(current) and isinstance(update, MessageLog):
+        return update
+    return current.append(update)
+
+
+@dataclass(slots=True)
+class State:
+    """Research agent graph state."""
+
+    messages: Annotated[MessageLog, append_messages] = field(default_factory=MessageLog)
+    relevant_data: Annotated[RelevantData, merge_relevant_data] = field(
+        default_factory=RelevantData
+    )
+
+
+_MESSAGES = TypeAdapter(list[AnyMessage])
+_EVIDENCE = TypeAdapter(list[Evidence])
+
+
+def validate_state(data: Mapping[str, Any]) -> State:
+    """Validate graph input at the boundary and build the compact state.
+
+    Args:
+        data: Input with ``messages`` (messages or message dicts) and optional
+            ``relevant_data`` (a ``RelevantData`` or evidence items/dicts)
+
+    Returns:
+        State to pass to the graph
+
+    Raises:
+        pydantic.ValidationError: If the input is malformed
+    """
+    relevant_data = data.get("relevant_data", ())
+    if not isinstance(relevant_data, RelevantData):
+        relevant_data = RelevantData(tuple(_EVIDENCE.validate_python(list(relevant_data))))
+    return State(
+        messages=MessageLog(_MESSAGES.validate_python(list(data.get("messages", ())))),
+        relevant_data=relevant_data,
+    )
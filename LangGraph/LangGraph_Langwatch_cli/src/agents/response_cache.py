@@ -0,0 +1,315 @@
+"""Response cache for agent executions with pluggable backends."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+from pydantic import BaseModel
+
+
+def cache_key(
+    messages: List[BaseMessage],
+    context: Optional[Dict[str, Any]],
+    context_keys: Iterable[str],
+    config: BaseModel,
+    version: str = "",
+    namespace: str = "",
+) -> str:
+    """Build a stable cache key for an agent execution.
+
+    Args:
+        messages: Input messages (type and content are hashed)
+        context: Execution context
+        context_keys: Context keys that affect the response
+        config: Agent configuration
+        version: Prompt template version
+        namespace: Key namespace, e.g. the agent class
+
+    Returns:
+        Hex digest identifying the request
+    """
+    context = context or {}
+    payload = {
+        "namespace": namespace,
+        "version": version,
+        "config": config.model_dump(mode="json"),
+        "messages": [[message.type, message.content] for message in messages],
+        "context": {key: context[key] for key in sorted(context_keys) if key in context},
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class CacheBackend(ABC):
+    """Storage for cached responses with TTL and size-bounded eviction."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[BaseMessage]:
+        """Get a cached response, or None if missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, message: BaseMessage) -> None:
+        """Store a response, evicting entries beyond the size bound."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove all entries."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of stored entries (including not yet evicted expired ones)."""
+
+
+class LRUCacheBackend(CacheBackend):
+    """In-process least-recently-used cache."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: Optional[float] = 3600.0) -> None:
+        """Initialize the backend.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            ttl_seconds: Entry lifetime (None for no expiry)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[BaseMessage, float]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[BaseMessage]:
+        """Get a cached response, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        message, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return message.model_copy()
+
+    async def set(self, key: str, message: BaseMessage) -> None:
+        """Store a response, evicting the least recently used entries."""
+        expires_at = (
+            time.monotonic() + self.ttl_seconds if self.ttl_seconds is not None else float("inf")
+        )
+        self._entries[key] = (message.model_copy(), expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of stored entries."""
+        return len(self._entries)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """On-disk cache shared across processes and restarts.
+
+    Database access runs in a worker thread so it does not block the event
+    loop. Eviction removes expired entries first, then the least recently
+    used ones.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_entries: int = 10_000,
+        ttl_seconds: Optional[float] = 86_400.0,
+    ) -> None:
+        """Initialize the backend, creating the database if needed.
+
+        Args:
+            path: SQLite database file
+            max_entries: Maximum number of cached responses
+            ttl_seconds: Entry lifetime (None for no expiry)
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " message TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)"
+            )
+
+    async def get(self, key: str) -> Optional[BaseMessage]:
+        """Get a cached response, or None if missing or expired."""
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, message: BaseMessage) -> None:
+        """Store a response, evicting expired and least recently used entries."""
+        await asyncio.to_thread(self._set, key, json.dumps(message_to_dict(message)))
+
+    async def clear(self) -> None:
+        """Remove all entries."""
+        await asyncio.to_thread(self._execute, "DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        """Number of stored entries."""
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def _get(self, key: str) -> Optional[BaseMessage]:
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT message, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < now:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        return messages_from_dict([json.loads(row[0])])[0]
+
+    def _set(self, key: str, message: str) -> None:
+        now = time.time()
+        expires_at = now + self.ttl_seconds if self.ttl_seconds is not None else float("inf")
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, message, expires_at, now),
+            )
+            self._connection.execute("DELETE FROM responses WHERE expires_at < ?", (now,))
+            self._connection.execute(
+                "DELETE FROM responses WHERE key IN ("
+                " SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def _execute(self, statement: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(statement)
+
+
+class ResponseCache:
+    """Cache agent responses with single-flight de-duplication.
+
+    Concurrent requests with the same key share one execution; its result
+    is stored in the backend for later requests. Failed executions are not
+    cached, and an execution is cancelled once every request waiting for it
+    has been cancelled.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            backend: Storage backend (defaults to an in-process LRU cache)
+        """
+        self.backend = backend if backend is not None else LRUCacheBackend()
+        self.logger = logging.getLogger(__name__)
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._waiters: Dict[asyncio.Future, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    async def get_or_execute(
+        self, key: str, execute: Callable[[], Awaitable[BaseMessage]]
+    ) -> BaseMessage:
+        """Get the cached response for a key, executing it on a miss.
+
+        Args:
+            key: Cache key (see ``cache_key``)
+            execute: Coroutine factory producing the response
+
+        Returns:
+            Cached or freshly computed response
+        """
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self.coalesced += 1
+            return await self._wait(key, in_flight)
+
+        cached = await self.backend.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        # Another request may have started the execution while the backend
+        # lookup was awaited
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self.coalesced += 1
+            return await self._wait(key, in_flight)
+
+        self.misses += 1
+        in_flight = asyncio.ensure_future(self._execute_and_store(key, execute))
+        self._in_flight[key] = in_flight
+        in_flight.add_done_callback(lambda _: self._forget(key, in_flight))
+        return await self._wait(key, in_flight)
+
+    async def _wait(self, key: str, in_flight: asyncio.Future) -> BaseMessage:
+        """Wait for a shared execution, cancelling it when its last waiter is cancelled."""
+        self._waiters[in_flight] = self._waiters.get(in_flight, 0) + 1
+        try:
+            return (await asyncio.shield(in_flight)).model_copy()
+        except asyncio.CancelledError:
+            if self._waiters[in_flight] == 1 and not in_flight.done():
+                in_flight.cancel()
+                self._forget(key, in_flight)
+            raise
+        finally:
+            self._waiters[in_flight] -= 1
+            if not self._waiters[in_flight]:
+                del self._waiters[in_flight]
+
+    def _forget(self, key: str, in_flight: asyncio.Future) -> None:
+        """Stop sharing an execution with new requests."""
+        if self._in_flight.get(key) is in_flight:
+            del self._in_flight[key]
+
+    async def _execute_and_store(
+        self, key: str, execute: Callable[[], Awaitable[BaseMessage]]
+    ) -> BaseMessage:
+        """Run an execution and store its result."""
+        message = await execute()
+        try:
+            await self.backend.set(key, message)
+        except Exception as e:
+            self.logger.warning(f"Failed to cache response: {e}")
+        return message
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache hit, miss and de-duplication counts.
+
+        Returns:
+            Dictionary of cache statistics
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "entries": len(self.backend),
+        }
@@ -0,0 +1,161 @@
+"""Token-bounded chunking and hierarchical map-reduce summarization."""
+
+import asyncio
+import re
+from collections.abc import Awaitable, Callable
+
+from pydantic import BaseModel, Field
+
+from llm.token_budget import CHARS_PER_TOKEN, estimate_tokens, truncate_to_tokens
+
+# Summarize callback: (content, max_tokens, is_reduce) -> summary
+SummarizeFunction = Callable[[str, int, bool], Awaitable[str]]
+
+_PARAGRAPH_PATTERN = re.compile(r"\n\s*\n")
+_SENTENCE_PATTERN = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_text(text: str, chunk_tokens: int) -> list[str]:
+    """Split text into chunks of at most ``chunk_tokens`` tokens.
+
+    Paragraphs are packed greedily; oversized paragraphs are split at
+    sentence boundaries and oversized sentences at the token limit.
+
+    Args:
+        text: Text to split
+        chunk_tokens: Maximum tokens per chunk
+
+    Returns:
+        Chunks in document order
+    """
+    if chunk_tokens <= 0:
+        msg = "chunk_tokens must be positive"
+        raise ValueError(msg)
+    if estimate_tokens(text) <= chunk_tokens:
+        return [text] if text.strip() else []
+
+    pieces: list[str] = []
+    for paragraph in _PARAGRAPH_PATTERN.split(text):
+        if estimate_tokens(paragraph) <= chunk_tokens:
+            pieces.append(paragraph)
+            continue
+        for sentence in _SENTENCE_PATTERN.split(paragraph):
+            if estimate_tokens(sentence) <= chunk_tokens:
+                pieces.append(sentence)
+                continue
+            width = chunk_tokens * CHARS_PER_TOKEN
+            pieces.extend(sentence[i : i + width] for i in range(0, len(sentence), width))
+
+    chunks: list[str] = []
+    current: list[str] = []
+    current_tokens = 0
+    for piece in pieces:
+        if not piece.strip():
+            continue
+        tokens = estimate_tokens(piece) + 1
+        if current and current_tokens + tokens > chunk_tokens:
+            chunks.append("\n\n".join(current))
+            current, current_tokens = [], 0
+        current.append(piece)
+        current_tokens += tokens
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+class MapReduceResult(BaseModel):
+    """Outcome of a map-reduce summarization."""
+
+    summary: str = Field(..., description="Final summary")
+    input_tokens: int = Field(..., description="Estimated tokens of the input")
+    chunks: int = Field(..., description="Chunks summarized in the map step")
+    reduce_rounds: int = Field(..., description="Hierarchical reduce rounds")
+    calls: int = Field(..., description="Summarize calls made")
+
+
+class MapReduceSummarizer:
+    """Summarize arbitrarily long text within a fixed token target.
+
+    The input is split into token-bounded chunks that are summarized
+    concurrently (map). The chunk summaries are then grouped into chunks
+    again and merged round by round (reduce) until they fit the target,
+    so the latency grows with the logarithm of the input size rather
+    than linearly, and no call exceeds the chunk size.
+    """
+
+    def __init__(
+        self,
+        summarize: SummarizeFunction,
+        chunk_tokens: int,
+        max_concurrency: int,
+        max_rounds: int = 8,
+    ):
+        """Initialize the summarizer.
+
+        Args:
+            summarize: Async callback summarizing one chunk
+            chunk_tokens: Maximum tokens of content per summarize call
+            max_concurrency: Maximum concurrent summarize calls
+            max_rounds: Reduce rounds before the result is truncated
+        """
+        self.summarize = summarize
+        self.chunk_tokens = chunk_tokens
+        self.max_rounds = max_rounds
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(self, text: str, max_tokens: int) -> MapReduceResult:
+        """Summarize a text to at most ``max_tokens`` tokens.
+
+        Args:
+            text: Text to summarize
+            max_tokens: Token target of the final summary
+
+        Returns:
+            Final summary and map-reduce statistics
+        """
+        input_tokens = estimate_tokens(text)
+        chunks = split_text(text, self.chunk_tokens)
+        if not chunks:
+            return MapReduceResult(
+                summary="", input_tokens=0, chunks=0, reduce_rounds=0, calls=0
+            )
+
+        # Intermediate summaries get at most half the chunk size so that each
+        # reduce round merges several of them per call; a single chunk goes
+        # straight to the final target.
+        summary_tokens = min(max(max_tokens, self.chunk_tokens // 4), self.chunk_tokens // 2)
+        calls = len(chunks)
+        summaries = await self._summarize_all(
+            chunks, max_tokens if len(chunks) == 1 else summary_tokens, is_reduce=False
+        )
+
+        rounds = 0
+        while estimate_tokens("\n\n".join(summaries)) > max_tokens:
+            if rounds >= self.max_rounds:
+                break
+            rounds += 1
+            groups = split_text("\n\n".join(summaries), self.chunk_tokens)
+            calls += len(groups)
+            summaries = await self._summarize_all(
+                groups, max_tokens if len(groups) == 1 else summary_tokens, is_reduce=True
+            )
+
+        summary = truncate_to_tokens("\n\n".join(summaries), max_tokens)
+        return MapReduceResult(
+            summary=summary,
+            input_tokens=input_tokens,
+            chunks=len(chunks),
+            reduce_rounds=rounds,
+            calls=calls,
+        )
+
+    async def _summarize_all(
+        self, chunks: list[str], max_tokens: int, is_reduce: bool
+    ) -> list[str]:
+        """Summarize chunks concurrently, keeping their order."""
+
+        async def summarize(chunk: str) -> str:
+            async with self._semaphore:
+                return await self.summarize(chunk, max_tokens, is_reduce)
+
+        return list(await asyncio.gather(*(summarize(chunk) for chunk in chunks)))
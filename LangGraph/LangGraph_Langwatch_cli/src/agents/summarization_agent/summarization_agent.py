@@ -1,44 +1,109 @@
 """Summarization agent implementation."""
 
+import re
+import time
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 
 from agents.base_agent import AgentConfig, BaseAgent
+from agents.response_cache import ResponseCache
+from agents.summarization_agent.map_reduce import MapReduceSummarizer
+from config.settings import settings
+from llm.router import ModelRouter
+from llm.token_budget import truncate_to_tokens
+from prompts.prompt_loader import PromptLoader
+
+_FIRST_SENTENCE_PATTERN = re.compile(r"(.+?[.!?])(?:\s|$)", re.DOTALL)
 
 
 class SummarizationAgent(BaseAgent):
     """Agent specialized in content summarization and synthesis."""
 
-    def __init__(self, config: Optional[AgentConfig] = None):
-        """Initialize the summarization agent."""
+    cache_context_keys = frozenset({"summary_style"})
+
+    def __init__(
+        self,
+        config: Optional[AgentConfig] = None,
+        tracker: Optional[Any] = None,
+        chat_model: Optional[BaseChatModel] = None,
+        chunk_tokens: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        response_cache: Optional[ResponseCache] = None,
+        model_router: Optional[ModelRouter] = None,
+    ):
+        """Initialize the summarization agent.
+
+        Args:
+            config: Agent configuration (``max_tokens`` bounds the summary)
+            tracker: Optional tracker receiving latency and token counts
+            chat_model: Chat model to use (routed across the configured model
+                backends if None; the agent falls back to extractive summaries
+                when neither is available)
+            chunk_tokens: Maximum tokens per summarize call
+                (defaults to ``settings.summarization.chunk_tokens``)
+            max_concurrency: Maximum concurrent summarize calls
+                (defaults to ``settings.summarization.max_concurrency``)
+            response_cache: Optional cache for identical summarization requests
+            model_router: Optional model router (defaults to the shared router)
+        """
         if config is None:
             config = AgentConfig(
                 name="summarization_agent",
                 description="Specializes in content summarization and synthesis",
                 temperature=0.2,
                 max_tokens=1500,
-                model_name="gpt-4",
             )
-        super().__init__(config)
+        super().__init__(config, tracker, response_cache, model_router)
+        self.chat_model = chat_model or self.get_chat_model()
+        self.chunk_tokens = chunk_tokens or settings.summarization.chunk_tokens
+        self.max_concurrency = max_concurrency or settings.summarization.max_concurrency
+
+        prompt_file = (
+            Path(__file__).parent.parent.parent / "prompts" / "summarization_agent_prompt.toml"
+        )
+        self.prompt_loader = PromptLoader(prompt_file)
 
     async def execute(
         self,
         messages: List[BaseMessage],
         context: Optional[Dict[str, Any]] = None,
     ) -> BaseMessage:
-        """Execute summarization task.
-        
+        """Execute summarization task, reusing cached summaries for identical requests.
+
         Args:
             messages: Input messages containing content to summarize
             context: Optional context with summarization parameters
-            
+
         Returns:
             Summary as AIMessage
         """
-        # TODO: Implement actual summarization logic with Azure OpenAI
-        # This is a mockup implementation
+        return await self.run_cached(messages, context, self._execute)
+
+    def get_cache_version(self) -> str:
+        """Get the prompt version and chunking behind summaries."""
+        mode = "extractive" if self.chat_model is None else "llm"
+        return f"{self.prompt_loader.get_prompt_set().version}:{mode}:{self.chunk_tokens}"
+
+    async def _execute(
+        self,
+        messages: List[BaseMessage],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> BaseMessage:
+        """Execute summarization task without the response cache.
+
+        Long content is split into chunks that are summarized concurrently
+        and merged hierarchically until the summary fits ``max_tokens``.
         
+        Args:
+            messages: Input messages containing content to summarize
+            context: Optional context with summarization parameters
+            
+        Returns:
+            Summary as AIMessage with map-reduce statistics in ``response_metadata``
+        """
         content_to_summarize = ""
         for msg in messages:
             if isinstance(msg, HumanMessage):
@@ -46,33 +111,114 @@ class SummarizationAgent(BaseAgent):
                 break
 
         # Get summarization style from context
-        summary_style = "comprehensive"
+        summary_style = settings.summarization.default_style
         if context and "summary_style" in context:
             summary_style = context["summary_style"]
+        style_instructions = self.get_style_instructions(summary_style)
 
-        # Mockup summarization response
-        summary = f"""
-        ## Summary ({summary_style} style)
-        
-        **Main Points:**
-        - Key insight 1 from the provided content
-        - Key insight 2 highlighting important details
-        - Key insight 3 providing actionable information
-        
-        **Core Message:**
-        The content discusses important concepts that require attention and further consideration.
-        
-        **Length:** Original content was {len(content_to_summarize)} characters, summarized to essential points.
-        
-        *Note: This is a mockup response. Actual implementation will use Azure OpenAI.*
+        async def summarize(content: str, max_tokens: int, is_reduce: bool) -> str:
+            return await self._summarize_chunk(
+                content, max_tokens, is_reduce, style_instructions
+            )
+
+        start = time.perf_counter()
+        summarizer = MapReduceSummarizer(summarize, self.chunk_tokens, self.max_concurrency)
+        result = await summarizer.run(content_to_summarize, self.config.max_tokens)
+        execution_time = time.perf_counter() - start
+
+        if self.tracker is not None:
+            self.tracker.track_agent_execution(
+                agent_name=self.name,
+                input_messages=messages,
+                output_message=result.summary,
+                execution_time=execution_time,
+                session_id=(context or {}).get("session_id"),
+                prompt_tokens=result.input_tokens,
+            )
+
+        return AIMessage(
+            content=result.summary,
+            response_metadata={
+                "summary_style": summary_style,
+                "mode": "extractive" if self.chat_model is None else "llm",
+                **result.model_dump(exclude={"summary"}),
+            },
+        )
+
+    def get_style_instructions(self, summary_style: str) -> str:
+        """Get the instructions for a summary style.
+
+        Args:
+            summary_style: Style name (e.g. "comprehensive", "brief")
+
+        Returns:
+            Style instructions, or a generic instruction for unknown styles
+        """
+        instructions = self.prompt_loader.get_prompt("styles", summary_style)
+        return instructions or f"Write the summary in a {summary_style} style."
+
+    async def _summarize_chunk(
+        self,
+        content: str,
+        max_tokens: int,
+        is_reduce: bool,
+        style_instructions: str,
+    ) -> str:
+        """Summarize one chunk or merge one group of chunk summaries.
+
+        Args:
+            content: Chunk text or joined summaries
+            max_tokens: Token limit of the summary
+            is_reduce: Whether the content is a group of summaries
+            style_instructions: Summary style instructions
+
+        Returns:
+            Summary text
         """
+        if self.chat_model is None:
+            return self._extract_summary(content, max_tokens)
+
+        template_key = "reduce_message_template" if is_reduce else "map_message_template"
+        prompt = self.prompt_loader.get_compiled("template", template_key).format(
+            max_tokens=max_tokens,
+            style_instructions=style_instructions,
+            content=content,
+        )
+        model = self.chat_model.bind(max_tokens=max_tokens)
+        response = await model.ainvoke(
+            [
+                SystemMessage(content=self.prompt_loader.get_system_prompt().strip()),
+                HumanMessage(content=prompt.strip()),
+            ]
+        )
+        return response.text
 
-        return AIMessage(content=summary.strip())
+    @staticmethod
+    def _extract_summary(content: str, max_tokens: int) -> str:
+        """Build an extractive summary from the first sentence of each paragraph.
+
+        Used when no chat model is configured.
+
+        Args:
+            content: Text to summarize
+            max_tokens: Token limit of the summary
+
+        Returns:
+            Extractive summary
+        """
+        sentences = []
+        for paragraph in content.split("\n\n"):
+            paragraph = paragraph.strip()
+            if paragraph:
+                match = _FIRST_SENTENCE_PATTERN.match(paragraph)
+                sentences.append(match.group(1) if match else paragraph)
+        return truncate_to_tokens("\n\n".join(sentences), max_tokens)
 
     async def health_check(self) -> str:
         """Perform health check."""
-        # TODO: Add actual Azure OpenAI connection check
-        return "healthy (mockup mode)"
+        if self.chat_model is None:
+            return "healthy (mockup mode)"
+        return f"healthy (model: {self.config.model_name})"
 
     def get_capabilities(self) -> List[str]:
         """Get summarization agent capabilities."""
@@ -0,0 +1,155 @@
+"""Data structures and statistics for batched workflow execution."""
+
+import time
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+BatchInputs = Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]
+
+
+class BatchItemResult(BaseModel):
+    """Result of a single input within a batch."""
+
+    index: int = Field(..., description="Position of the input in the batch")
+    result: Optional[Dict[str, Any]] = Field(None, description="Workflow result")
+    error: Optional[str] = Field(None, description="Error message if the item failed")
+    latency_seconds: float = Field(..., description="Execution time of the item")
+
+    @property
+    def success(self) -> bool:
+        """Whether the item completed without error."""
+        return self.error is None
+
+
+class BatchSummary(BaseModel):
+    """Aggregate statistics for a completed batch."""
+
+    workflow_name: str = Field(..., description="Name of the executed workflow")
+    total: int = Field(default=0, description="Number of inputs processed")
+    succeeded: int = Field(default=0, description="Number of successful items")
+    failed: int = Field(default=0, description="Number of failed items")
+    elapsed_seconds: float = Field(default=0.0, description="Wall-clock batch duration")
+    throughput_per_second: float = Field(default=0.0, description="Items per second")
+    latency_p50: float = Field(default=0.0, description="Median item latency (s)")
+    latency_p95: float = Field(default=0.0, description="95th percentile latency (s)")
+    latency_p99: float = Field(default=0.0, description="99th percentile latency (s)")
+    errors: Dict[str, int] = Field(default_factory=dict, description="Error counts by message")
+    node_latency: Dict[str, Dict[str, float]] = Field(
+        default_factory=dict,
+        description="Per-node execution count and latency percentiles (s) across items",
+    )
+
+
+class BatchReport(BaseModel):
+    """Results of a batch ordered by input index, with its summary."""
+
+    results: List[BatchItemResult] = Field(default_factory=list)
+    summary: BatchSummary
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Get a nearest-rank percentile from pre-sorted values.
+
+    Args:
+        sorted_values: Values sorted in ascending order
+        pct: Percentile in the range 0-100
+
+    Returns:
+        Percentile value, or 0.0 for an empty list
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[min(int(rank), len(sorted_values)) - 1]
+
+
+class BatchStats:
+    """Collect per-item outcomes of a batch and summarize them."""
+
+    def __init__(self, workflow_name: str) -> None:
+        """Initialize the collector.
+
+        Args:
+            workflow_name: Name of the executed workflow
+        """
+        self.workflow_name = workflow_name
+        self.latencies: List[float] = []
+        self.errors: Dict[str, int] = {}
+        self.node_latencies: Dict[str, List[float]] = {}
+        self.started_at = time.perf_counter()
+        self.finished_at: Optional[float] = None
+
+    def record(self, item: BatchItemResult) -> None:
+        """Record the outcome of one item.
+
+        Args:
+            item: Completed batch item
+        """
+        self.latencies.append(item.latency_seconds)
+        if item.error is not None:
+            self.errors[item.error] = self.errors.get(item.error, 0) + 1
+
+    def record_node(self, node: str, seconds: float) -> None:
+        """Record one node execution of an item.
+
+        Args:
+            node: Graph node name
+            seconds: Node execution time
+        """
+        self.node_latencies.setdefault(node, []).append(seconds)
+
+    def finish(self) -> None:
+        """Mark the batch as finished."""
+        self.finished_at = time.perf_counter()
+
+    def summary(self) -> BatchSummary:
+        """Summarize the recorded items.
+
+        Returns:
+            Batch summary with throughput and latency percentiles
+        """
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        elapsed = end - self.started_at
+        latencies = sorted(self.latencies)
+        failed = sum(self.errors.values())
+        return BatchSummary(
+            workflow_name=self.workflow_name,
+            total=len(latencies),
+            succeeded=len(latencies) - failed,
+            failed=failed,
+            elapsed_seconds=elapsed,
+            throughput_per_second=len(latencies) / elapsed if elapsed > 0 else 0.0,
+            latency_p50=percentile(latencies, 50),
+            latency_p95=percentile(latencies, 95),
+            latency_p99=percentile(latencies, 99),
+            errors=dict(self.errors),
+            node_latency={
+                node: {
+                    "count": len(values),
+                    "p50": percentile(values, 50),
+                    "p95": percentile(values, 95),
+                    "p99": percentile(values, 99),
+                }
+                for node, values in (
+                    (node, sorted(values)) for node, values in self.node_latencies.items()
+                )
+            },
+        )
+
+
+async def iterate_inputs(inputs: BatchInputs) -> AsyncIterator[Dict[str, Any]]:
+    """Iterate over sync or async batch inputs uniformly.
+
+    Args:
+        inputs: Iterable or async iterable of workflow inputs
+
+    Yields:
+        Workflow input dictionaries
+    """
+    if hasattr(inputs, "__aiter__"):
+        async for item in inputs:
+            yield item
+    else:
+        for item in inputs:
+            yield item
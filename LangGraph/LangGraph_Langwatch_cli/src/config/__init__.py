@@ -0,0 +1,5 @@
+"""Application settings, loaded once per process on first access."""
+
+from .settings import SettingsProvider, settings
+
+__all__ = ["SettingsProvider", "settings"]
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic_settings import BaseSettings
 
@@ -14,4 +14,12 @@ class ApplicationConfig(BaseSettings):
         env_file_encoding = "utf-8"
         extra = "allow"
 
-application_config = ApplicationConfig()
\ No newline at end of file
+
+# Global instance, built on first access by the settings provider
+def __getattr__(name: str) -> Any:
+    """Resolve ``application_config`` lazily from the shared settings provider."""
+    if name == "application_config":
+        from .settings import settings
+
+        return settings.application
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
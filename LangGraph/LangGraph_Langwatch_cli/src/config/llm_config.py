@@ -1,30 +1,38 @@
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic_settings import BaseSettings
 
 class LLMConfig(BaseSettings):
     # anthropic model configuration
     # left it here to easily switch from openai to anthropic
-    anthropic_region: Optional[str]
-    anthropic_inference_profile_id: Optional[str]
-    anthropic_inference_profile_id_sonnet_3_7: Optional[str]
-    anthropic_inference_profile_id_sonnet_4_0: Optional[str]
-    anthropic_version: Optional[str]
-    anthropic_max_tokens: Optional[int]
-    anthropic_chat_temperature: Optional[float]
-    anthropic_reasoning_temperature: Optional[float]
-    anthropic_thinking_budget_tokens: Optional[int]
+    anthropic_region: Optional[str] = None
+    anthropic_inference_profile_id: Optional[str] = None
+    anthropic_inference_profile_id_sonnet_3_7: Optional[str] = None
+    anthropic_inference_profile_id_sonnet_4_0: Optional[str] = None
+    anthropic_version: Optional[str] = None
+    anthropic_max_tokens: Optional[int] = None
+    anthropic_chat_temperature: Optional[float] = None
+    anthropic_reasoning_temperature: Optional[float] = None
+    anthropic_thinking_budget_tokens: Optional[int] = None
 
     # azure openai model configuration
-    openai_api_base: Optional[str]
-    openai_api_version: Optional[str]
-    openai_api_key: Optional[str]
-    openai_reasoning_deployment_name: Optional[str]
-    openai_chat_deployment_name: Optional[str]
+    openai_api_base: Optional[str] = None
+    openai_api_version: Optional[str] = None
+    openai_api_key: Optional[str] = None
+    openai_reasoning_deployment_name: Optional[str] = None
+    openai_chat_deployment_name: Optional[str] = None
 
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
         extra = "allow"
 
-llm_config = LLMConfig()
\ No newline at end of file
+
+# Global instance, built on first access by the settings provider
+def __getattr__(name: str) -> Any:
+    """Resolve ``llm_config`` lazily from the shared settings provider."""
+    if name == "llm_config":
+        from .settings import settings
+
+        return settings.llm
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
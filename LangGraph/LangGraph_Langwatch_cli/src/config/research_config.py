@@ -1,6 +1,6 @@
 """Research agent configuration management."""
 
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic_settings import BaseSettings
 
@@ -14,9 +14,17 @@ class ResearchConfig(BaseSettings):
     citation_format: Literal["academic", "apa", "mla", "chicago"] = "academic"
     fact_check_enabled: bool = True
     bias_detection_enabled: bool = True
+    min_confident_sources: int = 3
+    max_concurrent_retrievals: int = 8
 
     model_config = {"env_prefix": "RESEARCH_", "case_sensitive": False}
 
 
-# Global instance
-research_config = ResearchConfig()
+# Global instance, built on first access by the settings provider
+def __getattr__(name: str) -> Any:
+    """Resolve ``research_config`` lazily from the shared settings provider."""
+    if name == "research_config":
+        from .settings import settings
+
+        return settings.research
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
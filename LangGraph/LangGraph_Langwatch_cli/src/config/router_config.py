@@ -0,0 +1,29 @@
+"""Model router configuration management."""
+
+from typing import Any
+
+from pydantic_settings import BaseSettings
+
+
+class RouterConfig(BaseSettings):
+    """Configuration for routing model calls across provider deployments."""
+
+    window_size: int = 100
+    hedging_enabled: bool = True
+    hedge_percentile: float = 95.0
+    hedge_min_samples: int = 20
+    failure_threshold: int = 3
+    failure_cooldown_seconds: float = 30.0
+    rate_limit_cooldown_seconds: float = 10.0
+
+    model_config = {"env_prefix": "ROUTER_", "case_sensitive": False}
+
+
+# Global instance, built on first access by the settings provider
+def __getattr__(name: str) -> Any:
+    """Resolve ``router_config`` lazily from the shared settings provider."""
+    if name == "router_config":
+        from .settings import settings
+
+        return settings.router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,135 @@
+"""Process-wide settings provider.
+
+The environment and ``.env`` are read once per process and each settings
+class is built on first access, so importing the package (CLI start, worker
+spawn) parses nothing. Call ``settings.reload()`` to pick up changes, e.g.
+in tests after patching the environment.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Type, TypeVar
+
+from dotenv import dotenv_values
+from pydantic_settings import BaseSettings
+
+from .application_config import ApplicationConfig
+from .llm_config import LLMConfig
+from .research_config import ResearchConfig
+from .router_config import RouterConfig
+from .summarization_config import SummarizationConfig
+
+SettingsT = TypeVar("SettingsT", bound=BaseSettings)
+
+
+class SettingsProvider:
+    """Parse the environment once and build settings objects lazily."""
+
+    def __init__(self, env_file: Optional[str] = ".env") -> None:
+        """Initialize the provider (nothing is read until first access).
+
+        Args:
+            env_file: Dotenv file to read (None to use the environment only)
+        """
+        self.env_file = env_file
+        self._lock = threading.RLock()
+        self._dotenv: Optional[Dict[str, str]] = None
+        self._instances: Dict[type, BaseSettings] = {}
+        self._load_seconds: Dict[str, float] = {}
+
+    def get(self, config_class: Type[SettingsT]) -> SettingsT:
+        """Get the cached settings object of a class, building it on first use.
+
+        Values come from the environment, then ``.env``, then class defaults.
+
+        Args:
+            config_class: Settings class to build
+
+        Returns:
+            Shared settings instance
+        """
+        instance = self._instances.get(config_class)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(config_class)
+                if instance is None:
+                    values = self._dotenv_values(config_class)
+                    started = time.perf_counter()
+                    instance = config_class(_env_file=None, **values)
+                    self._load_seconds[config_class.__name__] = time.perf_counter() - started
+                    self._instances[config_class] = instance
+        return instance  # type: ignore[return-value]
+
+    @property
+    def llm(self) -> LLMConfig:
+        """LLM provider settings."""
+        return self.get(LLMConfig)
+
+    @property
+    def research(self) -> ResearchConfig:
+        """Research agent settings."""
+        return self.get(ResearchConfig)
+
+    @property
+    def summarization(self) -> SummarizationConfig:
+        """Summarization agent settings."""
+        return self.get(SummarizationConfig)
+
+    @property
+    def router(self) -> RouterConfig:
+        """Model router settings."""
+        return self.get(RouterConfig)
+
+    @property
+    def application(self) -> ApplicationConfig:
+        """Application settings."""
+        return self.get(ApplicationConfig)
+
+    def reload(self) -> None:
+        """Drop cached values so the next access re-reads the environment."""
+        with self._lock:
+            self._dotenv = None
+            self._instances.clear()
+            self._load_seconds.clear()
+
+    def load_metrics(self) -> Dict[str, Any]:
+        """Get the time spent loading settings, for startup metrics.
+
+        Returns:
+            Seconds spent parsing ``.env`` ("dotenv") and building each
+            settings class, and their total
+        """
+        with self._lock:
+            configs = dict(self._load_seconds)
+        return {
+            "config_load_seconds": sum(configs.values()),
+            "configs": configs,
+        }
+
+    def _dotenv_values(self, config_class: Type[BaseSettings]) -> Dict[str, str]:
+        """Get the ``.env`` values a settings class reads, as init arguments.
+
+        Keys set in the environment are skipped so they keep precedence.
+        """
+        if self._dotenv is None:
+            started = time.perf_counter()
+            values = dotenv_values(self.env_file) if self.env_file else {}
+            self._dotenv = {key.lower(): value for key, value in values.items() if value is not None}
+            self._load_seconds["dotenv"] = time.perf_counter() - started
+
+        prefix = config_class.model_config.get("env_prefix", "").lower()
+        allow_extra = config_class.model_config.get("extra") == "allow"
+        environ = {key.lower() for key in os.environ}
+        values = {}
+        for key, value in self._dotenv.items():
+            if key in environ or not key.startswith(prefix):
+                continue
+            name = key[len(prefix):]
+            if name in config_class.model_fields or allow_extra:
+                values[name] = value
+        return values
+
+
+# Global instance
+settings = SettingsProvider()
@@ -0,0 +1,25 @@
+"""Summarization agent configuration management."""
+
+from typing import Any
+
+from pydantic_settings import BaseSettings
+
+
+class SummarizationConfig(BaseSettings):
+    """Configuration for summarization agent operations."""
+
+    chunk_tokens: int = 4000
+    max_concurrency: int = 8
+    default_style: str = "comprehensive"
+
+    model_config = {"env_prefix": "SUMMARIZATION_", "case_sensitive": False}
+
+
+# Global instance, built on first access by the settings provider
+def __getattr__(name: str) -> Any:
+    """Resolve ``summarization_config`` lazily from the shared settings provider."""
+    if name == "summarization_config":
+        from .settings import settings
+
+        return settings.summarization
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,113 @@
+"""Concurrent, cached health checking for agents and workflows."""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+class HealthChecker:
+    """Run component health checks with timeouts, de-duplication and a TTL cache.
+
+    Results are cached per component instance, so an agent shared by several
+    workflows (or registered on its own as well) is checked once per TTL.
+    Concurrent requests for the same component share one in-flight check.
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0, timeout_seconds: float = 5.0) -> None:
+        """Initialize the health checker.
+
+        Args:
+            ttl_seconds: How long a health status stays fresh
+            timeout_seconds: Per-component health check timeout
+        """
+        self.ttl_seconds = ttl_seconds
+        self.timeout_seconds = timeout_seconds
+        self.logger = logging.getLogger(__name__)
+        # id(component) -> (component, status, checked_at); the component is
+        # kept referenced so its id cannot be reused while cached.
+        self._cache: Dict[int, Tuple[Any, str, float]] = {}
+        self._in_flight: Dict[int, asyncio.Future] = {}
+        self._refresher: Optional[asyncio.Task] = None
+
+    async def check(self, component: Any, max_age: Optional[float] = None) -> str:
+        """Get the health status of a component, using the cache when fresh.
+
+        Args:
+            component: Object with an async ``health_check() -> str`` method
+            max_age: Maximum acceptable age of a cached status (defaults to TTL)
+
+        Returns:
+            Health status string, or ``"error: ..."`` if the check failed
+        """
+        key = id(component)
+        max_age = self.ttl_seconds if max_age is None else max_age
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[2] <= max_age:
+            return cached[1]
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is None:
+            in_flight = asyncio.ensure_future(self._run_check(component))
+            self._in_flight[key] = in_flight
+            in_flight.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(in_flight)
+
+    async def _run_check(self, component: Any) -> str:
+        """Run a single health check under the timeout and cache the result."""
+        try:
+            async with asyncio.timeout(self.timeout_seconds):
+                status = await component.health_check()
+        except TimeoutError:
+            status = f"error: health check timed out after {self.timeout_seconds}s"
+        except Exception as e:
+            status = f"error: {str(e)}"
+        self._cache[id(component)] = (component, status, time.monotonic())
+        return status
+
+    def invalidate(self, component: Optional[Any] = None) -> None:
+        """Drop cached statuses.
+
+        Args:
+            component: Component to invalidate (all components if omitted)
+        """
+        if component is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(id(component), None)
+
+    def start_refresher(
+        self,
+        refresh: Callable[[], Awaitable[Any]],
+        interval_seconds: Optional[float] = None,
+    ) -> None:
+        """Start a background task that keeps cached statuses warm.
+
+        Args:
+            refresh: Coroutine function re-checking all components
+            interval_seconds: Refresh interval (defaults to half the TTL)
+        """
+        if self._refresher is not None and not self._refresher.done():
+            return
+        interval = interval_seconds or self.ttl_seconds / 2
+
+        async def refresher() -> None:
+            while True:
+                try:
+                    await refresh()
+                except Exception:
+                    self.logger.exception("Background health refresh failed")
+                await asyncio.sleep(interval)
+
+        self._refresher = asyncio.create_task(refresher(), name="health-refresher")
+
+    async def stop_refresher(self) -> None:
+        """Stop the background refresher task."""
+        if self._refresher is None:
+            return
+        self._refresher.cancel()
+        try:
+            await self._refresher
+        except asyncio.CancelledError:
+            pass
+        self._refresher = None
@@ -0,0 +1,15 @@
+"""LLM client construction, token budgeting and local test servers."""
+
+from .client import build_chat_model
+from .router import ModelRouter, ModelRouterError, RoutedChatModel, model_router
+from .token_budget import TokenBudget, estimate_tokens
+
+__all__ = [
+    "ModelRouter",
+    "ModelRouterError",
+    "RoutedChatModel",
+    "TokenBudget",
+    "build_chat_model",
+    "estimate_tokens",
+    "model_router",
+]
@@ -0,0 +1,40 @@
+"""Chat model construction from the LLM configuration."""
+
+from langchain_core.language_models import BaseChatModel
+from langchain_openai import AzureChatOpenAI
+
+from agents.base_agent import AgentConfig
+from config.llm_config import LLMConfig
+
+DEFAULT_API_VERSION = "2024-02-01"
+
+
+def build_chat_model(
+    llm_config: LLMConfig,
+    agent_config: AgentConfig,
+    deployment_name: str | None = None,
+) -> BaseChatModel | None:
+    """Build a streaming Azure OpenAI chat model.
+
+    Args:
+        llm_config: LLM configuration with the Azure OpenAI endpoint and key
+        agent_config: Agent configuration supplying temperature and max tokens
+        deployment_name: Deployment to call (defaults to the chat deployment)
+
+    Returns:
+        Configured chat model, or None when Azure OpenAI is not configured
+    """
+    deployment_name = deployment_name or llm_config.openai_chat_deployment_name
+    if not (llm_config.openai_api_base and llm_config.openai_api_key and deployment_name):
+        return None
+
+    return AzureChatOpenAI(
+        azure_endpoint=llm_config.openai_api_base,
+        api_key=llm_config.openai_api_key,
+        api_version=llm_config.openai_api_version or DEFAULT_API_VERSION,
+        azure_deployment=deployment_name,
+        temperature=agent_config.temperature,
+        max_tokens=agent_config.max_tokens,
+        streaming=True,
+        stream_usage=True,
+    )
@@ -0,0 +1,181 @@
+"""Local fake OpenAI-compatible chat completions server for tests and load tests.
+
+Serves both the OpenAI (``/v1/chat/completions``) and Azure OpenAI
+(``/openai/deployments/<name>/chat/completions``) routes, streaming or not,
+with configurable time-to-first-token and token rate.
+"""
+
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+
+class FakeLLMServer:
+    """Fake chat completions endpoint running in a background thread.
+
+    Each generated token is the word ``"token"`` (followed by a space), and
+    responses are capped by the request's ``max_tokens``.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        response_tokens: int = 50,
+        first_token_latency: float = 0.0,
+        tokens_per_second: float | None = None,
+        record_requests: bool = True,
+    ) -> None:
+        """Initialize the server (call ``start`` or use as a context manager).
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            response_tokens: Tokens generated per response before ``max_tokens``
+            first_token_latency: Delay before the first token in seconds
+            tokens_per_second: Token generation rate (unlimited if None)
+            record_requests: Keep received requests in ``requests`` (disable
+                for long load tests so the log does not grow unbounded)
+        """
+        self.response_tokens = response_tokens
+        self.first_token_latency = first_token_latency
+        self.tokens_per_second = tokens_per_second
+        self.record_requests = record_requests
+        self.requests: list[dict[str, Any]] = []
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        """Root URL of the server (use as Azure endpoint or with ``/v1``)."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeLLMServer":
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeLLMServer":
+        """Start the server."""
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop the server."""
+        self.stop()
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        """Build a request handler bound to this server's settings."""
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def do_POST(self) -> None:  # noqa: N802
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if fake.record_requests:
+                    fake.requests.append({"path": self.path, "body": body})
+                if not self.path.split("?", 1)[0].endswith("/chat/completions"):
+                    self.send_error(404)
+                    return
+                fake._respond(self, body)
+
+        return Handler
+
+    def _respond(self, handler: BaseHTTPRequestHandler, body: dict[str, Any]) -> None:
+        """Write a completion response for a chat request."""
+        max_tokens = body.get("max_completion_tokens") or body.get("max_tokens")
+        count = min(self.response_tokens, max_tokens or self.response_tokens)
+        prompt_tokens = sum(
+            len(str(message.get("content", ""))) // 4 + 1
+            for message in body.get("messages", [])
+        )
+        finish_reason = "length" if max_tokens and count == max_tokens else "stop"
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": count,
+            "total_tokens": prompt_tokens + count,
+        }
+        base = {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "created": int(time.time()),
+            "model": body.get("model") or "fake-model",
+        }
+        time.sleep(self.first_token_latency)
+
+        if not body.get("stream"):
+            self._sleep_for_tokens(count)
+            payload = json.dumps({
+                **base,
+                "object": "chat.completion",
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "token " * count},
+                    "finish_reason": finish_reason,
+                }],
+                "usage": usage,
+            }).encode("utf-8")
+            handler.send_response(200)
+            handler.send_header("Content-Type", "application/json")
+            handler.send_header("Content-Length", str(len(payload)))
+            handler.end_headers()
+            handler.wfile.write(payload)
+            return
+
+        handler.send_response(200)
+        handler.send_header("Content-Type", "text/event-stream")
+        handler.send_header("Connection", "close")
+        handler.end_headers()
+        include_usage = (body.get("stream_options") or {}).get("include_usage")
+        try:
+            for i in range(count):
+                self._sleep_for_tokens(1)
+                delta = {"content": "token "}
+                if i == 0:
+                    delta["role"] = "assistant"
+                self._send_chunk(handler, base, [
+                    {"index": 0, "delta": delta, "finish_reason": None}
+                ])
+            self._send_chunk(handler, base, [
+                {"index": 0, "delta": {}, "finish_reason": finish_reason}
+            ])
+            if include_usage:
+                self._send_chunk(handler, base, [], usage=usage)
+            handler.wfile.write(b"data: [DONE]\n\n")
+            handler.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        handler.close_connection = True
+
+    def _sleep_for_tokens(self, count: int) -> None:
+        """Simulate generation time for a number of tokens."""
+        if self.tokens_per_second:
+            time.sleep(count / self.tokens_per_second)
+
+    @staticmethod
+    def _send_chunk(
+        handler: BaseHTTPRequestHandler,
+        base: dict[str, Any],
+        choices: list[dict[str, Any]],
+        **extra: Any,
+    ) -> None:
+        """Write one streamed completion chunk as a server-sent event."""
+        data = {**base, "object": "chat.completion.chunk", "choices": choices, **extra}
+        handler.wfile.write(f"data: {json.dumps(data)}\n\n".encode("utf-8"))
+        handler.wfile.flush()
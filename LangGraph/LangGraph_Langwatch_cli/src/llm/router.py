@@ -0,0 +1,779 @@
+"""Latency-aware routing of chat model calls across provider deployments.
+
+Every configured deployment (Azure OpenAI chat and reasoning deployments,
+Anthropic inference profiles on Bedrock) is a backend of a tier ("chat" or
+"reasoning"). The router keeps rolling latency, error and rate-limit
+statistics per backend and sends each call to the fastest healthy backend of
+the requested tier. A call still running after the backend's latency
+percentile is hedged to the next backend (the first to answer wins), and a
+failed call fails over to the remaining backends.
+
+Agents get a ``RoutedChatModel`` for their tier, a regular chat model that
+supports ``bind``, ``ainvoke`` and ``astream``.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, Literal, TypeVar
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_openai import AzureChatOpenAI
+
+from batch import percentile
+from config.llm_config import LLMConfig
+from config.router_config import RouterConfig
+
+logger = logging.getLogger(__name__)
+
+ModelTier = Literal["chat", "reasoning"]
+LatencyKind = Literal["latency", "first_token"]
+
+DEFAULT_API_VERSION = "2024-02-01"
+
+ResultT = TypeVar("ResultT")
+
+
+class ModelRouterError(RuntimeError):
+    """Raised when no backend of a tier could serve a call."""
+
+
+def is_rate_limit(error: BaseException) -> bool:
+    """Check whether an error is a provider rate limit (HTTP 429 or throttling)."""
+    name = type(error).__name__
+    return (
+        getattr(error, "status_code", None) == 429
+        or "RateLimit" in name
+        or "Throttl" in name
+    )
+
+
+def retry_after_seconds(error: BaseException) -> float | None:
+    """Get the ``Retry-After`` delay a rate-limited response asked for, if any."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class BackendStats:
+    """Rolling latency, error and rate-limit statistics of one backend."""
+
+    def __init__(self, window_size: int = 100, alpha: float = 0.2) -> None:
+        """Initialize empty statistics.
+
+        Args:
+            window_size: Number of recent calls kept for percentiles and error rate
+            alpha: Smoothing factor of the moving average latency
+        """
+        self.alpha = alpha
+        self.latencies: dict[str, deque[float]] = {
+            "latency": deque(maxlen=window_size),
+            "first_token": deque(maxlen=window_size),
+        }
+        self.average: dict[str, float | None] = {"latency": None, "first_token": None}
+        self.outcomes: deque[bool] = deque(maxlen=window_size)
+        self.calls = 0
+        self.errors = 0
+        self.rate_limits = 0
+        self.consecutive_failures = 0
+        self.last_failure_at = 0.0
+        self.rate_limited_until = 0.0
+        self.in_flight = 0
+
+    def record_success(self, kind: LatencyKind, seconds: float) -> None:
+        """Record a successful call.
+
+        Args:
+            kind: ``latency`` for complete calls, ``first_token`` for streams
+            seconds: Measured latency
+        """
+        self.calls += 1
+        self.consecutive_failures = 0
+        self.outcomes.append(True)
+        self.latencies[kind].append(seconds)
+        average = self.average[kind]
+        self.average[kind] = (
+            seconds if average is None else average + self.alpha * (seconds - average)
+        )
+
+    def record_failure(self, error: BaseException, now: float, rate_limit_cooldown: float) -> None:
+        """Record a failed call.
+
+        Args:
+            error: Raised error
+            now: Monotonic time of the failure
+            rate_limit_cooldown: Seconds to avoid the backend after a rate limit
+                without ``Retry-After``
+        """
+        self.calls += 1
+        self.errors += 1
+        self.consecutive_failures += 1
+        self.last_failure_at = now
+        self.outcomes.append(False)
+        if is_rate_limit(error):
+            self.rate_limits += 1
+            delay = retry_after_seconds(error)
+            self.rate_limited_until = now + (delay if delay is not None else rate_limit_cooldown)
+
+    @property
+    def error_rate(self) -> float:
+        """Share of failed calls in the window."""
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def expected_latency(self, kind: LatencyKind) -> float:
+        """Get the moving average latency used to rank backends.
+
+        Backends without samples rank first, so each one is tried. Errors
+        inflate the expected latency, since a failed call costs a failover.
+
+        Args:
+            kind: Latency kind of the call
+
+        Returns:
+            Expected latency in seconds
+        """
+        average = self.average[kind]
+        if average is None:
+            other = "first_token" if kind == "latency" else "latency"
+            average = self.average[other] or 0.0
+        return average * (1.0 + self.error_rate)
+
+    def latency_percentile(self, kind: LatencyKind, pct: float) -> float | None:
+        """Get a latency percentile over the window, or None without samples."""
+        values = self.latencies[kind]
+        return percentile(sorted(values), pct) if values else None
+
+    def summary(self) -> dict[str, Any]:
+        """Summarize the statistics."""
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "rate_limits": self.rate_limits,
+            "error_rate": self.error_rate,
+            "in_flight": self.in_flight,
+            **{
+                f"{kind}_{name}": value
+                for kind in ("latency", "first_token")
+                for name, value in (
+                    ("avg", self.average[kind]),
+                    ("p50", self.latency_percentile(kind, 50)),
+                    ("p95", self.latency_percentile(kind, 95)),
+                )
+            },
+        }
+
+
+@dataclass
+class ModelBackend:
+    """One provider deployment serving a model tier."""
+
+    name: str
+    tier: ModelTier
+    model: BaseChatModel
+    provider: str = ""
+    stats: BackendStats = field(default_factory=BackendStats)
+
+
+def build_model_backends(llm_config: LLMConfig) -> list[ModelBackend]:
+    """Build backends for every deployment configured in the LLM configuration.
+
+    Azure OpenAI chat and reasoning deployments are always available.
+    Anthropic inference profiles are used when ``langchain-aws`` is installed.
+
+    Args:
+        llm_config: LLM configuration
+
+    Returns:
+        Backends in configuration order (empty when nothing is configured)
+    """
+    specs: list[tuple[str, ModelTier, str, Callable[[int], BaseChatModel]]] = []
+
+    if llm_config.openai_api_base and llm_config.openai_api_key:
+
+        def azure(deployment: str) -> Callable[[int], BaseChatModel]:
+            return lambda max_retries: AzureChatOpenAI(
+                azure_endpoint=llm_config.openai_api_base,
+                api_key=llm_config.openai_api_key,
+                api_version=llm_config.openai_api_version or DEFAULT_API_VERSION,
+                azure_deployment=deployment,
+                streaming=True,
+                stream_usage=True,
+                max_retries=max_retries,
+            )
+
+        for tier, deployment in (
+            ("chat", llm_config.openai_chat_deployment_name),
+            ("reasoning", llm_config.openai_reasoning_deployment_name),
+        ):
+            if deployment:
+                specs.append((f"azure_openai:{deployment}", tier, "azure_openai", azure(deployment)))
+
+    profiles = [
+        profile
+        for profile in (
+            llm_config.anthropic_inference_profile_id_sonnet_4_0,
+            llm_config.anthropic_inference_profile_id_sonnet_3_7,
+            llm_config.anthropic_inference_profile_id,
+        )
+        if profile
+    ]
+    if profiles and llm_config.anthropic_region:
+        try:
+            from botocore.config import Config
+            from langchain_aws import ChatBedrockConverse
+        except ImportError:
+            logger.warning("langchain-aws is not installed; skipping Anthropic backends")
+        else:
+
+            def bedrock(profile: str, reasoning: bool) -> Callable[[int], BaseChatModel]:
+                thinking = (
+                    {"thinking": {
+                        "type": "enabled",
+                        "budget_tokens": llm_config.anthropic_thinking_budget_tokens,
+                    }}
+                    if reasoning
+                    else None
+                )
+                temperature = (
+                    llm_config.anthropic_reasoning_temperature
+                    if reasoning
+                    else llm_config.anthropic_chat_temperature
+                )
+                # botocore counts the initial request in total_max_attempts
+                return lambda max_retries: ChatBedrockConverse(
+                    model=profile,
+                    region_name=llm_config.anthropic_region,
+                    temperature=temperature,
+                    additional_model_request_fields=thinking,
+                    config=Config(retries={
+                        "mode": "standard",
+                        "total_max_attempts": max_retries + 1,
+                    }),
+                )
+
+            for profile in dict.fromkeys(profiles):
+                specs.append((f"anthropic:{profile}", "chat", "anthropic", bedrock(profile, False)))
+                if llm_config.anthropic_thinking_budget_tokens:
+                    specs.append((
+                        f"anthropic:{profile}:thinking",
+                        "reasoning",
+                        "anthropic",
+                        bedrock(profile, True),
+                    ))
+
+    tier_sizes: dict[str, int] = {}
+    for _, tier, _, _ in specs:
+        tier_sizes[tier] = tier_sizes.get(tier, 0) + 1
+    # Client-side retries hide rate limits from the router; keep them only
+    # when a tier has no other backend to fail over to
+    return [
+        ModelBackend(name, tier, build(0 if tier_sizes[tier] > 1 else 2), provider)
+        for name, tier, provider, build in specs
+    ]
+
+
+class ModelRouter:
+    """Route chat model calls to the fastest healthy backend of a tier."""
+
+    def __init__(
+        self,
+        backends: list[ModelBackend] | None = None,
+        config: RouterConfig | None = None,
+    ) -> None:
+        """Initialize the router.
+
+        Args:
+            backends: Backends to route across (built from ``settings.llm`` on
+                first use if None)
+            config: Router configuration (defaults to ``settings.router``)
+        """
+        self._backends = backends
+        self._config = config
+        if backends is not None:
+            self._reset_windows(backends)
+
+    @property
+    def config(self) -> RouterConfig:
+        """Router configuration."""
+        if self._config is None:
+            from config.settings import settings
+
+            self._config = settings.router
+        return self._config
+
+    @property
+    def backends(self) -> list[ModelBackend]:
+        """All backends (built from the settings on first access)."""
+        if self._backends is None:
+            from config.settings import settings
+
+            backends = build_model_backends(settings.llm)
+            self._reset_windows(backends)
+            self._backends = backends
+        return self._backends
+
+    def reload(self) -> None:
+        """Rebuild backends and statistics from the settings on next use."""
+        self._backends = None
+        self._config = None
+
+    def tiers(self) -> set[str]:
+        """Tiers with at least one backend."""
+        return {backend.tier for backend in self.backends}
+
+    def chat_model(
+        self,
+        tier: ModelTier = "chat",
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        preferred: str | None = None,
+    ) -> "RoutedChatModel | None":
+        """Get a chat model routing calls to this router's backends.
+
+        Args:
+            tier: Model tier; falls back to "chat" when the tier has no backends
+            temperature: Sampling temperature sent with each call
+                (not sent to the reasoning tier)
+            max_tokens: Default completion limit sent with each call
+            preferred: Backend name or deployment to try first while healthy
+
+        Returns:
+            Routed chat model, or None when no backends are configured
+        """
+        tiers = self.tiers()
+        if tier not in tiers:
+            if "chat" not in tiers:
+                return None
+            tier = "chat"
+        return RoutedChatModel(
+            router=self,
+            tier=tier,
+            temperature=None if tier == "reasoning" else temperature,
+            max_tokens=max_tokens,
+            preferred=preferred,
+        )
+
+    def candidates(
+        self, tier: ModelTier, kind: LatencyKind = "latency", preferred: str | None = None
+    ) -> list[ModelBackend]:
+        """Get the backends of a tier in the order they should be tried.
+
+        Healthy backends come first, fastest first; backends that are rate
+        limited or failing are kept as a last resort.
+
+        Args:
+            tier: Model tier
+            kind: Latency kind used for ranking
+            preferred: Backend name or deployment to put first while healthy
+
+        Returns:
+            Ordered backends of the tier
+        """
+        now = time.monotonic()
+        backends = [backend for backend in self.backends if backend.tier == tier]
+        healthy = [backend for backend in backends if self.is_healthy(backend, now)]
+        healthy.sort(key=lambda backend: backend.stats.expected_latency(kind))
+        if preferred:
+            healthy.sort(key=lambda backend: not _matches(backend, preferred))
+        unhealthy = [backend for backend in backends if backend not in healthy]
+        unhealthy.sort(key=lambda backend: backend.stats.rate_limited_until)
+        return healthy + unhealthy
+
+    def is_healthy(self, backend: ModelBackend, now: float | None = None) -> bool:
+        """Check whether a backend should receive traffic.
+
+        A backend is unhealthy while rate limited, and after
+        ``failure_threshold`` consecutive failures until the failure cooldown
+        passes (then one call probes it again).
+        """
+        now = time.monotonic() if now is None else now
+        stats = backend.stats
+        if stats.rate_limited_until > now:
+            return False
+        return not (
+            stats.consecutive_failures >= self.config.failure_threshold
+            and now - stats.last_failure_at < self.config.failure_cooldown_seconds
+        )
+
+    def hedge_delay(self, backend: ModelBackend, kind: LatencyKind) -> float | None:
+        """Get how long to wait on a backend before hedging to another one.
+
+        Returns:
+            The backend's ``hedge_percentile`` latency, or None while hedging
+            is disabled or the backend has too few samples
+        """
+        if not self.config.hedging_enabled:
+            return None
+        if len(backend.stats.latencies[kind]) < self.config.hedge_min_samples:
+            return None
+        return backend.stats.latency_percentile(kind, self.config.hedge_percentile)
+
+    async def ainvoke(
+        self,
+        tier: ModelTier,
+        messages: list[BaseMessage],
+        preferred: str | None = None,
+        **kwargs: Any,
+    ) -> tuple[ModelBackend, BaseMessage]:
+        """Call the best backend of a tier, hedging and failing over as needed.
+
+        Args:
+            tier: Model tier
+            messages: Prompt messages
+            preferred: Backend name or deployment to try first while healthy
+            **kwargs: Call arguments (e.g. ``max_tokens``, ``stop``)
+
+        Returns:
+            Backend that answered and its response
+
+        Raises:
+            ModelRouterError: If every backend of the tier failed
+        """
+
+        async def call(backend: ModelBackend) -> BaseMessage:
+            return await backend.model.ainvoke(messages, **kwargs)
+
+        return await self._race(tier, "latency", preferred, call, None)
+
+    async def astream(
+        self,
+        tier: ModelTier,
+        messages: list[BaseMessage],
+        preferred: str | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[tuple[ModelBackend, AIMessageChunk]]:
+        """Stream from the best backend of a tier, hedging and failing over as needed.
+
+        Backends race to the first chunk; the rest of the response comes from
+        the winner. A failure after the first chunk is raised, since the
+        partial response cannot be replayed on another backend.
+
+        Args:
+            tier: Model tier
+            messages: Prompt messages
+            preferred: Backend name or deployment to try first while healthy
+            **kwargs: Call arguments (e.g. ``max_tokens``, ``stop``)
+
+        Yields:
+            Answering backend and each response chunk
+
+        Raises:
+            ModelRouterError: If every backend of the tier failed before streaming
+        """
+
+        async def open_stream(
+            backend: ModelBackend,
+        ) -> tuple[AIMessageChunk | None, AsyncIterator[AIMessageChunk]]:
+            chunks = aiter(backend.model.astream(messages, **kwargs))
+            try:
+                return await anext(chunks), chunks
+            except StopAsyncIteration:
+                return None, chunks
+            except BaseException:
+                await chunks.aclose()
+                raise
+
+        async def discard(result: tuple[Any, AsyncIterator[AIMessageChunk]]) -> None:
+            await result[1].aclose()
+
+        backend, (first, chunks) = await self._race(
+            tier, "first_token", preferred, open_stream, discard
+        )
+        try:
+            if first is not None:
+                yield backend, first
+            async for chunk in chunks:
+                yield backend, chunk
+        except Exception as e:
+            backend.stats.record_failure(
+                e, time.monotonic(), self.config.rate_limit_cooldown_seconds
+            )
+            raise
+        finally:
+            await chunks.aclose()
+
+    def invoke(
+        self,
+        tier: ModelTier,
+        messages: list[BaseMessage],
+        preferred: str | None = None,
+        **kwargs: Any,
+    ) -> tuple[ModelBackend, BaseMessage]:
+        """Call a tier synchronously, failing over in order (no hedging).
+
+        Raises:
+            ModelRouterError: If every backend of the tier failed
+        """
+        errors = []
+        for backend in self.candidates(tier, "latency", preferred):
+            started = time.perf_counter()
+            try:
+                response = backend.model.invoke(messages, **kwargs)
+            except Exception as e:
+                self._record_failure(backend, e)
+                errors.append(f"{backend.name}: {type(e).__name__}: {e}")
+                continue
+            backend.stats.record_success("latency", time.perf_counter() - started)
+            return backend, response
+        raise ModelRouterError(_failure_message(tier, errors))
+
+    def get_statistics(self) -> dict[str, dict[str, Any]]:
+        """Get per-backend statistics and health.
+
+        Returns:
+            Statistics keyed by backend name
+        """
+        now = time.monotonic()
+        return {
+            backend.name: {
+                "tier": backend.tier,
+                "provider": backend.provider,
+                "healthy": self.is_healthy(backend, now),
+                **backend.stats.summary(),
+            }
+            for backend in self.backends
+        }
+
+    async def _race(
+        self,
+        tier: ModelTier,
+        kind: LatencyKind,
+        preferred: str | None,
+        call: Callable[[ModelBackend], Awaitable[ResultT]],
+        discard: Callable[[ResultT], Awaitable[None]] | None,
+    ) -> tuple[ModelBackend, ResultT]:
+        """Run a call on the best backend, hedging once and failing over.
+
+        Args:
+            tier: Model tier
+            kind: Latency kind recorded for successful calls
+            preferred: Backend name or deployment to try first while healthy
+            call: Call to run on a backend
+            discard: Cleanup for successful results that lost the race
+
+        Returns:
+            Winning backend and its result
+
+        Raises:
+            ModelRouterError: If every backend failed
+        """
+        queue = self.candidates(tier, kind, preferred)
+        if not queue:
+            raise ModelRouterError(f"No model backends configured for tier '{tier}'")
+
+        pending: dict[asyncio.Task, ModelBackend] = {}
+        errors: list[str] = []
+        hedged = False
+
+        def launch() -> None:
+            backend = queue.pop(0)
+            pending[asyncio.create_task(self._timed(backend, kind, call))] = backend
+
+        launch()
+        try:
+            while pending:
+                timeout = None
+                if not hedged and queue and len(pending) == 1:
+                    [primary] = pending.values()
+                    timeout = self.hedge_delay(primary, kind)
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    hedged = True
+                    launch()
+                    continue
+
+                winner = None
+                for task in done:
+                    backend = pending.pop(task)
+                    if task.exception() is not None:
+                        error = task.exception()
+                        errors.append(f"{backend.name}: {type(error).__name__}: {error}")
+                    elif winner is None:
+                        winner = backend, task.result()
+                    elif discard is not None:
+                        await discard(task.result())
+                if winner is not None:
+                    return winner
+                if not pending and queue:
+                    launch()
+        finally:
+            for task in pending:
+                task.cancel()
+            for task, _ in list(pending.items()):
+                try:
+                    result = await task
+                except BaseException:
+                    continue
+                if discard is not None:
+                    await discard(result)
+        raise ModelRouterError(_failure_message(tier, errors))
+
+    async def _timed(
+        self,
+        backend: ModelBackend,
+        kind: LatencyKind,
+        call: Callable[[ModelBackend], Awaitable[ResultT]],
+    ) -> ResultT:
+        """Run a call on a backend and record its latency or failure."""
+        stats = backend.stats
+        stats.in_flight += 1
+        started = time.perf_counter()
+        try:
+            result = await call(backend)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._record_failure(backend, e)
+            raise
+        finally:
+            stats.in_flight -= 1
+        stats.record_success(kind, time.perf_counter() - started)
+        return result
+
+    def _record_failure(self, backend: ModelBackend, error: BaseException) -> None:
+        """Record a failed call and log it."""
+        backend.stats.record_failure(
+            error, time.monotonic(), self.config.rate_limit_cooldown_seconds
+        )
+        logger.warning("Model backend %s failed: %s: %s", backend.name, type(error).__name__, error)
+
+    def _reset_windows(self, backends: list[ModelBackend]) -> None:
+        """Size the statistics windows of new backends from the configuration."""
+        for backend in backends:
+            if backend.stats.calls == 0:
+                backend.stats = BackendStats(self.config.window_size)
+
+
+def _matches(backend: ModelBackend, preferred: str) -> bool:
+    """Check whether a backend is the preferred backend or deployment."""
+    return backend.name == preferred or backend.name.split(":", 1)[-1] == preferred
+
+
+def _failure_message(tier: str, errors: list[str]) -> str:
+    """Build the error message for a call every backend failed."""
+    return f"All model backends for tier '{tier}' failed: " + "; ".join(errors)
+
+
+class RoutedChatModel(BaseChatModel):
+    """Chat model whose calls are routed across a tier's backends."""
+
+    router: Any
+    tier: str = "chat"
+    temperature: float | None = None
+    max_tokens: int | None = None
+    preferred: str | None = None
+
+    @property
+    def _llm_type(self) -> str:
+        """Type of the chat model."""
+        return "model_router"
+
+    @property
+    def _identifying_params(self) -> dict[str, Any]:
+        """Parameters identifying the model (used in tracing metadata)."""
+        return {"tier": self.tier, "preferred": self.preferred}
+
+    def _call_kwargs(self, stop: list[str] | None, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Merge the default call arguments with per-call arguments."""
+        defaults: dict[str, Any] = {}
+        if self.temperature is not None:
+            defaults["temperature"] = self.temperature
+        if self.max_tokens is not None:
+            defaults["max_tokens"] = self.max_tokens
+        if stop is not None:
+            defaults["stop"] = stop
+        return {**defaults, **kwargs}
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        """Call the tier synchronously."""
+        backend, response = self.router.invoke(
+            self.tier, messages, self.preferred, **self._call_kwargs(stop, kwargs)
+        )
+        return _chat_result(backend, response)
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        """Call the tier, hedging and failing over across its backends."""
+        backend, response = await self.router.ainvoke(
+            self.tier, messages, self.preferred, **self._call_kwargs(stop, kwargs)
+        )
+        return _chat_result(backend, response)
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        """Stream synchronously (the complete response as one chunk)."""
+        result = self._generate(messages, stop, run_manager, **kwargs)
+        message = result.generations[0].message
+        yield ChatGenerationChunk(
+            message=AIMessageChunk(
+                content=message.content,
+                response_metadata=message.response_metadata,
+                usage_metadata=getattr(message, "usage_metadata", None),
+            )
+        )
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        """Stream from the tier's backend that produces the first chunk."""
+        first = True
+        async for backend, chunk in self.router.astream(
+            self.tier, messages, self.preferred, **self._call_kwargs(stop, kwargs)
+        ):
+            if first:
+                chunk = chunk.model_copy(update={
+                    "response_metadata": {**chunk.response_metadata, "model_backend": backend.name}
+                })
+                first = False
+            generation = ChatGenerationChunk(message=chunk)
+            if run_manager is not None and chunk.text:
+                await run_manager.on_llm_new_token(chunk.text, chunk=generation)
+            yield generation
+
+
+def _chat_result(backend: ModelBackend, response: BaseMessage) -> ChatResult:
+    """Wrap a backend response, recording which backend answered."""
+    message = AIMessage(
+        content=response.content,
+        additional_kwargs=response.additional_kwargs,
+        response_metadata={**response.response_metadata, "model_backend": backend.name},
+        usage_metadata=getattr(response, "usage_metadata", None),
+        id=response.id,
+    )
+    return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+# Global instance
+model_router = ModelRouter()
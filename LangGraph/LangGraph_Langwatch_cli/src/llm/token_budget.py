@@ -0,0 +1,90 @@
+"""Prompt and completion token budgets for agent LLM calls."""
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from agents.base_agent import AgentConfig
+
+ResearchDepth = Literal["surface", "standard", "deep"]
+
+# Completion budget multiplier applied to AgentConfig.max_tokens per depth
+DEPTH_COMPLETION_MULTIPLIERS: dict[str, float] = {
+    "surface": 0.5,
+    "standard": 1.0,
+    "deep": 2.0,
+}
+
+# Prompt budget per depth (system + user messages)
+DEPTH_PROMPT_TOKENS: dict[str, int] = {
+    "surface": 2000,
+    "standard": 4000,
+    "deep": 8000,
+}
+
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text.
+
+    Uses the common ~4 characters per token heuristic, which needs no
+    tokenizer download and is close enough for budgeting; exact counts come
+    from the API usage report.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated number of tokens
+    """
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Truncate a text to roughly ``max_tokens`` tokens.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Token limit
+
+    Returns:
+        Text cut to the estimated limit
+    """
+    return text[: max(0, max_tokens) * CHARS_PER_TOKEN]
+
+
+class TokenBudget(BaseModel):
+    """Token limits for a single LLM call."""
+
+    prompt_tokens: int = Field(..., description="Maximum prompt tokens")
+    completion_tokens: int = Field(..., description="Maximum completion tokens")
+
+    @property
+    def total_tokens(self) -> int:
+        """Combined prompt and completion budget."""
+        return self.prompt_tokens + self.completion_tokens
+
+    @classmethod
+    def for_agent(cls, config: AgentConfig, depth: str = "standard") -> "TokenBudget":
+        """Derive a budget from the agent config and research depth.
+
+        Args:
+            config: Agent configuration (``max_tokens`` is the standard depth budget)
+            depth: Research depth ("surface", "standard" or "deep")
+
+        Returns:
+            Token budget for the call
+
+        Raises:
+            ValueError: If the depth is unknown
+        """
+        if depth not in DEPTH_COMPLETION_MULTIPLIERS:
+            msg = f"Unknown research depth: {depth}"
+            raise ValueError(msg)
+        return cls(
+            prompt_tokens=DEPTH_PROMPT_TOKENS[depth],
+            completion_tokens=max(
+                1, int(config.max_tokens * DEPTH_COMPLETION_MULTIPLIERS[depth])
+            ),
+        )
@@ -0,0 +1,397 @@
+"""Load testing of orchestrated workflows against a local fake LLM server.
+
+Drives ``MainOrchestrator.execute_workflow`` either as a closed loop (a fixed
+number of workers, each sending its next request when the previous one
+completes) or as an open loop (requests arrive at a target rate regardless
+of how many are in flight). Agents call a ``FakeLLMServer`` with configurable
+time to first token and token rate, so runs are repeatable and free.
+
+The report is a JSON-serializable dict with throughput, latency percentiles,
+event-loop lag and a memory/in-flight timeline, meant to be stored per run
+and compared over time.
+"""
+
+import asyncio
+import json
+import random
+import resource
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional
+
+from langchain_openai import AzureChatOpenAI
+from pydantic import BaseModel, Field
+
+from agents.base_agent import AgentConfig
+from agents.research_agent.research_agent import ResearchAgent
+from agents.summarization_agent.summarization_agent import SummarizationAgent
+from batch import BatchItemResult, BatchStats, percentile
+from llm.fake_server import FakeLLMServer
+from orchestrator import MainOrchestrator
+from workflows.research_summarization_workflow import ResearchSummarizationWorkflow
+
+LOADTEST_WORKFLOW = "research_summarization"
+
+DEFAULT_QUERIES = [
+    "What is LangGraph?",
+    "How do multi-agent workflows coordinate state?",
+    "Compare retrieval-augmented generation with fine-tuning",
+    "What are the trade-offs of streaming LLM responses?",
+    "How should agent workflows be monitored in production?",
+]
+
+
+class LoadTestConfig(BaseModel):
+    """Configuration of a load test run."""
+
+    mode: Literal["closed", "open"] = Field(
+        default="closed", description="Closed loop (fixed workers) or open loop (arrival rate)"
+    )
+    concurrency: int = Field(default=8, ge=1, description="Workers (closed) or in-flight cap (open)")
+    arrival_rate: float = Field(default=10.0, gt=0, description="Requests per second (open loop)")
+    poisson: bool = Field(default=True, description="Exponential inter-arrival times (open loop)")
+    duration_seconds: float = Field(default=10.0, gt=0, description="Time to send requests for")
+    max_requests: Optional[int] = Field(default=None, ge=1, description="Stop after this many requests")
+    queries: List[str] = Field(default_factory=lambda: list(DEFAULT_QUERIES))
+    response_tokens: int = Field(default=50, ge=1, description="Tokens per fake LLM response")
+    first_token_latency: float = Field(default=0.05, ge=0, description="Fake LLM time to first token (s)")
+    tokens_per_second: Optional[float] = Field(default=200.0, description="Fake LLM token rate")
+    llm_endpoint: Optional[str] = Field(
+        default=None, description="Use an already running fake LLM server instead of starting one"
+    )
+    sample_interval: float = Field(default=1.0, gt=0, description="Timeline sampling interval (s)")
+    lag_interval: float = Field(default=0.05, gt=0, description="Event-loop lag probe interval (s)")
+    seed: int = Field(default=0, description="Seed for query selection and arrivals")
+
+
+def load_queries(path: str) -> List[str]:
+    """Load a query corpus from a file.
+
+    Args:
+        path: Text file with one query per line, or JSON lines with a
+            ``query`` field
+
+    Returns:
+        Non-empty queries in file order
+
+    Raises:
+        ValueError: If the file contains no queries
+    """
+    queries = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{"):
+            line = str(json.loads(line).get("query", "")).strip()
+        if line:
+            queries.append(line)
+    if not queries:
+        raise ValueError(f"No queries found in {path}")
+    return queries
+
+
+def current_rss_bytes() -> int:
+    """Get the resident set size of this process.
+
+    Falls back to the peak RSS where ``/proc`` is not available.
+
+    Returns:
+        Memory usage in bytes
+    """
+    try:
+        pages = int(Path("/proc/self/statm").read_text().split()[1])
+        return pages * resource.getpagesize()
+    except (OSError, IndexError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class LoopLagMonitor:
+    """Measure event-loop lag by timing how late periodic wake-ups fire."""
+
+    def __init__(self, interval: float = 0.05) -> None:
+        """Initialize the monitor.
+
+        Args:
+            interval: Probe interval in seconds
+        """
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start probing on the running loop."""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop probing."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def recent_max(self, count: int) -> float:
+        """Get the largest lag among the most recent samples.
+
+        Args:
+            count: Number of samples to consider
+
+        Returns:
+            Lag in seconds, or 0.0 without samples
+        """
+        return max(self.samples[-count:], default=0.0)
+
+    def summary(self) -> Dict[str, float]:
+        """Summarize the lag samples in seconds."""
+        lags = sorted(self.samples)
+        return {
+            "samples": len(lags),
+            "mean": sum(lags) / len(lags) if lags else 0.0,
+            "p50": percentile(lags, 50),
+            "p99": percentile(lags, 99),
+            "max": lags[-1] if lags else 0.0,
+        }
+
+    async def _run(self) -> None:
+        """Sleep for the interval and record how late each wake-up is."""
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, time.perf_counter() - started - self.interval))
+
+
+def build_orchestrator(endpoint: str, config: LoadTestConfig) -> MainOrchestrator:
+    """Build an orchestrator running the research summarization workflow.
+
+    Args:
+        endpoint: Base URL of the fake LLM server
+        config: Load test configuration
+
+    Returns:
+        Orchestrator with the workflow registered as ``LOADTEST_WORKFLOW``
+    """
+
+    def chat_model(deployment: str) -> AzureChatOpenAI:
+        return AzureChatOpenAI(
+            azure_endpoint=endpoint,
+            api_key="loadtest-key",
+            api_version="2024-02-01",
+            azure_deployment=deployment,
+            streaming=True,
+            stream_usage=True,
+            max_retries=0,
+        )
+
+    max_tokens = config.response_tokens * 2
+    workflow = ResearchSummarizationWorkflow(
+        research_agent=ResearchAgent(
+            config=AgentConfig(
+                name="research_agent", description="Load test research", max_tokens=max_tokens
+            ),
+            chat_model=chat_model("research"),
+        ),
+        summarization_agent=SummarizationAgent(
+            config=AgentConfig(
+                name="summarization_agent", description="Load test summary", max_tokens=max_tokens
+            ),
+            chat_model=chat_model("summarization"),
+        ),
+    )
+    orchestrator = MainOrchestrator(max_concurrency=config.concurrency)
+    orchestrator.register_workflow(LOADTEST_WORKFLOW, workflow)
+    return orchestrator
+
+
+class LoadTestRunner:
+    """Run one load test against an orchestrator and collect its metrics."""
+
+    def __init__(
+        self,
+        orchestrator: MainOrchestrator,
+        config: LoadTestConfig,
+        workflow_name: str = LOADTEST_WORKFLOW,
+    ) -> None:
+        """Initialize the runner.
+
+        Args:
+            orchestrator: Orchestrator with ``workflow_name`` registered
+            config: Load test configuration
+            workflow_name: Workflow to drive
+        """
+        self.orchestrator = orchestrator
+        self.config = config
+        self.workflow_name = workflow_name
+        self.stats = BatchStats(workflow_name)
+        self.lag = LoopLagMonitor(config.lag_interval)
+        self.timeline: List[Dict[str, Any]] = []
+        self.in_flight = 0
+        self._random = random.Random(config.seed)
+        self._sent = 0
+
+    async def run(self) -> Dict[str, Any]:
+        """Run the load test.
+
+        Returns:
+            JSON-serializable report
+        """
+        self.stats = BatchStats(self.workflow_name)
+        started = time.perf_counter()
+        deadline = started + self.config.duration_seconds
+        memory_start = current_rss_bytes()
+        self.lag.start()
+        sampler = asyncio.create_task(self._sample(started))
+        try:
+            if self.config.mode == "closed":
+                await asyncio.gather(
+                    *(self._worker(deadline) for _ in range(self.config.concurrency))
+                )
+            else:
+                await self._open_loop(deadline)
+        finally:
+            self.stats.finish()
+            sampler.cancel()
+            await asyncio.gather(sampler, return_exceptions=True)
+            await self.lag.stop()
+        self._record_sample(started)
+        return self._report(memory_start)
+
+    def _next_input(self) -> Optional[Dict[str, Any]]:
+        """Get the next workflow input, or None once ``max_requests`` were sent."""
+        if self.config.max_requests is not None and self._sent >= self.config.max_requests:
+            return None
+        self._sent += 1
+        return {"query": self._random.choice(self.config.queries)}
+
+    async def _send(self, input_data: Dict[str, Any], scheduled_at: float) -> None:
+        """Execute one request, measuring latency from its scheduled start."""
+        self.in_flight += 1
+        try:
+            await self.orchestrator.execute_workflow(self.workflow_name, input_data)
+            error = None
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            self.in_flight -= 1
+        self.stats.record(
+            BatchItemResult(
+                index=len(self.stats.latencies),
+                error=error,
+                latency_seconds=time.perf_counter() - scheduled_at,
+            )
+        )
+
+    async def _worker(self, deadline: float) -> None:
+        """Closed loop: send the next request as soon as the previous completes."""
+        while time.perf_counter() < deadline:
+            input_data = self._next_input()
+            if input_data is None:
+                return
+            await self._send(input_data, time.perf_counter())
+
+    async def _open_loop(self, deadline: float) -> None:
+        """Open loop: start requests on an arrival schedule.
+
+        Latency is measured from the scheduled arrival, so requests delayed
+        by the in-flight cap or a lagging loop still count their wait.
+        """
+        semaphore = asyncio.Semaphore(self.config.concurrency)
+        tasks: set[asyncio.Task] = set()
+
+        async def send(input_data: Dict[str, Any], scheduled_at: float) -> None:
+            async with semaphore:
+                await self._send(input_data, scheduled_at)
+
+        next_arrival = time.perf_counter()
+        try:
+            while next_arrival < deadline:
+                delay = next_arrival - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                input_data = self._next_input()
+                if input_data is None:
+                    break
+                task = asyncio.create_task(send(input_data, next_arrival))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                next_arrival += self._interarrival()
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _interarrival(self) -> float:
+        """Get the time until the next open-loop arrival."""
+        if self.config.poisson:
+            return self._random.expovariate(self.config.arrival_rate)
+        return 1.0 / self.config.arrival_rate
+
+    async def _sample(self, started: float) -> None:
+        """Record a timeline sample every ``sample_interval`` seconds."""
+        while True:
+            await asyncio.sleep(self.config.sample_interval)
+            self._record_sample(started)
+
+    def _record_sample(self, started: float) -> None:
+        """Append the current progress, memory and recent lag to the timeline."""
+        probes = max(1, int(self.config.sample_interval / self.config.lag_interval))
+        self.timeline.append({
+            "elapsed_seconds": round(time.perf_counter() - started, 3),
+            "completed": len(self.stats.latencies),
+            "in_flight": self.in_flight,
+            "rss_bytes": current_rss_bytes(),
+            "loop_lag_max_seconds": self.lag.recent_max(probes),
+        })
+
+    def _report(self, memory_start: int) -> Dict[str, Any]:
+        """Build the JSON report."""
+        rss = [sample["rss_bytes"] for sample in self.timeline]
+        memory_end = rss[-1] if rss else memory_start
+        return {
+            "timestamp": time.time(),
+            "config": self.config.model_dump(exclude={"queries"}),
+            "queries": len(self.config.queries),
+            "summary": self.stats.summary().model_dump(),
+            "event_loop_lag": self.lag.summary(),
+            "memory": {
+                "start_bytes": memory_start,
+                "end_bytes": memory_end,
+                "peak_bytes": max(rss, default=memory_start),
+                "growth_bytes": memory_end - memory_start,
+            },
+            "timeline": self.timeline,
+        }
+
+
+async def run_load_test(
+    config: LoadTestConfig,
+    orchestrator: Optional[MainOrchestrator] = None,
+    workflow_name: str = LOADTEST_WORKFLOW,
+) -> Dict[str, Any]:
+    """Run a load test, starting a local fake LLM server when needed.
+
+    Args:
+        config: Load test configuration
+        orchestrator: Orchestrator to drive (built against the fake server if None)
+        workflow_name: Registered workflow to drive
+
+    Returns:
+        JSON-serializable report
+    """
+    if orchestrator is not None:
+        return await LoadTestRunner(orchestrator, config, workflow_name).run()
+
+    if config.llm_endpoint:
+        orchestrator = build_orchestrator(config.llm_endpoint, config)
+        return await LoadTestRunner(orchestrator, config).run()
+
+    with FakeLLMServer(
+        response_tokens=config.response_tokens,
+        first_token_latency=config.first_token_latency,
+        tokens_per_second=config.tokens_per_second,
+        record_requests=False,
+    ) as server:
+        orchestrator = build_orchestrator(server.base_url, config)
+        return await LoadTestRunner(orchestrator, config).run()
@@ -1,20 +1,29 @@
-"""Simple example showing basic LangGraph usage."""
+"""Simple example showing basic LangGraph usage, plus a load test command.
 
+    python src/main.py                   # research "What is LangGraph?"
+    python src/main.py query "..."       # research a query
+    python src/main.py loadtest --help   # load test against a fake LLM server
+"""
+
+import argparse
 import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional
+
 from langchain_core.messages import HumanMessage
 from agents.research_agent.research_agent import ResearchAgent
 from dotenv import load_dotenv
+from loadtest import LoadTestConfig, load_queries, run_load_test
 
-async def main():
+async def run_query(query: str) -> None:
     """Simple example - just one agent doing research."""
 
-    load_dotenv()
-
     # Create agent
     agent = ResearchAgent()
 
     # Test query
-    query = "What is LangGraph?"
     message = HumanMessage(content=query)
 
     print(f"Query: {query}")
@@ -26,5 +35,79 @@ async def main():
     print(f"Result: {result.content}")
 
 
+async def run_loadtest(args: argparse.Namespace) -> None:
+    """Run a load test and write its JSON report."""
+    defaults = LoadTestConfig()
+    config = LoadTestConfig(
+        mode=args.mode,
+        concurrency=args.concurrency,
+        arrival_rate=args.rate,
+        poisson=not args.uniform,
+        duration_seconds=args.duration,
+        max_requests=args.requests,
+        queries=load_queries(args.queries) if args.queries else defaults.queries,
+        response_tokens=args.response_tokens,
+        first_token_latency=args.first_token_latency,
+        tokens_per_second=args.tokens_per_second or None,
+        llm_endpoint=args.llm_endpoint,
+        sample_interval=args.sample_interval,
+        seed=args.seed,
+    )
+    report = json.dumps(await run_load_test(config), indent=2)
+    if args.output:
+        Path(args.output).write_text(report + "\n", encoding="utf-8")
+    else:
+        print(report)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
+    defaults = LoadTestConfig()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command")
+
+    query = commands.add_parser("query", help="Research a single query")
+    query.add_argument("query", nargs="?", default="What is LangGraph?")
+
+    loadtest = commands.add_parser(
+        "loadtest", help="Drive the orchestrator against a local fake LLM server"
+    )
+    loadtest.add_argument("--mode", choices=["closed", "open"], default=defaults.mode,
+                          help="closed: fixed workers; open: fixed arrival rate")
+    loadtest.add_argument("--concurrency", type=int, default=defaults.concurrency,
+                          help="Workers (closed loop) or in-flight cap (open loop)")
+    loadtest.add_argument("--rate", type=float, default=defaults.arrival_rate,
+                          help="Arrivals per second (open loop)")
+    loadtest.add_argument("--uniform", action="store_true",
+                          help="Evenly spaced arrivals instead of Poisson (open loop)")
+    loadtest.add_argument("--duration", type=float, default=defaults.duration_seconds,
+                          help="Seconds to send requests for")
+    loadtest.add_argument("--requests", type=int, default=None,
+                          help="Stop after this many requests")
+    loadtest.add_argument("--queries", help="Query corpus: one query per line or JSON lines")
+    loadtest.add_argument("--response-tokens", type=int, default=defaults.response_tokens)
+    loadtest.add_argument("--first-token-latency", type=float,
+                          default=defaults.first_token_latency, help="Seconds")
+    loadtest.add_argument("--tokens-per-second", type=float,
+                          default=defaults.tokens_per_second, help="0 for unlimited")
+    loadtest.add_argument("--llm-endpoint", help="Use a running fake LLM server")
+    loadtest.add_argument("--sample-interval", type=float, default=defaults.sample_interval,
+                          help="Seconds between timeline samples")
+    loadtest.add_argument("--seed", type=int, default=defaults.seed)
+    loadtest.add_argument("--output", help="Write the JSON report to a file")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the selected command (research a query by default)."""
+    load_dotenv()
+
+    args = build_parser().parse_args(argv)
+    if args.command == "loadtest":
+        asyncio.run(run_loadtest(args))
+    else:
+        asyncio.run(run_query(getattr(args, "query", None) or "What is LangGraph?"))
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main(sys.argv[1:])
@@ -1,2 +1,94 @@
+"""Compact container for evidence retrieved during research."""
+
+import heapq
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, NamedTuple
+
+
+class Evidence(NamedTuple):
+    """One piece of retrieved evidence."""
+
+    content: str
+    title: str = ""
+    url: str = ""
+    retriever: str = ""
+    score: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
 class RelevantData:
-    pass
+    """Immutable, typed collection of retrieved evidence.
+
+    Evidence items are tuples, so the container stays small and cheap to
+    share between graph steps; adding evidence returns a new container.
+    """
+
+    evidence: tuple[Evidence, ...] = ()
+
+    @classmethod
+    def from_sources(cls, sources: Iterable[Any]) -> "RelevantData":
+        """Build the container from retriever sources.
+
+        Args:
+            sources: Objects with ``content``, ``title``, ``url``, ``retriever``
+                and ``score`` attributes (e.g. research agent ``Source``)
+
+        Returns:
+            Container holding one evidence item per source
+        """
+        return cls(
+            tuple(
+                Evidence(source.content, source.title, source.url, source.retriever, source.score)
+                for source in sources
+            )
+        )
+
+    def add(self, evidence: Iterable[Evidence]) -> "RelevantData":
+        """Get a container with additional evidence.
+
+        Args:
+            evidence: Evidence to append
+
+        Returns:
+            New container (this one is unchanged)
+        """
+        evidence = tuple(evidence)
+        if not evidence:
+            return self
+        return RelevantData(self.evidence + evidence)
+
+    def top(self, k: int) -> list[Evidence]:
+        """Get the highest scoring evidence.
+
+        Args:
+            k: Number of items
+
+        Returns:
+            Up to ``k`` items, best first
+        """
+        return heapq.nlargest(k, self.evidence, key=lambda item: item.score)
+
+    def __iter__(self) -> Iterator[Evidence]:
+        """Iterate over the evidence in retrieval order."""
+        return iter(self.evidence)
+
+    def __len__(self) -> int:
+        """Number of evidence items."""
+        return len(self.evidence)
+
+
+def merge_relevant_data(
+    current: RelevantData, update: RelevantData | Iterable[Evidence]
+) -> RelevantData:
+    """Graph state reducer appending new evidence.
+
+    Args:
+        current: Evidence collected so far
+        update: Container or evidence items returned by a node
+
+    Returns:
+        Container with the new evidence appended
+    """
+    if isinstance(update, RelevantData):
+        update = update.evidence
+    return current.add(update)
@@ -1,11 +1,25 @@
 """Main orchestrator for LangGraph workflows with optional monitoring."""
 
-from typing import Any, Dict, List, Optional, Protocol
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Protocol
 
+from langchain_core.callbacks import BaseCallbackManager
 from langgraph.graph import StateGraph
 
-from .agents.base_agent import BaseAgent
-from .workflows.base_workflow import BaseWorkflow
+from agents.base_agent import BaseAgent
+from batch import (
+    BatchInputs,
+    BatchItemResult,
+    BatchReport,
+    BatchStats,
+    iterate_inputs,
+)
+from config.settings import settings
+from health import HealthChecker
+from tracing import WorkflowTracer
+from workflows.base_workflow import BaseWorkflow
+from workflows.graph_registry import graph_registry
 
 
 class MonitoringTracker(Protocol):
@@ -14,8 +28,19 @@ class MonitoringTracker(Protocol):
     def track_agent_registration(self, name: str, agent_class: str) -> None: ...
     def track_workflow_registration(self, name: str, workflow_class: str) -> None: ...
     def start_workflow_execution(self, name: str, input_data: Dict[str, Any]) -> None: ...
-    def complete_workflow_execution(self, name: str, result: Dict[str, Any]) -> None: ...
-    def error_workflow_execution(self, name: str, error: str) -> None: ...
+    def complete_workflow_execution(
+        self, name: str, result: Dict[str, Any], *, execution_time: Optional[float] = None
+    ) -> None: ...
+    def error_workflow_execution(
+        self, name: str, error: str, *, execution_time: Optional[float] = None
+    ) -> None: ...
+    def track_batch_execution(self, name: str, summary: Dict[str, Any]) -> None: ...
+    def track_request_scheduling(self, name: str, **metrics: Any) -> None: ...
+    def track_node_execution(
+        self, name: str, node_name: str, execution_time: float, **metrics: Any
+    ) -> None: ...
+    def track_trace(self, name: str, spans: List[Dict[str, Any]], **kwargs: Any) -> None: ...
+    def track_startup(self, metrics: Dict[str, Any]) -> None: ...
 
 
 class MainOrchestrator:
@@ -24,16 +49,25 @@ class MainOrchestrator:
     def __init__(
         self,
         tracker: Optional[MonitoringTracker] = None,
+        max_concurrency: int = 64,
+        health_checker: Optional[HealthChecker] = None,
     ) -> None:
         """Initialize the orchestrator.
         
         Args:
             tracker: Optional monitoring tracker (langwatch, langfuse, etc)
+            max_concurrency: Global limit on concurrently executing batch items
+            health_checker: Optional health checker (cache TTL and timeouts)
         """
         self.agents: Dict[str, BaseAgent] = {}
         self.workflows: Dict[str, BaseWorkflow] = {}
         self.tracker = tracker
         self.active_graph: Optional[StateGraph] = None
+        self.max_concurrency = max_concurrency
+        self.workflow_concurrency: Dict[str, int] = {}
+        self._global_semaphore: Optional[asyncio.Semaphore] = None
+        self._workflow_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.health_checker = health_checker or HealthChecker()
 
     def register_agent(self, name: str, agent: BaseAgent) -> None:
         """Register an agent with the orchestrator.
@@ -46,17 +80,50 @@ class MainOrchestrator:
         if self.tracker:
             self.tracker.track_agent_registration(name, agent.__class__.__name__)
 
-    def register_workflow(self, name: str, workflow: BaseWorkflow) -> None:
+    def register_workflow(
+        self,
+        name: str,
+        workflow: BaseWorkflow,
+        max_concurrency: Optional[int] = None,
+    ) -> None:
         """Register a workflow with the orchestrator.
         
         Args:
             name: Workflow identifier
             workflow: Workflow instance
+            max_concurrency: Optional limit on concurrent batch items for this workflow
         """
         self.workflows[name] = workflow
+        if max_concurrency is not None:
+            self.workflow_concurrency[name] = max_concurrency
+            self._workflow_semaphores.pop(name, None)
         if self.tracker:
             self.tracker.track_workflow_registration(name, workflow.__class__.__name__)
 
+    async def warm_up(self) -> int:
+        """Compile the graphs of all registered workflows ahead of traffic.
+
+        Call once at startup so the first request does not pay the compile
+        cost. Graphs are shared process-wide, so workflows with the same class
+        and config compile only once. The tracker receives the compile time
+        and the time spent loading settings.
+
+        Returns:
+            Number of graphs compiled
+        """
+        start = time.perf_counter()
+        compiled = await graph_registry.warm_up(self.workflows.values())
+        if self.tracker:
+            compile_seconds = time.perf_counter() - start
+            config_metrics = settings.load_metrics()
+            self.tracker.track_startup({
+                "graphs_compiled": compiled,
+                "graph_compile_seconds": compile_seconds,
+                **config_metrics,
+                "startup_seconds": compile_seconds + config_metrics["config_load_seconds"],
+            })
+        return compiled
+
     async def execute_workflow(
         self,
         workflow_name: str,
@@ -84,19 +151,202 @@ class MainOrchestrator:
         if self.tracker:
             self.tracker.start_workflow_execution(workflow_name, input_data)
 
+        start = time.perf_counter()
         try:
-            result = await workflow.execute(input_data, config or {})
+            result = await workflow.execute(
+                input_data, self._with_tracer(workflow_name, config)
+            )
             
             if self.tracker:
-                self.tracker.complete_workflow_execution(workflow_name, result)
+                self.tracker.complete_workflow_execution(
+                    workflow_name, result, execution_time=time.perf_counter() - start
+                )
                 
             return result
             
         except Exception as e:
             if self.tracker:
-                self.tracker.error_workflow_execution(workflow_name, str(e))
+                self.tracker.error_workflow_execution(
+                    workflow_name, str(e), execution_time=time.perf_counter() - start
+                )
             raise
 
+    async def execute_many(
+        self,
+        workflow_name: str,
+        inputs: BatchInputs,
+        config: Optional[Dict[str, Any]] = None,
+        max_concurrency: Optional[int] = None,
+        stats: Optional[BatchStats] = None,
+    ) -> AsyncIterator[BatchItemResult]:
+        """Execute a workflow over many inputs concurrently.
+
+        Inputs are pulled only when a slot is free, so a large or unbounded
+        async stream is never read ahead of the concurrency limit. Items run
+        under the orchestrator's global and per-workflow limits, shared with
+        every other batch. A failed item is reported in its result and does not
+        stop the batch. The tracker receives one aggregated event per batch,
+        with node latency percentiles instead of per-item node events.
+
+        Args:
+            workflow_name: Name of the workflow to execute
+            inputs: Iterable or async iterable of input data dictionaries
+            config: Optional configuration passed to every execution
+            max_concurrency: Optional in-flight limit for this batch
+            stats: Optional collector to read the batch summary from afterwards
+
+        Yields:
+            Item results in completion order, tagged with their input index
+
+        Raises:
+            ValueError: If workflow is not registered
+        """
+        if workflow_name not in self.workflows:
+            raise ValueError(f"Workflow '{workflow_name}' not registered")
+
+        workflow = self.workflows[workflow_name]
+        stats = stats or BatchStats(workflow_name)
+        limit = min(
+            self.max_concurrency,
+            self.workflow_concurrency.get(workflow_name, self.max_concurrency),
+            max_concurrency or self.max_concurrency,
+        )
+        global_semaphore = self._get_global_semaphore()
+        workflow_semaphore = self._get_workflow_semaphore(workflow_name)
+
+        async def run_item(index: int, input_data: Dict[str, Any]) -> BatchItemResult:
+            async with global_semaphore, workflow_semaphore:
+                # Node spans are folded into the batch event instead of reported per item
+                tracer = WorkflowTracer(workflow_name) if self.tracker else None
+                started = time.perf_counter()
+                try:
+                    result = await workflow.execute(
+                        input_data, self._with_tracer(workflow_name, config, tracer)
+                    )
+                    error = None
+                except Exception as e:
+                    result, error = None, f"{type(e).__name__}: {e}"
+                if tracer is not None:
+                    for span in tracer.get_node_spans():
+                        stats.record_node(span.name, span.duration_seconds)
+                return BatchItemResult(
+                    index=index,
+                    result=result,
+                    error=error,
+                    latency_seconds=time.perf_counter() - started,
+                )
+
+        source = iterate_inputs(inputs)
+        pending: set[asyncio.Task] = set()
+        next_index = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < limit:
+                    try:
+                        input_data = await anext(source)
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending.add(asyncio.create_task(run_item(next_index, input_data)))
+                    next_index += 1
+
+                if not pending:
+                    break
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in sorted(done, key=lambda t: t.result().index):
+                    item = task.result()
+                    stats.record(item)
+                    yield item
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            await source.aclose()
+            stats.finish()
+            if self.tracker:
+                self.tracker.track_batch_execution(
+                    workflow_name, stats.summary().model_dump()
+                )
+
+    async def execute_batch(
+        self,
+        workflow_name: str,
+        inputs: BatchInputs,
+        config: Optional[Dict[str, Any]] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> BatchReport:
+        """Execute a workflow over many inputs and collect all results.
+
+        Args:
+            workflow_name: Name of the workflow to execute
+            inputs: Iterable or async iterable of input data dictionaries
+            config: Optional configuration passed to every execution
+            max_concurrency: Optional in-flight limit for this batch
+
+        Returns:
+            Results ordered by input index with throughput and latency summary
+
+        Raises:
+            ValueError: If workflow is not registered
+        """
+        stats = BatchStats(workflow_name)
+        results = [
+            item
+            async for item in self.execute_many(
+                workflow_name, inputs, config, max_concurrency, stats
+            )
+        ]
+        results.sort(key=lambda item: item.index)
+        return BatchReport(results=results, summary=stats.summary())
+
+    def _with_tracer(
+        self,
+        workflow_name: str,
+        config: Optional[Dict[str, Any]],
+        tracer: Optional[WorkflowTracer] = None,
+    ) -> Dict[str, Any]:
+        """Add a per-run node tracer to the run config when monitoring is enabled.
+
+        Args:
+            workflow_name: Name of the workflow being executed
+            config: Caller's run configuration (not modified)
+            tracer: Tracer to add (defaults to one reporting to the tracker)
+
+        Returns:
+            Run configuration with the tracer in its callbacks
+        """
+        config = dict(config or {})
+        if not self.tracker:
+            return config
+        if tracer is None:
+            tracer = WorkflowTracer(workflow_name, self.tracker)
+        callbacks = config.get("callbacks")
+        if isinstance(callbacks, BaseCallbackManager):
+            callbacks = callbacks.copy()
+            callbacks.add_handler(tracer)
+        else:
+            callbacks = [*(callbacks or []), tracer]
+        config["callbacks"] = callbacks
+        return config
+
+    def _get_global_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore enforcing the global concurrency limit."""
+        if self._global_semaphore is None:
+            self._global_semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._global_semaphore
+
+    def _get_workflow_semaphore(self, workflow_name: str) -> asyncio.Semaphore:
+        """Get the semaphore enforcing a workflow's concurrency limit."""
+        if workflow_name not in self._workflow_semaphores:
+            limit = self.workflow_concurrency.get(workflow_name, self.max_concurrency)
+            self._workflow_semaphores[workflow_name] = asyncio.Semaphore(limit)
+        return self._workflow_semaphores[workflow_name]
+
     def get_available_agents(self) -> List[str]:
         """Get list of registered agent names."""
         return list(self.agents.keys())
@@ -105,8 +355,16 @@ class MainOrchestrator:
         """Get list of registered workflow names."""
         return list(self.workflows.keys())
 
-    async def health_check(self) -> Dict[str, Any]:
+    async def health_check(self, max_age: Optional[float] = None) -> Dict[str, Any]:
         """Perform health check on all components.
+
+        All agents, including those used inside workflows, are checked
+        concurrently and only once each, with a per-component timeout. Results
+        are served from the health checker's TTL cache while fresh; start the
+        background refresher to keep them warm so probes return instantly.
+
+        Args:
+            max_age: Maximum acceptable age of cached results (0 forces re-checks)
         
         Returns:
             Health status of all components
@@ -118,18 +376,43 @@ class MainOrchestrator:
             "tracker": "disabled" if not self.tracker else "enabled"
         }
 
+        components = {id(agent): agent for agent in self.agents.values()}
+        for workflow in self.workflows.values():
+            agents = workflow.get_agents()
+            if agents:
+                components.update({id(agent): agent for agent in agents.values()})
+            else:
+                components[id(workflow)] = workflow
+
+        results = await asyncio.gather(
+            *(self.health_checker.check(c, max_age) for c in components.values())
+        )
+        checked = dict(zip(components, results, strict=True))
+
         for name, agent in self.agents.items():
-            try:
-                agent_status = await agent.health_check()
-                status["agents"][name] = agent_status
-            except Exception as e:
-                status["agents"][name] = f"error: {str(e)}"
+            status["agents"][name] = checked[id(agent)]
 
         for name, workflow in self.workflows.items():
-            try:
-                workflow_status = await workflow.health_check()
-                status["workflows"][name] = workflow_status
-            except Exception as e:
-                status["workflows"][name] = f"error: {str(e)}"
+            agents = workflow.get_agents()
+            if agents:
+                status["workflows"][name] = workflow.summarize_health(
+                    {label: checked[id(agent)] for label, agent in agents.items()}
+                )
+            else:
+                status["workflows"][name] = checked[id(workflow)]
+
+        return status
+
+    def start_health_refresher(self, interval_seconds: Optional[float] = None) -> None:
+        """Keep cached health statuses warm in the background.
+
+        Args:
+            interval_seconds: Refresh interval (defaults to half the cache TTL)
+        """
+        self.health_checker.start_refresher(
+            lambda: self.health_check(max_age=0), interval_seconds
+        )
 
-        return status
\ No newline at end of file
+    async def stop_health_refresher(self) -> None:
+        """Stop the background health refresher."""
+        await self.health_checker.stop_refresher()
@@ -1,12 +1,26 @@
 """Utility for loading prompt templates from TOML files."""
 
-import tomllib
 from pathlib import Path
 from typing import Any
 
+from .prompt_registry import CompiledTemplate, PromptSet, prompt_registry
+
+SYNTHESIS_COMPONENTS = {
+    "executive_summary": "executive_summary_template",
+    "key_findings": "key_findings_template",
+    "source_analysis": "source_analysis_template",
+    "confidence_assessment": "confidence_assessment_template",
+    "recommendations": "recommendations_template",
+    "further_research": "further_research_template",
+}
+
 
 class PromptLoader:
-    """Load and manage prompt templates from TOML files."""
+    """Load and manage prompt templates from TOML files.
+
+    Files are parsed once per process by the shared prompt registry, which
+    also reloads them when they change on disk.
+    """
 
     def __init__(self, prompt_file: str | Path) -> None:
         """Initialize the prompt loader.
@@ -15,25 +29,32 @@ class PromptLoader:
             prompt_file: Path to the TOML prompt file
         """
         self.prompt_file = Path(prompt_file)
-        self._prompts: dict[str, Any] = {}
         self._load_prompts()
 
     def _load_prompts(self) -> None:
         """Load prompts from the TOML file."""
-        if not self.prompt_file.exists():
-            msg = f"Prompt file not found: {self.prompt_file}"
-            raise FileNotFoundError(msg)
+        self.get_prompt_set()
 
-        with self.prompt_file.open("rb") as f:
-            self._prompts = tomllib.load(f)
+    def get_prompt_set(self) -> PromptSet:
+        """Get the current prompt set from the registry.
+
+        Returns:
+            Parsed and compiled prompts, reloaded if the file changed
+        """
+        return prompt_registry.get(self.prompt_file)
+
+    @property
+    def _prompts(self) -> dict[str, Any]:
+        """Parsed TOML data."""
+        return self.get_prompt_set().data
 
     def get_system_prompt(self) -> str:
         """Get the system message template."""
-        return self._prompts.get("template", {}).get("system_message_template", "")
+        return self.get_prompt_set().get("template", "system_message_template")
 
     def get_user_prompt(self) -> str:
         """Get the user message template."""
-        return self._prompts.get("template", {}).get("user_message_template", "")
+        return self.get_prompt_set().get("template", "user_message_template")
 
     def get_prompt(self, section: str, key: str) -> str:
         """Get a specific prompt from a section.
@@ -45,7 +66,19 @@ class PromptLoader:
         Returns:
             The prompt template string
         """
-        return self._prompts.get(section, {}).get(key, "")
+        return self.get_prompt_set().get(section, key)
+
+    def get_compiled(self, section: str, key: str) -> CompiledTemplate:
+        """Get a precompiled prompt template.
+
+        Args:
+            section: TOML section name
+            key: Prompt key within the section
+
+        Returns:
+            Compiled template (empty if the prompt does not exist)
+        """
+        return self.get_prompt_set().template(section, key)
 
     def format_user_prompt(self, **kwargs: Any) -> str:
         """Format the user prompt template with provided values.
@@ -56,8 +89,7 @@ class PromptLoader:
         Returns:
             Formatted prompt string
         """
-        template = self.get_user_prompt()
-        return template.format(**kwargs)
+        return self.get_compiled("template", "user_message_template").format(**kwargs)
 
     def get_research_type_prompt(self, research_type: str) -> str:
         """Get a specific research type prompt.
@@ -68,7 +100,7 @@ class PromptLoader:
         Returns:
             Research type specific instructions
         """
-        return self._prompts.get("research_types", {}).get(research_type, "")
+        return self.get_prompt_set().get("research_types", research_type)
 
     def get_template(self, template_name: str) -> str:
         """Get a template from the template section.
@@ -79,7 +111,7 @@ class PromptLoader:
         Returns:
             Template string
         """
-        return self._prompts.get("template", {}).get(template_name, "")
+        return self.get_prompt_set().get("template", template_name)
 
     def get_synthesis_components(self) -> dict[str, str]:
         """Get all synthesis component templates.
@@ -87,14 +119,20 @@ class PromptLoader:
         Returns:
             Dictionary of synthesis component templates
         """
-        template_section = self._prompts.get("template", {})
+        prompt_set = self.get_prompt_set()
+        return {
+            name: prompt_set.get("template", key)
+            for name, key in SYNTHESIS_COMPONENTS.items()
+        }
+
+    def get_compiled_synthesis_components(self) -> dict[str, CompiledTemplate]:
+        """Get all synthesis component templates, precompiled.
+
+        Returns:
+            Dictionary of compiled synthesis component templates
+        """
+        prompt_set = self.get_prompt_set()
         return {
-            "executive_summary": template_section.get("executive_summary_template", ""),
-            "key_findings": template_section.get("key_findings_template", ""),
-            "source_analysis": template_section.get("source_analysis_template", ""),
-            "confidence_assessment": template_section.get(
-                "confidence_assessment_template", ""
-            ),
-            "recommendations": template_section.get("recommendations_template", ""),
-            "further_research": template_section.get("further_research_template", ""),
+            name: prompt_set.template("template", key)
+            for name, key in SYNTHESIS_COMPONENTS.items()
         }
@@ -0,0 +1,190 @@
+"""Process-wide registry of parsed and precompiled prompt templates."""
+
+import hashlib
+import json
+import string
+import threading
+import time
+import tomllib
+from pathlib import Path
+from typing import Any
+
+_FORMATTER = string.Formatter()
+
+
+class CompiledTemplate:
+    """A prompt template parsed once and compiled to a fast formatter.
+
+    ``str.format`` templates are translated into ``%``-style mapping templates
+    when they only use plain named placeholders, which format roughly twice
+    as fast. Templates using format specs, conversions or attribute access
+    fall back to ``str.format``.
+    """
+
+    __slots__ = ("_compiled", "_literal", "placeholders", "text")
+
+    def __init__(self, text: str) -> None:
+        """Parse and compile the template.
+
+        Args:
+            text: Template string in ``str.format`` syntax
+
+        Raises:
+            ValueError: If the template is malformed
+        """
+        self.text = text
+        placeholders: set[str] = set()
+        pieces: list[str] = []
+        literals: list[str] = []
+        simple = True
+        for literal, field, spec, conversion in _FORMATTER.parse(text):
+            literals.append(literal)
+            pieces.append(literal.replace("%", "%%"))
+            if field is None:
+                continue
+            if spec or conversion or not field.isidentifier():
+                simple = False
+                field = field.split(".", 1)[0].split("[", 1)[0]
+            placeholders.add(field)
+            pieces.append(f"%({field})s")
+        self.placeholders = frozenset(placeholders)
+        self._compiled = "".join(pieces) if simple else None
+        # Text with escaped braces unescaped, as str.format returns it
+        self._literal = None if placeholders else "".join(literals)
+
+    def format(self, **kwargs: Any) -> str:
+        """Substitute placeholders.
+
+        Args:
+            **kwargs: Values for the template placeholders
+
+        Returns:
+            Formatted string
+
+        Raises:
+            KeyError: If a placeholder has no value
+        """
+        if self._literal is not None:
+            return self._literal
+        if self._compiled is None:
+            return self.text.format(**kwargs)
+        return self._compiled % kwargs
+
+    def validate(self, expected: set[str] | frozenset[str]) -> None:
+        """Check that the template only uses the expected placeholders.
+
+        Args:
+            expected: Placeholders the caller will supply
+
+        Raises:
+            ValueError: If the template uses placeholders that are not supplied
+        """
+        unknown = self.placeholders - set(expected)
+        if unknown:
+            msg = f"Template uses unsupported placeholders: {sorted(unknown)}"
+            raise ValueError(msg)
+
+
+class PromptSet:
+    """Parsed contents of one TOML prompt file with compiled templates."""
+
+    def __init__(self, path: Path, data: dict[str, Any], mtime_ns: int) -> None:
+        """Compile every string template in the file.
+
+        Args:
+            path: Path of the TOML file
+            data: Parsed TOML data
+            mtime_ns: File modification time the data was read at
+        """
+        self.path = path
+        self.data = data
+        self.mtime_ns = mtime_ns
+        # Content hash, stable across processes; identifies the template version
+        self.version = hashlib.sha256(
+            json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()[:16]
+        self.templates: dict[tuple[str, str], CompiledTemplate] = {
+            (section, key): CompiledTemplate(value)
+            for section, entries in data.items()
+            if isinstance(entries, dict)
+            for key, value in entries.items()
+            if isinstance(value, str)
+        }
+
+    def get(self, section: str, key: str) -> str:
+        """Get the raw template text, or "" if missing."""
+        return self.data.get(section, {}).get(key, "")
+
+    def template(self, section: str, key: str) -> CompiledTemplate:
+        """Get a compiled template (an empty template if missing)."""
+        compiled = self.templates.get((section, key))
+        if compiled is None:
+            compiled = CompiledTemplate("")
+        return compiled
+
+
+class PromptRegistry:
+    """Parse each prompt file once per process and reload it when it changes.
+
+    File modification times are checked at most once per
+    ``check_interval_seconds`` per file, so hot reload adds no filesystem
+    calls to the per-request path.
+    """
+
+    def __init__(self, check_interval_seconds: float = 1.0) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            check_interval_seconds: Minimum delay between mtime checks of a file
+                (0 checks on every access)
+        """
+        self.check_interval_seconds = check_interval_seconds
+        self._sets: dict[Path, PromptSet] = {}
+        self._checked_at: dict[Path, float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, prompt_file: str | Path) -> PromptSet:
+        """Get the prompt set for a file, loading or reloading it as needed.
+
+        Args:
+            prompt_file: Path to the TOML prompt file
+
+        Returns:
+            Parsed and compiled prompt set
+
+        Raises:
+            FileNotFoundError: If the prompt file does not exist
+        """
+        path = prompt_file if isinstance(prompt_file, Path) else Path(prompt_file)
+        prompt_set = self._sets.get(path)
+        now = time.monotonic()
+        if (
+            prompt_set is not None
+            and now - self._checked_at[path] < self.check_interval_seconds
+        ):
+            return prompt_set
+
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            msg = f"Prompt file not found: {path}"
+            raise FileNotFoundError(msg) from None
+
+        with self._lock:
+            prompt_set = self._sets.get(path)
+            if prompt_set is None or prompt_set.mtime_ns != mtime_ns:
+                with path.open("rb") as f:
+                    prompt_set = PromptSet(path, tomllib.load(f), mtime_ns)
+                self._sets[path] = prompt_set
+            self._checked_at[path] = now
+        return prompt_set
+
+    def clear(self) -> None:
+        """Drop all cached prompt sets."""
+        with self._lock:
+            self._sets.clear()
+            self._checked_at.clear()
+
+
+# Global instance
+prompt_registry = PromptRegistry()
@@ -0,0 +1,413 @@
+"""Priority-aware request scheduler and worker pool in front of the orchestrator."""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Dict, List, Optional
+
+from orchestrator import MainOrchestrator, MonitoringTracker
+from workflows.base_workflow import WorkflowTimeoutError
+
+logger = logging.getLogger(__name__)
+
+class Priority(IntEnum):
+    """Request priority; lower values are dispatched first."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BATCH = 2
+
+
+class AdmissionRejectedError(RuntimeError):
+    """Raised when a request cannot be admitted to the scheduler queue."""
+
+
+@dataclass(order=True)
+class ScheduledRequest:
+    """A queued workflow execution request."""
+
+    priority: int
+    sequence: int
+    workflow_name: str = field(compare=False)
+    input_data: Dict[str, Any] = field(compare=False)
+    config: Optional[Dict[str, Any]] = field(compare=False)
+    tenant: str = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    deadline: float = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class RequestScheduler:
+    """Queue workflow requests and drain them with a pool of worker tasks.
+
+    Each tenant (or session) has one priority queue per workflow. Workers pick
+    the tenant with the lowest virtual pass (stride scheduling, so tenants get
+    dispatch slots in proportion to their weight) and then the most urgent
+    request across that tenant's workflow queues. Workflows registered with a
+    concurrency limit on the orchestrator never occupy more workers than that
+    limit, so long "deep" runs cannot starve short interactive ones.
+
+    Admission control rejects a request up front when the queue is full or
+    when the estimated queue wait plus service time would exceed the
+    workflow's ``timeout_seconds``; requests still queued past that deadline
+    fail with ``WorkflowTimeoutError`` instead of running.
+
+    Workers are asyncio tasks on the orchestrator's event loop. Agents and
+    compiled graphs are not picklable, so scale out across processes by
+    running one scheduler per worker process.
+    """
+
+    def __init__(
+        self,
+        orchestrator: MainOrchestrator,
+        num_workers: int = 4,
+        max_queue_size: int = 1000,
+        tenant_weights: Optional[Dict[str, float]] = None,
+        tracker: Optional[MonitoringTracker] = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            orchestrator: Orchestrator executing the requests
+            num_workers: Number of worker tasks draining the queues
+            max_queue_size: Maximum number of queued requests
+            tenant_weights: Relative share of dispatch slots per tenant (default 1.0)
+            tracker: Optional monitoring tracker (defaults to the orchestrator's)
+        """
+        self.orchestrator = orchestrator
+        self.num_workers = num_workers
+        self.max_queue_size = max_queue_size
+        self.tenant_weights = dict(tenant_weights or {})
+        self.tracker = tracker or orchestrator.tracker
+
+        self._queues: Dict[str, Dict[str, List[ScheduledRequest]]] = {}
+        self._tenant_pass: Dict[str, float] = {}
+        self._running: Dict[str, int] = {}
+        self._depth = 0
+        self._sequence = itertools.count()
+        self._service_time: Dict[str, float] = {}
+        self._condition = asyncio.Condition()
+        self._workers: List[asyncio.Task] = []
+        self._stopping = False
+        self._drain = True
+
+        self.dispatched = 0
+        self.rejected = 0
+        self.expired = 0
+        self.total_wait_seconds = 0.0
+
+    async def __aenter__(self) -> "RequestScheduler":
+        """Start the worker pool."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Drain the queues and stop the worker pool."""
+        await self.stop()
+
+    async def start(self) -> None:
+        """Start the worker tasks."""
+        if self._workers:
+            return
+        self._condition = asyncio.Condition()
+        self._stopping = False
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"scheduler-worker-{i}")
+            for i in range(self.num_workers)
+        ]
+
+    async def stop(self, drain: bool = True) -> None:
+        """Stop the worker tasks.
+
+        Args:
+            drain: Finish queued requests first; otherwise cancel them
+        """
+        if not self._workers:
+            return
+        async with self._condition:
+            self._stopping = True
+            self._drain = drain
+            if not drain:
+                for request in self._pop_all():
+                    request.future.cancel()
+            self._condition.notify_all()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(
+        self,
+        workflow_name: str,
+        input_data: Dict[str, Any],
+        priority: int = Priority.NORMAL,
+        tenant: str = "default",
+        config: Optional[Dict[str, Any]] = None,
+    ) -> asyncio.Future:
+        """Queue a workflow execution.
+
+        Args:
+            workflow_name: Name of the workflow to execute
+            input_data: Input data for the workflow
+            priority: Request priority (lower runs first)
+            tenant: Tenant or session the request is accounted to
+            config: Optional configuration for execution
+
+        Returns:
+            Future resolving to the workflow result
+
+        Raises:
+            ValueError: If workflow is not registered
+            AdmissionRejectedError: If the request cannot complete within the
+                workflow timeout or the queue is full
+        """
+        if workflow_name not in self.orchestrator.workflows:
+            raise ValueError(f"Workflow '{workflow_name}' not registered")
+        if not self._workers or self._stopping:
+            raise AdmissionRejectedError("Scheduler is not running")
+
+        timeout = self.orchestrator.workflows[workflow_name].config.timeout_seconds
+        estimated_wait = self.estimate_wait(workflow_name)
+        if self._depth >= self.max_queue_size:
+            self._reject(workflow_name, tenant, estimated_wait)
+            raise AdmissionRejectedError(
+                f"Queue full ({self.max_queue_size} requests)"
+            )
+        estimated_total = estimated_wait + self._service_time.get(workflow_name, 0.0)
+        if estimated_total > timeout:
+            self._reject(workflow_name, tenant, estimated_wait)
+            raise AdmissionRejectedError(
+                f"Estimated completion in {estimated_total:.1f}s exceeds "
+                f"'{workflow_name}' timeout of {timeout}s"
+            )
+
+        now = time.monotonic()
+        request = ScheduledRequest(
+            priority=int(priority),
+            sequence=next(self._sequence),
+            workflow_name=workflow_name,
+            input_data=input_data,
+            config=config,
+            tenant=tenant,
+            enqueued_at=now,
+            deadline=now + timeout,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        async with self._condition:
+            if tenant not in self._queues:
+                # Tenants (re)joining start at the current virtual time, without
+                # credit for the time they were idle.
+                self._tenant_pass[tenant] = max(
+                    self._tenant_pass.get(tenant, 0.0), self._virtual_time()
+                )
+                self._queues[tenant] = {}
+            heapq.heappush(self._queues[tenant].setdefault(workflow_name, []), request)
+            self._depth += 1
+            self._condition.notify()
+        return request.future
+
+    async def run(
+        self,
+        workflow_name: str,
+        input_data: Dict[str, Any],
+        priority: int = Priority.NORMAL,
+        tenant: str = "default",
+        config: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Queue a workflow execution and wait for its result.
+
+        Args:
+            workflow_name: Name of the workflow to execute
+            input_data: Input data for the workflow
+            priority: Request priority (lower runs first)
+            tenant: Tenant or session the request is accounted to
+            config: Optional configuration for execution
+
+        Returns:
+            Workflow execution results
+        """
+        future = await self.submit(workflow_name, input_data, priority, tenant, config)
+        return await future
+
+    def estimate_wait(self, workflow_name: str) -> float:
+        """Estimate how long a new request would wait in the queue.
+
+        Args:
+            workflow_name: Name of the workflow to execute
+
+        Returns:
+            Estimated queue wait in seconds (0.0 until service times are known)
+        """
+        if not self._service_time:
+            return 0.0
+        average = sum(self._service_time.values()) / len(self._service_time)
+        service = self._service_time.get(workflow_name, average)
+        return self._depth * service / self.num_workers
+
+    def queue_depth(self) -> Dict[str, int]:
+        """Get the number of queued requests per workflow."""
+        depth: Dict[str, int] = {}
+        for workflows in self._queues.values():
+            for workflow_name, queue in workflows.items():
+                depth[workflow_name] = depth.get(workflow_name, 0) + len(queue)
+        return depth
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get scheduler metrics.
+
+        Returns:
+            Dictionary with queue depth, running counts and wait statistics
+        """
+        return {
+            "queue_depth": self.queue_depth(),
+            "total_queued": self._depth,
+            "running": dict(self._running),
+            "workers": len(self._workers),
+            "dispatched": self.dispatched,
+            "rejected": self.rejected,
+            "expired": self.expired,
+            "avg_wait_seconds": (
+                self.total_wait_seconds / self.dispatched if self.dispatched else 0.0
+            ),
+            "service_time_seconds": dict(self._service_time),
+        }
+
+    async def _worker(self) -> None:
+        """Drain the queues until the scheduler stops."""
+        while True:
+            request = await self._next_request()
+            if request is None:
+                return
+            try:
+                await self._dispatch(request)
+            finally:
+                async with self._condition:
+                    self._running[request.workflow_name] -= 1
+                    self._condition.notify_all()
+
+    async def _next_request(self) -> Optional[ScheduledRequest]:
+        """Wait for the next dispatchable request, or None when stopping."""
+        async with self._condition:
+            while True:
+                if self._stopping and (not self._drain or self._depth == 0):
+                    return None
+                request = self._pop_next()
+                if request is not None:
+                    self._running[request.workflow_name] = (
+                        self._running.get(request.workflow_name, 0) + 1
+                    )
+                    return request
+                await self._condition.wait()
+
+    def _pop_next(self) -> Optional[ScheduledRequest]:
+        """Pop the next request by tenant fair share, then priority."""
+        for tenant in sorted(self._queues, key=self._tenant_pass.__getitem__):
+            best: Optional[List[ScheduledRequest]] = None
+            for workflow_name, queue in self._queues[tenant].items():
+                if not queue or not self._has_capacity(workflow_name):
+                    continue
+                if best is None or queue[0] < best[0]:
+                    best = queue
+            if best is None:
+                continue
+            request = heapq.heappop(best)
+            self._depth -= 1
+            self._tenant_pass[tenant] += 1.0 / self.tenant_weights.get(tenant, 1.0)
+            if not any(self._queues[tenant].values()):
+                del self._queues[tenant]
+            return request
+        return None
+
+    def _pop_all(self) -> List[ScheduledRequest]:
+        """Remove and return every queued request."""
+        requests = [
+            request
+            for workflows in self._queues.values()
+            for queue in workflows.values()
+            for request in queue
+        ]
+        self._queues.clear()
+        self._depth = 0
+        return requests
+
+    def _virtual_time(self) -> float:
+        """Get the lowest pass among tenants with queued requests."""
+        active = [self._tenant_pass[tenant] for tenant in self._queues]
+        if active:
+            return min(active)
+        return max(self._tenant_pass.values(), default=0.0)
+
+    def _has_capacity(self, workflow_name: str) -> bool:
+        """Check the workflow's concurrency limit on the orchestrator."""
+        limit = self.orchestrator.workflow_concurrency.get(workflow_name)
+        return limit is None or self._running.get(workflow_name, 0) < limit
+
+    async def _dispatch(self, request: ScheduledRequest) -> None:
+        """Execute a dequeued request and resolve its future."""
+        if request.future.done():
+            return
+
+        now = time.monotonic()
+        wait = now - request.enqueued_at
+        self.dispatched += 1
+        self.total_wait_seconds += wait
+        self._track_scheduling(
+            request.workflow_name,
+            tenant=request.tenant,
+            priority=request.priority,
+            wait_seconds=wait,
+            admitted=True,
+        )
+
+        if now >= request.deadline:
+            self.expired += 1
+            request.future.set_exception(
+                WorkflowTimeoutError(
+                    f"Request for '{request.workflow_name}' expired after "
+                    f"{wait:.1f}s in queue"
+                )
+            )
+            return
+
+        started = time.monotonic()
+        try:
+            result = await self.orchestrator.execute_workflow(
+                request.workflow_name, request.input_data, request.config
+            )
+        except Exception as e:
+            if not request.future.done():
+                request.future.set_exception(e)
+        else:
+            if not request.future.done():
+                request.future.set_result(result)
+        finally:
+            self._record_service_time(request.workflow_name, time.monotonic() - started)
+
+    def _record_service_time(self, workflow_name: str, seconds: float) -> None:
+        """Update the moving average of a workflow's service time."""
+        previous = self._service_time.get(workflow_name)
+        self._service_time[workflow_name] = (
+            seconds if previous is None else 0.8 * previous + 0.2 * seconds
+        )
+
+    def _reject(self, workflow_name: str, tenant: str, estimated_wait: float) -> None:
+        """Account for and report a rejected request."""
+        self.rejected += 1
+        self._track_scheduling(
+            workflow_name,
+            tenant=tenant,
+            priority=None,
+            wait_seconds=estimated_wait,
+            admitted=False,
+        )
+
+    def _track_scheduling(self, workflow_name: str, **data: Any) -> None:
+        """Report a scheduling decision; tracker failures never reach workers or callers."""
+        if not self.tracker:
+            return
+        try:
+            self.tracker.track_request_scheduling(workflow_name, queue_depth=self._depth, **data)
+        except Exception as e:
+            logger.warning("Failed to track scheduling of '%s': %s", workflow_name, e)
@@ -0,0 +1,347 @@
+"""Per-node tracing of LangGraph runs as OpenTelemetry-compatible spans."""
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+# OpenTelemetry status codes (opentelemetry.trace.StatusCode)
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+# OpenTelemetry span kinds (opentelemetry.trace.SpanKind)
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+
+
+def state_size(value: Any) -> int:
+    """Measure the serialized size of a graph state or state update.
+
+    Args:
+        value: State, update or any JSON-like value
+
+    Returns:
+        Size in bytes of the JSON encoding (non-JSON values use ``str``)
+    """
+    try:
+        return len(json.dumps(value, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return len(str(value).encode("utf-8"))
+
+
+@dataclass
+class Span:
+    """A timed operation in a traced workflow run."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: Optional[str]
+    kind: int = SPAN_KIND_INTERNAL
+    start_time_unix_nano: int = field(default_factory=time.time_ns)
+    end_time_unix_nano: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status_code: int = STATUS_UNSET
+    status_message: str = ""
+
+    @property
+    def duration_seconds(self) -> float:
+        """Span duration (0.0 while the span is open)."""
+        if self.end_time_unix_nano is None:
+            return 0.0
+        return (self.end_time_unix_nano - self.start_time_unix_nano) / 1e9
+
+    def end(self, status_code: int = STATUS_OK, status_message: str = "") -> None:
+        """Close the span.
+
+        Args:
+            status_code: OpenTelemetry status code
+            status_message: Status description (for errors)
+        """
+        self.end_time_unix_nano = time.time_ns()
+        self.status_code = status_code
+        self.status_message = status_message
+
+    def to_otel(self) -> Dict[str, Any]:
+        """Convert the span to the OTLP/JSON span representation.
+
+        Returns:
+            Span dictionary as accepted by OTLP/HTTP JSON collectors
+        """
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id or "",
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_time_unix_nano),
+            "endTimeUnixNano": str(self.end_time_unix_nano or self.start_time_unix_nano),
+            "attributes": [
+                {"key": key, "value": _otel_value(value)}
+                for key, value in self.attributes.items()
+                if value is not None
+            ],
+            "status": {"code": self.status_code, "message": self.status_message},
+        }
+
+
+def _otel_value(value: Any) -> Dict[str, Any]:
+    """Encode an attribute value as an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class WorkflowTracer(BaseCallbackHandler):
+    """Callback handler recording node and LLM spans for one graph run.
+
+    Pass it in the run config's ``callbacks``. The graph run becomes the root
+    span, every node execution a child span (with enter/exit timing, input
+    state size, update size and iteration step), and every chat model call
+    inside a node a grandchild span with token usage. Token counts are also
+    summed onto the enclosing node span. Intermediate runnables are not
+    recorded; their children attach to the nearest recorded ancestor.
+
+    When the root span ends, the tracker receives one ``node_execution``
+    event per node and the whole trace as OpenTelemetry spans.
+    """
+
+    run_inline = True
+
+    def __init__(
+        self,
+        workflow_name: str,
+        tracker: Optional[Any] = None,
+        session_id: Optional[str] = None,
+    ):
+        """Initialize the tracer.
+
+        Args:
+            workflow_name: Workflow name recorded on the root span
+            tracker: Optional tracker receiving node events and the trace
+            session_id: Optional session identifier
+        """
+        self.workflow_name = workflow_name
+        self.tracker = tracker
+        self.session_id = session_id
+        self.trace_id = os.urandom(16).hex()
+        self.spans: List[Span] = []
+        self._spans: Dict[UUID, Span] = {}
+        # run_id -> nearest recorded ancestor span, for unrecorded runs
+        self._ancestors: Dict[UUID, Optional[Span]] = {}
+        self._root_run_id: Optional[UUID] = None
+
+    def get_node_spans(self) -> List[Span]:
+        """Get the spans of node executions, in start order."""
+        return [span for span in self.spans if "langgraph.node" in span.attributes]
+
+    def on_chain_start(
+        self,
+        serialized: Optional[Dict[str, Any]],
+        inputs: Any,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        name: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Open the root span or a node span."""
+        metadata = metadata or {}
+        if parent_run_id is None or self._root_run_id is None:
+            self._root_run_id = run_id
+            self._open(run_id, None, self.workflow_name, {"workflow.name": self.workflow_name})
+            return
+
+        parent = self._nearest(parent_run_id)
+        node = metadata.get("langgraph_node")
+        # A node's own run carries its name; runs inside the node inherit the metadata
+        is_node = node is not None and name == node
+        if is_node and parent is not None and "langgraph.node" not in parent.attributes:
+            self._open(
+                run_id,
+                parent,
+                node,
+                {
+                    "langgraph.node": node,
+                    "langgraph.step": metadata.get("langgraph_step"),
+                    "state.input_bytes": state_size(inputs),
+                },
+            )
+        else:
+            self._ancestors[run_id] = parent
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        """Close a node span or the root span."""
+        span = self._spans.get(run_id)
+        if span is None:
+            self._ancestors.pop(run_id, None)
+            return
+        span.attributes["state.output_bytes"] = state_size(outputs)
+        self._close(run_id, STATUS_OK)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        """Close a span with an error status."""
+        span = self._spans.get(run_id)
+        if span is None:
+            self._ancestors.pop(run_id, None)
+            return
+        span.attributes["exception.type"] = type(error).__name__
+        span.attributes["exception.message"] = str(error)
+        self._close(run_id, STATUS_ERROR, f"{type(error).__name__}: {error}")
+
+    def on_chat_model_start(
+        self,
+        serialized: Optional[Dict[str, Any]],
+        messages: List[List[Any]],
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        name: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Open an LLM span under the enclosing node."""
+        self._open_llm(run_id, parent_run_id, name, serialized, metadata)
+
+    def on_llm_start(
+        self,
+        serialized: Optional[Dict[str, Any]],
+        prompts: List[str],
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        name: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Open an LLM span under the enclosing node."""
+        self._open_llm(run_id, parent_run_id, name, serialized, metadata)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        """Close an LLM span, recording token usage on it and its node."""
+        span = self._spans.get(run_id)
+        if span is None:
+            return
+        prompt_tokens, completion_tokens = _token_usage(response)
+        span.attributes["gen_ai.usage.input_tokens"] = prompt_tokens
+        span.attributes["gen_ai.usage.output_tokens"] = completion_tokens
+        node = self._node_of(span)
+        if node is not None:
+            for key, tokens in (
+                ("gen_ai.usage.input_tokens", prompt_tokens),
+                ("gen_ai.usage.output_tokens", completion_tokens),
+            ):
+                node.attributes[key] = node.attributes.get(key, 0) + tokens
+        self._close(run_id, STATUS_OK)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        """Close an LLM span with an error status."""
+        self.on_chain_error(error, run_id=run_id)
+
+    def _open_llm(
+        self,
+        run_id: UUID,
+        parent_run_id: Optional[UUID],
+        name: Optional[str],
+        serialized: Optional[Dict[str, Any]],
+        metadata: Optional[Dict[str, Any]],
+    ) -> None:
+        """Open a client span for a model call."""
+        parent = self._nearest(parent_run_id) if parent_run_id is not None else None
+        if parent is None:
+            return
+        name = name or (serialized or {}).get("name") or "llm"
+        model = (metadata or {}).get("ls_model_name")
+        span = self._open(run_id, parent, name, {"gen_ai.request.model": model})
+        span.kind = SPAN_KIND_CLIENT
+
+    def _open(
+        self,
+        run_id: UUID,
+        parent: Optional[Span],
+        name: str,
+        attributes: Dict[str, Any],
+    ) -> Span:
+        """Open and register a span."""
+        span = Span(
+            name=name,
+            trace_id=self.trace_id,
+            span_id=os.urandom(8).hex(),
+            parent_span_id=parent.span_id if parent is not None else None,
+            attributes=attributes,
+        )
+        self.spans.append(span)
+        self._spans[run_id] = span
+        return span
+
+    def _close(self, run_id: UUID, status_code: int, status_message: str = "") -> None:
+        """End a span, and report the trace when the root span ends."""
+        span = self._spans.pop(run_id)
+        span.end(status_code, status_message)
+        if run_id == self._root_run_id:
+            self._report()
+
+    def _nearest(self, run_id: UUID) -> Optional[Span]:
+        """Get the span of a run, or its nearest recorded ancestor."""
+        span = self._spans.get(run_id)
+        if span is not None:
+            return span
+        return self._ancestors.get(run_id)
+
+    def _node_of(self, span: Span) -> Optional[Span]:
+        """Get the node span enclosing a span."""
+        by_id = {candidate.span_id: candidate for candidate in self.spans}
+        current: Optional[Span] = span
+        while current is not None and "langgraph.node" not in current.attributes:
+            current = by_id.get(current.parent_span_id) if current.parent_span_id else None
+        return current
+
+    def _report(self) -> None:
+        """Send node events and the trace to the tracker."""
+        if self.tracker is None:
+            return
+        for span in self.get_node_spans():
+            self.tracker.track_node_execution(
+                self.workflow_name,
+                span.name,
+                execution_time=span.duration_seconds,
+                step=span.attributes.get("langgraph.step"),
+                input_state_bytes=span.attributes.get("state.input_bytes"),
+                output_state_bytes=span.attributes.get("state.output_bytes"),
+                prompt_tokens=span.attributes.get("gen_ai.usage.input_tokens"),
+                completion_tokens=span.attributes.get("gen_ai.usage.output_tokens"),
+                error=span.status_message or None,
+                session_id=self.session_id,
+            )
+        self.tracker.track_trace(
+            self.workflow_name,
+            [span.to_otel() for span in self.spans],
+            session_id=self.session_id,
+        )
+
+
+def _token_usage(response: LLMResult) -> tuple[int, int]:
+    """Sum prompt and completion tokens reported for a model call."""
+    prompt_tokens = completion_tokens = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                prompt_tokens += usage.get("input_tokens", 0)
+                completion_tokens += usage.get("output_tokens", 0)
+    if not (prompt_tokens or completion_tokens) and response.llm_output:
+        usage = response.llm_output.get("token_usage") or {}
+        prompt_tokens = usage.get("prompt_tokens", 0)
+        completion_tokens = usage.get("completion_tokens", 0)
+    return prompt_tokens, completion_tokens
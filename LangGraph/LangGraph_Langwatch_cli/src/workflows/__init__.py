@@ -1,6 +1,22 @@
 """Workflow implementations for the LangGraph application."""
 
-from .base_workflow import BaseWorkflow
-from .research_summarization_workflow import ResearchSummarizationWorkflow
+from .base_workflow import BaseWorkflow, WorkflowConfig, WorkflowTimeoutError
+from .checkpoint import CompressedSerializer, SQLiteCheckpointSaver, get_checkpointer
+from .graph_registry import GraphRegistry, graph_registry
+from .research_summarization_workflow import (
+    ResearchSummarizationConfig,
+    ResearchSummarizationWorkflow,
+)
 
-__all__ = ["BaseWorkflow", "ResearchSummarizationWorkflow"]
\ No newline at end of file
+__all__ = [
+    "BaseWorkflow",
+    "CompressedSerializer",
+    "GraphRegistry",
+    "ResearchSummarizationConfig",
+    "ResearchSummarizationWorkflow",
+    "SQLiteCheckpointSaver",
+    "WorkflowConfig",
+    "WorkflowTimeoutError",
+    "get_checkpointer",
+    "graph_registry",
+]
\ No newline at end of file
@@ -1,12 +1,18 @@
 """Base workflow class for all LangGraph workflows."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from langchain_core.messages import BaseMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import StateGraph
 from pydantic import BaseModel, Field
 
+from .checkpoint import get_checkpointer, new_thread_id
+from .graph_registry import graph_registry
+
 
 class WorkflowConfig(BaseModel):
     """Configuration for workflows."""
@@ -14,7 +20,22 @@ class WorkflowConfig(BaseModel):
     name: str = Field(..., description="Workflow name")
     description: str = Field(..., description="Workflow description")
     max_iterations: int = Field(default=10, description="Maximum workflow iterations")
-    timeout_seconds: int = Field(default=300, description="Workflow timeout in seconds")
+    timeout_seconds: float = Field(default=300, description="Workflow timeout in seconds")
+    node_timeout_seconds: Optional[float] = Field(
+        default=None,
+        description="Per-node timeout in seconds (defaults to the workflow timeout)",
+    )
+    checkpoint_path: Optional[str] = Field(
+        default=None,
+        description="SQLite file for per-node checkpoints (None disables checkpointing)",
+    )
+
+
+class WorkflowTimeoutError(TimeoutError):
+    """Raised when a workflow or one of its nodes exceeds its time budget."""
+
+
+NodeFunction = Callable[..., Awaitable[Dict[str, Any]]]
 
 
 class BaseWorkflow(ABC):
@@ -34,12 +55,45 @@ class BaseWorkflow(ABC):
     @abstractmethod
     async def build_graph(self) -> StateGraph:
         """Build the LangGraph graph for this workflow.
+
+        The compiled graph is shared across instances with the same class and
+        config, so nodes must read agents from ``get_runtime_components`` via
+        the runnable config rather than closing over ``self``.
         
         Returns:
             Configured LangGraph graph
         """
         pass
 
+    async def get_graph(self) -> StateGraph:
+        """Get the compiled graph from the process-wide registry.
+
+        Returns:
+            Compiled LangGraph graph
+        """
+        if self.graph is None:
+            self.graph = await graph_registry.get_or_compile(self)
+        return self.graph
+
+    def get_checkpointer(self) -> Optional[BaseCheckpointSaver]:
+        """Get the checkpointer the compiled graph persists its state with.
+
+        Returns:
+            Shared SQLite checkpointer for ``checkpoint_path``, or None if
+            checkpointing is disabled
+        """
+        if self.config.checkpoint_path is None:
+            return None
+        return get_checkpointer(self.config.checkpoint_path)
+
+    def get_runtime_components(self) -> Dict[str, Any]:
+        """Get per-instance objects (e.g. agents) injected into graph nodes.
+
+        Returns:
+            Mapping placed under ``configurable`` in the runnable config
+        """
+        return {}
+
     @abstractmethod
     async def execute(
         self,
@@ -66,6 +120,222 @@ class BaseWorkflow(ABC):
         """
         pass
 
+    def get_agents(self) -> Dict[str, Any]:
+        """Get the agents this workflow depends on, keyed by role.
+
+        Returns:
+            Runtime components that expose an async ``health_check``
+        """
+        return {
+            label: component
+            for label, component in self.get_runtime_components().items()
+            if hasattr(component, "health_check")
+        }
+
+    def summarize_health(self, agent_statuses: Dict[str, str]) -> str:
+        """Derive the workflow health from its agents' statuses.
+
+        Args:
+            agent_statuses: Health status per agent role
+
+        Returns:
+            "healthy" if every agent is healthy, otherwise a degraded summary
+        """
+        if all(status.startswith("healthy") for status in agent_statuses.values()):
+            return "healthy"
+        details = ", ".join(f"{label}: {status}" for label, status in agent_statuses.items())
+        return f"degraded ({details})"
+
+    def wrap_node(self, node_name: str, node: NodeFunction) -> NodeFunction:
+        """Wrap a graph node so it is cancelled once it exceeds the node timeout.
+
+        Args:
+            node_name: Name of the node in the graph
+            node: Async node function taking the state and runnable config
+
+        Returns:
+            Node function enforcing ``node_timeout_seconds``
+        """
+        timeout = self.config.node_timeout_seconds or self.config.timeout_seconds
+        workflow_name = self.name
+
+        async def timed_node(state: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+            try:
+                async with asyncio.timeout(timeout):
+                    return await node(state, config)
+            except TimeoutError as e:
+                raise WorkflowTimeoutError(
+                    f"Node '{node_name}' exceeded {timeout}s in workflow '{workflow_name}'"
+                ) from e
+
+        return timed_node
+
+    def get_run_config(self, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Build the runnable config for a graph run.
+
+        Args:
+            config: Optional execution configuration
+
+        Returns:
+            Runnable config with the recursion limit bound to ``max_iterations``
+            and the runtime components under ``configurable``
+        """
+        config = config or {}
+        return {
+            "recursion_limit": self.config.max_iterations,
+            **config,
+            "configurable": {
+                **self.get_runtime_components(),
+                **config.get("configurable", {}),
+            },
+        }
+
+    async def run_graph(
+        self,
+        state: Dict[str, Any],
+        config: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Run the compiled graph to completion within the workflow timeout.
+
+        With checkpointing enabled, state is persisted after every node, a
+        retry with the same ``thread_id`` resumes a failed run from its last
+        checkpoint, and the checkpoints are dropped once the run completes.
+
+        Args:
+            state: Initial graph state
+            config: Optional execution configuration
+
+        Returns:
+            Final graph state
+
+        Raises:
+            WorkflowTimeoutError: If the run exceeds ``timeout_seconds``
+        """
+        graph = await self.get_graph()
+        graph_input, run_config, resumable = await self._prepare_run(graph, state, config)
+        completed = False
+        try:
+            async with asyncio.timeout(self.config.timeout_seconds):
+                final_state = await graph.ainvoke(graph_input, run_config)
+            completed = True
+            return final_state
+        except WorkflowTimeoutError:
+            raise
+        except TimeoutError as e:
+            raise WorkflowTimeoutError(
+                f"Workflow '{self.name}' exceeded {self.config.timeout_seconds}s"
+            ) from e
+        finally:
+            if completed or not resumable:
+                await self._finish_run(graph, run_config)
+
+    async def stream_graph(
+        self,
+        state: Dict[str, Any],
+        config: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Stream node outputs of the compiled graph as each node finishes.
+
+        The graph runs in its own task so the workflow timeout, an error or the
+        caller closing the iterator early cancels it cleanly.
+
+        Args:
+            state: Initial graph state
+            config: Optional execution configuration
+
+        Yields:
+            Tuples of node name and the state update produced by that node
+
+        Raises:
+            WorkflowTimeoutError: If the run exceeds ``timeout_seconds``
+        """
+        graph = await self.get_graph()
+        graph_input, run_config, resumable = await self._prepare_run(graph, state, config)
+        queue: asyncio.Queue = asyncio.Queue()
+        finished = object()
+        completed = False
+
+        async def produce() -> None:
+            nonlocal completed
+            try:
+                async for chunk in graph.astream(
+                    graph_input, run_config, stream_mode="updates"
+                ):
+                    for node_name, update in chunk.items():
+                        await queue.put((node_name, update or {}))
+                await self._finish_run(graph, run_config)
+                completed = True
+            except Exception as e:
+                await queue.put(e)
+            else:
+                await queue.put(finished)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.timeout_seconds
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                try:
+                    async with asyncio.timeout_at(deadline):
+                        item = await queue.get()
+                except TimeoutError as e:
+                    raise WorkflowTimeoutError(
+                        f"Workflow '{self.name}' exceeded {self.config.timeout_seconds}s"
+                    ) from e
+                if item is finished:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            if not producer.done():
+                producer.cancel()
+                try:
+                    await producer
+                except asyncio.CancelledError:
+                    pass
+            if not completed and not resumable:
+                await self._finish_run(graph, run_config)
+
+    async def _prepare_run(
+        self,
+        graph: Any,
+        state: Dict[str, Any],
+        config: Optional[Dict[str, Any]],
+    ) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any], bool]:
+        """Get the graph input and runnable config, resuming checkpointed runs.
+
+        With checkpointing enabled, each run is a checkpoint thread. Without
+        a ``thread_id`` in ``configurable`` the run gets a fresh one, so
+        identical runs never share checkpoints. If an explicit thread has
+        unfinished nodes from a failed or interrupted run, the graph resumes
+        from its last checkpoint instead of starting over.
+
+        Args:
+            graph: Compiled graph
+            state: Initial graph state
+            config: Optional execution configuration
+
+        Returns:
+            Graph input (None to resume), the runnable config, and whether the
+            run can be resumed later (its checkpoints are kept if it fails)
+        """
+        run_config = self.get_run_config(config)
+        if graph.checkpointer is None:
+            return state, run_config, False
+        if "thread_id" not in run_config["configurable"]:
+            run_config["configurable"]["thread_id"] = new_thread_id()
+            return state, run_config, False
+        snapshot = await graph.aget_state(run_config)
+        if snapshot.next:
+            return None, run_config, True
+        return state, run_config, True
+
+    async def _finish_run(self, graph: Any, run_config: Dict[str, Any]) -> None:
+        """Drop the checkpoints of a completed or unresumable run."""
+        if graph.checkpointer is not None:
+            await graph.checkpointer.adelete_thread(run_config["configurable"]["thread_id"])
+
     def get_workflow_steps(self) -> List[str]:
         """Get list of workflow steps.
         
@@ -0,0 +1,469 @@
+"""Persistent graph checkpoints for resumable workflow runs."""
+
+import asyncio
+import random
+import sqlite3
+import threading
+import uuid
+import zlib
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    SerializerProtocol,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+    writes_sort_key,
+)
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+_COMPRESSED_SUFFIX = "+zlib"
+
+
+class CompressedSerializer:
+    """Serializer compressing large payloads (e.g. long message histories).
+
+    Wraps LangGraph's msgpack-based serializer and zlib-compresses payloads
+    of at least ``min_size`` bytes when that makes them smaller. Compressed
+    payloads are tagged with a ``+zlib`` type suffix so both forms load.
+    """
+
+    def __init__(
+        self,
+        serde: Optional[SerializerProtocol] = None,
+        min_size: int = 1024,
+        level: int = 6,
+    ):
+        """Initialize the serializer.
+
+        Args:
+            serde: Underlying serializer (LangGraph's default if omitted)
+            min_size: Smallest payload in bytes worth compressing
+            level: zlib compression level
+        """
+        self.serde = serde or JsonPlusSerializer()
+        self.min_size = min_size
+        self.level = level
+
+    def dumps_typed(self, obj: Any) -> Tuple[str, bytes]:
+        """Serialize an object, compressing large payloads."""
+        type_, data = self.serde.dumps_typed(obj)
+        if len(data) >= self.min_size:
+            compressed = zlib.compress(data, self.level)
+            if len(compressed) < len(data):
+                return type_ + _COMPRESSED_SUFFIX, compressed
+        return type_, data
+
+    def loads_typed(self, data: Tuple[str, bytes]) -> Any:
+        """Deserialize an object written by ``dumps_typed``."""
+        type_, payload = data
+        if type_.endswith(_COMPRESSED_SUFFIX):
+            type_ = type_[: -len(_COMPRESSED_SUFFIX)]
+            payload = zlib.decompress(payload)
+        return self.serde.loads_typed((type_, payload))
+
+
+class SQLiteCheckpointSaver(BaseCheckpointSaver[str]):
+    """LangGraph checkpointer storing checkpoints in a local SQLite file.
+
+    Channel values are stored once per channel version rather than in every
+    checkpoint, so state that a node does not touch is not written again.
+    Database access runs in a worker thread so it does not block the event
+    loop.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        serde: Optional[SerializerProtocol] = None,
+    ):
+        """Initialize the saver, creating the database if needed.
+
+        Args:
+            path: SQLite database file
+            serde: Serializer (compressing msgpack serializer by default)
+        """
+        super().__init__(serde=serde or CompressedSerializer())
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints ("
+                " thread_id TEXT NOT NULL,"
+                " checkpoint_ns TEXT NOT NULL,"
+                " checkpoint_id TEXT NOT NULL,"
+                " parent_checkpoint_id TEXT,"
+                " type TEXT NOT NULL,"
+                " checkpoint BLOB NOT NULL,"
+                " metadata_type TEXT NOT NULL,"
+                " metadata BLOB NOT NULL,"
+                " PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id))"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS blobs ("
+                " thread_id TEXT NOT NULL,"
+                " checkpoint_ns TEXT NOT NULL,"
+                " channel TEXT NOT NULL,"
+                " version TEXT NOT NULL,"
+                " type TEXT NOT NULL,"
+                " blob BLOB,"
+                " PRIMARY KEY (thread_id, checkpoint_ns, channel, version))"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS writes ("
+                " thread_id TEXT NOT NULL,"
+                " checkpoint_ns TEXT NOT NULL,"
+                " checkpoint_id TEXT NOT NULL,"
+                " task_id TEXT NOT NULL,"
+                " idx INTEGER NOT NULL,"
+                " channel TEXT NOT NULL,"
+                " type TEXT NOT NULL,"
+                " value BLOB,"
+                " task_path TEXT NOT NULL,"
+                " PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx))"
+            )
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """Get a checkpoint, or the latest one of the thread if no ID is given.
+
+        Args:
+            config: Config with ``thread_id`` and optional ``checkpoint_id``
+
+        Returns:
+            The checkpoint tuple, or None if not found
+        """
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = get_checkpoint_id(config)
+        query = (
+            "SELECT checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata_type,"
+            " metadata FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?"
+        )
+        params: List[Any] = [thread_id, checkpoint_ns]
+        if checkpoint_id:
+            query += " AND checkpoint_id = ?"
+            params.append(checkpoint_id)
+        query += " ORDER BY checkpoint_id DESC LIMIT 1"
+        with self._lock:
+            row = self._connection.execute(query, params).fetchone()
+            if row is None:
+                return None
+            return self._load_tuple(thread_id, checkpoint_ns, row)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        """List checkpoints, newest first.
+
+        Args:
+            config: Optional config selecting the thread (and namespace or checkpoint)
+            filter: Optional metadata values the checkpoints must match
+            before: Optional config; only checkpoints older than it are listed
+            limit: Optional maximum number of checkpoints
+
+        Yields:
+            Matching checkpoint tuples
+        """
+        query = (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type,"
+            " checkpoint, metadata_type, metadata FROM checkpoints"
+        )
+        clauses: List[str] = []
+        params: List[Any] = []
+        if config is not None:
+            clauses.append("thread_id = ?")
+            params.append(config["configurable"]["thread_id"])
+            checkpoint_ns = config["configurable"].get("checkpoint_ns")
+            if checkpoint_ns is not None:
+                clauses.append("checkpoint_ns = ?")
+                params.append(checkpoint_ns)
+            checkpoint_id = get_checkpoint_id(config)
+            if checkpoint_id:
+                clauses.append("checkpoint_id = ?")
+                params.append(checkpoint_id)
+        before_id = get_checkpoint_id(before) if before is not None else None
+        if before_id:
+            clauses.append("checkpoint_id < ?")
+            params.append(before_id)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY checkpoint_id DESC"
+
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+        for thread_id, checkpoint_ns, *row in rows:
+            if limit is not None and limit <= 0:
+                return
+            metadata = self.serde.loads_typed((row[4], row[5]))
+            if filter and not all(metadata.get(key) == value for key, value in filter.items()):
+                continue
+            if limit is not None:
+                limit -= 1
+            with self._lock:
+                item = self._load_tuple(thread_id, checkpoint_ns, row)
+            yield item
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Store a checkpoint and the channel values that changed in it.
+
+        Args:
+            config: Config of the parent checkpoint
+            checkpoint: Checkpoint to store
+            metadata: Checkpoint metadata
+            new_versions: Channel versions written since the parent checkpoint
+
+        Returns:
+            Config pointing at the stored checkpoint
+        """
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        stored = checkpoint.copy()
+        values: Dict[str, Any] = stored.pop("channel_values")  # type: ignore[misc]
+        blobs = [
+            (
+                thread_id,
+                checkpoint_ns,
+                channel,
+                str(version),
+                *(self.serde.dumps_typed(values[channel]) if channel in values else ("empty", None)),
+            )
+            for channel, version in new_versions.items()
+        ]
+        type_, serialized = self.serde.dumps_typed(stored)
+        metadata_type, serialized_metadata = self.serde.dumps_typed(
+            get_checkpoint_metadata(config, metadata)
+        )
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO blobs VALUES (?, ?, ?, ?, ?, ?)", blobs
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    config["configurable"].get("checkpoint_id"),
+                    type_,
+                    serialized,
+                    metadata_type,
+                    serialized_metadata,
+                ),
+            )
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Store the pending writes of a task.
+
+        Writes of tasks that finished before a failure are kept, so those
+        tasks are not run again when the thread resumes.
+
+        Args:
+            config: Config of the checkpoint the writes belong to
+            writes: Channel and value pairs
+            task_id: Identifier of the task
+            task_path: Path of the task
+        """
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        # Regular writes are kept on retries; special ones (errors, interrupts) replaced
+        rows = {"INSERT OR IGNORE": [], "INSERT OR REPLACE": []}
+        for idx, (channel, value) in enumerate(writes):
+            idx = WRITES_IDX_MAP.get(channel, idx)
+            rows["INSERT OR IGNORE" if idx >= 0 else "INSERT OR REPLACE"].append(
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint_id,
+                    task_id,
+                    idx,
+                    channel,
+                    *self.serde.dumps_typed(value),
+                    task_path,
+                )
+            )
+        with self._lock, self._connection:
+            for statement, values in rows.items():
+                self._connection.executemany(
+                    f"{statement} INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", values
+                )
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes of a thread.
+
+        Args:
+            thread_id: Thread to delete
+        """
+        with self._lock, self._connection:
+            for table in ("checkpoints", "blobs", "writes"):
+                self._connection.execute(f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,))
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """Async version of ``get_tuple``."""
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """Async version of ``list``."""
+        items = await asyncio.to_thread(
+            lambda: [*self.list(config, filter=filter, before=before, limit=limit)]
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Async version of ``put``."""
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Async version of ``put_writes``."""
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Async version of ``delete_thread``."""
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+    def get_next_version(self, current: Optional[str], channel: None) -> str:
+        """Get the next channel version (monotonic and sortable as a string)."""
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _load_tuple(self, thread_id: str, checkpoint_ns: str, row: Sequence[Any]) -> CheckpointTuple:
+        """Build a checkpoint tuple from a checkpoints row (lock held by the caller)."""
+        checkpoint_id, parent_checkpoint_id, type_, serialized, metadata_type, metadata = row
+        checkpoint: Checkpoint = self.serde.loads_typed((type_, serialized))
+        channel_values: Dict[str, Any] = {}
+        for channel, version in checkpoint["channel_versions"].items():
+            blob = self._connection.execute(
+                "SELECT type, blob FROM blobs WHERE thread_id = ? AND checkpoint_ns = ?"
+                " AND channel = ? AND version = ?",
+                (thread_id, checkpoint_ns, channel, str(version)),
+            ).fetchone()
+            if blob is not None and blob[0] != "empty":
+                channel_values[channel] = self.serde.loads_typed(blob)
+        writes = self._connection.execute(
+            "SELECT task_id, idx, channel, type, value, task_path FROM writes"
+            " WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+        writes.sort(key=lambda write: writes_sort_key(write[5], write[0], write[1]))
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint={**checkpoint, "channel_values": channel_values},
+            metadata=self.serde.loads_typed((metadata_type, metadata)),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_checkpoint_id,
+                    }
+                }
+                if parent_checkpoint_id
+                else None
+            ),
+            pending_writes=[
+                (task_id, channel, self.serde.loads_typed((value_type, value)))
+                for task_id, _, channel, value_type, value, _ in writes
+            ],
+        )
+
+
+def new_thread_id() -> str:
+    """Create a checkpoint thread ID unique to one run.
+
+    Runs are never matched up by their input, so identical concurrent runs
+    keep separate checkpoints. Pass the same ``thread_id`` explicitly to
+    resume a failed run.
+
+    Returns:
+        Random hex thread ID
+    """
+    return uuid.uuid4().hex
+
+
+_checkpointers: Dict[Path, SQLiteCheckpointSaver] = {}
+
+
+def get_checkpointer(path: Union[str, Path]) -> SQLiteCheckpointSaver:
+    """Get the process-wide checkpointer for a database file.
+
+    Args:
+        path: SQLite database file
+
+    Returns:
+        Checkpointer shared by every workflow using the same file
+    """
+    key = Path(path).resolve()
+    checkpointer = _checkpointers.get(key)
+    if checkpointer is None:
+        checkpointer = _checkpointers[key] = SQLiteCheckpointSaver(key)
+    return checkpointer
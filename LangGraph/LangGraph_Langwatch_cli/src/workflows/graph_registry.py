@@ -0,0 +1,100 @@
+"""Process-wide registry of compiled workflow graphs."""
+
+import hashlib
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Tuple
+
+if TYPE_CHECKING:
+    from .base_workflow import BaseWorkflow, WorkflowConfig
+
+
+GraphKey = Tuple[type, str]
+
+
+def config_hash(config: "WorkflowConfig") -> str:
+    """Compute a stable hash of a workflow configuration.
+
+    Args:
+        config: Workflow configuration
+
+    Returns:
+        Hex digest identifying the configuration
+    """
+    return hashlib.sha256(config.model_dump_json().encode("utf-8")).hexdigest()
+
+
+class GraphRegistry:
+    """Compile each workflow topology once per process and share it.
+
+    Graphs are keyed on the workflow class and a hash of its ``WorkflowConfig``,
+    so every instance with the same class and configuration reuses one compiled
+    graph. Workflows must therefore not close over per-instance state (such as
+    agents) in their nodes; those are passed through the runtime config. The
+    workflow's checkpointer, if any, is attached to the compiled graph.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._graphs: Dict[GraphKey, Any] = {}
+
+    @staticmethod
+    def key_for(workflow: "BaseWorkflow") -> GraphKey:
+        """Get the registry key for a workflow instance.
+
+        Args:
+            workflow: Workflow instance
+
+        Returns:
+            Tuple of workflow class and configuration hash
+        """
+        return (workflow.__class__, config_hash(workflow.config))
+
+    async def get_or_compile(self, workflow: "BaseWorkflow") -> Any:
+        """Get the compiled graph for a workflow, compiling it on first use.
+
+        Args:
+            workflow: Workflow instance
+
+        Returns:
+            Compiled LangGraph graph shared by all matching instances
+        """
+        key = self.key_for(workflow)
+        graph = self._graphs.get(key)
+        if graph is None:
+            graph = await workflow.build_graph()
+            checkpointer = workflow.get_checkpointer()
+            if checkpointer is not None:
+                graph = graph.copy(update={"checkpointer": checkpointer})
+            graph = self._graphs.setdefault(key, graph)
+        return graph
+
+    async def warm_up(self, workflows: Iterable["BaseWorkflow"]) -> int:
+        """Compile graphs for the given workflows ahead of the first request.
+
+        Args:
+            workflows: Workflow instances to compile
+
+        Returns:
+            Number of graphs compiled by this call
+        """
+        compiled = 0
+        for workflow in workflows:
+            if self.key_for(workflow) not in self._graphs:
+                compiled += 1
+            workflow.graph = await self.get_or_compile(workflow)
+        return compiled
+
+    def clear(self) -> None:
+        """Drop all compiled graphs."""
+        self._graphs.clear()
+
+    def __contains__(self, workflow: "BaseWorkflow") -> bool:
+        """Check whether a workflow's graph is already compiled."""
+        return self.key_for(workflow) in self._graphs
+
+    def __len__(self) -> int:
+        """Number of compiled graphs in the registry."""
+        return len(self._graphs)
+
+
+# Global instance
+graph_registry = GraphRegistry()
@@ -1,18 +1,160 @@
 """Research and Summarization workflow implementation."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import operator
+from typing import Annotated, Any, AsyncIterator, Dict, List, Optional, Tuple, TypedDict
 
 from langchain_core.messages import HumanMessage
-from langgraph.graph import StateGraph
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph import START, StateGraph
+from langgraph.types import Send
+from pydantic import Field
 
+from agents.base_agent import BaseAgent
 from agents.research_agent.research_agent import ResearchAgent
+from agents.research_agent.research_engine import decompose_query
 from agents.summarization_agent.summarization_agent import SummarizationAgent
 from .base_workflow import BaseWorkflow, WorkflowConfig
 
 
+class ResearchSummarizationConfig(WorkflowConfig):
+    """Configuration for the research and summarization workflow."""
+
+    max_branches: int = Field(
+        default=1,
+        description="Maximum parallel research branches (1 researches the query as a whole)",
+    )
+    streaming_handoff: bool = Field(
+        default=False,
+        description="Summarize research sections while the research is still streaming",
+    )
+    handoff_section_chars: int = Field(
+        default=2000,
+        description="Minimum section size handed off to summarization",
+    )
+
+
+class ResearchSection(TypedDict, total=False):
+    """Research produced by one branch, with its partial summaries (hand-off only)."""
+
+    index: int
+    query: str
+    content: str
+    summaries: List[str]
+
+
+class WorkflowState(TypedDict, total=False):
+    """Workflow state container."""
+
+    query: str
+    context: Dict[str, Any]
+    research_sections: Annotated[List[ResearchSection], operator.add]
+    research_result: str
+    summary: str
+
+
+class ResearchBranchState(TypedDict):
+    """Input of one research branch."""
+
+    index: int
+    query: str
+    context: Dict[str, Any]
+
+
+def plan_sub_queries(query: str, max_branches: int) -> List[str]:
+    """Split a query into the sub-queries researched in parallel branches.
+
+    Args:
+        query: Research query
+        max_branches: Maximum number of branches
+
+    Returns:
+        The compound parts of the query, or the query itself if it has none
+    """
+    sub_queries = decompose_query(query, max_branches + 1)
+    if max_branches <= 1 or len(sub_queries) <= 2:
+        return [query]
+    return sub_queries[1:]
+
+
+def find_section_break(text: str, min_chars: int) -> Optional[int]:
+    """Find where a complete section of streamed text ends.
+
+    Args:
+        text: Text streamed so far and not yet handed off
+        min_chars: Minimum section size
+
+    Returns:
+        Index after the last paragraph break past ``min_chars``, or None
+    """
+    cut = text.rfind("\n\n")
+    if cut < min_chars:
+        return None
+    return cut + 2
+
+
+async def research_with_handoff(
+    research_agent: BaseAgent,
+    summarization_agent: BaseAgent,
+    messages: List[HumanMessage],
+    context: Dict[str, Any],
+    summary_context: Dict[str, Any],
+    section_chars: int,
+) -> Tuple[str, List[str]]:
+    """Stream research and summarize each section as soon as it is complete.
+
+    Agents without ``stream`` hand off their whole response as one section.
+
+    Args:
+        research_agent: Agent producing the research
+        summarization_agent: Agent summarizing each section
+        messages: Research request
+        context: Research context
+        summary_context: Summarization context
+        section_chars: Minimum section size handed off
+
+    Returns:
+        Full research text and the summaries of its sections, in order
+    """
+
+    async def summarize(section: str) -> str:
+        result = await summarization_agent.execute(
+            [HumanMessage(content=section)], summary_context
+        )
+        return result.content
+
+    stream = getattr(research_agent, "stream", None)
+    if stream is None:
+        content = (await research_agent.execute(messages, context)).content
+        return content, [await summarize(content)]
+
+    chunks: List[str] = []
+    pending = ""
+    summaries: List[asyncio.Task] = []
+    try:
+        async for chunk in stream(messages, context):
+            chunks.append(chunk)
+            pending += chunk
+            cut = find_section_break(pending, section_chars)
+            if cut is not None:
+                summaries.append(asyncio.create_task(summarize(pending[:cut])))
+                pending = pending[cut:]
+        if pending.strip():
+            summaries.append(asyncio.create_task(summarize(pending)))
+        return "".join(chunks), list(await asyncio.gather(*summaries))
+    finally:
+        unfinished = [task for task in summaries if not task.done()]
+        for task in unfinished:
+            task.cancel()
+        if unfinished:
+            await asyncio.gather(*unfinished, return_exceptions=True)
+
+
 class ResearchSummarizationWorkflow(BaseWorkflow):
     """Workflow that combines research and summarization agents."""
 
+    config: ResearchSummarizationConfig
+
     def __init__(
         self,
         research_agent: Optional[ResearchAgent] = None,
@@ -24,15 +166,18 @@ class ResearchSummarizationWorkflow(BaseWorkflow):
         Args:
             research_agent: Research agent instance
             summarization_agent: Summarization agent instance
-            config: Workflow configuration
+            config: Workflow configuration (``ResearchSummarizationConfig``
+                enables parallel branches and streaming hand-off)
         """
         if config is None:
-            config = WorkflowConfig(
+            config = ResearchSummarizationConfig(
                 name="research_summarization_workflow",
                 description="Combines research and summarization for comprehensive analysis",
                 max_iterations=5,
                 timeout_seconds=600,
             )
+        elif not isinstance(config, ResearchSummarizationConfig):
+            config = ResearchSummarizationConfig(**config.model_dump())
         
         super().__init__(config)
         
@@ -41,41 +186,37 @@ class ResearchSummarizationWorkflow(BaseWorkflow):
 
     async def build_graph(self) -> StateGraph:
         """Build the workflow graph.
+
+        By default research and summarization run one after the other. With
+        ``max_branches`` above 1 or ``streaming_handoff``, the parallel
+        topology from ``build_parallel_graph`` is used instead.
         
         Returns:
-            Configured LangGraph graph
+            Compiled LangGraph graph
         """
-        # TODO: Implement actual LangGraph graph construction
-        # This is a mockup implementation
-        
-        # Define the workflow state
-        class WorkflowState(Dict[str, Any]):
-            """Workflow state container."""
-            pass
+        if self.config.max_branches > 1 or self.config.streaming_handoff:
+            return self.build_parallel_graph()
 
-        # Create state graph
         graph = StateGraph(WorkflowState)
-        
-        # Define nodes
-        async def research_node(state: WorkflowState) -> WorkflowState:
+
+        async def research_node(state: WorkflowState, config: RunnableConfig) -> Dict[str, Any]:
             """Research node execution."""
-            query = state.get("query", "")
-            messages = [HumanMessage(content=query)]
-            result = await self.research_agent.execute(messages, state.get("context"))
-            state["research_result"] = result.content
-            return state
+            research_agent = config["configurable"]["research_agent"]
+            messages = [HumanMessage(content=state["query"])]
+            result = await research_agent.execute(messages, state.get("context"))
+            return {"research_result": result.content}
 
-        async def summarization_node(state: WorkflowState) -> WorkflowState:
+        async def summarization_node(state: WorkflowState, config: RunnableConfig) -> Dict[str, Any]:
             """Summarization node execution."""
-            research_content = state.get("research_result", "")
-            messages = [HumanMessage(content=research_content)]
-            result = await self.summarization_agent.execute(messages, state.get("context"))
-            state["summary"] = result.content
-            return state
-
-        # Add nodes to graph
-        graph.add_node("research", research_node)
-        graph.add_node("summarization", summarization_node)
+            messages = [HumanMessage(content=state.get("research_result", ""))]
+            context = {"summary_style": "comprehensive", **state.get("context", {})}
+            summarization_agent = config["configurable"]["summarization_agent"]
+            result = await summarization_agent.execute(messages, context)
+            return {"summary": result.content}
+
+        # Add nodes to graph, each bounded by the per-node timeout
+        graph.add_node("research", self.wrap_node("research", research_node))
+        graph.add_node("summarization", self.wrap_node("summarization", summarization_node))
         
         # Define edges
         graph.add_edge("research", "summarization")
@@ -84,10 +225,98 @@ class ResearchSummarizationWorkflow(BaseWorkflow):
         graph.set_entry_point("research")
         graph.set_finish_point("summarization")
         
-        compiled_graph = graph.compile()
-        self.graph = compiled_graph
-        
-        return compiled_graph
+        return graph.compile()
+
+    def build_parallel_graph(self) -> StateGraph:
+        """Build the graph with fan-out research branches.
+
+        Compound queries are split into sub-queries researched by parallel
+        ``research`` branches; their sections are merged by the state reducer
+        in query order. With ``streaming_handoff``, each branch summarizes its
+        research section by section while it is still streaming, and the
+        ``summarization`` node only combines the partial summaries. End-to-end
+        latency then follows the slowest branch rather than the sum of steps.
+
+        Returns:
+            Compiled LangGraph graph
+        """
+        max_branches = self.config.max_branches
+        streaming_handoff = self.config.streaming_handoff
+        section_chars = self.config.handoff_section_chars
+        graph = StateGraph(WorkflowState)
+
+        def summary_context(state: Dict[str, Any]) -> Dict[str, Any]:
+            return {"summary_style": "comprehensive", **state.get("context", {})}
+
+        def fan_out(state: WorkflowState) -> List[Send]:
+            """Send each sub-query to its own research branch."""
+            sub_queries = plan_sub_queries(state["query"], max_branches)
+            context = state.get("context", {})
+            return [
+                Send("research", {"index": index, "query": sub_query, "context": context})
+                for index, sub_query in enumerate(sub_queries)
+            ]
+
+        async def research_node(state: ResearchBranchState, config: RunnableConfig) -> Dict[str, Any]:
+            """Research one sub-query, summarizing its sections on hand-off."""
+            components = config["configurable"]
+            messages = [HumanMessage(content=state["query"])]
+            section: ResearchSection = {"index": state["index"], "query": state["query"]}
+            if streaming_handoff:
+                section["content"], section["summaries"] = await research_with_handoff(
+                    components["research_agent"],
+                    components["summarization_agent"],
+                    messages,
+                    state["context"],
+                    summary_context(state),
+                    section_chars,
+                )
+            else:
+                result = await components["research_agent"].execute(messages, state["context"])
+                section["content"] = result.content
+            return {"research_sections": [section]}
+
+        async def summarization_node(state: WorkflowState, config: RunnableConfig) -> Dict[str, Any]:
+            """Merge the research sections and summarize them."""
+            sections = sorted(state["research_sections"], key=lambda section: section["index"])
+            if len(sections) == 1:
+                research_result = sections[0]["content"]
+            else:
+                research_result = "\n\n".join(
+                    f"## {section['query']}\n\n{section['content']}" for section in sections
+                )
+            summaries = [summary for section in sections for summary in section.get("summaries", [])]
+            if len(summaries) == 1:
+                return {"research_result": research_result, "summary": summaries[0]}
+
+            summarization_agent = config["configurable"]["summarization_agent"]
+            text = "\n\n".join(summaries) if summaries else research_result
+            result = await summarization_agent.execute(
+                [HumanMessage(content=text)], summary_context(state)
+            )
+            return {"research_result": research_result, "summary": result.content}
+
+        graph.add_node("research", self.wrap_node("research", research_node))
+        graph.add_node("summarization", self.wrap_node("summarization", summarization_node))
+        graph.add_conditional_edges(START, fan_out, ["research"])
+        graph.add_edge("research", "summarization")
+        graph.set_finish_point("summarization")
+
+        return graph.compile()
+
+    def get_runtime_components(self) -> Dict[str, Any]:
+        """Get the agents injected into the shared graph's nodes."""
+        return {
+            "research_agent": self.research_agent,
+            "summarization_agent": self.summarization_agent,
+        }
+
+    def _initial_state(self, input_data: Dict[str, Any]) -> WorkflowState:
+        """Build the initial graph state from workflow input."""
+        return {
+            "query": input_data.get("query", ""),
+            "context": input_data.get("context", {}),
+        }
 
     async def execute(
         self,
@@ -102,53 +331,60 @@ class ResearchSummarizationWorkflow(BaseWorkflow):
             
         Returns:
             Dictionary containing research_result and summary
+
+        Raises:
+            ValueError: If input data is invalid
+            WorkflowTimeoutError: If a node or the whole run times out
         """
         if not await self.validate_input(input_data):
             raise ValueError("Invalid input data")
 
-        # Ensure graph is built
-        if self.graph is None:
-            await self.build_graph()
-
-        # Prepare initial state
-        initial_state = {
-            "query": input_data.get("query", ""),
-            "context": input_data.get("context", {}),
-        }
-
-        # TODO: Execute actual graph when LangGraph is properly integrated
-        # For now, execute steps sequentially as mockup
-        
-        # Step 1: Research
-        research_messages = [HumanMessage(content=initial_state["query"])]
-        research_result = await self.research_agent.execute(
-            research_messages, 
-            initial_state["context"]
-        )
-        
-        # Step 2: Summarization
-        summary_messages = [HumanMessage(content=research_result.content)]
-        summary_result = await self.summarization_agent.execute(
-            summary_messages,
-            {**initial_state["context"], "summary_style": "comprehensive"}
-        )
+        final_state = await self.run_graph(self._initial_state(input_data), config)
 
         return {
-            "query": initial_state["query"],
-            "research_result": research_result.content,
-            "summary": summary_result.content,
+            "query": final_state["query"],
+            "research_result": final_state.get("research_result", ""),
+            "summary": final_state.get("summary", ""),
             "workflow_status": "completed",
         }
 
+    async def stream(
+        self,
+        input_data: Dict[str, Any],
+        config: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Execute the workflow, yielding each node's output as soon as it finishes.
+
+        Args:
+            input_data: Must contain 'query' key
+            config: Optional execution configuration
+
+        Yields:
+            Tuples of node name ("research", "summarization") and its output
+
+        Raises:
+            ValueError: If input data is invalid
+            WorkflowTimeoutError: If a node or the whole run times out
+        """
+        if not await self.validate_input(input_data):
+            raise ValueError("Invalid input data")
+
+        async for node_name, update in self.stream_graph(
+            self._initial_state(input_data), config
+        ):
+            yield node_name, update
+
     async def health_check(self) -> str:
         """Perform health check on the workflow."""
-        research_health = await self.research_agent.health_check()
-        summary_health = await self.summarization_agent.health_check()
-        
-        if "healthy" in research_health and "healthy" in summary_health:
-            return "healthy"
-        else:
-            return f"degraded (research: {research_health}, summary: {summary_health})"
+        agents = self.get_agents()
+        statuses = await asyncio.gather(
+            *(agent.health_check() for agent in agents.values()),
+            return_exceptions=True,
+        )
+        return self.summarize_health({
+            label: f"error: {status}" if isinstance(status, BaseException) else status
+            for label, status in zip(agents, statuses, strict=True)
+        })
 
     def get_workflow_steps(self) -> List[str]:
         """Get workflow steps."""
@@ -162,7 +398,7 @@ class ResearchSummarizationWorkflow(BaseWorkflow):
     async def validate_input(self, input_data: Dict[str, Any]) -> bool:
         """Validate input data."""
         return (
-            super().validate_input(input_data) 
+            await super().validate_input(input_data)
             and "query" in input_data 
             and bool(input_data["query"].strip())
         )
\ No newline at end of file
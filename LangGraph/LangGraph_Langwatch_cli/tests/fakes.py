@@ -0,0 +1,70 @@
+"""Fake components shared by the test suite."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+from langchain_core.messages import AIMessage
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from agents.base_agent import AgentConfig, BaseAgent
+from workflows.base_workflow import BaseWorkflow, WorkflowConfig
+
+
+class FakeAgent(BaseAgent):
+    """Agent returning a canned response after an optional delay."""
+
+    def __init__(self, name: str, reply: str, delay: float = 0.0):
+        super().__init__(AgentConfig(name=name, description=f"Fake {name}"))
+        self.reply = reply
+        self.delay = delay
+        self.calls = []
+        self.cancelled = False
+        self.health = "healthy"
+        self.health_delay = 0.0
+        self.health_checks = 0
+
+    async def execute(self, messages, context=None):
+        self.calls.append((messages[0].content, context))
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return AIMessage(content=self.reply)
+
+    async def health_check(self):
+        self.health_checks += 1
+        await asyncio.sleep(self.health_delay)
+        return self.health
+
+
+class FakeWorkflow(BaseWorkflow):
+    """Workflow sleeping for ``input_data["delay"]`` and tracking concurrency."""
+
+    def __init__(self, name: str = "fake_workflow"):
+        super().__init__(WorkflowConfig(name=name, description="Fake workflow"))
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.started = []
+        self.executed = []
+
+    async def build_graph(self):
+        raise NotImplementedError
+
+    async def execute(self, input_data, config=None):
+        self.started.append(input_data["query"])
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(input_data.get("delay", 0))
+            if input_data.get("fail"):
+                raise RuntimeError("boom")
+            self.executed.append(input_data["query"])
+            return {"query": input_data["query"], "workflow_status": "completed"}
+        finally:
+            self.in_flight -= 1
+
+    async def health_check(self):
+        return "healthy"
@@ -0,0 +1,182 @@
+"""Tests for the LLM-backed research agent against a local fake server."""
+
+import sys
+from pathlib import Path
+
+import pytest
+from langchain_core.messages import HumanMessage
+from langchain_openai import AzureChatOpenAI
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from agents.base_agent import AgentConfig
+from agents.research_agent.research_agent import ResearchAgent
+from llm import TokenBudget, estimate_tokens
+from llm.fake_server import FakeLLMServer
+from monitoring.langwatch_tracker import LangWatchTracker
+
+
+@pytest.fixture
+def server():
+    """Run a fake OpenAI-compatible server for the duration of a test."""
+    with FakeLLMServer(response_tokens=20) as fake:
+        yield fake
+
+
+def make_agent(server, max_tokens=100, tracker=None):
+    """Create a research agent talking to the fake server."""
+    chat_model = AzureChatOpenAI(
+        azure_endpoint=server.base_url,
+        api_key="test-key",
+        api_version="2024-02-01",
+        azure_deployment="research",
+        streaming=True,
+        stream_usage=True,
+        max_retries=0,
+    )
+    config = AgentConfig(
+        name="research_agent",
+        description="Research test agent",
+        max_tokens=max_tokens,
+    )
+    return ResearchAgent(config=config, tracker=tracker, chat_model=chat_model)
+
+
+class TestResearchAgentLLM:
+    """Test suite for the streaming research execution path."""
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_model_response_with_usage(self, server):
+        """Test execute aggregates the streamed response and token usage."""
+        agent = make_agent(server)
+
+        result = await agent.execute([HumanMessage(content="Electric vehicles")])
+
+        assert result.content == "token " * 20
+        assert result.usage_metadata["output_tokens"] == 20
+        assert result.usage_metadata["input_tokens"] > 0
+
+    @pytest.mark.asyncio
+    async def test_prompt_uses_system_and_user_templates(self, server):
+        """Test the request carries the rendered system and user templates."""
+        agent = make_agent(server)
+
+        await agent.execute(
+            [HumanMessage(content="Electric vehicles")],
+            {"primary_focus": "Battery costs", "research_type": "market_research"},
+        )
+
+        messages = server.requests[-1]["body"]["messages"]
+        assert [message["role"] for message in messages] == ["system", "user"]
+        assert "Research Agent" in messages[0]["content"]
+        assert "market trends" in messages[0]["content"]
+        assert "Research Request: Electric vehicles" in messages[1]["content"]
+        assert "Primary focus: Battery costs" in messages[1]["content"]
+
+    @pytest.mark.asyncio
+    async def test_completion_budget_follows_depth(self, server):
+        """Test the completion budget scales with the research depth."""
+        agent = make_agent(server, max_tokens=10)
+
+        surface = await agent.execute(
+            [HumanMessage(content="Query")], {"depth_level": "surface"}
+        )
+        deep = await agent.execute(
+            [HumanMessage(content="Query")], {"depth_level": "deep"}
+        )
+
+        bodies = [request["body"] for request in server.requests]
+        limits = [body.get("max_completion_tokens") or body.get("max_tokens") for body in bodies]
+        assert limits == [5, 20]
+        assert surface.usage_metadata["output_tokens"] == 5
+        assert deep.usage_metadata["output_tokens"] == 20
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_incremental_chunks(self, server):
+        """Test stream yields the response as several chunks."""
+        agent = make_agent(server)
+
+        chunks = [chunk async for chunk in agent.stream([HumanMessage(content="Query")])]
+
+        assert len(chunks) == 20
+        assert "".join(chunks) == "token " * 20
+
+    @pytest.mark.asyncio
+    async def test_long_context_is_truncated_to_prompt_budget(self, server):
+        """Test oversized context is cut to fit the prompt budget."""
+        agent = make_agent(server)
+        budget = TokenBudget(prompt_tokens=1000, completion_tokens=10)
+
+        messages = agent.build_messages(
+            [HumanMessage(content="Query")], {"context": "x" * 100_000}, budget
+        )
+
+        total = sum(estimate_tokens(message.content) for message in messages)
+        assert total <= budget.prompt_tokens
+
+    @pytest.mark.asyncio
+    async def test_prompt_over_budget_without_context_raises(self, server):
+        """Test a prompt that cannot fit the budget is rejected."""
+        agent = make_agent(server)
+        budget = TokenBudget(prompt_tokens=10, completion_tokens=10)
+
+        with pytest.raises(ValueError, match="exceeds"):
+            agent.build_messages([HumanMessage(content="Query")], None, budget)
+
+    @pytest.mark.asyncio
+    async def test_execution_is_tracked_with_tokens(self, server):
+        """Test latency and token counts are reported to the tracker."""
+        tracker = LangWatchTracker(project_name="test")
+        agent = make_agent(server, tracker=tracker)
+
+        await agent.execute([HumanMessage(content="Query")], {"session_id": "s1"})
+
+        event = tracker.get_events("agent_execution")[-1]
+        assert event.session_id == "s1"
+        assert event.data["completion_tokens"] == 20
+        assert event.data["prompt_tokens"] > 0
+        assert 0 < event.data["time_to_first_token"] <= event.data["execution_time"]
+
+    @pytest.mark.asyncio
+    async def test_stream_is_tracked(self, server):
+        """Test a fully consumed stream reports latency and tokens."""
+        tracker = LangWatchTracker(project_name="test")
+        agent = make_agent(server, tracker=tracker)
+
+        chunks = [
+            chunk
+            async for chunk in agent.stream([HumanMessage(content="Query")], {"session_id": "s1"})
+        ]
+
+        [event] = tracker.get_events("agent_execution")
+        assert event.session_id == "s1"
+        assert event.data["output_length"] == len("".join(chunks))
+        assert event.data["completion_tokens"] == 20
+        assert 0 < event.data["time_to_first_token"] <= event.data["execution_time"]
+
+    @pytest.mark.asyncio
+    async def test_closed_stream_is_tracked(self, server):
+        """Test a stream closed early reports what was streamed so far."""
+        tracker = LangWatchTracker(project_name="test")
+        agent = make_agent(server, tracker=tracker)
+
+        stream = agent.stream([HumanMessage(content="Query")])
+        chunks = [await anext(stream) for _ in range(3)]
+        await stream.aclose()
+
+        [event] = tracker.get_events("agent_execution")
+        assert event.data["output_length"] == len("".join(chunks))
+        assert event.data["completion_tokens"] == 3
+
+    @pytest.mark.asyncio
+    async def test_mockup_mode_without_chat_model(self):
+        """Test the agent falls back to mockup responses when unconfigured."""
+        agent = ResearchAgent(
+            config=AgentConfig(name="research_agent", description="Mockup agent")
+        )
+        agent.chat_model = None
+
+        result = await agent.execute([HumanMessage(content="Query")])
+
+        assert "mockup" in result.content
+        assert await agent.health_check() == "healthy (mockup mode)"
@@ -0,0 +1,202 @@
+"""Tests for the concurrent multi-source research engine."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from langchain_core.messages import HumanMessage
+from langchain_core.tools import tool
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from agents.base_agent import AgentConfig
+from agents.research_agent.research_agent import ResearchAgent
+from agents.research_agent.research_engine import (
+    ResearchEngine,
+    ResearchResult,
+    decompose_query,
+)
+from agents.research_agent.retrievers import (
+    LocalCorpusRetriever,
+    MCPToolRetriever,
+    Source,
+    WebSearchRetriever,
+)
+from config.research_config import ResearchConfig
+from llm import estimate_tokens
+
+CORPUS = [
+    Source(title="Battery costs", content="Lithium battery costs for electric vehicles fell sharply."),
+    Source(title="Charging", content="Charging networks for electric vehicles expand across Europe."),
+    Source(title="Batteries copy", content="Lithium battery costs for electric vehicles fell sharply!"),
+    Source(title="Unrelated", content="Wheat harvests depend on rainfall."),
+]
+
+
+class SlowRetriever:
+    """Retriever returning fixed sources after a delay."""
+
+    def __init__(self, name, sources, delay=0.0, error=None):
+        self.name = name
+        self.sources = sources
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = 0
+
+    async def retrieve(self, query, limit):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error:
+            raise self.error
+        return self.sources[:limit]
+
+
+def make_config(**overrides):
+    """Create a research config for tests."""
+    return ResearchConfig(**{"max_sources": 10, "confidence_threshold": 0.7, **overrides})
+
+
+class TestResearchEngine:
+    """Test suite for source gathering."""
+
+    def test_decompose_splits_compound_queries(self):
+        """Test compound queries become sub-questions after the full query."""
+        query = "electric vehicle battery costs and charging network growth"
+
+        sub_questions = decompose_query(query)
+
+        assert sub_questions == [
+            query,
+            "electric vehicle battery costs",
+            "charging network growth",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_local_corpus_ranks_and_dedupes(self):
+        """Test near-duplicate documents are dropped and sources ranked."""
+        engine = ResearchEngine(
+            [LocalCorpusRetriever(CORPUS)],
+            config=make_config(min_confident_sources=10),
+        )
+
+        result = await engine.research("electric vehicles battery costs")
+
+        titles = [source.title for source in result.sources]
+        assert titles == ["Battery costs", "Charging"]
+        assert result.duplicates_removed >= 1
+        assert result.sources[0].score == 1.0
+
+    @pytest.mark.asyncio
+    async def test_retrievers_run_concurrently(self):
+        """Test sub-question and retriever fetches overlap in time."""
+        retrievers = [
+            SlowRetriever(f"r{i}", [Source(content=f"unique finding number {i}")], delay=0.1)
+            for i in range(4)
+        ]
+        engine = ResearchEngine(retrievers, config=make_config(min_confident_sources=10))
+
+        start = time.perf_counter()
+        result = await engine.research("finding")
+        elapsed = time.perf_counter() - start
+
+        assert len(result.sources) == 4
+        assert elapsed < 0.3
+
+    @pytest.mark.asyncio
+    async def test_stops_early_on_confident_evidence(self):
+        """Test slow retrievers are cancelled once enough evidence is in."""
+        fast = SlowRetriever(
+            "fast",
+            [Source(content=f"solar panel efficiency study {i}", url=f"u{i}") for i in range(3)],
+        )
+        slow = SlowRetriever("slow", [Source(content="solar panel late result")], delay=5)
+        engine = ResearchEngine([fast, slow], config=make_config(min_confident_sources=3))
+
+        result = await asyncio.wait_for(engine.research("solar panel efficiency"), 1)
+
+        assert result.stopped_early
+        assert result.confident_sources == 3
+        assert slow.cancelled == slow.calls
+
+    @pytest.mark.asyncio
+    async def test_failing_retriever_is_recorded(self):
+        """Test a failing backend does not fail the whole research."""
+        engine = ResearchEngine(
+            [
+                SlowRetriever("broken", [], error=RuntimeError("backend down")),
+                LocalCorpusRetriever(CORPUS),
+            ],
+            config=make_config(min_confident_sources=10),
+        )
+
+        result = await engine.research("charging networks")
+
+        assert result.sources[0].title == "Charging"
+        assert "broken: backend down" in result.errors
+
+    @pytest.mark.asyncio
+    async def test_mcp_tool_and_web_stub_retrievers(self):
+        """Test tool output is parsed into sources and the web stub is empty."""
+
+        @tool
+        def search(query: str) -> list[dict]:
+            """Search documents."""
+            return [{"text": f"Result about {query}", "title": "Doc", "url": "https://a"}]
+
+        sources = await MCPToolRetriever(search).retrieve("wind power", 5)
+
+        assert sources == [
+            Source(content="Result about wind power", title="Doc", url="https://a", retriever="search")
+        ]
+        assert await WebSearchRetriever().retrieve("wind power", 5) == []
+
+    def test_evidence_fits_token_budget(self):
+        """Test formatted evidence respects the token budget."""
+        result = ResearchResult(
+            query="q",
+            sources=[Source(title=f"S{i}", content="word " * 200) for i in range(5)],
+        )
+
+        evidence = result.format_evidence(400)
+
+        assert estimate_tokens(evidence) <= 400
+        assert evidence.startswith("[1] S0")
+
+
+class TestResearchAgentSources:
+    """Test suite for research agent source integration."""
+
+    @pytest.mark.asyncio
+    async def test_agent_reports_gathered_sources(self):
+        """Test the agent attaches gathered sources to its response."""
+        agent = ResearchAgent(
+            config=AgentConfig(name="research_agent", description="Source agent"),
+            retrievers=[LocalCorpusRetriever(CORPUS)],
+        )
+        agent.chat_model = None
+
+        result = await agent.execute([HumanMessage(content="electric vehicles charging")])
+
+        titles = [source["title"] for source in result.response_metadata["sources"]]
+        assert titles[0] == "Charging"
+
+    @pytest.mark.asyncio
+    async def test_sources_are_added_to_prompt_context(self):
+        """Test evidence is placed in the prompt context within budget."""
+        agent = ResearchAgent(
+            config=AgentConfig(name="research_agent", description="Source agent"),
+            retrievers=[LocalCorpusRetriever(CORPUS)],
+        )
+
+        context, _ = await agent.gather_sources(
+            [HumanMessage(content="electric vehicles charging")], {"context": "EU market"}
+        )
+
+        assert context["context"].startswith("EU market\n\n## Sources:\n[1] Charging")
@@ -0,0 +1,138 @@
+"""Tests for the compact research agent graph state."""
+
+import sys
+from pathlib import Path
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph import END, START, StateGraph
+from pydantic import ValidationError
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from agents.research_agent.state import MessageLog, State, append_messages, validate_state
+from models.relevant_data import Evidence, RelevantData, merge_relevant_data
+
+
+def messages(count, start=0):
+    """Create alternating human and AI messages."""
+    return [
+        HumanMessage(content=f"m{i}") if i % 2 == 0 else AIMessage(content=f"m{i}")
+        for i in range(start, start + count)
+    ]
+
+
+class TestMessageLog:
+    """Test suite for the append-only message log."""
+
+    def test_append_shares_history(self):
+        """Test appends leave the original unchanged and share its messages."""
+        history = messages(3)
+        log = MessageLog(history)
+
+        longer = log.append(messages(2, start=3))
+
+        assert len(log) == 3 and len(longer) == 5
+        assert list(log) == history
+        assert list(longer) == messages(5)
+        assert longer[0] is log[0]
+
+    def test_indexing_and_slicing(self):
+        """Test the log behaves like a sequence across appended chunks."""
+        log = MessageLog(messages(2))
+        for i in range(2, 6):
+            log = log.append(messages(1, start=i))
+
+        assert log[-1].content == "m5"
+        assert log[-4].content == "m2"
+        assert log[1].content == "m1"
+        assert [message.content for message in log[2:4]] == ["m2", "m3"]
+        with pytest.raises(IndexError):
+            log[6]
+
+    def test_equality(self):
+        """Test logs compare equal to logs and lists with the same messages."""
+        log = MessageLog(messages(1)).append(messages(1, start=1))
+
+        assert log == MessageLog(messages(2))
+        assert log == messages(2)
+        assert log != messages(1)
+
+    def test_reducer_accepts_single_messages_and_lists(self):
+        """Test the state reducer appends whatever a node returns."""
+        log = append_messages(MessageLog(), messages(1))
+        log = append_messages(log, AIMessage(content="m1"))
+
+        assert log == messages(2)
+
+
+class TestRelevantData:
+    """Test suite for the evidence container."""
+
+    def test_add_and_top(self):
+        """Test evidence is appended immutably and ranked by score."""
+        data = RelevantData().add([Evidence("a", score=0.2), Evidence("b", score=0.9)])
+
+        merged = merge_relevant_data(data, [Evidence("c", score=0.5)])
+
+        assert len(data) == 2
+        assert [item.content for item in merged] == ["a", "b", "c"]
+        assert [item.content for item in merged.top(2)] == ["b", "c"]
+
+    def test_from_sources(self):
+        """Test retriever sources convert to evidence."""
+
+        class Source:
+            content, title, url, retriever, score = "text", "Title", "https://x", "local", 0.7
+
+        data = RelevantData.from_sources([Source()])
+
+        assert data.evidence == (Evidence("text", "Title", "https://x", "local", 0.7),)
+
+
+class TestState:
+    """Test suite for the compact graph state."""
+
+    def test_validate_state_at_boundary(self):
+        """Test message and evidence dicts are validated into the compact state."""
+        state = validate_state({
+            "messages": [{"type": "human", "content": "What is LangGraph?"}],
+            "relevant_data": [{"content": "LangGraph is a library", "score": 0.8}],
+        })
+
+        assert isinstance(state.messages[0], HumanMessage)
+        assert state.relevant_data.evidence[0].score == 0.8
+
+    def test_validate_state_rejects_malformed_input(self):
+        """Test malformed input fails at the boundary."""
+        with pytest.raises(ValidationError):
+            validate_state({"messages": [{"type": "unknown", "content": "x"}]})
+
+    def test_graph_runs_with_compact_state(self):
+        """Test a graph appends messages and evidence through the reducers."""
+
+        def step(state: State) -> dict:
+            return {
+                "messages": [AIMessage(content=f"step {len(state.messages)}")],
+                "relevant_data": [Evidence(f"evidence {len(state.messages)}")],
+            }
+
+        def route(state: State) -> str:
+            return END if len(state.messages) >= 4 else "step"
+
+        graph = StateGraph(State)
+        graph.add_node("step", step)
+        graph.add_edge(START, "step")
+        graph.add_conditional_edges("step", route)
+
+        result = graph.compile().invoke(
+            validate_state({"messages": [{"type": "human", "content": "q"}]})
+        )
+
+        assert [message.content for message in result["messages"]] == [
+            "q",
+            "step 1",
+            "step 2",
+            "step 3",
+        ]
+        assert len(result["relevant_data"]) == 3
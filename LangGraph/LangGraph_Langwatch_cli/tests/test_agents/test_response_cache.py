@@ -0,0 +1,233 @@
+"""Tests for the agent response cache."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from agents.base_agent import AgentConfig, BaseAgent
+from agents.response_cache import (
+    LRUCacheBackend,
+    ResponseCache,
+    SQLiteCacheBackend,
+    cache_key,
+)
+from agents.summarization_agent.summarization_agent import SummarizationAgent
+
+
+class CountingAgent(BaseAgent):
+    """Agent counting its uncached executions."""
+
+    cache_context_keys = frozenset({"style"})
+
+    def __init__(self, response_cache=None, delay=0.0, config=None):
+        super().__init__(
+            config or AgentConfig(name="counting", description="Counting agent"),
+            response_cache=response_cache,
+        )
+        self.delay = delay
+        self.executions = 0
+        self.version = "v1"
+
+    async def execute(self, messages, context=None):
+        return await self.run_cached(messages, context, self._execute)
+
+    async def _execute(self, messages, context=None):
+        self.executions += 1
+        await asyncio.sleep(self.delay)
+        if messages[0].content == "fail":
+            raise RuntimeError("execution failed")
+        return AIMessage(content=f"answer {self.executions}")
+
+    def get_cache_version(self):
+        return self.version
+
+    async def health_check(self):
+        return "healthy"
+
+
+def ask(agent, content="question", **context):
+    """Execute an agent with one human message."""
+    return agent.execute([HumanMessage(content=content)], context)
+
+
+class TestCacheKey:
+    """Test suite for cache key construction."""
+
+    def test_key_depends_only_on_relevant_inputs(self):
+        """Test irrelevant context keys do not change the key."""
+        config = AgentConfig(name="a", description="d")
+        messages = [HumanMessage(content="q")]
+
+        base = cache_key(messages, {"style": "brief"}, {"style"}, config)
+
+        assert base == cache_key(
+            messages, {"style": "brief", "session_id": "s"}, {"style"}, config
+        )
+        assert base != cache_key(messages, {"style": "long"}, {"style"}, config)
+        assert base != cache_key(
+            messages, {"style": "brief"}, {"style"}, config.model_copy(update={"temperature": 0.1})
+        )
+        assert base != cache_key(messages, {"style": "brief"}, {"style"}, config, version="v2")
+
+
+class TestResponseCache:
+    """Test suite for cached agent execution."""
+
+    @pytest.mark.asyncio
+    async def test_agent_without_cache_always_executes(self):
+        """Test agents without a cache run every request."""
+        agent = CountingAgent()
+
+        await ask(agent)
+        await ask(agent)
+
+        assert agent.executions == 2
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_hit_cache(self):
+        """Test a repeated request is served from the cache."""
+        cache = ResponseCache()
+        agent = CountingAgent(cache)
+
+        first = await ask(agent, style="brief", session_id="a")
+        second = await ask(agent, style="brief", session_id="b")
+        other = await ask(agent, style="long")
+
+        assert first.content == second.content == "answer 1"
+        assert other.content == "answer 2"
+        assert cache.get_stats() == {"hits": 1, "misses": 2, "coalesced": 0, "entries": 2}
+
+    @pytest.mark.asyncio
+    async def test_prompt_version_change_invalidates(self):
+        """Test a new prompt version bypasses responses of the old one."""
+        agent = CountingAgent(ResponseCache())
+
+        await ask(agent)
+        agent.version = "v2"
+        result = await ask(agent)
+
+        assert result.content == "answer 2"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_execution(self):
+        """Test single-flight de-duplication of concurrent requests."""
+        cache = ResponseCache()
+        agent = CountingAgent(cache, delay=0.05)
+
+        results = await asyncio.gather(*(ask(agent) for _ in range(10)))
+
+        assert agent.executions == 1
+        assert {result.content for result in results} == {"answer 1"}
+        assert cache.coalesced == 9
+
+    @pytest.mark.asyncio
+    async def test_cancelling_last_waiter_cancels_execution(self):
+        """Test a shared execution is cancelled only once its last waiter is cancelled."""
+        cache = ResponseCache()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def execute():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        first = asyncio.create_task(cache.get_or_execute("key", execute))
+        second = asyncio.create_task(cache.get_or_execute("key", execute))
+        await started.wait()
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        await asyncio.sleep(0)
+        assert not cancelled.is_set()
+
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+        started.clear()
+        retry = asyncio.create_task(cache.get_or_execute("key", execute))
+        await asyncio.wait_for(started.wait(), timeout=1)
+        retry.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await retry
+        assert cache.get_stats()["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self):
+        """Test failed executions propagate and are retried later."""
+        agent = CountingAgent(ResponseCache(), delay=0.01)
+
+        results = await asyncio.gather(
+            ask(agent, "fail"), ask(agent, "fail"), return_exceptions=True
+        )
+        with pytest.raises(RuntimeError):
+            await ask(agent, "fail")
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert agent.executions == 2
+
+    @pytest.mark.asyncio
+    async def test_lru_evicts_and_expires(self):
+        """Test size-bounded eviction and TTL expiry."""
+        backend = LRUCacheBackend(max_entries=2, ttl_seconds=0.05)
+        for key in ("a", "b", "c"):
+            await backend.set(key, AIMessage(content=key))
+
+        assert await backend.get("a") is None
+        assert (await backend.get("c")).content == "c"
+        await asyncio.sleep(0.06)
+        assert await backend.get("c") is None
+
+    @pytest.mark.asyncio
+    async def test_sqlite_backend_persists_across_instances(self, tmp_path):
+        """Test the SQLite backend serves responses after a restart."""
+        path = tmp_path / "cache.db"
+        backend = SQLiteCacheBackend(path)
+        await CountingAgent(ResponseCache(backend)).execute([HumanMessage(content="q")])
+        backend.close()
+
+        agent = CountingAgent(ResponseCache(SQLiteCacheBackend(path)))
+        result = await ask(agent, "q")
+
+        assert result.content == "answer 1"
+        assert agent.executions == 0
+
+    @pytest.mark.asyncio
+    async def test_sqlite_backend_evicts_and_expires(self, tmp_path):
+        """Test SQLite eviction keeps the most recently used entries."""
+        backend = SQLiteCacheBackend(tmp_path / "cache.db", max_entries=2, ttl_seconds=0.05)
+        await backend.set("a", AIMessage(content="a"))
+        await backend.set("b", AIMessage(content="b"))
+        await backend.get("a")
+        await backend.set("c", AIMessage(content="c"))
+
+        assert len(backend) == 2
+        assert await backend.get("b") is None
+        await asyncio.sleep(0.06)
+        assert await backend.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_summarization_agent_uses_cache(self):
+        """Test the summarization agent opts into the response cache."""
+        cache = ResponseCache()
+        agent = SummarizationAgent(
+            config=AgentConfig(name="summarizer", description="Test", max_tokens=50),
+            response_cache=cache,
+        )
+        agent.chat_model = None
+
+        first = await agent.execute([HumanMessage(content="One. Two.")], {"summary_style": "brief"})
+        second = await agent.execute([HumanMessage(content="One. Two.")], {"summary_style": "brief"})
+
+        assert first.content == second.content
+        assert cache.hits == 1
@@ -0,0 +1,149 @@
+"""Tests for map-reduce summarization in the summarization agent."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from langchain_core.messages import HumanMessage
+from langchain_openai import AzureChatOpenAI
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from agents.base_agent import AgentConfig
+from agents.summarization_agent.map_reduce import MapReduceSummarizer, split_text
+from agents.summarization_agent.summarization_agent import SummarizationAgent
+from llm import estimate_tokens
+from llm.fake_server import FakeLLMServer
+from llm.token_budget import truncate_to_tokens
+
+
+def make_document(tokens):
+    """Create a document of roughly the given token count."""
+    paragraph = "The study reports a measurable effect on regional output. " * 4
+    count = max(1, tokens // estimate_tokens(paragraph))
+    return "\n\n".join(f"Section {i}. {paragraph}" for i in range(count))
+
+
+class SlowSummarizer:
+    """Summarize callback with a fixed latency that tracks concurrency."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, content, max_tokens, is_reduce):
+        self.calls.append((estimate_tokens(content), max_tokens, is_reduce))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return truncate_to_tokens(content, max_tokens)
+
+
+class TestMapReduce:
+    """Test suite for chunking and hierarchical reduction."""
+
+    def test_split_text_respects_chunk_tokens(self):
+        """Test every chunk fits the token limit and no text is lost."""
+        text = make_document(5000) + "\n\n" + "x" * 3000
+
+        chunks = split_text(text, 500)
+
+        assert all(estimate_tokens(chunk) <= 500 for chunk in chunks)
+        assert "".join(chunks).replace("\n", "") == text.replace("\n", "")
+
+    @pytest.mark.asyncio
+    async def test_reduces_until_within_max_tokens(self):
+        """Test long input is reduced hierarchically to the target size."""
+        summarize = SlowSummarizer(delay=0)
+        summarizer = MapReduceSummarizer(summarize, chunk_tokens=400, max_concurrency=8)
+
+        result = await summarizer.run(make_document(20_000), max_tokens=150)
+
+        assert estimate_tokens(result.summary) <= 150
+        assert result.reduce_rounds >= 2
+        assert all(tokens <= 400 for tokens, _, _ in summarize.calls)
+        assert summarize.calls[-1][1:] == (150, True)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_limited(self):
+        """Test chunk summaries never exceed the concurrency limit."""
+        summarize = SlowSummarizer()
+        summarizer = MapReduceSummarizer(summarize, chunk_tokens=200, max_concurrency=3)
+
+        await summarizer.run(make_document(5000), max_tokens=100)
+
+        assert summarize.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_latency_grows_sublinearly_with_input(self):
+        """Test 100x more input costs only a few extra reduce rounds."""
+        elapsed = {}
+        for tokens in (5_000, 500_000):
+            summarizer = MapReduceSummarizer(
+                SlowSummarizer(), chunk_tokens=4000, max_concurrency=256
+            )
+            start = time.perf_counter()
+            await summarizer.run(make_document(tokens), max_tokens=500)
+            elapsed[tokens] = time.perf_counter() - start
+
+        assert elapsed[500_000] < elapsed[5_000] * 10
+
+
+class TestSummarizationAgent:
+    """Test suite for the summarization agent."""
+
+    @pytest.mark.asyncio
+    async def test_extractive_mode_honors_max_tokens(self):
+        """Test the agent summarizes long input within max_tokens without a model."""
+        agent = SummarizationAgent(
+            config=AgentConfig(name="summarizer", description="Test", max_tokens=200),
+            chunk_tokens=500,
+        )
+        agent.chat_model = None
+
+        result = await agent.execute(
+            [HumanMessage(content=make_document(10_000))], {"summary_style": "brief"}
+        )
+
+        assert 0 < estimate_tokens(result.content) <= 200
+        assert result.response_metadata["summary_style"] == "brief"
+        assert result.response_metadata["mode"] == "extractive"
+        assert result.response_metadata["chunks"] > 1
+
+    @pytest.mark.asyncio
+    async def test_llm_mode_uses_style_and_chunk_limits(self):
+        """Test chunk prompts carry the style and a bounded completion limit."""
+        with FakeLLMServer(response_tokens=20) as server:
+            chat_model = AzureChatOpenAI(
+                azure_endpoint=server.base_url,
+                api_key="test-key",
+                api_version="2024-02-01",
+                azure_deployment="summarizer",
+                max_retries=0,
+            )
+            agent = SummarizationAgent(
+                config=AgentConfig(name="summarizer", description="Test", max_tokens=100),
+                chat_model=chat_model,
+                chunk_tokens=1000,
+            )
+
+            result = await agent.execute(
+                [HumanMessage(content=make_document(3000))],
+                {"summary_style": "bullet_points"},
+            )
+
+        assert result.content.split() == ["token"] * 20
+        assert result.response_metadata["calls"] == len(server.requests)
+        for request in server.requests:
+            body = request["body"]
+            prompt = body["messages"][-1]["content"]
+            assert "bullet point list" in prompt
+            assert estimate_tokens(prompt) <= 1000 + 200
+            assert (body.get("max_completion_tokens") or body.get("max_tokens")) <= 500
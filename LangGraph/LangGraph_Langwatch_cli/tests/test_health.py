@@ -0,0 +1,150 @@
+"""Tests for concurrent, cached health checking."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from health import HealthChecker
+from orchestrator import MainOrchestrator
+from tests.fakes import FakeAgent, FakeWorkflow
+from workflows.base_workflow import WorkflowConfig
+from workflows.research_summarization_workflow import ResearchSummarizationWorkflow
+
+
+def make_orchestrator(health_delay=0.0, **checker_kwargs):
+    """Create an orchestrator whose workflow shares its registered agents."""
+    research = FakeAgent("research", "report")
+    summary = FakeAgent("summary", "summary")
+    for agent in (research, summary):
+        agent.health_delay = health_delay
+    orchestrator = MainOrchestrator(health_checker=HealthChecker(**checker_kwargs))
+    orchestrator.register_agent("research", research)
+    orchestrator.register_agent("summary", summary)
+    orchestrator.register_workflow(
+        "research_summary",
+        ResearchSummarizationWorkflow(
+            research_agent=research,
+            summarization_agent=summary,
+            config=WorkflowConfig(name="health_workflow", description="Health test"),
+        ),
+    )
+    return orchestrator, research, summary
+
+
+class TestHealthCheck:
+    """Test suite for orchestrator health checking."""
+
+    @pytest.mark.asyncio
+    async def test_shared_agents_checked_once_concurrently(self):
+        """Test that shared agents are de-duplicated and checked in parallel."""
+        orchestrator, research, summary = make_orchestrator(health_delay=0.01)
+        in_flight = []
+        overlapping = []
+
+        def counted(agent):
+            check = agent.health_check
+
+            async def health_check():
+                in_flight.append(agent)
+                overlapping.append(len(in_flight))
+                try:
+                    return await check()
+                finally:
+                    in_flight.remove(agent)
+
+            return health_check
+
+        for agent in (research, summary):
+            agent.health_check = counted(agent)
+
+        statuses = await asyncio.gather(*(orchestrator.health_check() for _ in range(5)))
+
+        for status in statuses:
+            assert status["agents"] == {"research": "healthy", "summary": "healthy"}
+            assert status["workflows"] == {"research_summary": "healthy"}
+        assert research.health_checks == 1
+        assert summary.health_checks == 1
+        assert max(overlapping) == 2
+
+    @pytest.mark.asyncio
+    async def test_results_cached_within_ttl(self):
+        """Test that repeated probes are served from the cache."""
+        orchestrator, research, _ = make_orchestrator()
+
+        await orchestrator.health_check()
+        await orchestrator.health_check()
+        await orchestrator.health_check(max_age=0)
+
+        assert research.health_checks == 2
+
+    @pytest.mark.asyncio
+    async def test_per_component_timeout(self):
+        """Test that a hanging component reports an error instead of blocking."""
+        orchestrator, research, _ = make_orchestrator(timeout_seconds=0.02)
+        research.health_delay = 10
+
+        status = await orchestrator.health_check()
+
+        assert status["agents"]["research"].startswith("error: health check timed out")
+        assert status["agents"]["summary"] == "healthy"
+        assert status["workflows"]["research_summary"].startswith("degraded")
+
+    @pytest.mark.asyncio
+    async def test_workflow_without_agents_checked_directly(self):
+        """Test that workflows without agents use their own health_check."""
+        orchestrator = MainOrchestrator()
+        orchestrator.register_workflow("fake", FakeWorkflow())
+
+        status = await orchestrator.health_check()
+
+        assert status["workflows"] == {"fake": "healthy"}
+
+    @pytest.mark.asyncio
+    async def test_background_refresher_keeps_cache_warm(self):
+        """Test that the refresher re-checks components in the background."""
+        orchestrator, research, _ = make_orchestrator(ttl_seconds=60)
+
+        orchestrator.start_health_refresher(interval_seconds=0.01)
+        await asyncio.sleep(0.05)
+        await orchestrator.stop_health_refresher()
+        checks = research.health_checks
+        await orchestrator.health_check()
+
+        assert checks >= 2
+        assert research.health_checks == checks
+
+    @pytest.mark.asyncio
+    async def test_concurrent_probes_share_in_flight_check(self):
+        """Test single-flight de-duplication of concurrent checks."""
+        checker = HealthChecker()
+        agent = FakeAgent("agent", "reply")
+        agent.health_delay = 0.02
+
+        statuses = await asyncio.gather(*(checker.check(agent) for _ in range(5)))
+
+        assert statuses == ["healthy"] * 5
+        assert agent.health_checks == 1
+
+
+class TestWorkflowHealth:
+    """Test suite for workflow health summaries."""
+
+    @pytest.mark.asyncio
+    async def test_workflow_health_check_degraded(self):
+        """Test that a degraded agent degrades the workflow."""
+        _, research, _ = make_orchestrator()
+        workflow = ResearchSummarizationWorkflow(
+            research_agent=research,
+            summarization_agent=FakeAgent("summary", "summary"),
+        )
+        research.health = "unhealthy"
+
+        status = await workflow.health_check()
+
+        assert status == (
+            "degraded (research_agent: unhealthy, summarization_agent: healthy)"
+        )
@@ -0,0 +1,158 @@
+"""Tests for the load test runner and the loadtest command."""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import main
+from loadtest import LoadTestConfig, LoopLagMonitor, load_queries, run_load_test
+from orchestrator import MainOrchestrator
+from tests.fakes import FakeWorkflow
+
+
+class SlowWorkflow(FakeWorkflow):
+    """Workflow taking a fixed time per request and failing on "fail" queries."""
+
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+
+    async def execute(self, input_data, config=None):
+        return await super().execute({
+            **input_data,
+            "delay": self.delay,
+            "fail": input_data["query"] == "fail",
+        })
+
+
+def make_orchestrator(delay=0.01):
+    """Create an orchestrator with a slow fake workflow registered as "fake"."""
+    workflow = SlowWorkflow(delay)
+    orchestrator = MainOrchestrator()
+    orchestrator.register_workflow("fake", workflow)
+    return orchestrator, workflow
+
+
+class TestLoadTestRunner:
+    """Test suite for closed- and open-loop load generation."""
+
+    @pytest.mark.asyncio
+    async def test_closed_loop_keeps_concurrency_workers_busy(self):
+        """Test the closed loop runs exactly ``concurrency`` requests at a time."""
+        orchestrator, workflow = make_orchestrator(delay=0.02)
+        config = LoadTestConfig(concurrency=4, duration_seconds=10, max_requests=20)
+
+        report = await run_load_test(config, orchestrator, "fake")
+
+        summary = report["summary"]
+        assert summary["total"] == summary["succeeded"] == 20
+        assert workflow.max_in_flight == 4
+        assert 0.02 <= summary["latency_p50"] <= summary["latency_p95"] <= summary["latency_p99"]
+        assert summary["throughput_per_second"] > 0
+
+    @pytest.mark.asyncio
+    async def test_open_loop_follows_arrival_rate(self):
+        """Test the open loop sends at the arrival rate independent of latency."""
+        orchestrator, workflow = make_orchestrator(delay=0.1)
+        config = LoadTestConfig(
+            mode="open", arrival_rate=100, poisson=False, concurrency=100, duration_seconds=0.2
+        )
+
+        report = await run_load_test(config, orchestrator, "fake")
+
+        assert 18 <= report["summary"]["total"] <= 22
+        assert workflow.max_in_flight > 5
+
+    @pytest.mark.asyncio
+    async def test_open_loop_latency_includes_queueing(self):
+        """Test requests held back by the in-flight cap count their wait."""
+        orchestrator, _ = make_orchestrator(delay=0.05)
+        config = LoadTestConfig(
+            mode="open", arrival_rate=100, poisson=False, concurrency=1, max_requests=5
+        )
+
+        report = await run_load_test(config, orchestrator, "fake")
+
+        assert report["summary"]["latency_p99"] >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_errors_are_counted(self):
+        """Test failed requests are reported without stopping the run."""
+        orchestrator, _ = make_orchestrator()
+        config = LoadTestConfig(queries=["ok", "fail"], max_requests=10, concurrency=2)
+
+        report = await run_load_test(config, orchestrator, "fake")
+
+        summary = report["summary"]
+        assert summary["total"] == 10
+        assert summary["failed"] == summary["errors"]["RuntimeError: boom"] > 0
+
+    @pytest.mark.asyncio
+    async def test_report_has_lag_memory_and_timeline(self):
+        """Test the report is JSON with lag statistics and a timeline."""
+        orchestrator, _ = make_orchestrator(delay=0.01)
+        config = LoadTestConfig(duration_seconds=0.3, sample_interval=0.1, lag_interval=0.01)
+
+        report = json.loads(json.dumps(await run_load_test(config, orchestrator, "fake")))
+
+        assert report["event_loop_lag"]["samples"] > 0
+        assert report["memory"]["peak_bytes"] >= report["memory"]["start_bytes"] > 0
+        assert len(report["timeline"]) >= 3
+        completed = [sample["completed"] for sample in report["timeline"]]
+        assert completed == sorted(completed)
+        assert completed[-1] == report["summary"]["total"]
+
+
+class TestLoopLagMonitor:
+    """Test suite for event-loop lag measurement."""
+
+    @pytest.mark.asyncio
+    async def test_blocking_call_shows_as_lag(self):
+        """Test a blocking call on the loop is measured as lag."""
+        monitor = LoopLagMonitor(interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0.02)
+        time.sleep(0.1)
+        await asyncio.sleep(0.02)
+        await monitor.stop()
+
+        assert monitor.summary()["max"] >= 0.08
+
+
+class TestLoadTestCommand:
+    """Test suite for the ``loadtest`` subcommand."""
+
+    def test_load_queries_text_and_json_lines(self, tmp_path):
+        """Test query corpora in plain text and JSON lines."""
+        path = tmp_path / "queries.txt"
+        path.write_text('What is LangGraph?\n\n{"query": "What is LangWatch?"}\n')
+
+        assert load_queries(str(path)) == ["What is LangGraph?", "What is LangWatch?"]
+
+    def test_loadtest_against_fake_llm_server(self, tmp_path):
+        """Test the command drives real agents against the fake LLM server."""
+        queries = tmp_path / "queries.txt"
+        queries.write_text("What is LangGraph?\n")
+        output = tmp_path / "report.json"
+
+        main.main([
+            "loadtest",
+            "--requests", "4",
+            "--concurrency", "2",
+            "--queries", str(queries),
+            "--response-tokens", "5",
+            "--first-token-latency", "0",
+            "--tokens-per-second", "0",
+            "--output", str(output),
+        ])
+
+        report = json.loads(output.read_text())
+        assert report["summary"]["total"] == report["summary"]["succeeded"] == 4
+        assert report["config"]["concurrency"] == 2
+        assert report["queries"] == 1
@@ -0,0 +1,271 @@
+"""Tests for latency-aware routing of model calls across backends."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_openai import AzureChatOpenAI
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from agents.base_agent import AgentConfig
+from agents.research_agent.research_agent import ResearchAgent
+from config.llm_config import LLMConfig
+from config.router_config import RouterConfig
+from llm.fake_server import FakeLLMServer
+from llm.router import ModelBackend, ModelRouter, ModelRouterError, build_model_backends
+
+
+class RateLimitError(Exception):
+    """Provider error carrying an HTTP 429 status."""
+
+    status_code = 429
+
+
+class FakeBackendModel(BaseChatModel):
+    """Chat model answering after a delay, or raising a configured error."""
+
+    reply: str = "ok"
+    delay: float = 0.0
+    error: Any = None
+    calls: int = 0
+    cancelled: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake_backend"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.reply))])
+
+    async def _wait(self):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        await self._wait()
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.reply))])
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        await self._wait()
+        for word in self.reply.split():
+            yield ChatGenerationChunk(message=AIMessageChunk(content=f"{word} "))
+
+
+def make_router(*models, **config):
+    """Create a router with one chat backend per model, named b0, b1, ..."""
+    backends = [ModelBackend(f"b{i}", "chat", model) for i, model in enumerate(models)]
+    return ModelRouter(backends, RouterConfig(**config))
+
+
+def seed_latency(router, name, seconds, count=20, kind="latency"):
+    """Record past calls with a fixed latency for a backend."""
+    backend = next(backend for backend in router.backends if backend.name == name)
+    for _ in range(count):
+        backend.stats.record_success(kind, seconds)
+
+
+PROMPT = [HumanMessage(content="q")]
+
+
+class TestSelection:
+    """Test suite for picking the fastest healthy backend."""
+
+    @pytest.mark.asyncio
+    async def test_fastest_backend_receives_calls(self):
+        """Test calls go to the backend with the lowest observed latency."""
+        slow, fast = FakeBackendModel(delay=0.03), FakeBackendModel(delay=0.0)
+        router = make_router(slow, fast, hedging_enabled=False)
+
+        for _ in range(10):
+            await router.ainvoke("chat", PROMPT)
+
+        assert slow.calls == 1
+        assert fast.calls == 9
+
+    @pytest.mark.asyncio
+    async def test_preferred_backend_first_while_healthy(self):
+        """Test a preferred deployment is tried first."""
+        first, second = FakeBackendModel(reply="first"), FakeBackendModel(reply="second")
+        router = make_router(first, second)
+
+        backend, response = await router.ainvoke("chat", PROMPT, preferred="b1")
+
+        assert backend.name == "b1"
+        assert response.content == "second"
+
+    def test_tier_falls_back_to_chat(self):
+        """Test a tier without backends routes to the chat tier."""
+        router = make_router(FakeBackendModel())
+
+        assert router.chat_model("reasoning").tier == "chat"
+        assert ModelRouter([], RouterConfig()).chat_model("chat") is None
+
+
+class TestFailover:
+    """Test suite for error handling across backends."""
+
+    @pytest.mark.asyncio
+    async def test_failed_call_fails_over(self):
+        """Test a failing backend's call is retried on the next backend."""
+        broken = FakeBackendModel(error=ConnectionError("down"))
+        router = make_router(broken, FakeBackendModel(reply="backup"))
+
+        backend, response = await router.ainvoke("chat", PROMPT)
+
+        assert (backend.name, response.content) == ("b1", "backup")
+        assert router.get_statistics()["b0"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_backend_cools_down(self):
+        """Test a rate-limited backend is skipped until its cooldown passes."""
+        limited = FakeBackendModel(error=RateLimitError("slow down"))
+        router = make_router(limited, FakeBackendModel(), rate_limit_cooldown_seconds=60)
+
+        await router.ainvoke("chat", PROMPT)
+        await router.ainvoke("chat", PROMPT)
+
+        assert limited.calls == 1
+        statistics = router.get_statistics()["b0"]
+        assert statistics["rate_limits"] == 1
+        assert not statistics["healthy"]
+
+    @pytest.mark.asyncio
+    async def test_repeated_failures_open_circuit(self):
+        """Test a backend failing ``failure_threshold`` times stops receiving calls."""
+        flaky = FakeBackendModel(error=ConnectionError("down"))
+        router = make_router(flaky, FakeBackendModel(), failure_threshold=2)
+        seed_latency(router, "b0", 0.0, count=1)
+        seed_latency(router, "b1", 1.0, count=1)
+
+        for _ in range(4):
+            await router.ainvoke("chat", PROMPT)
+
+        assert flaky.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_all_backends_failing_raises(self):
+        """Test the router raises once every backend has failed."""
+        router = make_router(
+            FakeBackendModel(error=ConnectionError("a")),
+            FakeBackendModel(error=ConnectionError("b")),
+        )
+
+        with pytest.raises(ModelRouterError, match="b0: ConnectionError: a; b1"):
+            await router.ainvoke("chat", PROMPT)
+
+
+class TestHedging:
+    """Test suite for hedging slow calls to a second backend."""
+
+    @pytest.mark.asyncio
+    async def test_slow_call_is_hedged(self):
+        """Test a call slower than the backend's p95 is raced against another backend."""
+        primary = FakeBackendModel(reply="primary", delay=1.0)
+        secondary = FakeBackendModel(reply="secondary", delay=0.01)
+        router = make_router(primary, secondary, hedge_min_samples=20)
+        seed_latency(router, "b0", 0.02)
+        seed_latency(router, "b1", 0.05)
+
+        started = time.perf_counter()
+        backend, response = await router.ainvoke("chat", PROMPT)
+
+        assert (backend.name, response.content) == ("b1", "secondary")
+        assert time.perf_counter() - started < 0.5
+        assert primary.cancelled == 1
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_enough_samples(self):
+        """Test calls are not hedged before the percentile is meaningful."""
+        primary = FakeBackendModel(reply="primary", delay=0.05)
+        secondary = FakeBackendModel(reply="secondary")
+        router = make_router(primary, secondary, hedge_min_samples=20)
+        seed_latency(router, "b0", 0.001, count=5)
+        seed_latency(router, "b1", 0.01, count=5)
+
+        _, response = await router.ainvoke("chat", PROMPT)
+
+        assert response.content == "primary"
+        assert secondary.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_hedges_on_first_token(self):
+        """Test streams race to the first chunk and continue on the winner."""
+        primary = FakeBackendModel(reply="slow stream", delay=1.0)
+        secondary = FakeBackendModel(reply="fast stream", delay=0.01)
+        router = make_router(primary, secondary)
+        seed_latency(router, "b0", 0.02, kind="first_token")
+        seed_latency(router, "b1", 0.05, kind="first_token")
+        model = router.chat_model("chat")
+
+        chunks = [chunk async for chunk in model.astream(PROMPT)]
+
+        assert "".join(chunk.text for chunk in chunks) == "fast stream "
+        assert chunks[0].response_metadata["model_backend"] == "b1"
+        assert primary.cancelled == 1
+
+
+class TestBackends:
+    """Test suite for building backends and routing agent calls."""
+
+    def test_backends_from_llm_config(self):
+        """Test Azure chat and reasoning deployments become tiered backends."""
+        backends = build_model_backends(LLMConfig(
+            _env_file=None,
+            openai_api_base="https://example.openai.azure.com",
+            openai_api_key="key",
+            openai_chat_deployment_name="gpt-4o",
+            openai_reasoning_deployment_name="o3-mini",
+        ))
+
+        assert [(backend.name, backend.tier) for backend in backends] == [
+            ("azure_openai:gpt-4o", "chat"),
+            ("azure_openai:o3-mini", "reasoning"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_agent_routes_to_faster_deployment(self):
+        """Test agents stream through the router and settle on the faster server."""
+        with FakeLLMServer(response_tokens=5, first_token_latency=0.05) as slow, \
+                FakeLLMServer(response_tokens=5) as fast:
+            router = ModelRouter(
+                [
+                    ModelBackend(name, "chat", AzureChatOpenAI(
+                        azure_endpoint=server.base_url,
+                        api_key="test-key",
+                        api_version="2024-02-01",
+                        azure_deployment="research",
+                        streaming=True,
+                        stream_usage=True,
+                        max_retries=0,
+                    ))
+                    for name, server in (("slow", slow), ("fast", fast))
+                ],
+                RouterConfig(hedging_enabled=False),
+            )
+            agent = ResearchAgent(
+                config=AgentConfig(name="research", description="Test", max_tokens=50),
+                model_router=router,
+            )
+
+            for _ in range(4):
+                result = await agent.execute([HumanMessage(content="What is LangGraph?")])
+
+        assert result.content.split() == ["token"] * 5
+        assert len(slow.requests) == 1
+        assert len(fast.requests) == 3
@@ -0,0 +1,156 @@
+"""Tests for MainOrchestrator batch execution."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from batch import BatchStats, percentile
+from monitoring.langwatch_tracker import LangWatchTracker
+from orchestrator import MainOrchestrator
+from tests.fakes import FakeAgent, FakeWorkflow
+from workflows.research_summarization_workflow import ResearchSummarizationWorkflow
+
+
+def make_orchestrator(max_concurrency=64, workflow_concurrency=None):
+    """Create an orchestrator with a fake workflow and a tracker."""
+    orchestrator = MainOrchestrator(
+        tracker=LangWatchTracker(), max_concurrency=max_concurrency
+    )
+    orchestrator.register_workflow(
+        "fake", FakeWorkflow(), max_concurrency=workflow_concurrency
+    )
+    return orchestrator
+
+
+class TestBatchExecution:
+    """Test suite for execute_many / execute_batch."""
+
+    @pytest.mark.asyncio
+    async def test_yields_results_as_they_complete(self):
+        """Test that results stream in completion order with their input index."""
+        orchestrator = make_orchestrator()
+        inputs = [{"query": "slow", "delay": 0.05}, {"query": "fast", "delay": 0}]
+
+        items = [item async for item in orchestrator.execute_many("fake", inputs)]
+
+        assert [item.index for item in items] == [1, 0]
+        assert items[0].result["query"] == "fast"
+
+    @pytest.mark.asyncio
+    async def test_respects_global_and_workflow_limits(self):
+        """Test that in-flight items never exceed the tightest limit."""
+        inputs = [{"query": str(i), "delay": 0.01} for i in range(20)]
+
+        per_workflow = make_orchestrator(max_concurrency=8, workflow_concurrency=3)
+        await per_workflow.execute_batch("fake", inputs)
+        global_only = make_orchestrator(max_concurrency=2)
+        await global_only.execute_batch("fake", inputs, max_concurrency=10)
+
+        assert per_workflow.workflows["fake"].max_in_flight == 3
+        assert global_only.workflows["fake"].max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_backpressure_on_async_stream(self):
+        """Test that an async input stream is not read ahead of the limit."""
+        orchestrator = make_orchestrator()
+        workflow = orchestrator.workflows["fake"]
+        pulled = []
+
+        async def stream():
+            for i in range(10):
+                pulled.append(i)
+                assert len(pulled) - len(workflow.executed) <= 2
+                yield {"query": str(i), "delay": 0.005}
+
+        report = await orchestrator.execute_batch("fake", stream(), max_concurrency=2)
+
+        assert report.summary.total == 10
+        assert workflow.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_do_not_stop_batch(self):
+        """Test that a failing item is reported and the rest still run."""
+        orchestrator = make_orchestrator()
+        inputs = [{"query": "a"}, {"query": "b", "fail": True}, {"query": "c"}]
+
+        report = await orchestrator.execute_batch("fake", inputs)
+
+        assert [item.index for item in report.results] == [0, 1, 2]
+        assert report.results[1].error == "RuntimeError: boom"
+        assert not report.results[1].success
+        assert report.summary.succeeded == 2
+        assert report.summary.failed == 1
+        assert report.summary.errors == {"RuntimeError: boom": 1}
+
+    @pytest.mark.asyncio
+    async def test_tracker_receives_one_event_per_batch(self):
+        """Test that tracker events are aggregated per batch."""
+        orchestrator = make_orchestrator()
+        inputs = [{"query": str(i)} for i in range(5)]
+
+        report = await orchestrator.execute_batch("fake", inputs)
+
+        events = orchestrator.tracker.get_events()
+        batch_events = orchestrator.tracker.get_events("workflow_batch")
+        assert [e.event_type for e in events] == [
+            "workflow_registration",
+            "workflow_batch",
+        ]
+        assert batch_events[0].data["total"] == 5
+        assert batch_events[0].data["latency_p95"] == report.summary.latency_p95
+
+    @pytest.mark.asyncio
+    async def test_graph_nodes_folded_into_batch_event(self):
+        """Test node spans of graph items are aggregated, not tracked per item."""
+        orchestrator = MainOrchestrator(tracker=LangWatchTracker())
+        orchestrator.register_workflow(
+            "research",
+            ResearchSummarizationWorkflow(
+                research_agent=FakeAgent("research", "findings"),
+                summarization_agent=FakeAgent("summary", "short"),
+            ),
+        )
+
+        report = await orchestrator.execute_batch(
+            "research", [{"query": str(i)} for i in range(3)]
+        )
+
+        assert report.summary.succeeded == 3
+        assert orchestrator.tracker.get_events("node_execution") == []
+        assert orchestrator.tracker.get_events("trace") == []
+        [event] = orchestrator.tracker.get_events("workflow_batch")
+        node_latency = event.data["node_latency"]
+        assert node_latency == report.summary.node_latency
+        assert all(stats["count"] == 3 for stats in node_latency.values())
+        assert all(stats["p95"] >= stats["p50"] > 0 for stats in node_latency.values())
+
+    @pytest.mark.asyncio
+    async def test_unknown_workflow(self):
+        """Test that an unregistered workflow is rejected."""
+        orchestrator = make_orchestrator()
+
+        with pytest.raises(ValueError):
+            await orchestrator.execute_batch("missing", [{"query": "a"}])
+
+
+class TestBatchStats:
+    """Test suite for batch statistics helpers."""
+
+    def test_percentile_nearest_rank(self):
+        """Test nearest-rank percentiles."""
+        values = [float(v) for v in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 50) == 0.0
+
+    def test_empty_summary(self):
+        """Test summary of a batch without items."""
+        summary = BatchStats("fake").summary()
+
+        assert summary.total == 0
+        assert summary.latency_p50 == 0.0
@@ -0,0 +1,132 @@
+"""Tests for the shared prompt registry and precompiled templates."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from prompts.prompt_loader import PromptLoader
+from prompts.prompt_registry import CompiledTemplate, PromptRegistry, prompt_registry
+
+PROMPT_FILE = Path(__file__).parent.parent / "src" / "prompts" / "research_agent_prompt.toml"
+
+
+class TestCompiledTemplate:
+    """Test suite for CompiledTemplate."""
+
+    def test_matches_str_format_for_all_templates(self):
+        """Test that compiled formatting matches str.format for every prompt."""
+        prompt_set = prompt_registry.get(PROMPT_FILE)
+
+        for (section, key), compiled in prompt_set.templates.items():
+            values = {name: f"<{name}>" for name in compiled.placeholders}
+            expected = prompt_set.get(section, key).format(**values)
+            assert compiled.format(**values) == expected, (section, key)
+
+    def test_placeholders(self):
+        """Test that placeholder sets are extracted up front."""
+        compiled = CompiledTemplate("{a} and {b} but not {{c}}")
+
+        assert compiled.placeholders == {"a", "b"}
+        assert compiled.format(a=1, b=2) == "1 and 2 but not {c}"
+
+    def test_escaped_braces_without_placeholders(self):
+        """Test that escaped braces are unescaped even when nothing is substituted."""
+        template = "Use {{json}} output with 100% {{braces}}"
+
+        assert CompiledTemplate(template).format() == template.format()
+        assert CompiledTemplate(template).format() == "Use {json} output with 100% {braces}"
+
+    def test_missing_placeholder(self):
+        """Test that a missing value raises KeyError like str.format."""
+        with pytest.raises(KeyError):
+            CompiledTemplate("{a}").format()
+
+    def test_format_spec_falls_back_to_str_format(self):
+        """Test templates with format specs and attribute access."""
+        assert CompiledTemplate("{x:.2f}").format(x=1.0) == "1.00"
+        assert CompiledTemplate("{x.real}").placeholders == {"x"}
+
+    def test_validate(self):
+        """Test validation against the supplied placeholders."""
+        CompiledTemplate("{a}").validate({"a", "b"})
+
+        with pytest.raises(ValueError, match="unsupported placeholders"):
+            CompiledTemplate("{a} {typo}").validate({"a"})
+
+
+class TestPromptRegistry:
+    """Test suite for PromptRegistry."""
+
+    def test_loaders_share_parsed_file(self):
+        """Test that loaders of the same file share one parsed prompt set."""
+        first = PromptLoader(PROMPT_FILE)
+        second = PromptLoader(PROMPT_FILE)
+
+        assert first.get_prompt_set() is second.get_prompt_set()
+        assert first._prompts is second._prompts
+
+    def test_missing_file(self):
+        """Test that a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            PromptRegistry().get(Path("/nonexistent/file.toml"))
+
+    def test_hot_reload_on_mtime_change(self, tmp_path):
+        """Test that a changed file is reloaded without a restart."""
+        prompt_file = tmp_path / "prompts.toml"
+        prompt_file.write_text('[prompts]\ngreeting = "Hello {name}"\n')
+        registry = PromptRegistry(check_interval_seconds=0)
+
+        before = registry.get(prompt_file)
+        prompt_file.write_text('[prompts]\ngreeting = "Hi {name}!"\n')
+        stat = prompt_file.stat()
+        os.utime(prompt_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        after = registry.get(prompt_file)
+
+        assert before is not after
+        assert after.template("prompts", "greeting").format(name="Ann") == "Hi Ann!"
+
+    def test_reload_throttled_by_check_interval(self, tmp_path):
+        """Test that mtimes are not re-checked within the check interval."""
+        prompt_file = tmp_path / "prompts.toml"
+        prompt_file.write_text('[prompts]\ngreeting = "Hello"\n')
+        registry = PromptRegistry(check_interval_seconds=60)
+
+        before = registry.get(prompt_file)
+        prompt_file.unlink()
+
+        assert registry.get(prompt_file) is before
+
+
+class TestResearchAgentPrompts:
+    """Test that ResearchAgent assembles prompts from compiled templates."""
+
+    @pytest.mark.asyncio
+    async def test_execute_matches_str_format_assembly(self):
+        """Test that the compiled assembly produces the original output."""
+        from langchain_core.messages import HumanMessage
+
+        from agents.base_agent import AgentConfig
+        from agents.research_agent.research_agent import ResearchAgent
+        from config.research_config import research_config
+
+        agent = ResearchAgent(AgentConfig(name="research", description="Research"))
+        loader = PromptLoader(PROMPT_FILE)
+        components = loader.get_synthesis_components()
+        query = "What is LangGraph?"
+        expected = loader.get_prompt("prompts", "synthesis_prompt").format(
+            source_count=research_config.max_sources,
+            executive_summary=components["executive_summary"].format(user_query=query),
+            key_findings=components["key_findings"].format(user_query=query).strip(),
+            source_analysis=components["source_analysis"].strip(),
+            confidence_assessment=components["confidence_assessment"].strip(),
+            recommendations=components["recommendations"].format(user_query=query).strip(),
+            further_research=components["further_research"].format(user_query=query).strip(),
+        )
+
+        result = await agent.execute([HumanMessage(content=query)])
+
+        assert result.content.startswith(expected)
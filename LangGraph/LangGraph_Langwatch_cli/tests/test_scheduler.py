@@ -0,0 +1,189 @@
+"""Tests for the priority-aware request scheduler."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from monitoring.langwatch_tracker import LangWatchTracker
+from orchestrator import MainOrchestrator
+from scheduler import AdmissionRejectedError, Priority, RequestScheduler
+from tests.fakes import FakeWorkflow
+from workflows.base_workflow import WorkflowTimeoutError
+
+
+def make_orchestrator(deep_concurrency=None):
+    """Create an orchestrator with a "quick" and a "deep" fake workflow."""
+    orchestrator = MainOrchestrator(tracker=LangWatchTracker())
+    orchestrator.register_workflow("quick", FakeWorkflow("quick"))
+    orchestrator.register_workflow(
+        "deep", FakeWorkflow("deep"), max_concurrency=deep_concurrency
+    )
+    return orchestrator
+
+
+async def occupy_worker(scheduler, workflow_name="quick", delay=0.05):
+    """Submit a request that keeps a worker busy while others queue up."""
+    future = await scheduler.submit(workflow_name, {"query": "blocker", "delay": delay})
+    await asyncio.sleep(0)
+    return future
+
+
+class TestRequestScheduler:
+    """Test suite for RequestScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_run_returns_workflow_result(self):
+        """Test that a scheduled request resolves to the workflow result."""
+        async with RequestScheduler(make_orchestrator()) as scheduler:
+            result = await scheduler.run("quick", {"query": "hello"})
+
+        assert result["query"] == "hello"
+        assert scheduler.get_metrics()["dispatched"] == 1
+
+    @pytest.mark.asyncio
+    async def test_priority_order(self):
+        """Test that interactive requests overtake queued batch requests."""
+        orchestrator = make_orchestrator()
+        async with RequestScheduler(orchestrator, num_workers=1) as scheduler:
+            await occupy_worker(scheduler)
+            futures = [
+                await scheduler.submit("quick", {"query": "batch"}, Priority.BATCH),
+                await scheduler.submit("quick", {"query": "normal"}),
+                await scheduler.submit(
+                    "quick", {"query": "interactive"}, Priority.INTERACTIVE
+                ),
+            ]
+            await asyncio.gather(*futures)
+
+        assert orchestrator.workflows["quick"].started == [
+            "blocker",
+            "interactive",
+            "normal",
+            "batch",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_weighted_fair_share_between_tenants(self):
+        """Test that tenants get dispatch slots in proportion to their weight."""
+        orchestrator = make_orchestrator()
+        scheduler = RequestScheduler(
+            orchestrator, num_workers=1, tenant_weights={"a": 3.0, "b": 1.0}
+        )
+        async with scheduler:
+            await occupy_worker(scheduler)
+            futures = [
+                await scheduler.submit("quick", {"query": tenant}, tenant=tenant)
+                for tenant in ["a"] * 8 + ["b"] * 8
+            ]
+            await asyncio.gather(*futures)
+
+        first_eight = orchestrator.workflows["quick"].started[1:9]
+        assert first_eight.count("a") == 6
+        assert first_eight.count("b") == 2
+
+    @pytest.mark.asyncio
+    async def test_deep_workflow_cannot_starve_quick_requests(self):
+        """Test that a workflow concurrency cap leaves workers for others."""
+        orchestrator = make_orchestrator(deep_concurrency=1)
+        async with RequestScheduler(orchestrator, num_workers=2) as scheduler:
+            deep = [
+                await scheduler.submit("deep", {"query": f"deep{i}", "delay": 0.05})
+                for i in range(3)
+            ]
+            quick = await scheduler.submit("quick", {"query": "quick"})
+
+            await asyncio.wait_for(quick, timeout=0.04)
+            assert orchestrator.workflows["deep"].max_in_flight == 1
+            await asyncio.gather(*deep)
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self):
+        """Test admission control on queue size."""
+        orchestrator = make_orchestrator()
+        scheduler = RequestScheduler(orchestrator, num_workers=1, max_queue_size=1)
+        async with scheduler:
+            blocker = await occupy_worker(scheduler)
+            queued = await scheduler.submit("quick", {"query": "queued"})
+
+            with pytest.raises(AdmissionRejectedError):
+                await scheduler.submit("quick", {"query": "rejected"})
+            await asyncio.gather(blocker, queued)
+
+        assert scheduler.get_metrics()["rejected"] == 1
+        assert len(orchestrator.tracker.get_events("request_rejected")) == 1
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_estimated_wait_exceeds_timeout(self):
+        """Test admission control against WorkflowConfig.timeout_seconds."""
+        orchestrator = make_orchestrator()
+        orchestrator.workflows["deep"].config.timeout_seconds = 0.1
+        async with RequestScheduler(orchestrator, num_workers=1) as scheduler:
+            await scheduler.run("deep", {"query": "warm", "delay": 0.06})
+            await occupy_worker(scheduler, "deep", delay=0.06)
+            queued = await scheduler.submit("deep", {"query": "q1", "delay": 0.06})
+
+            with pytest.raises(AdmissionRejectedError, match="timeout"):
+                await scheduler.submit("deep", {"query": "q2", "delay": 0.06})
+            await queued
+
+    @pytest.mark.asyncio
+    async def test_expired_requests_are_not_executed(self):
+        """Test that requests past their deadline fail instead of running."""
+        orchestrator = make_orchestrator()
+        orchestrator.workflows["quick"].config.timeout_seconds = 0.02
+        async with RequestScheduler(orchestrator, num_workers=1) as scheduler:
+            await occupy_worker(scheduler, "deep", delay=0.05)
+            expired = await scheduler.submit("quick", {"query": "late"})
+
+            with pytest.raises(WorkflowTimeoutError):
+                await expired
+
+        assert "late" not in orchestrator.workflows["quick"].started
+        assert scheduler.get_metrics()["expired"] == 1
+
+    @pytest.mark.asyncio
+    async def test_dispatch_metrics_are_tracked(self):
+        """Test that queue depth and wait time reach the tracker."""
+        orchestrator = make_orchestrator()
+        async with RequestScheduler(orchestrator, num_workers=1) as scheduler:
+            await occupy_worker(scheduler, delay=0.02)
+            await scheduler.run("quick", {"query": "waiting"})
+
+        events = orchestrator.tracker.get_events("request_dispatch")
+        assert len(events) == 2
+        assert events[1].data["wait_seconds"] > 0
+        assert scheduler.get_metrics()["avg_wait_seconds"] > 0
+
+    @pytest.mark.asyncio
+    async def test_tracker_failure_does_not_strand_requests(self, monkeypatch):
+        """Test requests still resolve, and workers survive, when the tracker raises."""
+        orchestrator = make_orchestrator()
+
+        def broken(*args, **kwargs):
+            raise RuntimeError("tracker down")
+
+        monkeypatch.setattr(orchestrator.tracker, "track_request_scheduling", broken)
+        async with RequestScheduler(orchestrator, num_workers=1) as scheduler:
+            first = await asyncio.wait_for(scheduler.run("quick", {"query": "a"}), 1)
+            second = await asyncio.wait_for(scheduler.run("quick", {"query": "b"}), 1)
+
+        assert (first["query"], second["query"]) == ("a", "b")
+        assert scheduler.get_metrics()["dispatched"] == 2
+
+    @pytest.mark.asyncio
+    async def test_stop_without_drain_cancels_queued(self):
+        """Test that stopping without draining cancels queued requests."""
+        scheduler = RequestScheduler(make_orchestrator(), num_workers=1)
+        await scheduler.start()
+        await occupy_worker(scheduler)
+        queued = await scheduler.submit("quick", {"query": "queued"})
+
+        await scheduler.stop(drain=False)
+
+        assert queued.cancelled()
+        with pytest.raises(AdmissionRejectedError):
+            await scheduler.submit("quick", {"query": "after stop"})
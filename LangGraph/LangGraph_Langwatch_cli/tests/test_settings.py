@@ -0,0 +1,128 @@
+"""Tests for the cached, lazily loaded settings provider."""
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from config import SettingsProvider, settings
+from config.llm_config import LLMConfig
+from config.research_config import ResearchConfig
+from monitoring.langwatch_tracker import LangWatchTracker
+from orchestrator import MainOrchestrator
+from tests.fakes import FakeAgent
+from workflows.graph_registry import graph_registry
+from workflows.research_summarization_workflow import ResearchSummarizationWorkflow
+
+
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    """Write a dotenv file and clear the variables it sets from the environment."""
+    path = tmp_path / ".env"
+    path.write_text(
+        "RESEARCH_MAX_SOURCES=4\n"
+        "RESEARCH_DEFAULT_DEPTH=deep\n"
+        "OPENAI_API_BASE=https://example.openai.azure.com\n"
+        "LANGWATCH_API_KEY=secret\n"
+    )
+    for name in ("RESEARCH_MAX_SOURCES", "RESEARCH_DEFAULT_DEPTH", "OPENAI_API_BASE"):
+        monkeypatch.delenv(name, raising=False)
+    return path
+
+
+class TestSettingsProvider:
+    """Test suite for the settings provider."""
+
+    def test_settings_are_built_lazily_and_cached(self, env_file):
+        """Test nothing is read before first access and instances are shared."""
+        provider = SettingsProvider(str(env_file))
+
+        assert provider.load_metrics()["configs"] == {}
+        research = provider.research
+
+        assert provider.research is research
+        assert research.max_sources == 4
+        assert research.default_depth == "deep"
+        assert set(provider.load_metrics()["configs"]) == {"dotenv", "ResearchConfig"}
+
+    def test_dotenv_is_parsed_once(self, env_file, monkeypatch):
+        """Test building several settings classes parses the file only once."""
+        settings_module = importlib.import_module("config.settings")
+        calls = []
+        original = settings_module.dotenv_values
+        monkeypatch.setattr(
+            settings_module,
+            "dotenv_values",
+            lambda path: calls.append(path) or original(path),
+        )
+        provider = SettingsProvider(str(env_file))
+
+        assert provider.llm.openai_api_base == "https://example.openai.azure.com"
+        assert provider.research.max_sources == 4
+        assert provider.summarization.chunk_tokens == 4000
+        assert calls == [str(env_file)]
+
+    def test_environment_takes_precedence(self, env_file, monkeypatch):
+        """Test environment variables override the dotenv file."""
+        monkeypatch.setenv("RESEARCH_MAX_SOURCES", "7")
+
+        assert SettingsProvider(str(env_file)).research.max_sources == 7
+
+    def test_extra_keys_kept_for_permissive_classes(self, env_file):
+        """Test classes allowing extras still receive unknown dotenv keys."""
+        provider = SettingsProvider(str(env_file))
+
+        assert provider.get(LLMConfig).langwatch_api_key == "secret"
+        assert not hasattr(provider.get(ResearchConfig), "langwatch_api_key")
+
+    def test_reload_rereads_environment(self, env_file, monkeypatch):
+        """Test reload drops cached settings and timings."""
+        provider = SettingsProvider(str(env_file))
+        before = provider.research
+        monkeypatch.setenv("RESEARCH_MAX_SOURCES", "9")
+
+        assert provider.research is before
+        provider.reload()
+
+        assert provider.load_metrics()["configs"] == {}
+        assert provider.research.max_sources == 9
+
+    def test_module_globals_resolve_to_provider(self):
+        """Test the legacy module-level globals are the shared instances."""
+        from config.llm_config import llm_config
+        from config.research_config import research_config
+
+        assert research_config is settings.research
+        assert llm_config is settings.llm
+
+
+class TestStartupMetrics:
+    """Test suite for startup metrics reported by the orchestrator."""
+
+    @pytest.mark.asyncio
+    async def test_warm_up_reports_config_load_time(self):
+        """Test warm-up reports graph compile and settings load times."""
+        graph_registry.clear()
+        settings.reload()
+        assert settings.research.max_sources > 0
+        tracker = LangWatchTracker()
+        orchestrator = MainOrchestrator(tracker=tracker)
+        orchestrator.register_workflow(
+            "research",
+            ResearchSummarizationWorkflow(
+                research_agent=FakeAgent("research", "findings"),
+                summarization_agent=FakeAgent("summary", "short"),
+            ),
+        )
+
+        await orchestrator.warm_up()
+
+        [event] = tracker.get_events("startup")
+        assert event.data["graphs_compiled"] == 1
+        assert event.data["graph_compile_seconds"] > 0
+        assert "ResearchConfig" in event.data["configs"]
+        assert event.data["startup_seconds"] >= event.data["config_load_seconds"]
+        graph_registry.clear()
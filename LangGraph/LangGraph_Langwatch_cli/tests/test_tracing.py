@@ -0,0 +1,169 @@
+"""Tests for per-node workflow tracing."""
+
+import sys
+from pathlib import Path
+from typing import Any, Dict, TypedDict
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langgraph.graph import END, START, StateGraph
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from monitoring.langwatch_tracker import LangWatchTracker
+from orchestrator import MainOrchestrator
+from tests.fakes import FakeAgent
+from tracing import STATUS_ERROR, STATUS_OK, WorkflowTracer
+from workflows.base_workflow import BaseWorkflow, WorkflowConfig
+from workflows.research_summarization_workflow import ResearchSummarizationWorkflow
+
+
+class LLMState(TypedDict):
+    """State of the LLM test graph."""
+
+    query: str
+    answer: str
+
+
+class LLMWorkflow(BaseWorkflow):
+    """Workflow with a chat model node followed by an optionally failing node."""
+
+    def __init__(self, fail: bool = False):
+        super().__init__(WorkflowConfig(name="llm_workflow", description="LLM workflow"))
+        self.fail = fail
+        self.model = GenericFakeChatModel(
+            messages=iter(
+                [
+                    AIMessage(
+                        content="answer",
+                        usage_metadata={
+                            "input_tokens": 12,
+                            "output_tokens": 3,
+                            "total_tokens": 15,
+                        },
+                    )
+                ]
+            )
+        )
+
+    async def build_graph(self):
+        async def ask(state: LLMState, config) -> Dict[str, Any]:
+            model = config["configurable"]["model"]
+            response = await model.ainvoke(state["query"])
+            return {"answer": response.content}
+
+        async def check(state: LLMState, config) -> Dict[str, Any]:
+            if config["configurable"]["fail"]:
+                raise RuntimeError("check failed")
+            return {"answer": state["answer"].upper()}
+
+        graph = StateGraph(LLMState)
+        graph.add_node("ask", ask)
+        graph.add_node("check", check)
+        graph.add_edge(START, "ask")
+        graph.add_edge("ask", "check")
+        graph.add_edge("check", END)
+        return graph.compile()
+
+    def get_runtime_components(self):
+        return {"model": self.model, "fail": self.fail}
+
+    async def execute(self, input_data, config=None):
+        return await self.run_graph({"query": input_data["query"], "answer": ""}, config)
+
+    async def health_check(self):
+        return "healthy"
+
+
+def make_orchestrator(workflow):
+    """Create an orchestrator with a tracker and one registered workflow."""
+    tracker = LangWatchTracker()
+    orchestrator = MainOrchestrator(tracker=tracker)
+    orchestrator.register_workflow("traced", workflow)
+    return orchestrator, tracker
+
+
+class TestWorkflowTracer:
+    """Test suite for per-node tracing through the orchestrator."""
+
+    @pytest.mark.asyncio
+    async def test_node_events_for_compiled_graph(self):
+        """Test every node of a workflow run is recorded with timing and state size."""
+        workflow = ResearchSummarizationWorkflow(
+            research_agent=FakeAgent("research", "findings"),
+            summarization_agent=FakeAgent("summary", "short"),
+        )
+        orchestrator, tracker = make_orchestrator(workflow)
+
+        await orchestrator.execute_workflow("traced", {"query": "q"})
+
+        events = tracker.get_events("node_execution")
+        assert [event.data["node_name"] for event in events] == ["research", "summarization"]
+        assert [event.data["step"] for event in events] == [1, 2]
+        for event in events:
+            assert event.data["execution_time"] > 0
+            assert event.data["input_state_bytes"] > 0
+            assert event.data["output_state_bytes"] > 0
+            assert event.data["success"]
+        nodes = tracker.get_statistics()["workflows"]["traced"]["nodes"]
+        assert set(nodes) == {"research", "summarization"}
+
+    @pytest.mark.asyncio
+    async def test_trace_spans_are_nested(self):
+        """Test the trace has a workflow root, node children and LLM grandchildren."""
+        orchestrator, tracker = make_orchestrator(LLMWorkflow())
+
+        await orchestrator.execute_workflow("traced", {"query": "q"})
+
+        spans = tracker.get_events("trace")[0].data["spans"]
+        by_name = {span["name"]: span for span in spans}
+        root = by_name["traced"]
+        assert root["parentSpanId"] == ""
+        assert by_name["ask"]["parentSpanId"] == root["spanId"]
+        assert by_name["check"]["parentSpanId"] == root["spanId"]
+        assert by_name["GenericFakeChatModel"]["parentSpanId"] == by_name["ask"]["spanId"]
+        assert {span["traceId"] for span in spans} == {root["traceId"]}
+        assert len(root["traceId"]) == 32 and len(root["spanId"]) == 16
+        for span in spans:
+            assert int(span["endTimeUnixNano"]) >= int(span["startTimeUnixNano"])
+            assert span["status"]["code"] == STATUS_OK
+
+    @pytest.mark.asyncio
+    async def test_token_usage_is_attributed_to_node(self):
+        """Test model token usage is summed onto the enclosing node."""
+        orchestrator, tracker = make_orchestrator(LLMWorkflow())
+
+        await orchestrator.execute_workflow("traced", {"query": "q"})
+
+        ask, check = tracker.get_events("node_execution")
+        assert (ask.data["prompt_tokens"], ask.data["completion_tokens"]) == (12, 3)
+        assert check.data["prompt_tokens"] is None
+
+    @pytest.mark.asyncio
+    async def test_node_errors_are_recorded(self):
+        """Test a failing node closes its span and the root span with an error."""
+        orchestrator, tracker = make_orchestrator(LLMWorkflow(fail=True))
+
+        with pytest.raises(RuntimeError):
+            await orchestrator.execute_workflow("traced", {"query": "q"})
+
+        ask, check = tracker.get_events("node_execution")
+        assert ask.data["success"]
+        assert check.data["error"] == "RuntimeError: check failed"
+        spans = tracker.get_events("trace")[0].data["spans"]
+        failed = [span["name"] for span in spans if span["status"]["code"] == STATUS_ERROR]
+        assert failed == ["traced", "check"]
+
+    @pytest.mark.asyncio
+    async def test_tracer_keeps_caller_callbacks(self):
+        """Test the orchestrator adds its tracer next to callbacks from the caller."""
+        orchestrator, tracker = make_orchestrator(LLMWorkflow())
+        own_tracer = WorkflowTracer("own")
+        config = {"callbacks": [own_tracer]}
+
+        await orchestrator.execute_workflow("traced", {"query": "q"}, config)
+
+        assert config == {"callbacks": [own_tracer]}
+        assert [span.name for span in own_tracer.get_node_spans()] == ["ask", "check"]
+        assert len(tracker.get_events("trace")) == 1
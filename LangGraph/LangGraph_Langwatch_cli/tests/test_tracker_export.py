@@ -0,0 +1,127 @@
+"""Tests for the batched, non-blocking tracker export pipeline."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from monitoring.export_pipeline import ExportPipeline, LocalCollectorExporter
+from monitoring.langwatch_tracker import LangWatchTracker
+
+
+class FlakyExporter(LocalCollectorExporter):
+    """Collector failing a number of export attempts before succeeding."""
+
+    def __init__(self, failures):
+        super().__init__()
+        self.failures = failures
+        self.attempts = 0
+
+    async def export(self, batch):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise ConnectionError("collector unavailable")
+        await super().export(batch)
+
+
+def track(tracker, count):
+    """Track a number of registration events."""
+    for i in range(count):
+        tracker.track_agent_registration(f"agent_{i}", "FakeAgent")
+
+
+class TestExportPipeline:
+    """Test suite for tracker event export."""
+
+    @pytest.mark.asyncio
+    async def test_events_are_exported_in_batches(self):
+        """Test full batches are shipped by the background worker."""
+        collector = LocalCollectorExporter()
+        tracker = LangWatchTracker(exporter=collector, batch_size=10, flush_interval_seconds=60)
+
+        track(tracker, 25)
+        await asyncio.sleep(0.05)
+
+        assert [len(batch) for batch in collector.batches] == [10, 10]
+        await tracker.close()
+        assert [len(batch) for batch in collector.batches] == [10, 10, 5]
+        assert collector.events[0]["data"]["agent_name"] == "agent_0"
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_is_flushed_on_interval(self):
+        """Test events are exported after the flush interval without a full batch."""
+        collector = LocalCollectorExporter()
+        tracker = LangWatchTracker(exporter=collector, batch_size=100, flush_interval_seconds=0.05)
+
+        track(tracker, 3)
+        await asyncio.sleep(0.15)
+
+        assert len(collector.events) == 3
+        await tracker.close()
+
+    @pytest.mark.asyncio
+    async def test_overflow_drops_new_events(self):
+        """Test a full buffer drops events instead of growing."""
+        collector = LocalCollectorExporter()
+        tracker = LangWatchTracker(
+            exporter=collector, buffer_size=5, batch_size=100, flush_interval_seconds=60
+        )
+
+        track(tracker, 8)
+        stats = tracker.get_statistics()["export"]
+
+        assert stats["buffered"] == 5
+        assert stats["dropped_overflow"] == 3
+        await tracker.close()
+        assert len(collector.events) == 5
+
+    @pytest.mark.asyncio
+    async def test_failed_batches_are_retried(self):
+        """Test transient export failures are retried with backoff."""
+        exporter = FlakyExporter(failures=2)
+        pipeline = ExportPipeline(exporter, max_retries=3, retry_backoff_seconds=0.01)
+
+        pipeline.submit({"event": 1})
+        await pipeline.stop()
+
+        assert len(exporter.events) == 1
+        assert pipeline.get_stats()["retries"] == 2
+        assert pipeline.get_stats()["dropped_failed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_batches_are_dropped_after_retries(self):
+        """Test a persistently failing collector drops batches and counts them."""
+        exporter = FlakyExporter(failures=100)
+        pipeline = ExportPipeline(exporter, max_retries=1, retry_backoff_seconds=0.01)
+
+        pipeline.submit({"event": 1})
+        pipeline.submit({"event": 2})
+        await pipeline.stop()
+
+        assert pipeline.get_stats()["dropped_failed"] == 2
+        assert exporter.attempts == 2
+
+    def test_tracking_without_event_loop_buffers_events(self):
+        """Test tracking from synchronous code buffers until flushed."""
+        collector = LocalCollectorExporter()
+        tracker = LangWatchTracker(exporter=collector)
+
+        track(tracker, 3)
+        assert tracker.get_statistics()["export"]["buffered"] == 3
+
+        asyncio.run(tracker.flush())
+        assert len(collector.events) == 3
+
+    def test_retained_events_are_bounded(self):
+        """Test local event history keeps only the most recent events."""
+        tracker = LangWatchTracker(max_retained_events=10)
+
+        track(tracker, 25)
+
+        events = tracker.get_events()
+        assert len(events) == 10
+        assert events[0].data["agent_name"] == "agent_15"
+        assert tracker.get_statistics()["export"] is None
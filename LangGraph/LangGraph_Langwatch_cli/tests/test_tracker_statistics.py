@@ -0,0 +1,139 @@
+"""Tests for incremental tracker statistics and bounded event retention."""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from monitoring.langwatch_tracker import LangWatchTracker, TrackingEvent
+from monitoring.statistics import EventStore, LatencyHistogram, StoredEvent
+from orchestrator import MainOrchestrator
+from tests.fakes import FakeWorkflow
+
+
+def track_executions(tracker, latencies, workflow_name="research"):
+    """Track one completed workflow execution per latency."""
+    for latency in latencies:
+        tracker.complete_workflow_execution(workflow_name, {}, execution_time=latency)
+
+
+class TestLatencyHistogram:
+    """Test suite for streaming latency histograms."""
+
+    def test_percentiles_are_close_to_exact(self):
+        """Test percentiles interpolated within buckets stay close to the exact values."""
+        histogram = LatencyHistogram()
+        values = [i / 1000 for i in range(1, 1001)]
+        for value in values:
+            histogram.record(value)
+
+        summary = histogram.summary()
+
+        assert summary["count"] == 1000
+        assert summary["min"] == 0.001
+        assert summary["max"] == 1.0
+        assert summary["mean"] == pytest.approx(0.5005)
+        assert summary["p50"] == pytest.approx(0.5, rel=0.02)
+        assert summary["p95"] == pytest.approx(0.95, rel=0.02)
+        assert summary["p99"] == pytest.approx(0.99, rel=0.02)
+
+    def test_memory_is_bounded(self):
+        """Test the histogram uses a bounded number of buckets."""
+        histogram = LatencyHistogram()
+        for i in range(100_000):
+            histogram.record(i * 1e-5)
+
+        assert len(histogram.buckets) < 100
+
+
+class TestEventStore:
+    """Test suite for indexed event retention."""
+
+    def test_count_bound_evicts_oldest_across_types(self):
+        """Test eviction by count keeps the type index consistent."""
+        store = EventStore(max_events=3)
+        now = time.time()
+        for i, event_type in enumerate(["a", "b", "a", "b", "a"]):
+            store.add(StoredEvent(event_type, now, {"i": i}, None))
+
+        assert [event.data["i"] for event in store.get()] == [2, 3, 4]
+        assert [event.data["i"] for event in store.get("a")] == [2, 4]
+        assert [event.data["i"] for event in store.get("a", limit=1)] == [4]
+
+    def test_age_bound_expires_old_events(self):
+        """Test events older than the maximum age are dropped."""
+        store = EventStore(max_age_seconds=60)
+        now = time.time()
+        store.add(StoredEvent("a", now - 120, {}, None))
+        store.add(StoredEvent("a", now, {}, None))
+
+        assert len(store.get("a")) == 1
+
+
+class TestTrackerStatistics:
+    """Test suite for incremental tracker statistics."""
+
+    def test_statistics_survive_retention(self):
+        """Test counters cover events that are no longer retained."""
+        tracker = LangWatchTracker(max_retained_events=5)
+        track_executions(tracker, [0.1] * 20)
+
+        stats = tracker.get_statistics()
+
+        assert stats["total_events"] == 20
+        assert stats["retained_events"] == 5
+        assert stats["event_types"] == {"workflow_complete": 20}
+        assert stats["latency"]["workflow_complete"]["count"] == 20
+
+    def test_statistics_per_workflow(self):
+        """Test counters and latency histograms are kept per workflow."""
+        tracker = LangWatchTracker()
+        track_executions(tracker, [0.1, 0.2], "research")
+        track_executions(tracker, [1.0], "summary")
+        tracker.error_workflow_execution("summary", "boom", execution_time=2.0)
+
+        workflows = tracker.get_statistics()["workflows"]
+
+        assert workflows["research"]["event_types"] == {"workflow_complete": 2}
+        assert workflows["summary"]["event_types"] == {
+            "workflow_complete": 1,
+            "workflow_error": 1,
+        }
+        assert workflows["summary"]["latency"]["workflow_error"]["max"] == 2.0
+
+    def test_get_events_by_type_returns_tracking_events(self):
+        """Test typed lookups return public TrackingEvent objects."""
+        tracker = LangWatchTracker()
+        tracker.track_agent_registration("a", "Agent")
+        track_executions(tracker, [0.1])
+
+        events = tracker.get_events("agent_registration")
+
+        assert len(events) == 1
+        assert isinstance(events[0], TrackingEvent)
+        assert events[0].data["agent_name"] == "a"
+
+    def test_clear_events_resets_statistics(self):
+        """Test clearing drops events and statistics."""
+        tracker = LangWatchTracker()
+        track_executions(tracker, [0.1])
+
+        tracker.clear_events()
+
+        assert tracker.get_events() == []
+        assert tracker.get_statistics()["total_events"] == 0
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_reports_execution_time(self):
+        """Test workflow latency flows from the orchestrator into the histograms."""
+        tracker = LangWatchTracker()
+        orchestrator = MainOrchestrator(tracker=tracker)
+        orchestrator.register_workflow("fake", FakeWorkflow())
+
+        await orchestrator.execute_workflow("fake", {"query": "q", "delay": 0.02})
+
+        latency = tracker.get_statistics()["workflows"]["fake"]["latency"]
+        assert latency["workflow_complete"]["min"] >= 0.02
@@ -0,0 +1 @@
+"""Test package for workflows."""
\ No newline at end of file
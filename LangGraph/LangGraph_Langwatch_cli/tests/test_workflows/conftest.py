@@ -0,0 +1,18 @@
+"""Shared fixtures for the workflow tests."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from workflows.graph_registry import graph_registry
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    """Start each test with an empty global registry."""
+    graph_registry.clear()
+    yield
+    graph_registry.clear()
@@ -0,0 +1,191 @@
+"""Tests for checkpointed, resumable workflow execution."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from tests.fakes import FakeAgent
+from workflows.base_workflow import WorkflowConfig
+from workflows.checkpoint import CompressedSerializer, SQLiteCheckpointSaver
+from workflows.graph_registry import graph_registry
+from workflows.research_summarization_workflow import ResearchSummarizationWorkflow
+
+
+class FlakyAgent(FakeAgent):
+    """Agent failing a number of calls before answering."""
+
+    def __init__(self, name, reply, failures=1):
+        super().__init__(name, reply)
+        self.failures = failures
+
+    async def execute(self, messages, context=None):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError(f"{self.name} failed")
+        return await super().execute(messages, context)
+
+
+def make_workflow(path, research_agent=None, summarization_agent=None):
+    """Create a checkpointed workflow storing its checkpoints in ``path``."""
+    return ResearchSummarizationWorkflow(
+        research_agent=research_agent or FakeAgent("research", "findings"),
+        summarization_agent=summarization_agent or FakeAgent("summary", "short"),
+        config=WorkflowConfig(
+            name="checkpointed_workflow",
+            description="Checkpointed test workflow",
+            checkpoint_path=str(path),
+        ),
+    )
+
+
+RUN = {"configurable": {"thread_id": "run-1"}}
+
+
+def count_checkpoints(path):
+    """Count the checkpoints stored in a database file."""
+    saver = SQLiteCheckpointSaver(path)
+    try:
+        return len([*saver.list(None)])
+    finally:
+        saver.close()
+
+
+class TestCheckpointedWorkflow:
+    """Test suite for resuming workflows from checkpoints."""
+
+    @pytest.mark.asyncio
+    async def test_retry_resumes_after_failed_node(self, tmp_path):
+        """Test a retry does not re-run nodes that completed before a failure."""
+        research = FakeAgent("research", "findings")
+        summary = FlakyAgent("summary", "short")
+        workflow = make_workflow(tmp_path / "checkpoints.db", research, summary)
+
+        with pytest.raises(RuntimeError, match="summary failed"):
+            await workflow.execute({"query": "q"}, RUN)
+        result = await workflow.execute({"query": "q"}, RUN)
+
+        assert result["summary"] == "short"
+        assert result["research_result"] == "findings"
+        assert len(research.calls) == 1
+        assert len(summary.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_checkpoints_survive_restart(self, tmp_path):
+        """Test a new workflow instance (e.g. after a restart) resumes from disk."""
+        path = tmp_path / "checkpoints.db"
+        with pytest.raises(RuntimeError):
+            await make_workflow(path, summarization_agent=FlakyAgent("summary", "short")).execute(
+                {"query": "q"}, RUN
+            )
+        graph_registry.clear()
+        research = FakeAgent("research", "fresh findings")
+
+        result = await make_workflow(path, research_agent=research).execute({"query": "q"}, RUN)
+
+        assert result["research_result"] == "findings"
+        assert research.calls == []
+
+    @pytest.mark.asyncio
+    async def test_completed_runs_drop_checkpoints(self, tmp_path):
+        """Test checkpoints are deleted once a run completes."""
+        path = tmp_path / "checkpoints.db"
+        research = FakeAgent("research", "findings")
+        workflow = make_workflow(path, research)
+
+        await workflow.execute({"query": "q"})
+        await workflow.execute({"query": "q"})
+
+        assert count_checkpoints(path) == 0
+        assert len(research.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_thread_id_separates_runs(self, tmp_path):
+        """Test an explicit thread ID starts a separate run for the same input."""
+        research = FakeAgent("research", "findings")
+        workflow = make_workflow(
+            tmp_path / "checkpoints.db", research, FlakyAgent("summary", "short")
+        )
+        with pytest.raises(RuntimeError):
+            await workflow.execute({"query": "q"}, RUN)
+
+        await workflow.execute({"query": "q"}, {"configurable": {"thread_id": "other"}})
+
+        assert len(research.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_runs_without_thread_id_start_over(self, tmp_path):
+        """Test a run without a thread ID neither resumes nor keeps checkpoints of the same input."""
+        path = tmp_path / "checkpoints.db"
+        research = FakeAgent("research", "findings")
+        workflow = make_workflow(path, research, FlakyAgent("summary", "short"))
+        with pytest.raises(RuntimeError):
+            await workflow.execute({"query": "q"})
+
+        await workflow.execute({"query": "q"})
+
+        assert len(research.calls) == 2
+        assert count_checkpoints(path) == 0
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_runs_are_isolated(self, tmp_path):
+        """Test identical inputs running at once keep separate checkpoint threads."""
+        path = tmp_path / "checkpoints.db"
+        research = FakeAgent("research", "findings", delay=0.05)
+        summary = FakeAgent("summary", "short", delay=0.2)
+        workflow = make_workflow(path, research, summary)
+
+        first = asyncio.create_task(workflow.execute({"query": "q"}))
+        # Start the second run while the first one is summarizing
+        await asyncio.sleep(0.1)
+        second = asyncio.create_task(workflow.execute({"query": "q"}))
+        results = await asyncio.gather(first, second)
+
+        assert [result["summary"] for result in results] == ["short", "short"]
+        assert len(research.calls) == 2
+        assert len(summary.calls) == 2
+        assert count_checkpoints(path) == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_resumes_after_failed_node(self, tmp_path):
+        """Test streaming a retried run yields only the nodes that still had to run."""
+        workflow = make_workflow(
+            tmp_path / "checkpoints.db", summarization_agent=FlakyAgent("summary", "short")
+        )
+        with pytest.raises(RuntimeError):
+            await workflow.execute({"query": "q"}, RUN)
+
+        steps = [step async for step, _ in workflow.stream({"query": "q"}, RUN)]
+
+        assert steps == ["summarization"]
+
+
+class TestCompressedSerializer:
+    """Test suite for compact checkpoint serialization."""
+
+    def test_large_message_history_is_compressed(self):
+        """Test long message histories are stored compressed and round-trip."""
+        serializer = CompressedSerializer()
+        messages = [
+            HumanMessage(content="What changed in the quarterly report? " * 20),
+            AIMessage(content="Revenue grew while costs stayed flat. " * 20),
+        ] * 10
+
+        type_, data = serializer.dumps_typed(messages)
+
+        assert type_.endswith("+zlib")
+        assert len(data) < len(serializer.serde.dumps_typed(messages)[1]) / 5
+        assert serializer.loads_typed((type_, data)) == messages
+
+    def test_small_values_are_not_compressed(self):
+        """Test small payloads skip compression."""
+        serializer = CompressedSerializer()
+
+        type_, data = serializer.dumps_typed({"query": "q"})
+
+        assert not type_.endswith("+zlib")
+        assert serializer.loads_typed((type_, data)) == {"query": "q"}
@@ -0,0 +1,93 @@
+"""Tests for the process-wide compiled graph registry."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from orchestrator import MainOrchestrator
+from tests.fakes import FakeAgent
+from workflows.base_workflow import WorkflowConfig
+from workflows.graph_registry import GraphRegistry, graph_registry
+from workflows.research_summarization_workflow import ResearchSummarizationWorkflow
+
+
+def make_workflow(reply: str, timeout_seconds: float = 5):
+    """Create a workflow whose agents answer with the given reply."""
+    return ResearchSummarizationWorkflow(
+        research_agent=FakeAgent("research", f"research {reply}"),
+        summarization_agent=FakeAgent("summary", f"summary {reply}"),
+        config=WorkflowConfig(
+            name="registry_workflow",
+            description="Registry test workflow",
+            timeout_seconds=timeout_seconds,
+        ),
+    )
+
+
+class TestGraphRegistry:
+    """Test suite for GraphRegistry."""
+
+    @pytest.mark.asyncio
+    async def test_same_config_shares_compiled_graph(self):
+        """Test that instances with the same class and config share one graph."""
+        first, second = make_workflow("a"), make_workflow("b")
+
+        assert await first.get_graph() is await second.get_graph()
+        assert len(graph_registry) == 1
+
+    @pytest.mark.asyncio
+    async def test_different_config_compiles_separately(self):
+        """Test that a different config hash gets its own graph."""
+        first, second = make_workflow("a"), make_workflow("b", timeout_seconds=10)
+
+        assert await first.get_graph() is not await second.get_graph()
+        assert len(graph_registry) == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_graph_uses_instance_agents(self):
+        """Test that agents are injected per run, not captured at compile time."""
+        first, second = make_workflow("a"), make_workflow("b")
+
+        results = await asyncio.gather(
+            first.execute({"query": "q"}), second.execute({"query": "q"})
+        )
+
+        assert [r["summary"] for r in results] == ["summary a", "summary b"]
+        assert first.graph is second.graph
+
+    @pytest.mark.asyncio
+    async def test_compiles_once(self, monkeypatch):
+        """Test that build_graph runs once per topology."""
+        registry = GraphRegistry()
+        calls = []
+        original = ResearchSummarizationWorkflow.build_graph
+
+        async def counting_build_graph(self):
+            calls.append(self)
+            return await original(self)
+
+        monkeypatch.setattr(
+            ResearchSummarizationWorkflow, "build_graph", counting_build_graph
+        )
+
+        for reply in "abc":
+            await registry.get_or_compile(make_workflow(reply))
+
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_warm_up(self):
+        """Test that orchestrator warm-up compiles registered workflow graphs."""
+        orchestrator = MainOrchestrator()
+        orchestrator.register_workflow("one", make_workflow("a"))
+        orchestrator.register_workflow("two", make_workflow("b"))
+
+        compiled = await orchestrator.warm_up()
+
+        assert compiled == 1
+        assert all(w.graph is not None for w in orchestrator.workflows.values())
+        assert orchestrator.workflows["one"] in graph_registry
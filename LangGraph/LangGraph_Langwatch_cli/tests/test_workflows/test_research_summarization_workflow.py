@@ -0,0 +1,266 @@
+"""Tests for graph-based execution of ResearchSummarizationWorkflow."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from tests.fakes import FakeAgent
+from workflows.base_workflow import WorkflowConfig, WorkflowTimeoutError
+from workflows.research_summarization_workflow import (
+    ResearchSummarizationConfig,
+    ResearchSummarizationWorkflow,
+)
+
+
+def make_workflow(research_delay=0.0, summary_delay=0.0, **config_kwargs):
+    """Create a workflow wired to fake agents."""
+    config = WorkflowConfig(
+        name="test_workflow",
+        description="Test workflow",
+        **{"max_iterations": 5, "timeout_seconds": 5, **config_kwargs},
+    )
+    return ResearchSummarizationWorkflow(
+        research_agent=FakeAgent("research", "research report", research_delay),
+        summarization_agent=FakeAgent("summary", "short summary", summary_delay),
+        config=config,
+    )
+
+
+COMPOUND_QUERY = "How does LangGraph schedule nodes and how does LangWatch trace agents?"
+
+
+class StreamingFakeAgent(FakeAgent):
+    """Agent streaming its sections with a delay before each one."""
+
+    def __init__(self, name, sections, delay):
+        super().__init__(name, "\n\n".join(sections), delay)
+        self.sections = sections
+        self.finished_at = None
+
+    async def stream(self, messages, context=None):
+        self.calls.append((messages[0].content, context))
+        for i, section in enumerate(self.sections):
+            await asyncio.sleep(self.delay)
+            yield section + ("\n\n" if i < len(self.sections) - 1 else "")
+        self.finished_at = time.perf_counter()
+
+
+class TimedFakeAgent(FakeAgent):
+    """Agent recording when each call starts."""
+
+    def __init__(self, name, reply, delay=0.0):
+        super().__init__(name, reply, delay)
+        self.started_at = []
+
+    async def execute(self, messages, context=None):
+        self.started_at.append(time.perf_counter())
+        return await super().execute(messages, context)
+
+
+def make_parallel_workflow(research_agent, summarization_agent, **config_kwargs):
+    """Create a workflow with the parallel topology."""
+    config = ResearchSummarizationConfig(
+        name="parallel_workflow",
+        description="Parallel test workflow",
+        **{"timeout_seconds": 5, **config_kwargs},
+    )
+    return ResearchSummarizationWorkflow(
+        research_agent=research_agent,
+        summarization_agent=summarization_agent,
+        config=config,
+    )
+
+
+class TestResearchSummarizationWorkflow:
+    """Test suite for compiled-graph execution."""
+
+    @pytest.mark.asyncio
+    async def test_execute_runs_graph(self):
+        """Test that execute runs both nodes through the compiled graph."""
+        workflow = make_workflow()
+
+        result = await workflow.execute({"query": "What is LangGraph?"})
+
+        assert workflow.graph is not None
+        assert result == {
+            "query": "What is LangGraph?",
+            "research_result": "research report",
+            "summary": "short summary",
+            "workflow_status": "completed",
+        }
+        assert workflow.summarization_agent.calls[0][0] == "research report"
+        assert workflow.summarization_agent.calls[0][1]["summary_style"] == "comprehensive"
+
+    @pytest.mark.asyncio
+    async def test_context_overrides_summary_style(self):
+        """Test that a summary_style in the input context is preserved."""
+        workflow = make_workflow()
+
+        await workflow.execute({"query": "q", "context": {"summary_style": "brief"}})
+
+        assert workflow.summarization_agent.calls[0][1]["summary_style"] == "brief"
+
+    @pytest.mark.asyncio
+    async def test_invalid_input(self):
+        """Test that an empty query is rejected."""
+        workflow = make_workflow()
+
+        with pytest.raises(ValueError):
+            await workflow.execute({"query": "   "})
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_node_outputs_in_order(self):
+        """Test that stream yields each node's output as it finishes."""
+        workflow = make_workflow()
+
+        updates = [item async for item in workflow.stream({"query": "q"})]
+
+        assert updates == [
+            ("research", {"research_result": "research report"}),
+            ("summarization", {"summary": "short summary"}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_node_timeout(self):
+        """Test that a slow node is cancelled after the per-node timeout."""
+        workflow = make_workflow(summary_delay=10, node_timeout_seconds=0.05)
+
+        with pytest.raises(WorkflowTimeoutError, match="summarization"):
+            await workflow.execute({"query": "q"})
+
+        assert workflow.summarization_agent.cancelled
+
+    @pytest.mark.asyncio
+    async def test_workflow_timeout_cancels_stream(self):
+        """Test that the whole-workflow timeout cancels a running stream."""
+        workflow = make_workflow(summary_delay=10, timeout_seconds=0.1)
+        received = []
+
+        with pytest.raises(WorkflowTimeoutError):
+            async for item in workflow.stream({"query": "q"}):
+                received.append(item)
+        await asyncio.sleep(0.05)
+
+        assert [name for name, _ in received] == ["research"]
+        assert workflow.summarization_agent.cancelled
+
+    @pytest.mark.asyncio
+    async def test_closing_stream_early_cancels_graph(self):
+        """Test that abandoning the stream cancels the remaining nodes."""
+        workflow = make_workflow(summary_delay=10)
+
+        stream = workflow.stream({"query": "q"})
+        first = await anext(stream)
+        await asyncio.sleep(0.01)
+        await stream.aclose()
+        await asyncio.sleep(0.05)
+
+        assert first[0] == "research"
+        assert workflow.summarization_agent.cancelled
+
+    def test_recursion_limit_follows_max_iterations(self):
+        """Test that max_iterations bounds the graph recursion limit."""
+        workflow = make_workflow(max_iterations=7)
+
+        run_config = workflow.get_run_config({"tags": ["x"]})
+
+        assert run_config["recursion_limit"] == 7
+        assert run_config["tags"] == ["x"]
+        assert run_config["configurable"]["research_agent"] is workflow.research_agent
+
+
+class TestParallelBranches:
+    """Test suite for fan-out research branches and streaming hand-off."""
+
+    @pytest.mark.asyncio
+    async def test_sub_queries_are_researched_in_parallel(self):
+        """Test compound queries fan out and latency follows the slowest branch."""
+        research = FakeAgent("research", "report", delay=0.2)
+        summary = FakeAgent("summary", "short summary")
+        workflow = make_parallel_workflow(research, summary, max_branches=4)
+
+        started = time.perf_counter()
+        result = await workflow.execute({"query": COMPOUND_QUERY})
+        elapsed = time.perf_counter() - started
+
+        assert sorted(query for query, _ in research.calls) == [
+            "How does LangGraph schedule nodes",
+            "how does LangWatch trace agents",
+        ]
+        assert elapsed < 0.35
+        assert result["research_result"] == (
+            "## How does LangGraph schedule nodes\n\nreport\n\n"
+            "## how does LangWatch trace agents\n\nreport"
+        )
+        assert summary.calls == [(result["research_result"], {"summary_style": "comprehensive"})]
+        assert result["summary"] == "short summary"
+
+    @pytest.mark.asyncio
+    async def test_simple_query_uses_single_branch(self):
+        """Test a query without parts is researched as a whole."""
+        research = FakeAgent("research", "report")
+        workflow = make_parallel_workflow(
+            research, FakeAgent("summary", "short summary"), max_branches=4
+        )
+
+        result = await workflow.execute({"query": "What is LangGraph?"})
+
+        assert research.calls[0][0] == "What is LangGraph?"
+        assert result["research_result"] == "report"
+
+    @pytest.mark.asyncio
+    async def test_streaming_handoff_overlaps_research(self):
+        """Test sections are summarized while research is still streaming."""
+        sections = ["First section. " * 5, "Second section. " * 5, "Third section. " * 5]
+        research = StreamingFakeAgent("research", sections, delay=0.05)
+        summary = TimedFakeAgent("summary", "partial")
+        workflow = make_parallel_workflow(
+            research, summary, streaming_handoff=True, handoff_section_chars=50
+        )
+
+        result = await workflow.execute({"query": "What is LangGraph?"})
+
+        assert result["research_result"] == "\n\n".join(sections)
+        section_calls = [content for content, _ in summary.calls[:-1]]
+        assert [content.strip() for content in section_calls] == [
+            section.strip() for section in sections
+        ]
+        assert summary.calls[-1][0] == "partial\n\npartial\n\npartial"
+        assert summary.started_at[0] < research.finished_at
+
+    @pytest.mark.asyncio
+    async def test_single_section_summary_is_used_directly(self):
+        """Test a short research result needs no combining summarization call."""
+        research = StreamingFakeAgent("research", ["Only section."], delay=0)
+        summary = FakeAgent("summary", "short summary")
+        workflow = make_parallel_workflow(research, summary, streaming_handoff=True)
+
+        result = await workflow.execute({"query": "What is LangGraph?"})
+
+        assert result["summary"] == "short summary"
+        assert len(summary.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_branch_fails_workflow(self):
+        """Test an error in one branch fails the run before summarization."""
+
+        class PartlyFailingAgent(FakeAgent):
+            async def execute(self, messages, context=None):
+                if "LangWatch" in messages[0].content:
+                    raise RuntimeError("branch failed")
+                return await super().execute(messages, context)
+
+        summary = FakeAgent("summary", "short summary")
+        workflow = make_parallel_workflow(
+            PartlyFailingAgent("research", "report"), summary, max_branches=4
+        )
+
+        with pytest.raises(RuntimeError, match="branch failed"):
+            await workflow.execute({"query": COMPOUND_QUERY})
+
+        assert summary.calls == []
@@ -0,0 +1,98 @@
+"""Throughput benchmark of document chunking, in MB/s.
+
+Generates a large synthetic regulatory document (sections with headings,
+paragraphs of sentences of varying length) and streams it through the
+paragraph splitter and the token-aware chunker, with and without merging
+similar sections.
+
+Run from the project root:
+
+    python benchmarks/chunking_benchmark.py --size-mb 100
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Iterator, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chunking import Chunker, build_token_counter  # noqa: E402
+from document_stream import iter_chunks  # noqa: E402
+from embedding_index import HashingEmbedder  # noqa: E402
+
+WORDS = (
+    "customer identification amount currency risk assessment evaluation analysis "
+    "transaction transfer account report policy data retention privacy control "
+    "review compliance obligation disclosure the of and to in must shall be is"
+).split()
+
+
+def write_document(path: str, size_bytes: int, rng: random.Random) -> None:
+    """Write sections of 1-8 paragraphs, each of 1-10 sentences, until the size is reached."""
+    written = 0
+    section = 0
+    with open(path, "w", encoding="utf-8") as file:
+        while written < size_bytes:
+            section += 1
+            parts = [f"Section {section}: {' '.join(rng.choices(WORDS, k=3)).title()}"]
+            for _ in range(rng.randint(1, 8)):
+                sentences = (
+                    " ".join(rng.choices(WORDS, k=rng.randint(4, 40))).capitalize() + "."
+                    for _ in range(rng.randint(1, 10))
+                )
+                parts.append(" ".join(sentences))
+            text = "\n\n".join(parts) + "\n\n"
+            file.write(text)
+            written += len(text)
+
+
+def measure(chunks: Callable[[], Iterator[Tuple[object, str]]], size_bytes: int) -> Tuple[float, int]:
+    """Consume all chunks; return MB/s and the chunk count."""
+    started = time.perf_counter()
+    count = sum(1 for _ in chunks())
+    return size_bytes / 2**20 / (time.perf_counter() - started), count
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=100)
+    parser.add_argument("--max-tokens", type=int, default=512)
+    parser.add_argument("--overlap-tokens", type=int, default=64)
+    parser.add_argument("--tokenizer", default="approx", help='"approx" or a tiktoken encoding, e.g. o200k_base')
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    count_tokens = build_token_counter(args.tokenizer)
+    chunker = Chunker(args.max_tokens, args.overlap_tokens, count_tokens)
+    merging_chunker = Chunker(
+        args.max_tokens, args.overlap_tokens, count_tokens,
+        embedder=HashingEmbedder(), merge_similarity=0.8,
+    )
+
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    os.close(fd)
+    try:
+        write_document(path, int(args.size_mb * 2**20), random.Random(args.seed))
+        size_bytes = os.path.getsize(path)
+        print(f"{size_bytes / 2**20:.0f} MB document, {args.max_tokens} token chunks, "
+              f"{args.overlap_tokens} token overlap, {args.tokenizer} tokenizer\n")
+        print(f"{'':>24}{'MB/s':>10}{'chunks':>12}")
+        for name, chunks in (
+            ("paragraph split", lambda: iter_chunks(path)),
+            ("token-aware", lambda: chunker.iter_chunks(path)),
+            ("token-aware + merge", lambda: merging_chunker.iter_chunks(path)),
+        ):
+            throughput, count = measure(chunks, size_bytes)
+            print(f"{name:>24}{throughput:10.1f}{count:12d}")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Benchmark of candidate rule extraction with the precompiled keyword index.
+
+Compares the original nested loop (every keyword of every rule searched in
+every chunk) with one ``KeywordIndex`` pass per chunk, on synthetic rules and
+chunks. The nested loop is timed on a sample of chunks and extrapolated.
+
+Run from the project root:
+
+    python benchmarks/keyword_index_benchmark.py --rules 10000 --chunks 100000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from keyword_index import KeywordIndex  # noqa: E402
+
+
+def make_vocabulary(size: int, rng: random.Random) -> List[str]:
+    """Make distinct pseudo-words."""
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(letters) for _ in range(rng.randint(4, 10))))
+    return sorted(words)
+
+
+def make_rules(count: int, vocabulary: List[str], rng: random.Random) -> List[Dict[str, Any]]:
+    """Make rules with 2-5 keywords each, some of them two-word phrases."""
+    rules = []
+    for position in range(count):
+        keywords = []
+        for _ in range(rng.randint(2, 5)):
+            words = rng.sample(vocabulary, 2 if rng.random() < 0.2 else 1)
+            keywords.append(" ".join(words))
+        rules.append({"id": f"R{position:05d}", "description": "", "keywords": keywords})
+    return rules
+
+
+def make_chunks(count: int, vocabulary: List[str], rng: random.Random, words: int = 80) -> List[str]:
+    """Make paragraph-sized chunks of random words."""
+    return [" ".join(rng.choices(vocabulary, k=words)).capitalize() + "." for _ in range(count)]
+
+
+def naive_match(rules: List[Dict[str, Any]], chunk: str) -> Dict[int, int]:
+    """Match the way extract_candidate_rules used to: substring search per keyword."""
+    chunk_lower = chunk.lower()
+    counts = {}
+    for position, rule in enumerate(rules):
+        matches = sum(1 for keyword in rule["keywords"] if keyword.lower() in chunk_lower)
+        if matches > 0:
+            counts[position] = matches
+    return counts
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rules", type=int, default=10000)
+    parser.add_argument("--chunks", type=int, default=100000)
+    parser.add_argument("--vocabulary", type=int, default=50000)
+    parser.add_argument("--naive-sample", type=int, default=50, help="chunks timed with the nested loop")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocabulary = make_vocabulary(args.vocabulary, rng)
+    rules = make_rules(args.rules, vocabulary, rng)
+    chunks = make_chunks(args.chunks, vocabulary, rng)
+
+    started = time.perf_counter()
+    index = KeywordIndex(rules)
+    build_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    candidates = sum(len(index.match_counts(chunk)) for chunk in chunks)
+    indexed_seconds = time.perf_counter() - started
+
+    sample = chunks[:args.naive_sample]
+    started = time.perf_counter()
+    naive_results = [naive_match(rules, chunk) for chunk in sample]
+    naive_seconds = (time.perf_counter() - started) * len(chunks) / len(sample)
+    # Whole-word matching can only drop substring hits of the nested loop
+    assert all(
+        set(index.match_counts(chunk)) <= set(result)
+        for chunk, result in zip(sample, naive_results)
+    )
+
+    print(f"{args.rules} rules, {args.chunks} chunks, {candidates} candidate rule applications\n")
+    print(f"{'':>24}{'seconds':>12}{'us/chunk':>12}")
+    print(f"{'index build':>24}{build_seconds:12.2f}")
+    print(f"{'nested loop (est.)':>24}{naive_seconds:12.1f}{naive_seconds / len(chunks) * 1e6:12.1f}")
+    print(f"{'keyword index':>24}{indexed_seconds:12.2f}{indexed_seconds / len(chunks) * 1e6:12.1f}")
+    print(f"\nspeedup {naive_seconds / indexed_seconds:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""Token-aware chunking of streamed documents.
+
+Documents are split into sentence (or line) segments that are packed into
+windows of at most ``max_tokens`` tokens. Consecutive windows share up to
+``overlap_tokens`` tokens of trailing segments. Headings always start a new
+chunk, and optionally adjacent chunks whose embeddings are similar are merged
+while they fit the token budget.
+
+Chunks are emitted as ``ChunkRef`` byte ranges of the document, streamed
+paragraph by paragraph, with IDs hashed from their normalized text so they
+stay the same across runs.
+"""
+
+import hashlib
+import re
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from document_stream import ChunkRef, iter_chunks
+
+# Sentences end with . ! or ? followed by whitespace; otherwise a segment runs to the end of its line
+SENTENCE_PATTERN = re.compile(r"\S[^.!?\n]*(?:[.!?](?!\s)[^.!?\n]*)*[.!?]?")
+SENTENCE_BREAK_PATTERN = re.compile(r"[.!?]\s")
+# Lines holding only whitespace separate blocks within a paragraph
+LINE_PATTERN = re.compile(r"[^\n]+")
+# A heading is the short first line of a block, not ending like a sentence (or a markdown heading)
+HEADING_MAX_CHARS = 80
+HEADING_END_CHARACTERS = ".!?;,"
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about 4 characters per token)."""
+    return len(text) // 4 + 1
+
+def build_token_counter(tokenizer: str) -> Callable[[str], int]:
+    """Create a token counter: "approx" or the name of a tiktoken encoding (e.g. o200k_base).
+
+    Falls back to the approximation when tiktoken or the encoding is unavailable.
+    """
+    if tokenizer == "approx":
+        return estimate_tokens
+    try:
+        import tiktoken
+        encoding = tiktoken.get_encoding(tokenizer)
+    except Exception as e:
+        print(f"Tokenizer {tokenizer} unavailable ({type(e).__name__}), using approximate token counts")
+        return estimate_tokens
+    return lambda text: len(encoding.encode_ordinary(text))
+
+def chunk_id(text: str) -> str:
+    """Stable chunk ID: hash of the text with whitespace normalized."""
+    return hashlib.blake2b(" ".join(text.split()).encode("utf-8"), digest_size=8).hexdigest()
+
+class Segment(NamedTuple):
+    """Sentence or line of a document: UTF-8 byte offsets [start, end)."""
+    start: int
+    end: int
+    text: str
+    tokens: int
+    heading: bool
+
+class Window(NamedTuple):
+    """Segments of one chunk."""
+    segments: List[Segment]
+    tokens: int
+
+    @property
+    def text(self) -> str:
+        """Segment texts joined by single spaces."""
+        return " ".join(segment.text for segment in self.segments)
+
+    def ref(self, path: str) -> ChunkRef:
+        """Reference to the document bytes from the first to the last segment."""
+        return ChunkRef(path, self.segments[0].start, self.segments[-1].end, chunk_id(self.text))
+
+class Chunker:
+    """Split documents into token-bounded chunks along sentence and heading boundaries."""
+
+    def __init__(
+        self,
+        max_tokens: int = 512,
+        overlap_tokens: int = 64,
+        count_tokens: Callable[[str], int] = estimate_tokens,
+        embedder=None,
+        merge_similarity: float = 0.0,
+        batch_size: int = 64,
+    ):
+        """Configure the chunker.
+
+        Args:
+            max_tokens: Token budget of a chunk (single segments above it are split by words)
+            overlap_tokens: Tokens of trailing segments repeated at the start of the next chunk
+            count_tokens: Token counter, see ``build_token_counter``
+            embedder: Embedder used to merge similar neighbouring chunks (None disables merging)
+            merge_similarity: Cosine similarity at which neighbouring chunks are merged (0 disables merging)
+            batch_size: Chunks embedded per batch when merging
+        """
+        if overlap_tokens >= max_tokens:
+            raise ValueError(f"overlap_tokens ({overlap_tokens}) must be below max_tokens ({max_tokens})")
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+        self.count_tokens = count_tokens
+        self.embedder = embedder
+        self.merge_similarity = merge_similarity
+        self.batch_size = batch_size
+
+    def iter_chunks(self, path: str) -> Iterator[Tuple[ChunkRef, str]]:
+        """Stream a document and yield its chunks.
+
+        Yields:
+            Reference (with chunk ID) and normalized text of each chunk, in document order
+        """
+        windows = self._windows(self._segments(path))
+        if self.embedder is not None and self.merge_similarity > 0:
+            windows = self._merge_similar(windows)
+        for window in windows:
+            yield window.ref(path), window.text
+
+    def _segments(self, path: str) -> Iterator[Segment]:
+        """Split the paragraphs of a document into sentence and line segments."""
+        for paragraph_ref, paragraph in iter_chunks(path):
+            # Byte offset of character positions, advanced as segments are found
+            char_position, byte_position = 0, paragraph_ref.start
+            block_start = True
+            for line in LINE_PATTERN.finditer(paragraph):
+                stripped = line.group().strip()
+                if not stripped:
+                    block_start = True
+                    continue
+                heading = block_start and (
+                    stripped.startswith("#")
+                    or (
+                        len(stripped) <= HEADING_MAX_CHARS
+                        and stripped[-1] not in HEADING_END_CHARACTERS
+                        and not SENTENCE_BREAK_PATTERN.search(stripped)
+                    )
+                )
+                block_start = False
+                for sentence in SENTENCE_PATTERN.finditer(paragraph, line.start(), line.end()):
+                    start = byte_position + len(paragraph[char_position:sentence.start()].encode("utf-8"))
+                    text = sentence.group()
+                    end = start + len(text.encode("utf-8"))
+                    char_position, byte_position = sentence.end(), end
+                    yield from self._split_oversized(Segment(start, end, text, self.count_tokens(text), heading))
+                    heading = False
+
+    def _split_oversized(self, segment: Segment) -> Iterator[Segment]:
+        """Split a segment above the token budget into word runs that fit it."""
+        if segment.tokens <= self.max_tokens:
+            yield segment
+            return
+        piece_start = piece_end = None
+        words: List[str] = []
+        tokens = 0
+        byte_position, char_position = segment.start, 0
+        for word in re.finditer(r"\S+", segment.text):
+            word_start = byte_position + len(segment.text[char_position:word.start()].encode("utf-8"))
+            word_end = word_start + len(word.group().encode("utf-8"))
+            byte_position, char_position = word_end, word.end()
+            word_tokens = self.count_tokens(word.group() + " ")
+            if words and tokens + word_tokens > self.max_tokens:
+                yield Segment(piece_start, piece_end, " ".join(words), tokens, segment.heading and piece_start == segment.start)
+                words, tokens = [], 0
+            if not words:
+                piece_start = word_start
+            words.append(word.group())
+            tokens += word_tokens
+            piece_end = word_end
+        if words:
+            yield Segment(piece_start, piece_end, " ".join(words), tokens, False)
+
+    def _windows(self, segments: Iterator[Segment]) -> Iterator[Window]:
+        """Pack segments into token-bounded windows with overlap."""
+        window: List[Segment] = []
+        tokens = 0
+        for segment in segments:
+            if window and segment.heading and not all(previous.heading for previous in window):
+                # A heading starts a new chunk, without overlap across sections
+                yield Window(window, tokens)
+                window, tokens = [], 0
+            elif window and tokens + segment.tokens > self.max_tokens:
+                yield Window(window, tokens)
+                window, tokens = self._overlap(window, segment.tokens)
+            window.append(segment)
+            tokens += segment.tokens
+        if window:
+            yield Window(window, tokens)
+
+    def _overlap(self, window: List[Segment], next_tokens: int) -> Tuple[List[Segment], int]:
+        """Trailing segments of a window to repeat before a segment of ``next_tokens`` tokens."""
+        carried: List[Segment] = []
+        tokens = 0
+        # Never carry the whole window, and leave room for the next segment
+        for segment in reversed(window[1:]):
+            if tokens + segment.tokens > min(self.overlap_tokens, self.max_tokens - next_tokens):
+                break
+            carried.insert(0, segment)
+            tokens += segment.tokens
+        return carried, tokens
+
+    def _merge_similar(self, windows: Iterator[Window]) -> Iterator[Window]:
+        """Merge neighbouring windows whose embeddings are similar, while they fit the token budget.
+
+        Only windows separated by a heading can fit together (token-split
+        windows are full), so this joins short sections on the same topic.
+        """
+        pending: Optional[Window] = None
+        pending_vector: Optional[np.ndarray] = None
+        batch: List[Window] = []
+
+        def flush_batch() -> Iterator[Window]:
+            nonlocal pending, pending_vector
+            vectors = self.embedder.embed([window.text for window in batch])
+            for window, vector in zip(batch, vectors):
+                if pending is not None:
+                    segments = pending.segments + [s for s in window.segments if s.start >= pending.segments[-1].end]
+                    tokens = sum(segment.tokens for segment in segments)
+                    if tokens <= self.max_tokens and float(pending_vector @ vector) >= self.merge_similarity:
+                        # Merged vector: token-weighted mean of both chunks
+                        merged = pending_vector * pending.tokens + vector * window.tokens
+                        pending = Window(segments, tokens)
+                        pending_vector = merged / (np.linalg.norm(merged) or 1.0)
+                        continue
+                    yield pending
+                pending, pending_vector = window, vector
+            batch.clear()
+
+        for window in windows:
+            batch.append(window)
+            if len(batch) == self.batch_size:
+                yield from flush_batch()
+        if batch:
+            yield from flush_batch()
+        if pending is not None:
+            yield pending
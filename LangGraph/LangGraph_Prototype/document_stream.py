@@ -0,0 +1,80 @@
+"""Streaming document ingestion with chunks kept as byte-offset references.
+
+Documents are read incrementally in blocks of READ_SIZE bytes and split into
+paragraph chunks by a generator, so memory stays bounded by the block size
+and the longest paragraph rather than the document size. Graph state keeps
+only ``ChunkRef`` offsets; chunk text is read back from the file when a node
+needs it.
+"""
+
+from typing import Iterable, Iterator, NamedTuple, Tuple
+
+# Bytes read from the document per block
+READ_SIZE = 1 << 20
+
+# Chunks are paragraphs separated by a blank line
+PARAGRAPH_SEPARATOR = b"\n\n"
+
+class ChunkRef(NamedTuple):
+    """Location of a chunk in a document: UTF-8 byte offsets [start, end)."""
+    path: str
+    start: int
+    end: int
+    # Stable ID assigned by the chunker (see chunking.chunk_id)
+    chunk_id: str = ""
+
+def iter_chunks(path: str, separator: bytes = PARAGRAPH_SEPARATOR, read_size: int = READ_SIZE) -> Iterator[Tuple[ChunkRef, str]]:
+    """Read a document incrementally and yield its non-empty, stripped chunks.
+
+    Yields:
+        Reference and text of each chunk, in document order
+    """
+    with open(path, "rb") as file:
+        buffer = b""
+        offset = 0  # document offset of buffer[0]
+        while True:
+            block = file.read(read_size)
+            buffer += block
+            position = 0
+            while True:
+                found = buffer.find(separator, position)
+                if found < 0:
+                    if block:
+                        break
+                    # End of the file: the rest of the buffer is the last chunk
+                    found = len(buffer)
+                piece = buffer[position:found]
+                stripped = piece.strip()
+                if stripped:
+                    start = offset + position + len(piece) - len(piece.lstrip())
+                    yield ChunkRef(path, start, start + len(stripped)), stripped.decode("utf-8")
+                position = found + len(separator)
+                if position >= len(buffer):
+                    break
+            # Keep only the unfinished chunk for the next block
+            consumed = min(position, len(buffer))
+            buffer = buffer[consumed:]
+            offset += consumed
+            if not block:
+                return
+
+def read_chunk(ref: ChunkRef) -> str:
+    """Read the text of one chunk from its document."""
+    with open(ref.path, "rb") as file:
+        file.seek(ref.start)
+        return file.read(ref.end - ref.start).decode("utf-8")
+
+def read_chunks(refs: Iterable[ChunkRef]) -> Iterator[Tuple[ChunkRef, str]]:
+    """Read chunk texts back one at a time, keeping each document open while its chunks are read."""
+    file, path = None, None
+    try:
+        for ref in refs:
+            if ref.path != path:
+                if file is not None:
+                    file.close()
+                file, path = open(ref.path, "rb"), ref.path
+            file.seek(ref.start)
+            yield ref, file.read(ref.end - ref.start).decode("utf-8")
+    finally:
+        if file is not None:
+            file.close()
@@ -0,0 +1,167 @@
+"""Embedding index of rules for vector-similarity candidate retrieval.
+
+Rule texts are embedded once and stored as a float32 matrix in a local index
+directory; later runs memory-map the matrix instead of embedding again, and
+rebuild it only when the rules or the embedder change. Chunks are embedded
+in batches and scored against all rules with one matrix product per batch.
+
+Embedders run offline: ``HashingEmbedder`` is deterministic and needs no
+model (feature hashing of word tokens), and any sentence-transformers model
+can be used when that package is installed.
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from keyword_index import tokenize
+
+class HashingEmbedder:
+    """Deterministic bag-of-words embedder using signed feature hashing."""
+
+    def __init__(self, dimensions: int = 512):
+        self.dimensions = dimensions
+        self.name = f"hashing-{dimensions}"
+        # Signed bucket of each token seen so far (hashing dominates embedding time)
+        self._buckets = lru_cache(maxsize=1 << 16)(self._signed_bucket)
+
+    def _signed_bucket(self, token: str) -> int:
+        """Bucket of a token plus one, negated for a negative sign."""
+        bucket, sign = self._bucket(token)
+        return int(sign) * (bucket + 1)
+
+    def _bucket(self, token: str) -> Tuple[int, float]:
+        """Get the stable bucket and sign of a token."""
+        digest = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+        return digest % self.dimensions, 1.0 if digest >> 63 else -1.0
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts as L2-normalized rows."""
+        vectors = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            tokens = tokenize(text)
+            buckets = np.fromiter((self._buckets(token) for token in tokens), dtype=np.int64, count=len(tokens))
+            # Signed buckets: bucket + 1 for +1, -(bucket + 1) for -1
+            np.add.at(vectors[row], np.abs(buckets) - 1, np.sign(buckets).astype(np.float32))
+        return normalize(vectors)
+
+class SentenceTransformerEmbedder:
+    """Local sentence-transformers model (loaded on first use)."""
+
+    def __init__(self, model_name: str):
+        self.name = model_name
+        self._model = None
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts as L2-normalized rows."""
+        if self._model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError as e:
+                raise ImportError(
+                    f"EMBEDDING_MODEL={self.name} needs sentence-transformers "
+                    "(pip install sentence-transformers), or use EMBEDDING_MODEL=hashing"
+                ) from e
+            self._model = SentenceTransformer(self.name)
+        vectors = self._model.encode(list(texts), convert_to_numpy=True)
+        return normalize(vectors.astype(np.float32))
+
+def build_embedder(model: str):
+    """Create the embedder named by EMBEDDING_MODEL ("hashing" or a local model name)."""
+    if model == "hashing":
+        return HashingEmbedder()
+    return SentenceTransformerEmbedder(model)
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length (all-zero rows are left as they are)."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+def rule_text(rule: Dict[str, Any]) -> str:
+    """Text embedded for a rule: its description and keywords."""
+    return f"{rule['description']}. {', '.join(rule['keywords'])}"
+
+class RuleEmbeddingIndex:
+    """Persistent matrix of rule embeddings with top-k cosine search."""
+
+    def __init__(self, rules: Sequence[Dict[str, Any]], embedder, index_dir: str):
+        """Describe the index; the matrix is loaded or built on first use."""
+        self.rules = list(rules)
+        self.embedder = embedder
+        self.index_dir = Path(index_dir)
+        self._matrix: Optional[np.ndarray] = None
+
+    def fingerprint(self) -> str:
+        """Hash of the embedder and the embedded rule texts."""
+        digest = hashlib.sha256(self.embedder.name.encode("utf-8"))
+        for rule in self.rules:
+            digest.update(f"\0{rule['id']}\0{rule_text(rule)}".encode("utf-8"))
+        return digest.hexdigest()
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Rule embeddings, one row per rule in rule order."""
+        if self._matrix is None:
+            self._matrix = self._load()
+            if self._matrix is None:
+                self._matrix = self._build()
+        return self._matrix
+
+    def _load(self) -> Optional[np.ndarray]:
+        """Memory-map the stored matrix if it matches the current rules and embedder."""
+        try:
+            meta = json.loads((self.index_dir / "rules.json").read_text())
+        except (OSError, ValueError):
+            return None
+        if meta.get("fingerprint") != self.fingerprint():
+            return None
+        print(f"Loaded rule embeddings from {self.index_dir}")
+        return np.load(self.index_dir / "rules.npy", mmap_mode="r")
+
+    def _build(self) -> np.ndarray:
+        """Embed all rules and store the matrix with its metadata."""
+        print(f"Embedding {len(self.rules)} rules with {self.embedder.name}...")
+        matrix = np.asarray(self.embedder.embed([rule_text(rule) for rule in self.rules]), dtype=np.float32)
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        np.save(self.index_dir / "rules.npy", matrix)
+        (self.index_dir / "rules.json").write_text(json.dumps({
+            "fingerprint": self.fingerprint(),
+            "embedder": self.embedder.name,
+            "rule_ids": [rule["id"] for rule in self.rules],
+        }, indent=2))
+        return matrix
+
+    def top_k(
+        self,
+        texts: Sequence[str],
+        k: int,
+        batch_size: int = 64,
+        include: Optional[Sequence[Iterable[int]]] = None,
+    ) -> List[Dict[int, float]]:
+        """Find the k most similar rules of each text.
+
+        Args:
+            texts: Texts to search with, embedded ``batch_size`` at a time
+            k: Number of rules per text
+            batch_size: Texts embedded and scored per matrix product
+            include: Extra rule positions per text to score as well (e.g. keyword hits)
+
+        Returns:
+            Cosine similarity keyed by rule position, one dict per text
+        """
+        matrix = self.matrix
+        k = min(k, len(self.rules))
+        results = []
+        for start in range(0, len(texts), batch_size):
+            scores = self.embedder.embed(texts[start:start + batch_size]) @ matrix.T
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k] if k > 0 else None
+            for offset, row in enumerate(scores):
+                positions = list(top[offset]) if k > 0 else []
+                if include is not None:
+                    positions.extend(include[start + offset])
+                results.append({int(position): float(row[position]) for position in positions})
+        return results
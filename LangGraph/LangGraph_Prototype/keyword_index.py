@@ -0,0 +1,91 @@
+"""Precompiled multi-keyword matcher for rule candidate extraction.
+
+Builds an Aho-Corasick automaton over the keywords of all rules once, then
+matches a chunk in a single pass. Matching works on word tokens, so keywords
+only match whole words ("ID" does not match inside "identity"); symbols such
+as "$" are tokens of their own, and multi-word keywords match as phrases.
+"""
+
+import re
+from collections import deque
+from typing import Any, Dict, List, Sequence
+
+# Words, or single non-space symbols such as "$" or "%"
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+def tokenize(text: str) -> List[str]:
+    """Split lowercased text into word and symbol tokens."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+class KeywordIndex:
+    """Aho-Corasick automaton mapping keyword matches in a chunk to rules."""
+
+    def __init__(self, rules: Sequence[Dict[str, Any]]):
+        """Build the automaton from rules with a "keywords" list."""
+        self.rules = list(rules)
+        # Rules using each keyword (keywords shared by several rules are stored once)
+        keyword_ids: Dict[tuple, int] = {}
+        self.keyword_rules: List[List[int]] = []
+        for position, rule in enumerate(self.rules):
+            for keyword in dict.fromkeys(tuple(tokenize(keyword)) for keyword in rule["keywords"]):
+                if not keyword:
+                    continue
+                if keyword not in keyword_ids:
+                    keyword_ids[keyword] = len(self.keyword_rules)
+                    self.keyword_rules.append([])
+                self.keyword_rules[keyword_ids[keyword]].append(position)
+
+        # Trie of keyword token sequences
+        self._goto: List[Dict[str, int]] = [{}]
+        self._outputs: List[List[int]] = [[]]
+        for keyword, keyword_id in keyword_ids.items():
+            state = 0
+            for token in keyword:
+                next_state = self._goto[state].get(token)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][token] = next_state
+                    self._goto.append({})
+                    self._outputs.append([])
+                state = next_state
+            self._outputs[state].append(keyword_id)
+
+        # Failure links (breadth first, children of the root fail to the root);
+        # outputs include those of the failure state
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(token, 0)
+                self._outputs[next_state] += self._outputs[self._fail[next_state]]
+
+    def matched_keywords(self, text: str) -> set:
+        """Get the ids of all keywords occurring in the text."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        matched = set()
+        state = 0
+        for token in tokenize(text):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if outputs[state]:
+                matched.update(outputs[state])
+        return matched
+
+    def match_counts(self, text: str) -> Dict[int, int]:
+        """Count the distinct keywords of each rule found in the text.
+
+        Returns:
+            Number of matched keywords keyed by rule position, in rule order
+            (rules without matches are left out)
+        """
+        counts: Dict[int, int] = {}
+        for keyword_id in self.matched_keywords(text):
+            for position in self.keyword_rules[keyword_id]:
+                counts[position] = counts.get(position, 0) + 1
+        return dict(sorted(counts.items()))
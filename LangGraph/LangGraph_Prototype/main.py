@@ -1,10 +1,18 @@
+import asyncio
 import os
+from itertools import islice
 from pathlib import Path
 from dotenv import load_dotenv
-from typing import Dict, List, Tuple, Any, TypedDict
+from typing import Dict, List, Optional, Tuple, Any, TypedDict
 from langchain_core.messages import HumanMessage, AIMessage
 from langchain_openai import ChatOpenAI
 from langgraph.graph import StateGraph, END
+from pydantic import BaseModel, Field
+
+from chunking import Chunker, build_token_counter, estimate_tokens
+from document_stream import ChunkRef, read_chunk, read_chunks
+from embedding_index import RuleEmbeddingIndex, build_embedder
+from keyword_index import KeywordIndex
 # Define state schema for better type safety
 from typing import NotRequired
 
@@ -18,10 +26,54 @@ llm = ChatOpenAI(
     api_key=os.getenv("OPENAI_API_KEY"),
 )
 
+# Rule validation: concurrent LLM calls in flight and timeout per call
+VALIDATION_CONCURRENCY = int(os.getenv("VALIDATION_CONCURRENCY", "8"))
+VALIDATION_TIMEOUT_SECONDS = float(os.getenv("VALIDATION_TIMEOUT_SECONDS", "60"))
+# "batched": one structured JSON call per chunk with all its candidate rules
+# "per_rule": one ReAct call per (rule, chunk) pair
+VALIDATION_MODE = os.getenv("VALIDATION_MODE", "batched")
+# Prompt token budget of a batched call; a chunk's rules are split across calls above it
+VALIDATION_BATCH_TOKENS = int(os.getenv("VALIDATION_BATCH_TOKENS", "3000"))
+
+# Chunking: token budget per chunk, tokens repeated between consecutive chunks, and
+# the tokenizer counting them ("approx" or a tiktoken encoding such as o200k_base)
+CHUNK_MAX_TOKENS = int(os.getenv("CHUNK_MAX_TOKENS", "512"))
+CHUNK_OVERLAP_TOKENS = int(os.getenv("CHUNK_OVERLAP_TOKENS", "64"))
+CHUNK_TOKENIZER = os.getenv("CHUNK_TOKENIZER", "approx")
+# Cosine similarity at which neighbouring sections are merged into one chunk (0 disables merging)
+CHUNK_MERGE_SIMILARITY = float(os.getenv("CHUNK_MERGE_SIMILARITY", "0"))
+
+# Candidate retrieval: "hashing" (deterministic, offline) or a local sentence-transformers model
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "hashing")
+# Directory of the persistent rule embedding index
+EMBEDDING_INDEX_DIR = os.getenv("EMBEDDING_INDEX_DIR", ".rule_index")
+# Most similar rules per chunk and the similarity they need to become candidates
+EMBEDDING_TOP_K = int(os.getenv("EMBEDDING_TOP_K", "3"))
+EMBEDDING_MIN_SIMILARITY = float(os.getenv("EMBEDDING_MIN_SIMILARITY", "0.3"))
+# Chunks embedded per batch
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
+# Weight of keyword hits in the hybrid candidate score (the rest is cosine similarity)
+HYBRID_KEYWORD_WEIGHT = float(os.getenv("HYBRID_KEYWORD_WEIGHT", "0.5"))
+
+# Batched validation asks for a JSON object response
+json_llm = llm.bind(response_format={"type": "json_object"})
+
+class RuleVerdict(BaseModel):
+    """Verdict of the LLM for one candidate rule."""
+    rule_id: str
+    reasoning: str
+    applies: bool
+    confidence: float = Field(ge=0.0, le=1.0)
+
+class ChunkValidation(BaseModel):
+    """Structured response of a batched validation call: one verdict per rule."""
+    verdicts: List[RuleVerdict]
+
 # Define state schema for better type safety
 class DocumentState(TypedDict):
-    content: NotRequired[str] # Made optional to avoid type errors
-    chunks: NotRequired[List[str]]
+    document_path: NotRequired[str]
+    # Chunks are kept as byte-offset references into the document, not text
+    chunks: NotRequired[List[ChunkRef]]
     candidate_rules: NotRequired[List[Dict[str, Any]]]
     validated_rules: NotRequired[List[Dict[str, Any]]]
     confidence_score: NotRequired[float]
@@ -50,21 +102,28 @@ SAMPLE_RULES = [
     }
 ]
 
-def read_file(file_path: str) -> str:
-    """Read content from a text file."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return file.read()
-    except Exception as e:
-        print(f"Error reading file: {e}")
-        return ""
+# Keyword matcher over all rules, compiled once
+KEYWORD_INDEX = KeywordIndex(SAMPLE_RULES)
+# Rule embeddings, loaded from (or built into) EMBEDDING_INDEX_DIR on first use
+RULE_INDEX = RuleEmbeddingIndex(SAMPLE_RULES, build_embedder(EMBEDDING_MODEL), EMBEDDING_INDEX_DIR)
+# Token-aware chunker (shares the embedder for similarity merging)
+CHUNKER = Chunker(
+    max_tokens=CHUNK_MAX_TOKENS,
+    overlap_tokens=CHUNK_OVERLAP_TOKENS,
+    count_tokens=build_token_counter(CHUNK_TOKENIZER),
+    embedder=RULE_INDEX.embedder,
+    merge_similarity=CHUNK_MERGE_SIMILARITY,
+    batch_size=EMBEDDING_BATCH_SIZE,
+)
 
 def chunk_document(state: DocumentState) -> DocumentState:
-    """Split document into manageable chunks."""
-    content = state["content"]
-    
-    # Simple chunking by paragraphs (enhance with semantic chunking later)
-    chunks = [chunk.strip() for chunk in content.split('\n\n') if chunk.strip()]
+    """Split the document into chunks, streaming it from disk."""
+    # Token-bounded chunks along sentence and heading boundaries
+    try:
+        chunks = [ref for ref, _ in CHUNKER.iter_chunks(state["document_path"])]
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Error reading file: {e}")
+        chunks = []
     
     print(f"Document split into {len(chunks)} chunks")
     
@@ -74,36 +133,52 @@ def chunk_document(state: DocumentState) -> DocumentState:
         "iteration_count": state.get("iteration_count", 0)
     }
 
+def add_candidates(
+    best_candidates: Dict[Tuple[str, str], Dict[str, Any]],
+    chunk_ref: ChunkRef,
+    hits: Dict[int, int],
+    similarities: Dict[int, float],
+) -> None:
+    """Add the candidate rules of one chunk, keeping the most confident per rule and chunk ID."""
+    for rule_position, similarity in sorted(similarities.items()):
+        keyword_matches = hits.get(rule_position, 0)
+        if not keyword_matches and similarity < EMBEDDING_MIN_SIMILARITY:
+            continue
+        rule = KEYWORD_INDEX.rules[rule_position]
+        keyword_score = keyword_matches / len(rule["keywords"])
+        candidate = {
+            "rule_id": rule["id"],
+            "rule_description": rule["description"],
+            "chunk_ref": chunk_ref,
+            "keyword_matches": keyword_matches,
+            "similarity": similarity,
+            # Hybrid score of keyword hits and cosine similarity
+            "confidence": HYBRID_KEYWORD_WEIGHT * keyword_score
+                          + (1 - HYBRID_KEYWORD_WEIGHT) * max(similarity, 0.0)
+        }
+        key = (rule["id"], chunk_ref.chunk_id)
+        if key not in best_candidates or candidate["confidence"] > best_candidates[key]["confidence"]:
+            best_candidates[key] = candidate
+
 def extract_candidate_rules(state: DocumentState) -> DocumentState:
-    """Extract potentially applicable rules using keyword matching and basic NLP."""
-    chunks = state["chunks"]
-    candidate_rules = []
+    """Extract potentially applicable rules using keyword hits and vector similarity."""
+    # Best candidate per (rule, chunk ID): chunks with the same text share an ID
+    best_candidates: Dict[Tuple[str, str], Dict[str, Any]] = {}
     
-    for chunk in chunks:
-        chunk_lower = chunk.lower()
+    # Chunk texts are read back in batches of EMBEDDING_BATCH_SIZE, so only one batch is in memory
+    chunk_texts = read_chunks(state["chunks"])
+    while batch := list(islice(chunk_texts, EMBEDDING_BATCH_SIZE)):
+        texts = [text for _, text in batch]
+        # Single pass over each chunk for all rules
+        keyword_hits = [KEYWORD_INDEX.match_counts(text) for text in texts]
+        # Top-k similar rules per chunk, plus the similarity of the keyword hits
+        similar_rules = RULE_INDEX.top_k(texts, EMBEDDING_TOP_K, EMBEDDING_BATCH_SIZE, include=keyword_hits)
         
-        for rule in SAMPLE_RULES:
-            # Simple keyword matching (replace with vector similarity later)
-            keyword_matches = sum(1 for keyword in rule["keywords"] 
-                                if keyword.lower() in chunk_lower)
-            
-            if keyword_matches > 0:
-                candidate_rules.append({
-                    "rule_id": rule["id"],
-                    "rule_description": rule["description"],
-                    "chunk": chunk,
-                    "keyword_matches": keyword_matches,
-                    "confidence": keyword_matches / len(rule["keywords"])
-                })
+        for (chunk_ref, _), hits, similarities in zip(batch, keyword_hits, similar_rules):
+            add_candidates(best_candidates, chunk_ref, hits, similarities)
     
-    # Remove duplicates and sort by confidence
-    unique_candidates = []
-    seen = set()
-    for candidate in sorted(candidate_rules, key=lambda x: x["confidence"], reverse=True):
-        key = (candidate["rule_id"], candidate["chunk"][:50])  # First 50 chars as identifier
-        if key not in seen:
-            unique_candidates.append(candidate)
-            seen.add(key)
+    # Sort by confidence
+    unique_candidates = sorted(best_candidates.values(), key=lambda x: x["confidence"], reverse=True)
     
     print(f"Found {len(unique_candidates)} candidate rule applications")
     
@@ -112,19 +187,14 @@ def extract_candidate_rules(state: DocumentState) -> DocumentState:
         "candidate_rules": unique_candidates
     }
 
-def react_rule_validation(state: DocumentState) -> DocumentState:
-    """Use ReAct pattern to validate rule applicability."""
-    candidate_rules = state["candidate_rules"]
-    validated_rules = []
-    
-    for candidate in candidate_rules:
-        # ReAct prompt for rule validation
-        prompt = f"""
+def build_validation_prompt(candidate: Dict[str, Any]) -> str:
+    """Build the ReAct validation prompt for one candidate rule application."""
+    return f"""
         You are a financial document compliance expert. Analyze if the following rule applies to the given text chunk.
 
         RULE: {candidate['rule_description']}
         
-        TEXT CHUNK: {candidate['chunk']}
+        TEXT CHUNK: {read_chunk(candidate['chunk_ref'])}
         
         Think step by step:
         1. THOUGHT: What does this rule require?
@@ -138,31 +208,160 @@ def react_rule_validation(state: DocumentState) -> DocumentState:
         ACTION: [YES or NO]
         CONFIDENCE: [0.0-1.0]
         """
-        
-        try:
-            response = llm.invoke([HumanMessage(content=prompt)])
-            response_text = response.content
-            
-            # Parse ReAct response (simplified parsing)
-            lines = response_text.strip().split('\n')
-            action_line = next((line for line in lines if line.startswith('ACTION:')), 'ACTION: NO')
-            confidence_line = next((line for line in lines if line.startswith('CONFIDENCE:')), 'CONFIDENCE: 0.0')
-            
-            action = action_line.split(':', 1)[1].strip().upper()
-            confidence = float(confidence_line.split(':', 1)[1].strip())
-            
-            if action == 'YES' and confidence > 0.5:  # Threshold for validation
-                validated_rules.append({
-                    **candidate,
-                    "validation_confidence": confidence,
-                    "llm_reasoning": response_text
-                })
-                
-        except Exception as e:
-            print(f"Error in ReAct validation: {e}")
-            continue
+
+def parse_validation_response(candidate: Dict[str, Any], response_text: str) -> Optional[Dict[str, Any]]:
+    """Parse a ReAct response; return the validated rule or None if it does not apply."""
+    # Parse ReAct response (simplified parsing)
+    lines = response_text.strip().split('\n')
+    action_line = next((line for line in lines if line.startswith('ACTION:')), 'ACTION: NO')
+    confidence_line = next((line for line in lines if line.startswith('CONFIDENCE:')), 'CONFIDENCE: 0.0')
     
-    print(f"Validated {len(validated_rules)} rules")
+    action = action_line.split(':', 1)[1].strip().upper()
+    confidence = float(confidence_line.split(':', 1)[1].strip())
+    
+    if action == 'YES' and confidence > 0.5:  # Threshold for validation
+        return {
+            **candidate,
+            "validation_confidence": confidence,
+            "llm_reasoning": response_text
+        }
+    return None
+
+async def validate_candidate(candidate: Dict[str, Any], semaphore: asyncio.Semaphore) -> Optional[Dict[str, Any]]:
+    """Validate one candidate with the LLM, bounded by the semaphore and a timeout."""
+    async with semaphore:
+        # Read the chunk off the event loop, and only once a call slot is free
+        prompt = await asyncio.to_thread(build_validation_prompt, candidate)
+        response = await asyncio.wait_for(
+            llm.ainvoke([HumanMessage(content=prompt)]),
+            timeout=VALIDATION_TIMEOUT_SECONDS,
+        )
+    return parse_validation_response(candidate, response.content)
+
+def build_batch_validation_prompt(chunk: str, candidates: List[Dict[str, Any]]) -> str:
+    """Build one validation prompt for a chunk and all of its candidate rules."""
+    rules = "\n".join(f"- {candidate['rule_id']}: {candidate['rule_description']}" for candidate in candidates)
+    return f"""
+        You are a financial document compliance expert. For each rule below, decide if it applies to the given text chunk.
+
+        RULES:
+        {rules}
+
+        TEXT CHUNK: {chunk}
+
+        For each rule think step by step: what does the rule require, what do you observe in the text, does the rule apply, and how confident are you (0.0-1.0)?
+
+        Respond with a JSON object with exactly one verdict per rule id listed above:
+        {{"verdicts": [{{"rule_id": "<id>", "reasoning": "<thought and observation>", "applies": true|false, "confidence": 0.0-1.0}}]}}
+        """
+
+# Prompt tokens of a batch before any rule is listed
+BATCH_PROMPT_OVERHEAD_TOKENS = estimate_tokens(build_batch_validation_prompt("", []))
+
+def group_candidates_by_chunk(candidates: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """Group candidates by chunk, splitting a chunk's rules to stay within VALIDATION_BATCH_TOKENS."""
+    by_chunk: Dict[ChunkRef, List[Dict[str, Any]]] = {}
+    for candidate in candidates:
+        by_chunk.setdefault(candidate["chunk_ref"], []).append(candidate)
+    
+    batches = []
+    for chunk_ref, group in by_chunk.items():
+        # Chunk size in bytes stands in for its length in characters
+        base_tokens = BATCH_PROMPT_OVERHEAD_TOKENS + (chunk_ref.end - chunk_ref.start) // 4 + 1
+        batch, tokens = [], base_tokens
+        for candidate in group:
+            rule_tokens = estimate_tokens(f"- {candidate['rule_id']}: {candidate['rule_description']}\n") + 30  # room for the verdict
+            if batch and tokens + rule_tokens > VALIDATION_BATCH_TOKENS:
+                batches.append(batch)
+                batch, tokens = [], base_tokens
+            batch.append(candidate)
+            tokens += rule_tokens
+        batches.append(batch)
+    return batches
+
+def parse_batch_validation_response(candidates: List[Dict[str, Any]], response_text: str) -> List[Optional[Dict[str, Any]]]:
+    """Strictly validate a batched response; return the validated rule (or None) per candidate.
+
+    Raises:
+        ValueError: If the JSON does not match the schema or the verdicts do
+            not cover exactly the requested rule ids
+    """
+    result = ChunkValidation.model_validate_json(response_text, strict=True)
+    verdicts = {verdict.rule_id: verdict for verdict in result.verdicts}
+    expected = [candidate["rule_id"] for candidate in candidates]
+    if len(verdicts) != len(result.verdicts) or set(verdicts) != set(expected):
+        raise ValueError(f"Expected one verdict for each of {expected}, got {[v.rule_id for v in result.verdicts]}")
+    
+    validated = []
+    for candidate in candidates:
+        verdict = verdicts[candidate["rule_id"]]
+        if verdict.applies and verdict.confidence > 0.5:  # Threshold for validation
+            validated.append({
+                **candidate,
+                "validation_confidence": verdict.confidence,
+                "llm_reasoning": verdict.reasoning
+            })
+        else:
+            validated.append(None)
+    return validated
+
+async def validate_chunk_batch(candidates: List[Dict[str, Any]], semaphore: asyncio.Semaphore) -> List[Optional[Dict[str, Any]]]:
+    """Validate all candidates of one chunk in a single structured LLM call."""
+    async with semaphore:
+        # Read the chunk off the event loop, and only once a call slot is free
+        chunk = await asyncio.to_thread(read_chunk, candidates[0]["chunk_ref"])
+        prompt = build_batch_validation_prompt(chunk, candidates)
+        response = await asyncio.wait_for(
+            json_llm.ainvoke([HumanMessage(content=prompt)]),
+            timeout=VALIDATION_TIMEOUT_SECONDS,
+        )
+    return parse_batch_validation_response(candidates, response.content)
+
+async def react_rule_validation(state: DocumentState) -> DocumentState:
+    """Use ReAct pattern to validate rule applicability.
+
+    In "batched" mode each chunk is sent once with all of its candidate rules
+    and a structured JSON verdict per rule comes back; in "per_rule" mode each
+    candidate gets its own ReAct call. Calls run concurrently (at most
+    VALIDATION_CONCURRENCY in flight, each limited to
+    VALIDATION_TIMEOUT_SECONDS). A failed or timed out call skips only its
+    candidates; results keep candidate order.
+    """
+    candidate_rules = state["candidate_rules"]
+    semaphore = asyncio.Semaphore(VALIDATION_CONCURRENCY)
+    
+    if VALIDATION_MODE == "batched":
+        batches = group_candidates_by_chunk(candidate_rules)
+        calls = [validate_chunk_batch(batch, semaphore) for batch in batches]
+    else:
+        batches = [[candidate] for candidate in candidate_rules]
+        calls = [validate_candidate(batch[0], semaphore) for batch in batches]
+    
+    results = await asyncio.gather(*calls, return_exceptions=True)
+    
+    # Map results back to candidates so validated rules keep candidate order
+    outcomes: Dict[int, Optional[Dict[str, Any]]] = {}
+    failures = 0
+    for batch, result in zip(batches, results):
+        rule_ids = ", ".join(candidate["rule_id"] for candidate in batch)
+        if isinstance(result, asyncio.TimeoutError):
+            failures += 1
+            print(f"ReAct validation of {rule_ids} timed out after {VALIDATION_TIMEOUT_SECONDS}s")
+        elif isinstance(result, BaseException):
+            failures += 1
+            print(f"Error in ReAct validation of {rule_ids}: {result}")
+        else:
+            batch_results = result if isinstance(result, list) else [result]
+            for candidate, validated in zip(batch, batch_results):
+                outcomes[id(candidate)] = validated
+    
+    validated_rules = [
+        outcomes[id(candidate)]
+        for candidate in candidate_rules
+        if outcomes.get(id(candidate)) is not None
+    ]
+    
+    print(f"Validated {len(validated_rules)} rules in {len(batches)} LLM calls ({failures} failed)")
     
     return {
         **state,
@@ -207,26 +406,31 @@ def enrich_rules(state: DocumentState) -> DocumentState:
     print("Attempting rule enrichment...")
     
     # Simple enrichment: look for rules we might have missed
-    chunks = state["chunks"]
     current_rule_ids = {rule["rule_id"] for rule in state["validated_rules"]}
     
-    # Check if we missed any obvious rules
-    for rule in SAMPLE_RULES:
-        if rule["id"] not in current_rule_ids:
-            # More aggressive matching for enrichment
-            for chunk in chunks:
-                if any(keyword.lower() in chunk.lower() for keyword in rule["keywords"]):
-                    # Add to validated rules with lower confidence
-                    state["validated_rules"].append({
-                        "rule_id": rule["id"],
-                        "rule_description": rule["description"],
-                        "chunk": chunk,
-                        "keyword_matches": 1,
-                        "confidence": 0.6,  # Lower confidence for enriched rules
-                        "validation_confidence": 0.6,
-                        "llm_reasoning": "Added during enrichment phase"
-                    })
-                    break
+    # Check if we missed any obvious rules: first chunk matching any keyword of each missing rule
+    missing = {position for position, rule in enumerate(KEYWORD_INDEX.rules) if rule["id"] not in current_rule_ids}
+    first_chunks: Dict[int, ChunkRef] = {}
+    for chunk_ref, text in read_chunks(state["chunks"]):
+        if len(first_chunks) == len(missing):
+            break
+        # More aggressive matching for enrichment
+        for rule_position in KEYWORD_INDEX.match_counts(text):
+            if rule_position in missing:
+                first_chunks.setdefault(rule_position, chunk_ref)
+    
+    for rule_position, chunk_ref in sorted(first_chunks.items()):
+        rule = KEYWORD_INDEX.rules[rule_position]
+        # Add to validated rules with lower confidence
+        state["validated_rules"].append({
+            "rule_id": rule["id"],
+            "rule_description": rule["description"],
+            "chunk_ref": chunk_ref,
+            "keyword_matches": 1,
+            "confidence": 0.6,  # Lower confidence for enriched rules
+            "validation_confidence": 0.6,
+            "llm_reasoning": "Added during enrichment phase"
+        })
     
     return state
 
@@ -264,14 +468,13 @@ workflow.set_entry_point("chunk")
 # Compile the graph
 app = workflow.compile()
 
-def main():
+async def main():
     # Example file path
     file_path = Path("data/example.txt")
-    content = read_file(str(file_path))
     
-    # Initialize the state
+    # Initialize the state (the document is streamed from disk, not loaded)
     initial_state: DocumentState = {
-        "content": content,
+        "document_path": str(file_path),
         "chunks": [],
         "candidate_rules": [],
         "validated_rules": [],
@@ -282,7 +485,7 @@ def main():
     
     # Run the workflow
     print("Starting document analysis workflow...")
-    result = app.invoke(initial_state)
+    result = await app.ainvoke(initial_state)
     
     print("\n" + "="*50)
     print("FINAL RESULTS")
@@ -296,8 +499,8 @@ def main():
     for rule in result['validated_rules']:
         print(f"- {rule['rule_id']}: {rule['rule_description']}")
         print(f"  Confidence: {rule['validation_confidence']:.2f}")
-        print(f"  Applied to: {rule['chunk'][:100]}...")
+        print(f"  Applied to: {read_chunk(rule['chunk_ref'])[:100]}...")
         print()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file